@@ -34,7 +34,10 @@ async def azure_openai_langchain(embedder_config: AzureOpenAIEmbedderModelConfig
         client = patch_with_retry(client,
                                   retries=embedder_config.num_retries,
                                   retry_codes=embedder_config.retry_on_status_codes,
-                                  retry_on_messages=embedder_config.retry_on_errors)
+                                  retry_on_messages=embedder_config.retry_on_errors,
+                                  backoff_strategy=embedder_config.backoff_strategy,
+                                  retry_budget=embedder_config.retry_budget,
+                                  circuit_breaker=embedder_config.circuit_breaker)
 
     yield client
 
@@ -50,7 +53,10 @@ async def nim_langchain(embedder_config: NIMEmbedderModelConfig, builder: Builde
         client = patch_with_retry(client,
                                   retries=embedder_config.num_retries,
                                   retry_codes=embedder_config.retry_on_status_codes,
-                                  retry_on_messages=embedder_config.retry_on_errors)
+                                  retry_on_messages=embedder_config.retry_on_errors,
+                                  backoff_strategy=embedder_config.backoff_strategy,
+                                  retry_budget=embedder_config.retry_budget,
+                                  circuit_breaker=embedder_config.circuit_breaker)
 
     yield client
 
@@ -66,6 +72,9 @@ async def openai_langchain(embedder_config: OpenAIEmbedderModelConfig, builder:
         client = patch_with_retry(client,
                                   retries=embedder_config.num_retries,
                                   retry_codes=embedder_config.retry_on_status_codes,
-                                  retry_on_messages=embedder_config.retry_on_errors)
+                                  retry_on_messages=embedder_config.retry_on_errors,
+                                  backoff_strategy=embedder_config.backoff_strategy,
+                                  retry_budget=embedder_config.retry_budget,
+                                  circuit_breaker=embedder_config.circuit_breaker)
 
     yield client
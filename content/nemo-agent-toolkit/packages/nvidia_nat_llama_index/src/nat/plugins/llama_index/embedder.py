@@ -34,7 +34,10 @@ async def azure_openai_llama_index(embedder_config: AzureOpenAIEmbedderModelConf
         client = patch_with_retry(client,
                                   retries=embedder_config.num_retries,
                                   retry_codes=embedder_config.retry_on_status_codes,
-                                  retry_on_messages=embedder_config.retry_on_errors)
+                                  retry_on_messages=embedder_config.retry_on_errors,
+                                  backoff_strategy=embedder_config.backoff_strategy,
+                                  retry_budget=embedder_config.retry_budget,
+                                  circuit_breaker=embedder_config.circuit_breaker)
 
     yield client
 
@@ -53,7 +56,10 @@ async def nim_llama_index(embedder_config: NIMEmbedderModelConfig, _builder: Bui
         client = patch_with_retry(client,
                                   retries=embedder_config.num_retries,
                                   retry_codes=embedder_config.retry_on_status_codes,
-                                  retry_on_messages=embedder_config.retry_on_errors)
+                                  retry_on_messages=embedder_config.retry_on_errors,
+                                  backoff_strategy=embedder_config.backoff_strategy,
+                                  retry_budget=embedder_config.retry_budget,
+                                  circuit_breaker=embedder_config.circuit_breaker)
 
     yield client
 
@@ -69,6 +75,9 @@ async def openai_llama_index(embedder_config: OpenAIEmbedderModelConfig, _builde
         client = patch_with_retry(client,
                                   retries=embedder_config.num_retries,
                                   retry_codes=embedder_config.retry_on_status_codes,
-                                  retry_on_messages=embedder_config.retry_on_errors)
+                                  retry_on_messages=embedder_config.retry_on_errors,
+                                  backoff_strategy=embedder_config.backoff_strategy,
+                                  retry_budget=embedder_config.retry_budget,
+                                  circuit_breaker=embedder_config.circuit_breaker)
 
     yield client
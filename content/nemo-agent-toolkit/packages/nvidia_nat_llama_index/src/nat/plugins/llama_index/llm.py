@@ -59,7 +59,10 @@ def _patch_llm_based_on_config(client: ModelType, llm_config: LLMBaseConfig) ->
         client = patch_with_retry(client,
                                   retries=llm_config.num_retries,
                                   retry_codes=llm_config.retry_on_status_codes,
-                                  retry_on_messages=llm_config.retry_on_errors)
+                                  retry_on_messages=llm_config.retry_on_errors,
+                                  backoff_strategy=llm_config.backoff_strategy,
+                                  retry_budget=llm_config.retry_budget,
+                                  circuit_breaker=llm_config.circuit_breaker)
 
     if isinstance(llm_config, ThinkingMixin) and llm_config.thinking_system_prompt is not None:
         client = patch_with_thinking(
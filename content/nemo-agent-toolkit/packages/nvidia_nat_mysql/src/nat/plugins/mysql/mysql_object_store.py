@@ -13,26 +13,173 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import json
 import logging
 import re
+import uuid
+from collections.abc import AsyncGenerator
 
 import aiomysql
 from aiomysql.pool import Pool
+from pydantic import BaseModel
 
 from nat.data_models.object_store import KeyAlreadyExistsError
 from nat.data_models.object_store import NoSuchKeyError
+from nat.object_store.interfaces import DEFAULT_CHUNK_SIZE
 from nat.object_store.interfaces import ObjectStore
+from nat.object_store.interfaces import ObjectStoreUpload
 from nat.object_store.models import ObjectStoreItem
+from nat.object_store.models import ObjectStoreItemInfo
 from nat.utils.type_utils import override
 
 logger = logging.getLogger(__name__)
 
 
+class _ObjectManifest(BaseModel):
+    """Describes an object whose data is stored in rows of the object_chunks table."""
+    upload_id: str
+    chunk_size: int
+    num_chunks: int
+    content_type: str | None = None
+    metadata: dict[str, str] | None = None
+
+
+class MySQLChunkedUpload(ObjectStoreUpload):
+    """
+    Uploads an object to MySQL one chunk row at a time. The whole upload is a single transaction on one connection, so
+    the object only becomes visible once it is committed.
+    """
+
+    def __init__(self,
+                 store: "MySQLObjectStore",
+                 key: str,
+                 *,
+                 content_type: str | None,
+                 metadata: dict[str, str] | None,
+                 overwrite: bool):
+        self._store = store
+        self._key = key
+        self._content_type = content_type
+        self._metadata = metadata
+        self._overwrite = overwrite
+
+        self._conn: aiomysql.Connection | None = None
+        self._cur: aiomysql.Cursor | None = None
+        self._obj_id: int | None = None
+        self._buffer = bytearray()
+        self._size = 0
+        self._num_chunks = 0
+
+    async def _begin(self) -> None:
+        if self._conn is not None:
+            return
+
+        pool = self._store._get_pool()
+        conn = await pool.acquire()
+        cur = await conn.cursor()
+        try:
+            await cur.execute(f"USE {self._store._schema};")
+            await cur.execute("START TRANSACTION;")
+
+            if self._overwrite:
+                await cur.execute(
+                    """
+                    INSERT INTO object_meta (path, size)
+                    VALUES (%s, 0) AS new
+                    ON DUPLICATE KEY UPDATE size=new.size, created_at=CURRENT_TIMESTAMP
+                    """, (self._key, ))
+            else:
+                await cur.execute("INSERT IGNORE INTO object_meta (path, size) VALUES (%s, 0)", (self._key, ))
+                if cur.rowcount == 0:
+                    raise KeyAlreadyExistsError(
+                        key=self._key,
+                        additional_message=f"MySQL table {self._store._bucket_name} already has key {self._key}")
+
+            await cur.execute("SELECT id FROM object_meta WHERE path=%s FOR UPDATE;", (self._key, ))
+            (self._obj_id, ) = await cur.fetchone()
+
+            # Chunks of the object being replaced
+            await cur.execute("DELETE FROM object_chunks WHERE id=%s", (self._obj_id, ))
+        except Exception:
+            await conn.rollback()
+            await cur.close()
+            pool.release(conn)
+            raise
+
+        self._conn = conn
+        self._cur = cur
+
+    async def _release(self) -> None:
+        await self._cur.close()
+        self._store._get_pool().release(self._conn)
+        self._conn = None
+        self._cur = None
+
+    async def _write_chunk(self, data: bytes) -> None:
+        await self._cur.execute("INSERT INTO object_chunks (id, chunk_index, data) VALUES (%s, %s, %s)",
+                                (self._obj_id, self._num_chunks, data))
+        self._num_chunks += 1
+
+    async def write(self, data: bytes) -> None:
+        await self._begin()
+
+        self._buffer += data
+        self._size += len(data)
+
+        chunk_size = self._store.CHUNK_SIZE
+        while len(self._buffer) >= chunk_size:
+            chunk = bytes(self._buffer[:chunk_size])
+            del self._buffer[:chunk_size]
+            await self._write_chunk(chunk)
+
+    async def complete(self) -> None:
+        await self._begin()
+
+        try:
+            if self._buffer:
+                await self._write_chunk(bytes(self._buffer))
+                self._buffer = bytearray()
+
+            manifest = _ObjectManifest(upload_id=str(uuid.uuid4()),
+                                       chunk_size=self._store.CHUNK_SIZE,
+                                       num_chunks=self._num_chunks,
+                                       content_type=self._content_type,
+                                       metadata=self._metadata)
+
+            await self._cur.execute("UPDATE object_meta SET size=%s WHERE id=%s", (self._size, self._obj_id))
+            await self._cur.execute("REPLACE INTO object_data (id, data) VALUES (%s, %s)",
+                                    (self._obj_id, manifest.model_dump_json()))
+            await self._conn.commit()
+        except Exception:
+            await self._conn.rollback()
+            raise
+        finally:
+            await self._release()
+
+    async def abort(self) -> None:
+        self._buffer = bytearray()
+
+        if self._conn is not None:
+            try:
+                await self._conn.rollback()
+            finally:
+                await self._release()
+
+
 class MySQLObjectStore(ObjectStore):
     """
     Implementation of ObjectStore that stores objects in a MySQL database.
+
+    The data of each object is stored in rows of at most `CHUNK_SIZE` bytes in the object_chunks table, so that objects
+    can be read in ranges and streamed, and the object_data table holds a JSON manifest describing the chunks. Objects
+    stored by earlier versions as a single JSON value in the object_data table can still be read.
+
+    Streams read each chunk in a separate transaction. A stream fails with `NoSuchKeyError` if the object is replaced
+    or deleted before it is finished.
     """
 
+    CHUNK_SIZE = 1024 * 1024
+
     def __init__(self, *, bucket_name: str, host: str, port: int, username: str | None, password: str | None):
         super().__init__()
 
@@ -95,6 +242,17 @@ class MySQLObjectStore(ObjectStore):
                         FOREIGN KEY (id) REFERENCES object_meta(id) ON DELETE CASCADE
                     ) ENGINE=InnoDB ROW_FORMAT=DYNAMIC;
                     """)
+
+                    # Create blob chunk table
+                    await cur.execute("""
+                    CREATE TABLE IF NOT EXISTS object_chunks (
+                        id INT NOT NULL,
+                        chunk_index INT NOT NULL,
+                        data LONGBLOB NOT NULL,
+                        PRIMARY KEY (id, chunk_index),
+                        FOREIGN KEY (id) REFERENCES object_meta(id) ON DELETE CASCADE
+                    ) ENGINE=InnoDB ROW_FORMAT=DYNAMIC;
+                    """)
                 finally:
                     await cur.execute("SET sql_notes = 1;")
 
@@ -116,79 +274,102 @@ class MySQLObjectStore(ObjectStore):
 
         self._conn_pool = None
 
-    @override
-    async def put_object(self, key: str, item: ObjectStoreItem):
-
+    def _get_pool(self) -> Pool:
         if not self._conn_pool:
             raise RuntimeError("Connection not established")
 
-        async with self._conn_pool.acquire() as conn:
+        return self._conn_pool
+
+    async def _load(self, cur: aiomysql.Cursor, key: str) -> tuple[int, int, _ObjectManifest | ObjectStoreItem]:
+        """Load the ID, size and manifest of an object, or the whole object if it was stored by an earlier version."""
+        await cur.execute(
+            """
+            SELECT m.id, m.size, d.data
+            FROM object_data d
+            JOIN object_meta m USING(id)
+            WHERE m.path=%s
+        """, (key, ))
+        row = await cur.fetchone()
+        if not row:
+            raise NoSuchKeyError(key=key, additional_message=f"MySQL table {self._bucket_name} does not have key {key}")
+
+        (obj_id, size, value) = row
+        parsed = json.loads(value)
+        if "data" in parsed:
+            return (obj_id, size, ObjectStoreItem.model_validate(parsed))
+
+        return (obj_id, size, _ObjectManifest.model_validate(parsed))
+
+    async def _get_chunk(self, key: str, obj_id: int, manifest: _ObjectManifest, index: int) -> bytes:
+        """
+        Get one chunk of an object in its own short transaction, so that streams do not hold a connection for the whole
+        download. Fails if the object was replaced or deleted since `manifest` was loaded.
+        """
+        async with self._get_pool().acquire() as conn:
             async with conn.cursor() as cur:
                 await cur.execute(f"USE {self._schema};")
                 try:
-                    await cur.execute("START TRANSACTION;")
-                    await cur.execute("INSERT IGNORE INTO object_meta (path, size) VALUES (%s, %s)",
-                                      (key, len(item.data)))
-                    if cur.rowcount == 0:
-                        raise KeyAlreadyExistsError(
-                            key=key, additional_message=f"MySQL table {self._bucket_name} already has key {key}")
-                    await cur.execute("SELECT id FROM object_meta WHERE path=%s FOR UPDATE;", (key, ))
-                    (obj_id, ) = await cur.fetchone()
-                    blob = item.model_dump_json()
-                    await cur.execute("INSERT INTO object_data (id, data) VALUES (%s, %s)", (obj_id, blob))
-                    await conn.commit()
-                except Exception:
+                    # The chunk and the manifest are read by the same statement, so they come from the same snapshot
+                    await cur.execute(
+                        """
+                        SELECT c.data, d.data
+                        FROM object_chunks c
+                        JOIN object_data d USING(id)
+                        WHERE c.id=%s AND c.chunk_index=%s
+                    """, (obj_id, index))
+                    row = await cur.fetchone()
+                finally:
                     await conn.rollback()
-                    raise
+
+        if row is None or json.loads(row[1]).get("upload_id") != manifest.upload_id:
+            raise NoSuchKeyError(key=key,
+                                 additional_message=f"MySQL table {self._bucket_name} key {key} was replaced or "
+                                 "deleted while it was being read")
+
+        return row[0]
+
+    @staticmethod
+    def _chunk_span(manifest: _ObjectManifest, size: int, start: int, end: int | None) -> tuple[int, int, int] | None:
+        """Get the first and last chunk holding the range, and the absolute offset of the first chunk."""
+        end = size if end is None else min(end, size)
+        if start >= end:
+            return None
+
+        first = start // manifest.chunk_size
+        last = (end - 1) // manifest.chunk_size
+        return (first, last, first * manifest.chunk_size)
 
     @override
-    async def upsert_object(self, key: str, item: ObjectStoreItem):
+    async def put_object(self, key: str, item: ObjectStoreItem):
 
-        if not self._conn_pool:
-            raise RuntimeError("Connection not established")
+        async with self.open_upload(key, content_type=item.content_type, metadata=item.metadata) as upload:
+            await upload.write(item.data)
 
-        async with self._conn_pool.acquire() as conn:
-            async with conn.cursor() as cur:
-                await cur.execute(f"USE {self._schema};")
-                try:
-                    await cur.execute("START TRANSACTION;")
-                    await cur.execute(
-                        """
-                        INSERT INTO object_meta (path, size)
-                        VALUES (%s, %s) AS new
-                        ON DUPLICATE KEY UPDATE size=new.size, created_at=CURRENT_TIMESTAMP
-                        """, (key, len(item.data)))
-                    await cur.execute("SELECT id FROM object_meta WHERE path=%s FOR UPDATE;", (key, ))
-                    (obj_id, ) = await cur.fetchone()
-
-                    blob = item.model_dump_json()
-                    await cur.execute("REPLACE INTO object_data (id, data) VALUES (%s, %s)", (obj_id, blob))
-                    await conn.commit()
-                except Exception:
-                    await conn.rollback()
-                    raise
+    @override
+    async def upsert_object(self, key: str, item: ObjectStoreItem):
+
+        async with self.open_upload(key, content_type=item.content_type, metadata=item.metadata,
+                                    overwrite=True) as upload:
+            await upload.write(item.data)
 
     @override
     async def get_object(self, key: str) -> ObjectStoreItem:
 
-        if not self._conn_pool:
-            raise RuntimeError("Connection not established")
-
-        async with self._conn_pool.acquire() as conn:
+        async with self._get_pool().acquire() as conn:
             async with conn.cursor() as cur:
                 await cur.execute(f"USE {self._schema};")
-                await cur.execute(
-                    """
-                    SELECT d.data
-                    FROM object_data d
-                    JOIN object_meta m USING(id)
-                    WHERE m.path=%s
-                """, (key, ))
-                row = await cur.fetchone()
-                if not row:
-                    raise NoSuchKeyError(key=key,
-                                         additional_message=f"MySQL table {self._bucket_name} does not have key {key}")
-                return ObjectStoreItem.model_validate_json(row[0].decode("utf-8"))
+                try:
+                    # Read the manifest and the chunks from the same snapshot
+                    await cur.execute("START TRANSACTION WITH CONSISTENT SNAPSHOT, READ ONLY;")
+                    (obj_id, _, manifest) = await self._load(cur, key)
+                    if isinstance(manifest, ObjectStoreItem):
+                        return manifest
+
+                    await cur.execute("SELECT data FROM object_chunks WHERE id=%s ORDER BY chunk_index", (obj_id, ))
+                    data = b"".join(row[0] for row in await cur.fetchall())
+                    return ObjectStoreItem(data=data, content_type=manifest.content_type, metadata=manifest.metadata)
+                finally:
+                    await conn.rollback()
 
     @override
     async def delete_object(self, key: str):
@@ -216,3 +397,100 @@ class MySQLObjectStore(ObjectStore):
                 except Exception:
                     await conn.rollback()
                     raise
+
+    @override
+    async def get_object_info(self, key: str) -> ObjectStoreItemInfo:
+
+        async with self._get_pool().acquire() as conn:
+            async with conn.cursor() as cur:
+                await cur.execute(f"USE {self._schema};")
+                try:
+                    (_, size, manifest) = await self._load(cur, key)
+                    return ObjectStoreItemInfo(
+                        size=size,
+                        content_type=manifest.content_type,
+                        metadata=manifest.metadata,
+                        etag=manifest.upload_id if isinstance(manifest, _ObjectManifest) else None)
+                finally:
+                    await conn.rollback()
+
+    @override
+    async def get_object_range(self, key: str, start: int = 0, end: int | None = None) -> bytes:
+        self._check_range(start, end)
+
+        async with self._get_pool().acquire() as conn:
+            async with conn.cursor() as cur:
+                await cur.execute(f"USE {self._schema};")
+                try:
+                    await cur.execute("START TRANSACTION WITH CONSISTENT SNAPSHOT, READ ONLY;")
+                    (obj_id, size, manifest) = await self._load(cur, key)
+                    if isinstance(manifest, ObjectStoreItem):
+                        return manifest.data[start:end]
+
+                    span = self._chunk_span(manifest, size, start, end)
+                    if span is None:
+                        return b""
+
+                    (first, last, offset) = span
+                    await cur.execute(
+                        """
+                        SELECT data
+                        FROM object_chunks
+                        WHERE id=%s AND chunk_index BETWEEN %s AND %s
+                        ORDER BY chunk_index
+                    """, (obj_id, first, last))
+                    data = b"".join(row[0] for row in await cur.fetchall())
+                    return data[start - offset:None if end is None else end - offset]
+                finally:
+                    await conn.rollback()
+
+    @override
+    async def stream_object(self,
+                            key: str,
+                            start: int = 0,
+                            end: int | None = None,
+                            chunk_size: int = DEFAULT_CHUNK_SIZE) -> AsyncGenerator[bytes]:
+        self._check_range(start, end)
+        self._check_chunk_size(chunk_size)
+
+        async with self._get_pool().acquire() as conn:
+            async with conn.cursor() as cur:
+                await cur.execute(f"USE {self._schema};")
+                try:
+                    (obj_id, size, manifest) = await self._load(cur, key)
+                finally:
+                    await conn.rollback()
+
+        if isinstance(manifest, ObjectStoreItem):
+            data = memoryview(manifest.data)[start:end]
+            for position in range(0, len(data), chunk_size):
+                yield bytes(data[position:position + chunk_size])
+            return
+
+        span = self._chunk_span(manifest, size, start, end)
+        if span is None:
+            return
+
+        (first, last, offset) = span
+        end = size if end is None else min(end, size)
+
+        # Load one stored chunk at a time, and split it into chunks of the requested size
+        for index in range(first, last + 1):
+            chunk = await self._get_chunk(key, obj_id, manifest, index)
+            data = memoryview(chunk)[max(start - offset, 0):min(end - offset, len(chunk))]
+            for position in range(0, len(data), chunk_size):
+                yield bytes(data[position:position + chunk_size])
+
+            offset += len(chunk)
+
+    @override
+    def open_upload(self,
+                    key: str,
+                    *,
+                    content_type: str | None = None,
+                    metadata: dict[str, str] | None = None,
+                    overwrite: bool = False) -> ObjectStoreUpload:
+
+        self._get_pool()
+
+        return MySQLChunkedUpload(self, key, content_type=content_type, metadata=metadata, overwrite=overwrite)
@@ -0,0 +1,323 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import copy
+from contextlib import asynccontextmanager
+from unittest.mock import patch
+
+import pytest
+
+from nat.data_models.object_store import NoSuchKeyError
+from nat.object_store.models import ObjectStoreItem
+from nat.plugins.mysql.mysql_object_store import MySQLObjectStore
+from nat.test.object_store_tests import ObjectStoreTests
+
+# These tests run the object store against an in-memory stand-in for an aiomysql connection pool, which understands
+# the statements issued by MySQLObjectStore. Transactions are isolated only from other connections' uncommitted
+# changes, which is enough for these tests as they do not run statements concurrently.
+
+
+class _FakeTables:
+
+    def __init__(self):
+        self.next_id = 1
+        self.object_meta: dict[str, list] = {}  # path -> [id, size]
+        self.object_data: dict[int, bytes] = {}  # id -> data
+        self.object_chunks: dict[tuple[int, int], bytes] = {}  # (id, chunk_index) -> data
+
+    def copy(self) -> "_FakeTables":
+        return copy.deepcopy(self)
+
+    def path_of(self, obj_id: int) -> str:
+        return next(path for (path, (meta_id, _)) in self.object_meta.items() if meta_id == obj_id)
+
+    def chunks_of(self, obj_id: int, first: int = 0, last: int | None = None) -> list[tuple[bytes]]:
+        indexes = sorted(index for (chunk_id, index) in self.object_chunks if chunk_id == obj_id)
+        return [(self.object_chunks[(obj_id, index)], ) for index in indexes
+                if index >= first and (last is None or index <= last)]
+
+
+class _FakeCursor:
+
+    def __init__(self, conn: "_FakeConnection"):
+        self._conn = conn
+        self._rows: list[tuple] = []
+        self.rowcount = 0
+
+    async def execute(self, query: str, args: tuple = ()) -> None:
+        sql = " ".join(query.split()).rstrip(";")
+        self._rows = []
+        self.rowcount = 0
+
+        if sql.startswith(("USE ", "SET ", "CREATE ", "START TRANSACTION")):
+            return
+
+        if sql.startswith("SELECT"):
+            self._select(sql, args, self._conn.tables)
+        else:
+            self._modify(sql, args, self._conn.begin_write())
+
+    def _select(self, sql: str, args: tuple, tables: _FakeTables) -> None:
+        if sql.startswith("SELECT m.id, m.size, d.data"):
+            meta = tables.object_meta.get(args[0])
+            if meta is not None and meta[0] in tables.object_data:
+                self._rows = [(meta[0], meta[1], tables.object_data[meta[0]])]
+        elif sql.startswith("SELECT id FROM object_meta"):
+            self._rows = [(tables.object_meta[args[0]][0], )]
+        elif sql.startswith("SELECT data FROM object_chunks WHERE id=%s ORDER BY"):
+            self._rows = tables.chunks_of(args[0])
+        elif sql.startswith("SELECT data FROM object_chunks WHERE id=%s AND chunk_index BETWEEN"):
+            self._rows = tables.chunks_of(*args)
+        elif sql.startswith("SELECT c.data, d.data"):
+            (obj_id, index) = args
+            if (obj_id, index) in tables.object_chunks and obj_id in tables.object_data:
+                self._rows = [(tables.object_chunks[(obj_id, index)], tables.object_data[obj_id])]
+        else:
+            raise AssertionError(f"Unexpected statement: {sql}")
+
+    def _modify(self, sql: str, args: tuple, tables: _FakeTables) -> None:
+        if sql.startswith("INSERT INTO object_meta"):
+            if args[0] in tables.object_meta:
+                tables.object_meta[args[0]][1] = 0
+                self.rowcount = 2
+            else:
+                self._insert_meta(tables, args[0])
+        elif sql.startswith("INSERT IGNORE INTO object_meta"):
+            if args[0] not in tables.object_meta:
+                self._insert_meta(tables, args[0])
+        elif sql.startswith("DELETE FROM object_chunks"):
+            for chunk_key in [chunk_key for chunk_key in tables.object_chunks if chunk_key[0] == args[0]]:
+                del tables.object_chunks[chunk_key]
+        elif sql.startswith("INSERT INTO object_chunks"):
+            (obj_id, index, data) = args
+            tables.object_chunks[(obj_id, index)] = data
+        elif sql.startswith("UPDATE object_meta SET size"):
+            (size, obj_id) = args
+            tables.object_meta[tables.path_of(obj_id)][1] = size
+        elif sql.startswith("REPLACE INTO object_data"):
+            (obj_id, data) = args
+            tables.object_data[obj_id] = data.encode() if isinstance(data, str) else data
+        elif sql.startswith("DELETE m, d"):
+            meta = tables.object_meta.get(args[0])
+            if meta is not None and meta[0] in tables.object_data:
+                obj_id = meta[0]
+                del tables.object_meta[args[0]]
+                del tables.object_data[obj_id]
+                # ON DELETE CASCADE
+                for chunk_key in [chunk_key for chunk_key in tables.object_chunks if chunk_key[0] == obj_id]:
+                    del tables.object_chunks[chunk_key]
+                self.rowcount = 2
+        else:
+            raise AssertionError(f"Unexpected statement: {sql}")
+
+    def _insert_meta(self, tables: _FakeTables, path: str) -> None:
+        tables.object_meta[path] = [tables.next_id, 0]
+        tables.next_id += 1
+        self.rowcount = 1
+
+    async def fetchone(self) -> tuple | None:
+        return self._rows[0] if self._rows else None
+
+    async def fetchall(self) -> list[tuple]:
+        return self._rows
+
+    async def close(self) -> None:
+        pass
+
+
+class _AwaitableContext:
+    """Mimics the aiomysql helpers which can be either awaited or used as an async context manager."""
+
+    def __init__(self, open_fn, close_fn):
+        self._open = open_fn
+        self._close = close_fn
+        self._value = None
+
+    def __await__(self):
+        return self._open().__await__()
+
+    async def __aenter__(self):
+        self._value = await self._open()
+        return self._value
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self._close(self._value)
+
+
+class _FakeConnection:
+
+    def __init__(self, pool: "_FakePool"):
+        self._pool = pool
+        self._pending: _FakeTables | None = None
+
+    @property
+    def tables(self) -> _FakeTables:
+        return self._pending if self._pending is not None else self._pool.tables
+
+    def begin_write(self) -> _FakeTables:
+        if self._pending is None:
+            self._pending = self._pool.tables.copy()
+        return self._pending
+
+    def cursor(self) -> _AwaitableContext:
+
+        async def _open():
+            return _FakeCursor(self)
+
+        async def _close(cur: _FakeCursor):
+            await cur.close()
+
+        return _AwaitableContext(_open, _close)
+
+    async def commit(self) -> None:
+        if self._pending is not None:
+            self._pool.tables = self._pending
+            self._pending = None
+
+    async def rollback(self) -> None:
+        self._pending = None
+
+
+class _FakePool:
+
+    def __init__(self):
+        self.tables = _FakeTables()
+        self.in_use = 0
+        self.max_in_use = 0
+
+    def acquire(self) -> _AwaitableContext:
+
+        async def _open():
+            self.in_use += 1
+            self.max_in_use = max(self.max_in_use, self.in_use)
+            return _FakeConnection(self)
+
+        async def _close(conn: _FakeConnection):
+            self.release(conn)
+
+        return _AwaitableContext(_open, _close)
+
+    def release(self, conn: _FakeConnection) -> None:
+        # Like aiomysql, uncommitted changes are discarded when a connection returns to the pool
+        conn._pending = None
+        self.in_use -= 1
+
+    def close(self) -> None:
+        pass
+
+    async def wait_closed(self) -> None:
+        pass
+
+
+@asynccontextmanager
+async def _mock_store(pool: _FakePool | None = None):
+
+    async def _create_pool(**_kwargs):
+        return pool if pool is not None else _FakePool()
+
+    with patch("nat.plugins.mysql.mysql_object_store.aiomysql.create_pool", _create_pool):
+        async with MySQLObjectStore(bucket_name="test", host="localhost", port=3306, username=None,
+                                    password=None) as store:
+            yield store
+
+
+class TestMySQLObjectStoreMockPool(ObjectStoreTests):
+
+    @asynccontextmanager
+    async def _get_store(self):
+        async with _mock_store() as store:
+            yield store
+
+
+@pytest.fixture(name="pool")
+def pool_fixture() -> _FakePool:
+    return _FakePool()
+
+
+@pytest.fixture(name="small_chunks")
+def small_chunks_fixture():
+    with patch.object(MySQLObjectStore, "CHUNK_SIZE", 4):
+        yield
+
+
+@pytest.mark.usefixtures("small_chunks")
+async def test_objects_are_stored_in_chunk_rows(pool: _FakePool):
+    async with _mock_store(pool) as store:
+        await store.put_object("key", ObjectStoreItem(data=b"0123456789", content_type="text/plain"))
+
+        (obj_id, size) = pool.tables.object_meta["key"]
+        assert size == 10
+        assert pool.tables.chunks_of(obj_id) == [(b"0123", ), (b"4567", ), (b"89", )]
+
+        await store.upsert_object("key", ObjectStoreItem(data=b"abcde"))
+        assert pool.tables.object_meta["key"] == [obj_id, 5]
+        assert pool.tables.chunks_of(obj_id) == [(b"abcd", ), (b"e", )]
+
+        assert (await store.get_object("key")).data == b"abcde"
+        assert await store.get_object_range("key", 3, 5) == b"de"
+        assert [chunk async for chunk in store.stream_object("key", 1, chunk_size=2)] == [b"bc", b"d", b"e"]
+        assert pool.in_use == 0
+
+
+async def test_read_legacy_single_row_format(pool: _FakePool):
+    item = ObjectStoreItem(data=b"stored by an earlier version", content_type="text/plain", metadata={"a": "b"})
+    pool.tables.object_meta["legacy"] = [42, len(item.data)]
+    pool.tables.object_data[42] = item.model_dump_json().encode()
+
+    async with _mock_store(pool) as store:
+        assert await store.get_object("legacy") == item
+
+        info = await store.get_object_info("legacy")
+        assert info.size == len(item.data)
+        assert info.content_type == "text/plain"
+        assert info.metadata == {"a": "b"}
+        assert info.etag is None
+
+        assert await store.get_object_range("legacy", 10, 12) == b"an"
+        assert b"".join([chunk async for chunk in store.stream_object("legacy", chunk_size=5)]) == item.data
+
+        await store.upsert_object("legacy", ObjectStoreItem(data=b"new"))
+        assert (await store.get_object("legacy")).data == b"new"
+
+
+@pytest.mark.usefixtures("small_chunks")
+async def test_stream_does_not_hold_a_connection(pool: _FakePool):
+    async with _mock_store(pool) as store:
+        await store.put_object("key", ObjectStoreItem(data=b"0123456789"))
+
+        chunks = []
+        async for chunk in store.stream_object("key", chunk_size=4):
+            assert pool.in_use == 0
+            chunks.append(chunk)
+
+        assert chunks == [b"0123", b"4567", b"89"]
+
+
+@pytest.mark.usefixtures("small_chunks")
+@pytest.mark.parametrize("replace", [True, False], ids=["replaced", "deleted"])
+async def test_stream_fails_if_object_changes(pool: _FakePool, replace: bool):
+    async with _mock_store(pool) as store:
+        await store.put_object("key", ObjectStoreItem(data=b"0123456789"))
+
+        stream = store.stream_object("key", chunk_size=4)
+        assert await anext(stream) == b"0123"
+
+        if replace:
+            await store.upsert_object("key", ObjectStoreItem(data=b"abcdefghij"))
+        else:
+            await store.delete_object("key")
+
+        with pytest.raises(NoSuchKeyError):
+            await anext(stream)
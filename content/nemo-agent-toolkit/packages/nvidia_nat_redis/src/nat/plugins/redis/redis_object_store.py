@@ -13,26 +13,157 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import json
 import logging
+import uuid
+from collections.abc import AsyncGenerator
 
 import redis.asyncio as redis
+from pydantic import BaseModel
+from pydantic import ConfigDict
 
 from nat.data_models.object_store import KeyAlreadyExistsError
 from nat.data_models.object_store import NoSuchKeyError
+from nat.object_store.interfaces import DEFAULT_CHUNK_SIZE
 from nat.object_store.interfaces import ObjectStore
+from nat.object_store.interfaces import ObjectStoreUpload
 from nat.object_store.models import ObjectStoreItem
+from nat.object_store.models import ObjectStoreItemInfo
 from nat.utils.type_utils import override
 
 logger = logging.getLogger(__name__)
 
 
+class _ObjectManifest(BaseModel):
+    """
+    Describes an object whose data is stored in chunks under separate keys, or in `inline_data` if the object is
+    smaller than a chunk.
+    """
+    model_config = ConfigDict(ser_json_bytes="base64", val_json_bytes="base64")
+
+    upload_id: str
+    size: int
+    chunk_size: int
+    num_chunks: int
+    inline_data: bytes | None = None
+    content_type: str | None = None
+    metadata: dict[str, str] | None = None
+
+
+class RedisChunkedUpload(ObjectStoreUpload):
+    """
+    Uploads an object to Redis one chunk at a time. The manifest is written last, so the object only becomes visible
+    once all of its chunks are stored.
+    """
+
+    def __init__(self,
+                 store: "RedisObjectStore",
+                 key: str,
+                 *,
+                 content_type: str | None,
+                 metadata: dict[str, str] | None,
+                 overwrite: bool):
+        self._store = store
+        self._key = key
+        self._content_type = content_type
+        self._metadata = metadata
+        self._overwrite = overwrite
+
+        self._upload_id = str(uuid.uuid4())
+        self._buffer = bytearray()
+        self._size = 0
+        self._num_chunks = 0
+
+    async def _write_chunk(self, data: bytes) -> None:
+        # Chunks expire unless the upload completes, so that abandoned uploads do not leak memory
+        await self._store._get_client().set(self._store._make_chunk_key(self._upload_id, self._num_chunks),
+                                            data,
+                                            ex=self._store.UPLOAD_TTL)
+        self._num_chunks += 1
+
+    async def write(self, data: bytes) -> None:
+        self._buffer += data
+        self._size += len(data)
+
+        chunk_size = self._store.CHUNK_SIZE
+        while len(self._buffer) >= chunk_size:
+            chunk = bytes(self._buffer[:chunk_size])
+            del self._buffer[:chunk_size]
+            await self._write_chunk(chunk)
+
+    async def complete(self) -> None:
+        client = self._store._get_client()
+
+        # Objects smaller than a chunk are stored in the manifest, saving a key and a round trip per read
+        inline_data = None
+        if self._num_chunks == 0:
+            inline_data = bytes(self._buffer)
+        elif self._buffer:
+            await self._write_chunk(bytes(self._buffer))
+        self._buffer = bytearray()
+
+        manifest = _ObjectManifest(upload_id=self._upload_id,
+                                   size=self._size,
+                                   chunk_size=self._store.CHUNK_SIZE,
+                                   num_chunks=self._num_chunks,
+                                   inline_data=inline_data,
+                                   content_type=self._content_type,
+                                   metadata=self._metadata)
+        full_key = self._store._make_key(self._key)
+
+        previous = None
+        try:
+            if self._num_chunks:
+                async with client.pipeline(transaction=False) as pipe:
+                    for index in range(self._num_chunks):
+                        pipe.persist(self._store._make_chunk_key(self._upload_id, index))
+                    await pipe.execute()
+
+            if self._overwrite:
+                previous = await client.set(full_key, manifest.model_dump_json(), get=True)
+            elif not await client.set(full_key, manifest.model_dump_json(), nx=True):
+                raise KeyAlreadyExistsError(key=self._key,
+                                            additional_message=f"Redis bucket {self._store._bucket_name} already has "
+                                            f"key {self._key}")
+        except Exception:
+            # The chunks were persisted, they would never expire if the manifest referencing them was not stored
+            await self.abort()
+            raise
+
+        if previous is not None:
+            await self._store._discard_chunks(previous)
+
+    async def abort(self) -> None:
+        self._buffer = bytearray()
+
+        if self._num_chunks:
+            await self._store._get_client().delete(
+                *(self._store._make_chunk_key(self._upload_id, index) for index in range(self._num_chunks)))
+            self._num_chunks = 0
+
+
 class RedisObjectStore(ObjectStore):
     """
     Implementation of ObjectStore that stores objects in Redis.
 
-    Each object is stored as a single binary value at key "nat/object_store/{bucket_name}/{object_key}".
+    The data of each object is stored in chunks of at most `CHUNK_SIZE` bytes at keys
+    "nat/object_store_chunks/{bucket_name}/{upload_id}/{index}", so that objects can be read in ranges and streamed.
+    A JSON manifest describing the chunks is stored at key "nat/object_store/{bucket_name}/{object_key}". Objects
+    smaller than `CHUNK_SIZE` are stored in the manifest instead of in a chunk. Objects stored by earlier versions as a
+    single JSON value at that key can still be read.
+
+    When an object is replaced or deleted its chunks expire after `REPLACED_CHUNK_TTL` seconds instead of being deleted
+    immediately, so that reads which are in progress can finish.
     """
 
+    CHUNK_SIZE = 1024 * 1024
+
+    # Seconds until the chunks of an upload which was never completed expire
+    UPLOAD_TTL = 24 * 60 * 60
+
+    # Seconds until the chunks of a replaced or deleted object expire
+    REPLACED_CHUNK_TTL = 60
+
     def __init__(self, *, bucket_name: str, host: str, port: int, db: int):
 
         super().__init__()
@@ -76,51 +207,182 @@ class RedisObjectStore(ObjectStore):
     def _make_key(self, key: str) -> str:
         return f"nat/object_store/{self._bucket_name}/{key}"
 
-    @override
-    async def put_object(self, key: str, item: ObjectStoreItem):
+    def _make_chunk_key(self, upload_id: str, index: int) -> str:
+        return f"nat/object_store_chunks/{self._bucket_name}/{upload_id}/{index}"
 
+    def _get_client(self) -> redis.Redis:
         if not self._client:
             raise RuntimeError("Connection not established")
 
-        full_key = self._make_key(key)
+        return self._client
 
-        item_json = item.model_dump_json()
-        # Redis SET with NX ensures we do not overwrite existing keys
-        if not await self._client.set(full_key, item_json, nx=True):
-            raise KeyAlreadyExistsError(key=key,
-                                        additional_message=f"Redis bucket {self._bucket_name} already has key {key}")
+    @staticmethod
+    def _parse_value(value: bytes) -> _ObjectManifest | ObjectStoreItem:
+        parsed = json.loads(value)
+        if "data" in parsed:
+            # Stored as a single value by an earlier version
+            return ObjectStoreItem.model_validate(parsed)
+
+        return _ObjectManifest.model_validate(parsed)
+
+    async def _load(self, key: str) -> _ObjectManifest | ObjectStoreItem:
+        value = await self._get_client().get(self._make_key(key))
+        if value is None:
+            raise NoSuchKeyError(key=key,
+                                 additional_message=f"Redis bucket {self._bucket_name} does not have key {key}")
+
+        return self._parse_value(value)
+
+    @staticmethod
+    def _inline_data(manifest: _ObjectManifest | ObjectStoreItem) -> bytes | None:
+        """Get the data of an object which is stored with its manifest, or None if it is stored in chunks."""
+        if isinstance(manifest, ObjectStoreItem):
+            return manifest.data
+
+        return manifest.inline_data
+
+    async def _discard_chunks(self, value: bytes) -> None:
+        manifest = self._parse_value(value)
+        if not isinstance(manifest, _ObjectManifest) or manifest.num_chunks == 0:
+            return
+
+        async with self._get_client().pipeline(transaction=False) as pipe:
+            for index in range(manifest.num_chunks):
+                pipe.expire(self._make_chunk_key(manifest.upload_id, index), self.REPLACED_CHUNK_TTL)
+            await pipe.execute()
+
+    async def _get_chunks(self, key: str, manifest: _ObjectManifest, first: int, last: int) -> list[bytes]:
+        """Get chunks `first` to `last` (inclusive) of an object."""
+        chunks = await self._get_client().mget(
+            [self._make_chunk_key(manifest.upload_id, index) for index in range(first, last + 1)])
+        if any(chunk is None for chunk in chunks):
+            raise NoSuchKeyError(key=key,
+                                 additional_message=f"Redis bucket {self._bucket_name} key {key} was replaced or "
+                                 "deleted while it was being read")
+
+        return chunks
+
+    @staticmethod
+    def _chunk_span(manifest: _ObjectManifest, start: int, end: int | None) -> tuple[int, int, int] | None:
+        """Get the first and last chunk holding the range, and the absolute offset of the first chunk."""
+        end = manifest.size if end is None else min(end, manifest.size)
+        if start >= end:
+            return None
+
+        first = start // manifest.chunk_size
+        last = (end - 1) // manifest.chunk_size
+        return (first, last, first * manifest.chunk_size)
 
     @override
-    async def upsert_object(self, key: str, item: ObjectStoreItem):
+    async def put_object(self, key: str, item: ObjectStoreItem):
 
-        if not self._client:
-            raise RuntimeError("Connection not established")
+        async with self.open_upload(key, content_type=item.content_type, metadata=item.metadata) as upload:
+            await upload.write(item.data)
+
+    @override
+    async def upsert_object(self, key: str, item: ObjectStoreItem):
 
-        full_key = self._make_key(key)
-        item_json = item.model_dump_json()
-        await self._client.set(full_key, item_json)
+        async with self.open_upload(key, content_type=item.content_type, metadata=item.metadata,
+                                    overwrite=True) as upload:
+            await upload.write(item.data)
 
     @override
     async def get_object(self, key: str) -> ObjectStoreItem:
 
-        if not self._client:
-            raise RuntimeError("Connection not established")
+        manifest = await self._load(key)
+        if isinstance(manifest, ObjectStoreItem):
+            return manifest
 
-        full_key = self._make_key(key)
-        data = await self._client.get(full_key)
+        data = manifest.inline_data
         if data is None:
-            raise NoSuchKeyError(key=key,
-                                 additional_message=f"Redis bucket {self._bucket_name} does not have key {key}")
-        return ObjectStoreItem.model_validate_json(data)
+            data = b"".join(await self._get_chunks(key, manifest, 0, manifest.num_chunks - 1))
+
+        return ObjectStoreItem(data=data, content_type=manifest.content_type, metadata=manifest.metadata)
 
     @override
     async def delete_object(self, key: str):
 
-        if not self._client:
-            raise RuntimeError("Connection not established")
-
-        full_key = self._make_key(key)
-        deleted = await self._client.delete(full_key)
-        if deleted == 0:
+        value = await self._get_client().getdel(self._make_key(key))
+        if value is None:
             raise NoSuchKeyError(key=key,
                                  additional_message=f"Redis bucket {self._bucket_name} does not have key {key}")
+
+        await self._discard_chunks(value)
+
+    @override
+    async def get_object_info(self, key: str) -> ObjectStoreItemInfo:
+
+        manifest = await self._load(key)
+        if isinstance(manifest, ObjectStoreItem):
+            return ObjectStoreItemInfo(size=len(manifest.data),
+                                       content_type=manifest.content_type,
+                                       metadata=manifest.metadata)
+
+        return ObjectStoreItemInfo(size=manifest.size,
+                                   content_type=manifest.content_type,
+                                   metadata=manifest.metadata,
+                                   etag=manifest.upload_id)
+
+    @override
+    async def get_object_range(self, key: str, start: int = 0, end: int | None = None) -> bytes:
+        self._check_range(start, end)
+
+        manifest = await self._load(key)
+        data = self._inline_data(manifest)
+        if data is not None:
+            return data[start:end]
+
+        span = self._chunk_span(manifest, start, end)
+        if span is None:
+            return b""
+
+        (first, last, offset) = span
+        data = b"".join(await self._get_chunks(key, manifest, first, last))
+        return data[start - offset:None if end is None else end - offset]
+
+    @override
+    async def stream_object(self,
+                            key: str,
+                            start: int = 0,
+                            end: int | None = None,
+                            chunk_size: int = DEFAULT_CHUNK_SIZE) -> AsyncGenerator[bytes]:
+        self._check_range(start, end)
+        self._check_chunk_size(chunk_size)
+
+        manifest = await self._load(key)
+        data = self._inline_data(manifest)
+        if data is not None:
+            data = memoryview(data)[start:end]
+            for offset in range(0, len(data), chunk_size):
+                yield bytes(data[offset:offset + chunk_size])
+            return
+
+        span = self._chunk_span(manifest, start, end)
+        if span is None:
+            return
+
+        (first, last, offset) = span
+        end = manifest.size if end is None else min(end, manifest.size)
+
+        # Load one stored chunk at a time, and split it into chunks of the requested size
+        for index in range(first, last + 1):
+            (chunk, ) = await self._get_chunks(key, manifest, index, index)
+            chunk_start = max(start - offset, 0)
+            chunk_end = min(end - offset, len(chunk))
+            data = memoryview(chunk)[chunk_start:chunk_end]
+            for position in range(0, len(data), chunk_size):
+                yield bytes(data[position:position + chunk_size])
+
+            offset += len(chunk)
+
+    @override
+    def open_upload(self,
+                    key: str,
+                    *,
+                    content_type: str | None = None,
+                    metadata: dict[str, str] | None = None,
+                    overwrite: bool = False) -> ObjectStoreUpload:
+
+        self._get_client()
+
+        return RedisChunkedUpload(self, key, content_type=content_type, metadata=metadata, overwrite=overwrite)
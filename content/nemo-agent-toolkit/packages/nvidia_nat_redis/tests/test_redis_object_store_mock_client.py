@@ -0,0 +1,207 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+from contextlib import asynccontextmanager
+from unittest.mock import patch
+
+import pytest
+
+from nat.data_models.object_store import KeyAlreadyExistsError
+from nat.object_store.models import ObjectStoreItem
+from nat.plugins.redis.redis_object_store import RedisObjectStore
+from nat.test.object_store_tests import ObjectStoreTests
+
+# These tests run the object store against an in-memory stand-in for a redis.asyncio client, which implements the
+# commands used by RedisObjectStore. Keys never actually expire, their TTL is only recorded.
+
+
+class _FakePipeline:
+
+    def __init__(self, client: "_FakeRedis"):
+        self._client = client
+        self._commands = []
+
+    async def __aenter__(self) -> "_FakePipeline":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        pass
+
+    def persist(self, name: str) -> None:
+        self._commands.append((self._client.persist, name))
+
+    def expire(self, name: str, seconds: int) -> None:
+        self._commands.append((self._client.expire, name, seconds))
+
+    async def execute(self) -> list:
+        self._client.check_failure("pipeline")
+        return [command(*args) for (command, *args) in self._commands]
+
+
+class _FakeRedis:
+
+    def __init__(self):
+        self.values: dict[str, bytes] = {}
+        self.ttls: dict[str, int] = {}
+        self.fail_on: str | None = None
+
+    def check_failure(self, command: str) -> None:
+        if self.fail_on == command:
+            raise ConnectionError(f"Connection lost during {command}")
+
+    async def ping(self) -> bool:
+        return True
+
+    async def close(self) -> None:
+        pass
+
+    async def set(self, name: str, value: str | bytes, ex: int | None = None, nx: bool = False, get: bool = False):
+        if not name.startswith("nat/object_store_chunks/"):
+            self.check_failure("manifest set")
+        previous = self.values.get(name)
+        if nx and previous is not None:
+            return None
+
+        self.values[name] = value.encode() if isinstance(value, str) else value
+        self.ttls.pop(name, None)
+        if ex is not None:
+            self.ttls[name] = ex
+
+        return previous if get else True
+
+    async def get(self, name: str) -> bytes | None:
+        return self.values.get(name)
+
+    async def getdel(self, name: str) -> bytes | None:
+        self.ttls.pop(name, None)
+        return self.values.pop(name, None)
+
+    async def mget(self, keys: list[str]) -> list[bytes | None]:
+        assert keys, "MGET requires at least one key"
+        return [self.values.get(key) for key in keys]
+
+    async def delete(self, *names: str) -> int:
+        deleted = [name for name in names if self.values.pop(name, None) is not None]
+        for name in names:
+            self.ttls.pop(name, None)
+        return len(deleted)
+
+    def persist(self, name: str) -> bool:
+        return self.ttls.pop(name, None) is not None
+
+    def expire(self, name: str, seconds: int) -> bool:
+        if name not in self.values:
+            return False
+        self.ttls[name] = seconds
+        return True
+
+    def pipeline(self, transaction: bool = True) -> _FakePipeline:
+        return _FakePipeline(self)
+
+    def chunk_keys(self) -> list[str]:
+        return sorted(key for key in self.values if key.startswith("nat/object_store_chunks/"))
+
+
+@asynccontextmanager
+async def _mock_store(client: _FakeRedis | None = None):
+    with patch("nat.plugins.redis.redis_object_store.redis.Redis", return_value=client or _FakeRedis()):
+        async with RedisObjectStore(bucket_name="test", host="localhost", port=6379, db=0) as store:
+            yield store
+
+
+class TestRedisObjectStoreMockClient(ObjectStoreTests):
+
+    @asynccontextmanager
+    async def _get_store(self):
+        async with _mock_store() as store:
+            yield store
+
+
+@pytest.fixture(name="client")
+def client_fixture() -> _FakeRedis:
+    return _FakeRedis()
+
+
+@pytest.fixture(name="small_chunks")
+def small_chunks_fixture():
+    with patch.object(RedisObjectStore, "CHUNK_SIZE", 4):
+        yield
+
+
+@pytest.mark.usefixtures("small_chunks")
+async def test_small_objects_are_stored_inline(client: _FakeRedis):
+    async with _mock_store(client) as store:
+        await store.put_object("small", ObjectStoreItem(data=b"abc", content_type="text/plain"))
+        await store.put_object("empty", ObjectStoreItem(data=b""))
+
+        assert client.chunk_keys() == []
+        assert (await store.get_object("small")).data == b"abc"
+        assert (await store.get_object("empty")).data == b""
+        assert await store.get_object_range("small", 1) == b"bc"
+        assert [chunk async for chunk in store.stream_object("small", chunk_size=2)] == [b"ab", b"c"]
+
+        info = await store.get_object_info("small")
+        assert info.size == 3
+        assert info.content_type == "text/plain"
+        assert info.etag is not None
+
+        # Objects of at least one chunk are stored in chunks
+        await store.upsert_object("small", ObjectStoreItem(data=b"abcdefghij"))
+        assert len(client.chunk_keys()) == 3
+        assert json.loads(client.values["nat/object_store/test/small"]).get("inline_data") is None
+        assert (await store.get_object("small")).data == b"abcdefghij"
+
+        # Replacing a chunked object with an inline one discards the chunks
+        await store.upsert_object("small", ObjectStoreItem(data=b"xyz"))
+        assert all(client.ttls[key] == RedisObjectStore.REPLACED_CHUNK_TTL for key in client.chunk_keys())
+        assert (await store.get_object("small")).data == b"xyz"
+
+
+@pytest.mark.usefixtures("small_chunks")
+@pytest.mark.parametrize("fail_on", ["pipeline", "manifest set"])
+async def test_failed_upload_does_not_leak_chunks(client: _FakeRedis, fail_on: str):
+    async with _mock_store(client) as store:
+        client.fail_on = fail_on
+        with pytest.raises(ConnectionError):
+            await store.put_object("key", ObjectStoreItem(data=b"0123456789"))
+
+        assert client.chunk_keys() == []
+        assert "nat/object_store/test/key" not in client.values
+
+
+@pytest.mark.usefixtures("small_chunks")
+async def test_existing_key_does_not_leak_chunks(client: _FakeRedis):
+    async with _mock_store(client) as store:
+        await store.put_object("key", ObjectStoreItem(data=b"0123456789"))
+        chunk_keys = client.chunk_keys()
+
+        with pytest.raises(KeyAlreadyExistsError):
+            await store.put_object("key", ObjectStoreItem(data=b"abcdefghij"))
+
+        assert client.chunk_keys() == chunk_keys
+        assert not any(key in client.ttls for key in chunk_keys)
+        assert (await store.get_object("key")).data == b"0123456789"
+
+
+async def test_read_legacy_single_value_format(client: _FakeRedis):
+    item = ObjectStoreItem(data=b"stored by an earlier version", content_type="text/plain", metadata={"a": "b"})
+    client.values["nat/object_store/test/legacy"] = item.model_dump_json().encode()
+
+    async with _mock_store(client) as store:
+        assert await store.get_object("legacy") == item
+        assert (await store.get_object_info("legacy")).etag is None
+        assert await store.get_object_range("legacy", 10, 12) == b"an"
+        assert b"".join([chunk async for chunk in store.stream_object("legacy", chunk_size=5)]) == item.data
@@ -14,6 +14,7 @@
 # limitations under the License.
 
 import logging
+from collections.abc import AsyncGenerator
 
 import aioboto3
 from botocore.client import BaseClient
@@ -21,17 +22,141 @@ from botocore.exceptions import ClientError
 
 from nat.data_models.object_store import KeyAlreadyExistsError
 from nat.data_models.object_store import NoSuchKeyError
+from nat.object_store.interfaces import DEFAULT_CHUNK_SIZE
 from nat.object_store.interfaces import ObjectStore
+from nat.object_store.interfaces import ObjectStoreUpload
 from nat.object_store.models import ObjectStoreItem
+from nat.object_store.models import ObjectStoreItemInfo
 
 logger = logging.getLogger(__name__)
 
 
+def _is_no_such_key(e: ClientError) -> bool:
+    # HEAD responses have no body, so a missing key is only reported by its status code
+    return e.response['Error']['Code'] in ('NoSuchKey', '404')
+
+
+def _is_invalid_range(e: ClientError) -> bool:
+    return e.response['Error']['Code'] == 'InvalidRange'
+
+
+def _is_precondition_failed(e: ClientError) -> bool:
+    return e.response.get("ResponseMetadata", {}).get("HTTPStatusCode", None) == 412
+
+
+class S3MultipartUpload(ObjectStoreUpload):
+    """
+    Uploads an object to S3 in parts of `part_size` bytes, so that only about one part is held in memory at a time.
+    Objects smaller than one part are saved with a single PutObject request.
+    """
+
+    def __init__(self,
+                 store: "S3ObjectStore",
+                 key: str,
+                 *,
+                 content_type: str | None,
+                 metadata: dict[str, str] | None,
+                 overwrite: bool,
+                 part_size: int):
+        self._store = store
+        self._key = key
+        self._content_type = content_type
+        self._metadata = metadata
+        self._overwrite = overwrite
+        self._part_size = part_size
+
+        self._buffer = bytearray()
+        self._upload_id: str | None = None
+        self._parts: list[dict] = []
+
+    async def _upload_part(self, data: bytes) -> None:
+        client = self._store._get_client()
+
+        if self._upload_id is None:
+            create_args = {"Bucket": self._store.bucket_name, "Key": self._key}
+            if self._content_type:
+                create_args["ContentType"] = self._content_type
+            if self._metadata:
+                create_args["Metadata"] = self._metadata
+
+            response = await client.create_multipart_upload(**create_args)
+            self._upload_id = response["UploadId"]
+
+        part_number = len(self._parts) + 1
+        response = await client.upload_part(Bucket=self._store.bucket_name,
+                                            Key=self._key,
+                                            UploadId=self._upload_id,
+                                            PartNumber=part_number,
+                                            Body=data)
+        self._parts.append({"ETag": response["ETag"], "PartNumber": part_number})
+
+    async def write(self, data: bytes) -> None:
+        self._buffer += data
+
+        while len(self._buffer) >= self._part_size:
+            part = bytes(self._buffer[:self._part_size])
+            del self._buffer[:self._part_size]
+            await self._upload_part(part)
+
+    async def complete(self) -> None:
+        if self._upload_id is None:
+            # Smaller than one part
+            item = ObjectStoreItem(data=bytes(self._buffer), content_type=self._content_type, metadata=self._metadata)
+            self._buffer = bytearray()
+            if self._overwrite:
+                await self._store.upsert_object(self._key, item)
+            else:
+                await self._store.put_object(self._key, item)
+            return
+
+        if self._buffer:
+            # The last part may be smaller than the minimum part size
+            await self._upload_part(bytes(self._buffer))
+            self._buffer = bytearray()
+
+        complete_args = {
+            "Bucket": self._store.bucket_name,
+            "Key": self._key,
+            "UploadId": self._upload_id,
+            "MultipartUpload": {
+                "Parts": self._parts
+            },
+        }
+        if not self._overwrite:
+            complete_args["IfNoneMatch"] = '*'
+
+        try:
+            await self._store._get_client().complete_multipart_upload(**complete_args)
+        except ClientError as e:
+            await self.abort()
+            if _is_precondition_failed(e):
+                raise KeyAlreadyExistsError(
+                    key=self._key,
+                    additional_message=f"S3 object {self._store.bucket_name}/{self._key} already exists",
+                ) from e
+            raise
+
+        self._upload_id = None
+
+    async def abort(self) -> None:
+        self._buffer = bytearray()
+
+        if self._upload_id is not None:
+            upload_id = self._upload_id
+            self._upload_id = None
+            await self._store._get_client().abort_multipart_upload(Bucket=self._store.bucket_name,
+                                                                   Key=self._key,
+                                                                   UploadId=upload_id)
+
+
 class S3ObjectStore(ObjectStore):
     """
     S3ObjectStore is an ObjectStore implementation that uses S3 as the underlying storage.
     """
 
+    # Size of the parts of multipart uploads, S3 requires every part except the last to be at least 5 MiB
+    MULTIPART_PART_SIZE = 8 * 1024 * 1024
+
     def __init__(self,
                  *,
                  bucket_name: str,
@@ -87,6 +212,12 @@ class S3ObjectStore(ObjectStore):
         self._client = None
         self._client_context = None
 
+    def _get_client(self) -> BaseClient:
+        if self._client is None:
+            raise RuntimeError("Connection not established")
+
+        return self._client
+
     async def put_object(self, key: str, item: ObjectStoreItem) -> None:
 
         if self._client is None:
@@ -164,3 +295,82 @@ class S3ObjectStore(ObjectStore):
 
         if results.get('DeleteMarker', False):
             raise NoSuchKeyError(key=key, additional_message="Object was a delete marker")
+
+    async def get_object_info(self, key: str) -> ObjectStoreItemInfo:
+        client = self._get_client()
+
+        try:
+            response = await client.head_object(Bucket=self.bucket_name, Key=key)
+        except ClientError as e:
+            if _is_no_such_key(e):
+                raise NoSuchKeyError(key=key, additional_message=str(e)) from e
+            raise
+
+        return ObjectStoreItemInfo(size=response['ContentLength'],
+                                   content_type=response.get('ContentType'),
+                                   metadata=response.get('Metadata'),
+                                   etag=response.get('ETag', '').strip('"') or None)
+
+    async def _get_range_response(self, key: str, start: int, end: int | None) -> dict | None:
+        """Send a ranged GetObject request, returning None if the range is empty."""
+        client = self._get_client()
+
+        if end == start:
+            # An empty range can not be requested, only check the object exists
+            await self.get_object_info(key)
+            return None
+
+        byte_range = f"bytes={start}-" if end is None else f"bytes={start}-{end - 1}"
+        try:
+            return await client.get_object(Bucket=self.bucket_name, Key=key, Range=byte_range)
+        except ClientError as e:
+            if _is_no_such_key(e):
+                raise NoSuchKeyError(key=key, additional_message=str(e)) from e
+            if _is_invalid_range(e):
+                # The range starts past the end of the object
+                return None
+            raise
+
+    async def get_object_range(self, key: str, start: int = 0, end: int | None = None) -> bytes:
+        self._check_range(start, end)
+
+        response = await self._get_range_response(key, start, end)
+        if response is None:
+            return b""
+
+        body = response["Body"]
+        async with body:
+            return await body.read()
+
+    async def stream_object(self,
+                            key: str,
+                            start: int = 0,
+                            end: int | None = None,
+                            chunk_size: int = DEFAULT_CHUNK_SIZE) -> AsyncGenerator[bytes]:
+        self._check_range(start, end)
+        self._check_chunk_size(chunk_size)
+
+        response = await self._get_range_response(key, start, end)
+        if response is None:
+            return
+
+        # Closing the body releases the connection if the caller stops early
+        body = response["Body"]
+        async with body:
+            async for chunk in body.iter_chunks(chunk_size):
+                yield chunk
+
+    def open_upload(self,
+                    key: str,
+                    *,
+                    content_type: str | None = None,
+                    metadata: dict[str, str] | None = None,
+                    overwrite: bool = False) -> ObjectStoreUpload:
+        self._get_client()
+
+        return S3MultipartUpload(self,
+                                 key,
+                                 content_type=content_type,
+                                 metadata=metadata,
+                                 overwrite=overwrite,
+                                 part_size=self.MULTIPART_PART_SIZE)
@@ -13,6 +13,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import hashlib
+import tracemalloc
 import uuid
 from abc import abstractmethod
 from contextlib import asynccontextmanager
@@ -25,6 +27,21 @@ from nat.data_models.object_store import NoSuchKeyError
 from nat.object_store.interfaces import ObjectStore
 from nat.object_store.models import ObjectStoreItem
 
+LARGE_OBJECT_SIZE = 24 * 1024 * 1024
+LARGE_OBJECT_CHUNK_SIZE = 1024 * 1024
+
+
+async def _generate_chunks(size: int, chunk_size: int):
+    """Yield `size` bytes of non repeating data, so that misordered chunks are detected."""
+    for offset in range(0, size, chunk_size):
+        length = min(chunk_size, size - offset)
+        block = hashlib.sha256(offset.to_bytes(8, "big")).digest()
+        yield (block * (length // len(block) + 1))[:length]
+
+
+async def _collect(chunks) -> bytes:
+    return b"".join([chunk async for chunk in chunks])
+
 
 @pytest.mark.asyncio(loop_scope="class")
 class ObjectStoreTests:
@@ -115,3 +132,169 @@ class ObjectStoreTests:
         # Try to delete the object again
         with pytest.raises(NoSuchKeyError):
             await store.delete_object(key)
+
+    async def test_get_object_info(self, store: ObjectStore):
+        key = f"test_key_{uuid.uuid4()}"
+
+        item = ObjectStoreItem(data=b"test_value", content_type="text/plain", metadata={"key": "value"})
+        await store.put_object(key, item)
+
+        info = await store.get_object_info(key)
+        assert info.size == len(b"test_value")
+        assert info.content_type == "text/plain"
+        assert info.metadata == {"key": "value"}
+
+        with pytest.raises(NoSuchKeyError):
+            await store.get_object_info(f"test_key_{uuid.uuid4()}")
+
+        # The ETag, if the object store provides one, changes when the object is replaced with different data
+        if info.etag is not None:
+            assert (await store.get_object_info(key)).etag == info.etag
+            await store.upsert_object(key, ObjectStoreItem(data=b"new_value"))
+            assert (await store.get_object_info(key)).etag != info.etag
+
+    async def test_get_object_range(self, store: ObjectStore):
+        key = f"test_key_{uuid.uuid4()}"
+        data = b"0123456789"
+
+        await store.put_object(key, ObjectStoreItem(data=data))
+
+        for (start, end) in ((0, None), (2, 5), (3, None), (5, 5), (8, 20), (10, None), (15, 20)):
+            assert await store.get_object_range(key, start, end) == data[start:end]
+
+        with pytest.raises(ValueError):
+            await store.get_object_range(key, -1)
+
+        with pytest.raises(ValueError):
+            await store.get_object_range(key, 5, 4)
+
+        with pytest.raises(NoSuchKeyError):
+            await store.get_object_range(f"test_key_{uuid.uuid4()}", 0, 5)
+
+    async def test_stream_object(self, store: ObjectStore):
+        key = f"test_key_{uuid.uuid4()}"
+        data = b"0123456789"
+
+        await store.put_object(key, ObjectStoreItem(data=data))
+
+        chunks = [chunk async for chunk in store.stream_object(key, chunk_size=4)]
+        assert b"".join(chunks) == data
+        assert all(0 < len(chunk) <= 4 for chunk in chunks)
+
+        assert await _collect(store.stream_object(key, 3, 8, chunk_size=2)) == data[3:8]
+        assert await _collect(store.stream_object(key, 20)) == b""
+
+        with pytest.raises(NoSuchKeyError):
+            await _collect(store.stream_object(f"test_key_{uuid.uuid4()}"))
+
+    async def test_open_upload(self, store: ObjectStore):
+        key = f"test_key_{uuid.uuid4()}"
+
+        async with store.open_upload(key, content_type="text/plain", metadata={"key": "value"}) as upload:
+            await upload.write(b"test_")
+            await upload.write(b"value")
+
+        retrieved_item = await store.get_object(key)
+        assert retrieved_item.data == b"test_value"
+        assert retrieved_item.content_type == "text/plain"
+        assert retrieved_item.metadata == {"key": "value"}
+
+        # Uploads do not overwrite existing objects unless asked to
+        with pytest.raises(KeyAlreadyExistsError):
+            async with store.open_upload(key) as upload:
+                await upload.write(b"new_value")
+
+        async with store.open_upload(key, overwrite=True) as upload:
+            await upload.write(b"new_value")
+
+        assert (await store.get_object(key)).data == b"new_value"
+
+    async def test_abort_upload(self, store: ObjectStore):
+        key = f"test_key_{uuid.uuid4()}"
+
+        upload = store.open_upload(key)
+        await upload.write(b"test_value")
+        await upload.abort()
+
+        with pytest.raises(NoSuchKeyError):
+            await store.get_object(key)
+
+        # An exception in the context aborts the upload
+        with pytest.raises(RuntimeError):
+            async with store.open_upload(key) as upload:
+                await upload.write(b"test_value")
+                raise RuntimeError("Upload failed")
+
+        with pytest.raises(NoSuchKeyError):
+            await store.get_object(key)
+
+    async def test_put_object_stream(self, store: ObjectStore):
+        key = f"test_key_{uuid.uuid4()}"
+
+        size = await store.put_object_stream(key, _generate_chunks(100, 7), content_type="application/octet-stream")
+        assert size == 100
+
+        expected = await _collect(_generate_chunks(100, 7))
+        retrieved_item = await store.get_object(key)
+        assert retrieved_item.data == expected
+        assert retrieved_item.content_type == "application/octet-stream"
+
+        with pytest.raises(KeyAlreadyExistsError):
+            await store.put_object_stream(key, _generate_chunks(100, 7))
+
+        assert await store.upsert_object_stream(key, _generate_chunks(10, 3)) == 10
+        assert (await store.get_object(key)).data == await _collect(_generate_chunks(10, 3))
+
+        # Objects uploaded with put_object can be streamed and replaced with streams, and vice versa
+        await store.upsert_object(key, ObjectStoreItem(data=b"test_value"))
+        assert await _collect(store.stream_object(key, 5)) == b"value"
+
+    async def test_large_object(self, store: ObjectStore):
+        key = f"test_key_{uuid.uuid4()}"
+
+        size = await store.put_object_stream(key, _generate_chunks(LARGE_OBJECT_SIZE, LARGE_OBJECT_CHUNK_SIZE))
+        assert size == LARGE_OBJECT_SIZE
+        assert (await store.get_object_info(key)).size == LARGE_OBJECT_SIZE
+
+        expected = hashlib.sha256()
+        async for chunk in _generate_chunks(LARGE_OBJECT_SIZE, LARGE_OBJECT_CHUNK_SIZE):
+            expected.update(chunk)
+
+        actual = hashlib.sha256()
+        async for chunk in store.stream_object(key):
+            actual.update(chunk)
+
+        assert actual.hexdigest() == expected.hexdigest()
+
+        # A range crossing a chunk boundary, at an odd offset
+        start = 3 * LARGE_OBJECT_CHUNK_SIZE - 1001
+        end = start + LARGE_OBJECT_CHUNK_SIZE + 2002
+        full_data = await _collect(_generate_chunks(end, LARGE_OBJECT_CHUNK_SIZE))
+        assert await store.get_object_range(key, start, end) == full_data[start:end]
+
+        await store.delete_object(key)
+        with pytest.raises(NoSuchKeyError):
+            await store.get_object_info(key)
+
+    async def test_stream_object_memory_ceiling(self, store: ObjectStore):
+        if type(store).stream_object is ObjectStore.stream_object:
+            pytest.skip("The object store does not stream objects natively")
+
+        key = f"test_key_{uuid.uuid4()}"
+        await store.put_object_stream(key, _generate_chunks(LARGE_OBJECT_SIZE, LARGE_OBJECT_CHUNK_SIZE))
+
+        size = 0
+        tracemalloc.start()
+        try:
+            async for chunk in store.stream_object(key, chunk_size=LARGE_OBJECT_CHUNK_SIZE):
+                size += len(chunk)
+            (_, peak) = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert size == LARGE_OBJECT_SIZE
+
+        # Only a few chunks may be held in memory at a time
+        assert peak < LARGE_OBJECT_SIZE / 4
+
+        await store.delete_object(key)
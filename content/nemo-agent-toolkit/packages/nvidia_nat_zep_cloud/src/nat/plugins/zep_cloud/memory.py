@@ -49,6 +49,9 @@ async def zep_memory_client(config: ZepMemoryClientConfig, builder: Builder):
         memory_editor = patch_with_retry(memory_editor,
                                          retries=config.num_retries,
                                          retry_codes=config.retry_on_status_codes,
-                                         retry_on_messages=config.retry_on_errors)
+                                         retry_on_messages=config.retry_on_errors,
+                                         backoff_strategy=config.backoff_strategy,
+                                         retry_budget=config.retry_budget,
+                                         circuit_breaker=config.circuit_breaker)
 
     yield memory_editor
@@ -78,6 +78,10 @@ class ReWOOAgentGraph(BaseAgent):
 
     Args:
         detailed_logs: Toggles logging of inputs, outputs, and intermediate steps.
+        dataflow_execution: If True, the executor starts each step as soon as the steps it depends on have finished,
+            and executes the whole plan in a single graph step. Otherwise, the steps are executed level by level.
+        max_concurrent_tool_calls: Maximum number of tool calls running at the same time. If None, there is no limit.
+        tool_rate_limits: Maximum number of calls per second, by tool name. Tools not listed are not rate limited.
     """
 
     def __init__(self,
@@ -90,7 +94,10 @@ class ReWOOAgentGraph(BaseAgent):
                  detailed_logs: bool = False,
                  log_response_max_chars: int = 1000,
                  tool_call_max_retries: int = 3,
-                 raise_tool_call_error: bool = True):
+                 raise_tool_call_error: bool = True,
+                 dataflow_execution: bool = False,
+                 max_concurrent_tool_calls: int | None = None,
+                 tool_rate_limits: dict[str, float] | None = None):
         super().__init__(llm=llm,
                          tools=tools,
                          callbacks=callbacks,
@@ -115,6 +122,12 @@ class ReWOOAgentGraph(BaseAgent):
         self.tools_dict = {tool.name: tool for tool in tools}
         self.tool_call_max_retries = tool_call_max_retries
         self.raise_tool_call_error = raise_tool_call_error
+        self.dataflow_execution = dataflow_execution
+        self.max_concurrent_tool_calls = max_concurrent_tool_calls
+        self.tool_rate_limits = tool_rate_limits or {}
+
+        # The earliest time the next call of each rate limited tool may start
+        self._tool_next_call_time: dict[str, float] = {}
 
         logger.debug("%s Initialized ReWOO Agent Graph", AGENT_LOG_PREFIX)
 
@@ -159,6 +172,25 @@ class ReWOOAgentGraph(BaseAgent):
         except Exception as ex:
             raise ValueError(f"The output of planner is invalid JSON format: {planner_output}") from ex
 
+    @staticmethod
+    def _get_dependencies(evidence_map: dict[str, ReWOOPlanStep]) -> dict[str, list[str]]:
+        """
+        Get the placeholders each step depends on, i.e. the other placeholders referenced in its tool input.
+
+        Args:
+            evidence_map: mapping from evidence placeholders to step info.
+
+        Returns:
+            A mapping from evidence placeholders to the placeholders they depend on.
+        """
+        return {
+            placeholder: [
+                var for var in re.findall(r"#E\d+", str(step.evidence.tool_input))
+                if var in evidence_map and var != placeholder
+            ]
+            for placeholder, step in evidence_map.items()
+        }
+
     @staticmethod
     def _parse_planner_dependencies(steps: list[ReWOOPlanStep]) -> tuple[dict[str, ReWOOPlanStep], list[list[str]]]:
         """
@@ -178,13 +210,7 @@ class ReWOOAgentGraph(BaseAgent):
         }
 
         # Second pass: find dependencies now that we have all placeholders
-        dependencies = {
-            step.evidence.placeholder: [
-                var for var in re.findall(r"#E\d+", str(step.evidence.tool_input))
-                if var in evidences and var != step.evidence.placeholder
-            ]
-            for step in steps if step.evidence and step.evidence.placeholder
-        }
+        dependencies = ReWOOAgentGraph._get_dependencies(evidences)
 
         # Create execution levels using topological sort
         levels: list[list[str]] = []
@@ -311,6 +337,9 @@ class ReWOOAgentGraph(BaseAgent):
 
             current_level, level_complete = self._get_current_level_status(state)
 
+            if self.dataflow_execution and current_level >= 0:
+                return await self._execute_dataflow(state)
+
             # Should not be invoked if all levels are complete
             if current_level < 0:
                 logger.error("%s ReWOO Executor invoked after all levels complete", AGENT_LOG_PREFIX)
@@ -340,10 +369,11 @@ class ReWOOAgentGraph(BaseAgent):
                          pending_placeholders)
 
             # Execute all tools in current level in parallel
+            semaphore = self._get_concurrency_limiter()
             tasks = []
             for placeholder in pending_placeholders:
                 step_info = state.evidence_map[placeholder]
-                task = self._execute_single_tool(placeholder, step_info, state.intermediate_results)
+                task = self._execute_step(placeholder, step_info, state.intermediate_results, semaphore)
                 tasks.append(task)
 
             # Wait for all tasks in current level to complete
@@ -381,6 +411,117 @@ class ReWOOAgentGraph(BaseAgent):
             logger.error("%s Failed to call executor_node: %s", AGENT_LOG_PREFIX, ex)
             raise
 
+    async def _execute_dataflow(self, state: ReWOOGraphState):
+        """
+        Execute all remaining steps of the plan, starting each step as soon as the steps it depends on have finished.
+        """
+        intermediate_results = dict(state.intermediate_results)
+
+        # The unfinished dependencies of each step which has not been executed yet
+        waiting = {
+            placeholder: set(deps) - intermediate_results.keys()
+            for placeholder, deps in self._get_dependencies(state.evidence_map).items()
+            if placeholder not in intermediate_results
+        }
+
+        semaphore = self._get_concurrency_limiter()
+        running: dict[asyncio.Task, str] = {}
+
+        logger.debug("%s Executing %s steps as their dependencies finish", AGENT_LOG_PREFIX, len(waiting))
+
+        try:
+            while waiting or running:
+                for placeholder in [ph for ph, deps in waiting.items() if not deps]:
+                    del waiting[placeholder]
+                    # Steps only see the results available when they start, which include all of their dependencies
+                    task = asyncio.create_task(
+                        self._execute_step(placeholder,
+                                           state.evidence_map[placeholder],
+                                           dict(intermediate_results),
+                                           semaphore))
+                    running[task] = placeholder
+
+                if not running:
+                    raise ValueError("Circular dependency detected in planner output")
+
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+
+                for task in done:
+                    placeholder = running.pop(task)
+                    intermediate_results[placeholder] = self._get_step_result(placeholder, task)
+
+                    for deps in waiting.values():
+                        deps.discard(placeholder)
+
+        finally:
+            for task in running:
+                task.cancel()
+
+            # Wait for the cancelled steps to finish, this also consumes the errors of steps which were not processed
+            await asyncio.gather(*running, return_exceptions=True)
+
+        if self.detailed_logs:
+            logger.info("%s Completed %s steps", AGENT_LOG_PREFIX, len(intermediate_results))
+
+        return {"intermediate_results": intermediate_results, "current_level": len(state.execution_levels)}
+
+    def _get_step_result(self, placeholder: str, task: asyncio.Task) -> ToolMessage:
+        """
+        Get the result of a finished step, raising the error of a failed step if `raise_tool_call_error` is set.
+        """
+        if (ex := task.exception()) is not None:
+            logger.error("%s Tool execution failed for %s: %s", AGENT_LOG_PREFIX, placeholder, ex)
+            if self.raise_tool_call_error:
+                raise ex
+            return ToolMessage(content=f"Tool execution failed: {str(ex)}", tool_call_id=placeholder)
+
+        result = task.result()
+        if (isinstance(result, ToolMessage) and result.status == "error" and self.raise_tool_call_error):
+            logger.error("%s Tool call failed for %s: %s", AGENT_LOG_PREFIX, placeholder, result.content)
+            raise RuntimeError(f"Tool call failed: {result.content}")
+
+        return result
+
+    def _get_concurrency_limiter(self) -> asyncio.Semaphore | None:
+        if self.max_concurrent_tool_calls is None:
+            return None
+
+        return asyncio.Semaphore(self.max_concurrent_tool_calls)
+
+    async def _wait_for_rate_limit(self, tool_name: str) -> None:
+        """
+        Wait until the rate limit of the tool allows another call.
+        """
+        rate = self.tool_rate_limits.get(tool_name)
+        if not rate:
+            return
+
+        # Calls which wake up together check the time again, so that only the first of them starts and calls are spaced
+        # out by the time they actually started, even if some of them were delayed
+        loop = asyncio.get_running_loop()
+        while (delay := self._tool_next_call_time.get(tool_name, 0.0) - loop.time()) > 0:
+            await asyncio.sleep(delay)
+
+        self._tool_next_call_time[tool_name] = loop.time() + 1.0 / rate
+
+    async def _execute_step(self,
+                            placeholder: str,
+                            step_info: ReWOOPlanStep,
+                            intermediate_results: dict[str, ToolMessage],
+                            semaphore: asyncio.Semaphore | None = None) -> ToolMessage:
+        """
+        Execute a single step, respecting the concurrency limit and the rate limit of its tool.
+        """
+        if semaphore is None:
+            await self._wait_for_rate_limit(step_info.evidence.tool)
+            return await self._execute_single_tool(placeholder, step_info, intermediate_results)
+
+        # Wait for the rate limit only once a concurrency slot is held, otherwise the call could start late and closer
+        # than the rate limit allows to the calls after it
+        async with semaphore:
+            await self._wait_for_rate_limit(step_info.evidence.tool)
+            return await self._execute_single_tool(placeholder, step_info, intermediate_results)
+
     async def _execute_single_tool(self,
                                    placeholder: str,
                                    step_info: ReWOOPlanStep,
@@ -17,6 +17,7 @@ import logging
 
 from pydantic import AliasChoices
 from pydantic import Field
+from pydantic import PositiveFloat
 from pydantic import PositiveInt
 
 from nat.builder.builder import Builder
@@ -66,6 +67,15 @@ class ReWOOAgentWorkflowConfig(AgentBaseConfig, name="rewoo_agent"):
                                         description="Whether to raise a exception immediately if a tool"
                                         "call fails. If set to False, the tool call error message will be included in"
                                         "the tool response and passed to the next tool.")
+    dataflow_execution: bool = Field(
+        default=False,
+        description="Whether to start each step as soon as the steps it depends on have finished. If set to False, "
+        "the steps are executed level by level, and each level waits for every step of the previous level.")
+    max_concurrent_tool_calls: PositiveInt | None = Field(
+        default=None, description="Maximum number of tool calls running at the same time. If 'None', there is no limit.")
+    tool_rate_limits: dict[str, PositiveFloat] = Field(
+        default_factory=dict,
+        description="Maximum number of calls per second, by tool name. Tools not listed are not rate limited.")
 
 
 @register_function(config_type=ReWOOAgentWorkflowConfig, framework_wrappers=[LLMFrameworkEnum.LANGCHAIN])
@@ -121,7 +131,10 @@ async def rewoo_agent_workflow(config: ReWOOAgentWorkflowConfig, builder: Builde
         detailed_logs=config.verbose,
         log_response_max_chars=config.log_response_max_chars,
         tool_call_max_retries=config.tool_call_max_retries,
-        raise_tool_call_error=config.raise_tool_call_error).build_graph()
+        raise_tool_call_error=config.raise_tool_call_error,
+        dataflow_execution=config.dataflow_execution,
+        max_concurrent_tool_calls=config.max_concurrent_tool_calls,
+        tool_rate_limits=config.tool_rate_limits).build_graph()
 
     async def _response_fn(chat_request_or_message: ChatRequestOrMessage) -> ChatResponse | str:
         """
@@ -0,0 +1,95 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import dataclasses
+
+
+@dataclasses.dataclass(frozen=True)
+class ComponentBuildTiming:
+    """
+    The time it took to build a single component.
+
+    Args:
+        name (str): The name of the component instance.
+        component_group (str): The component group of the instance, or ``"workflow"`` for the workflow itself.
+        start (float): Seconds between the start of the build and the start of this component.
+        duration (float): Seconds spent building this component.
+        dependencies (tuple[str, ...]): Labels of the components this component waited for.
+    """
+
+    name: str
+    component_group: str
+    start: float
+    duration: float
+    dependencies: tuple[str, ...] = ()
+
+    @property
+    def label(self) -> str:
+        return f"{self.name} ({self.component_group})"
+
+
+@dataclasses.dataclass
+class BuildTimingReport:
+    """
+    Per-component build timings collected by `WorkflowBuilder.populate_builder`.
+    """
+
+    timings: list[ComponentBuildTiming] = dataclasses.field(default_factory=list)
+    total_duration: float = 0.0
+
+    def critical_path(self) -> list[ComponentBuildTiming]:
+        """
+        Returns the chain of dependent components with the largest summed build time. No matter how much concurrency
+        is allowed, the build can not finish faster than this chain.
+        """
+        by_label = {timing.label: timing for timing in self.timings}
+        finish: dict[str, float] = {}
+        previous: dict[str, str | None] = {}
+
+        # Timings are recorded in completion order, so dependencies are always visited first
+        for timing in self.timings:
+            slowest = max((dep for dep in timing.dependencies if dep in finish), key=finish.__getitem__, default=None)
+            finish[timing.label] = timing.duration + (finish[slowest] if slowest is not None else 0.0)
+            previous[timing.label] = slowest
+
+        if (not finish):
+            return []
+
+        label: str | None = max(finish, key=finish.__getitem__)
+        path = []
+
+        while label is not None:
+            path.append(by_label[label])
+            label = previous[label]
+
+        return path[::-1]
+
+    def format(self) -> str:
+        critical_path = self.critical_path()
+        critical_duration = sum(timing.duration for timing in critical_path)
+
+        width = max((len(timing.label) for timing in self.timings), default=0)
+
+        lines = [
+            f"Built {len(self.timings)} components in {self.total_duration:.3f}s "
+            f"(critical path {critical_duration:.3f}s):"
+        ]
+
+        for timing in sorted(self.timings, key=lambda t: t.duration, reverse=True):
+            lines.append(f"  {timing.label:<{width}}  start {timing.start:8.3f}s  duration {timing.duration:8.3f}s")
+
+        lines.append("Critical path: " + " -> ".join(timing.label for timing in critical_path))
+
+        return "\n".join(lines)
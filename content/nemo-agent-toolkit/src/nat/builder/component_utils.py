@@ -318,3 +318,32 @@ def build_dependency_sequence(config: "Config") -> list[ComponentInstanceData]:
     assert len(dependency_sequence) == total_node_count, "Dependency sequence generation failed. Report as bug."
 
     return dependency_sequence
+
+
+def build_dependency_map(config: "Config") -> dict[str, set[str]]:
+    """Generates a map of each component runtime instance to the runtime instances it directly depends on.
+
+    Args:
+        config (Config): A NAT configuration object.
+
+    Returns:
+        dict[str, set[str]]: A map of runtime instance IDs to the set of runtime instance IDs referenced by their
+            configuration objects. References to components that are not present in the configuration are omitted.
+    """
+
+    dependency_map, dependency_graph = config_to_dependency_objects(config=config)
+
+    direct_dependencies: dict[str, set[str]] = {instance_id: set() for instance_id in dependency_map}
+
+    for instance_id, dependencies in direct_dependencies.items():
+
+        if (instance_id not in dependency_graph):
+            continue
+
+        # Edges go from an instance to the ComponentRefNodes it uses, and from each node to the referenced instance
+        for ref_node in dependency_graph.successors(instance_id):
+            for dependency_id in dependency_graph.successors(ref_node):
+                if (dependency_id in dependency_map and dependency_id != instance_id):
+                    dependencies.add(dependency_id)
+
+    return direct_dependencies
@@ -28,8 +28,8 @@ from nat.data_models.authentication import AuthFlowType
 from nat.data_models.authentication import AuthProviderBaseConfig
 from nat.data_models.interactive import HumanResponse
 from nat.data_models.interactive import InteractionPrompt
-from nat.data_models.intermediate_step import IntermediateStep
 from nat.data_models.intermediate_step import IntermediateStepPayload
+from nat.data_models.intermediate_step import IntermediateStepRecord
 from nat.data_models.intermediate_step import IntermediateStepType
 from nat.data_models.intermediate_step import StreamEventData
 from nat.data_models.intermediate_step import TraceMetadata
@@ -73,7 +73,7 @@ class ContextState(metaclass=Singleton):
         self.input_message: ContextVar[typing.Any] = ContextVar("input_message", default=None)
         self.user_manager: ContextVar[typing.Any] = ContextVar("user_manager", default=None)
         self._metadata: ContextVar[RequestAttributes | None] = ContextVar("request_attributes", default=None)
-        self._event_stream: ContextVar[Subject[IntermediateStep] | None] = ContextVar("event_stream", default=None)
+        self._event_stream: ContextVar[Subject[IntermediateStepRecord] | None] = ContextVar("event_stream", default=None)
         self._active_function: ContextVar[InvocationNode | None] = ContextVar("active_function", default=None)
         self._active_span_id_stack: ContextVar[list[str] | None] = ContextVar("active_span_id_stack", default=None)
 
@@ -99,10 +99,10 @@ class ContextState(metaclass=Singleton):
         return typing.cast(ContextVar[InvocationNode], self._active_function)
 
     @property
-    def event_stream(self) -> ContextVar[Subject[IntermediateStep]]:
+    def event_stream(self) -> ContextVar[Subject[IntermediateStepRecord]]:
         if self._event_stream.get() is None:
             self._event_stream.set(Subject())
-        return typing.cast(ContextVar[Subject[IntermediateStep]], self._event_stream)
+        return typing.cast(ContextVar[Subject[IntermediateStepRecord]], self._event_stream)
 
     @property
     def active_span_id_stack(self) -> ContextVar[list[str]]:
@@ -232,14 +232,18 @@ class Context:
         # 1) Set the active function in the contextvar
         fn_token = self._context_state.active_function.set(current_function_node)
 
-        # 2) Optionally record function start as an intermediate step
+        # 2) Optionally record function start as an intermediate step. The payload is only built if a subscriber is
+        #    interested in function events
         step_manager = self.intermediate_step_manager
-        step_manager.push_intermediate_step(
-            IntermediateStepPayload(UUID=current_function_id,
-                                    event_type=IntermediateStepType.FUNCTION_START,
-                                    name=function_name,
-                                    data=StreamEventData(input=input_data),
-                                    metadata=metadata))
+        step_manager.push_lazy_intermediate_step(
+            current_function_id,
+            IntermediateStepType.FUNCTION_START,
+            function_name,
+            lambda: IntermediateStepPayload(UUID=current_function_id,
+                                            event_type=IntermediateStepType.FUNCTION_START,
+                                            name=function_name,
+                                            data=StreamEventData(input=input_data),
+                                            metadata=metadata))
 
         manager = ActiveFunctionContextManager()
 
@@ -247,14 +251,14 @@ class Context:
             yield manager  # run the function body
         finally:
             # 3) Record function end
-
-            data = StreamEventData(input=input_data, output=manager.output)
-
-            step_manager.push_intermediate_step(
-                IntermediateStepPayload(UUID=current_function_id,
-                                        event_type=IntermediateStepType.FUNCTION_END,
-                                        name=function_name,
-                                        data=data))
+            step_manager.push_lazy_intermediate_step(
+                current_function_id,
+                IntermediateStepType.FUNCTION_END,
+                function_name,
+                lambda: IntermediateStepPayload(UUID=current_function_id,
+                                                event_type=IntermediateStepType.FUNCTION_END,
+                                                name=function_name,
+                                                data=StreamEventData(input=input_data, output=manager.output)))
 
             # 4) Unset the function contextvar
             self._context_state.active_function.reset(fn_token)
@@ -16,13 +16,22 @@
 import dataclasses
 import logging
 import typing
+import weakref
+from collections.abc import Callable
+from collections.abc import Iterable
 
 from nat.data_models.intermediate_step import IntermediateStep
 from nat.data_models.intermediate_step import IntermediateStepPayload
+from nat.data_models.intermediate_step import IntermediateStepRecord
 from nat.data_models.intermediate_step import IntermediateStepState
+from nat.data_models.intermediate_step import IntermediateStepType
+from nat.data_models.intermediate_step import as_intermediate_step
+from nat.data_models.intermediate_step import event_type_state
 from nat.utils.reactive.observable import OnComplete
 from nat.utils.reactive.observable import OnError
 from nat.utils.reactive.observable import OnNext
+from nat.utils.reactive.observer import Observer
+from nat.utils.reactive.subject import Subject
 from nat.utils.reactive.subscription import Subscription
 
 if typing.TYPE_CHECKING:
@@ -41,6 +50,78 @@ class OpenStep:
     active_stack: list[str]
 
 
+_EventInterest = frozenset[IntermediateStepType] | None
+
+
+class EventTypeObserver(Observer[IntermediateStepRecord]):
+    """
+    Observer which declares interest in a subset of intermediate step types and only receives events of those types.
+    The declared `event_types` are used by the `IntermediateStepManager` to skip building steps nobody listens to.
+    """
+
+    def __init__(self,
+                 event_types: Iterable[IntermediateStepType],
+                 on_next: OnNext[IntermediateStepRecord] | None = None,
+                 on_error: OnError | None = None,
+                 on_complete: OnComplete | None = None) -> None:
+        super().__init__(on_next, on_error, on_complete)
+        self.event_types: frozenset[IntermediateStepType] = frozenset(event_types)
+
+    def on_next(self, value: IntermediateStepRecord) -> None:
+        if value.event_type in self.event_types:
+            super().on_next(value)
+
+
+class EventInterestRegistry:
+    """
+    Resolves which intermediate step types the subscribers of an event stream are interested in.
+
+    Observers declare their interest by exposing an `event_types` attribute (see `EventTypeObserver`). Observers
+    without one are interested in every event type. The resolved interest is cached per stream and recomputed only when
+    the stream's subscriptions change.
+    """
+
+    # Maps each stream to the observer snapshot the interest was computed from and the resolved interest. An interest
+    # of `None` means at least one observer is interested in all event types.
+    _cache: weakref.WeakKeyDictionary[Subject, tuple[tuple, _EventInterest]] = weakref.WeakKeyDictionary()
+
+    @classmethod
+    def interested_types(cls, stream: Subject[IntermediateStepRecord]) -> _EventInterest:
+        """
+        Returns the set of event types with at least one interested observer, or `None` if every type is of interest.
+        """
+        observers = stream.observers
+
+        cached = cls._cache.get(stream)
+        if (cached is not None and cached[0] is observers):
+            return cached[1]
+
+        interest: set[IntermediateStepType] | None = set()
+        for observer in observers:
+            event_types = getattr(observer, "event_types", None)
+            if (event_types is None):
+                interest = None
+                break
+            interest.update(event_types)
+
+        resolved = frozenset(interest) if interest is not None else None
+        cls._cache[stream] = (observers, resolved)
+
+        return resolved
+
+    @classmethod
+    def is_interested(cls, stream: Subject[IntermediateStepRecord], event_type: IntermediateStepType) -> bool:
+        """
+        Returns True if any observer of `stream` would receive an event of type `event_type`.
+        """
+        if (not stream.observers):
+            return False
+
+        interest = cls.interested_types(stream)
+
+        return interest is None or event_type in interest
+
+
 class IntermediateStepManager:
     """
     Manages updates to the NAT Event Stream for intermediate steps
@@ -51,6 +132,12 @@ class IntermediateStepManager:
 
         self._outstanding_start_steps: dict[str, OpenStep] = {}
 
+    def is_interested(self, event_type: IntermediateStepType) -> bool:
+        """
+        Returns True if any subscriber of the NAT Event Stream would receive an event of the given type.
+        """
+        return EventInterestRegistry.is_interested(self._context_state.event_stream.get(), event_type)
+
     def push_intermediate_step(self, payload: IntermediateStepPayload) -> None:
         """
         Pushes an intermediate step to the NAT Event Stream
@@ -59,42 +146,66 @@ class IntermediateStepManager:
         if not isinstance(payload, IntermediateStepPayload):
             raise TypeError(f"Payload must be of type IntermediateStepPayload, not {type(payload)}")
 
+        self._push_step(payload.UUID, payload.name, payload.event_type, lambda: payload)
+
+    def push_lazy_intermediate_step(self,
+                                    step_id: str,
+                                    event_type: IntermediateStepType,
+                                    name: str | None,
+                                    payload_factory: Callable[[], IntermediateStepPayload]) -> None:
+        """
+        Pushes an intermediate step to the NAT Event Stream, deferring construction of the payload.
+
+        The span bookkeeping is always performed, however `payload_factory` is only called if a subscriber is
+        interested in `event_type`. The payload returned by the factory must have the same `UUID` and `event_type`.
+        """
+
+        self._push_step(step_id, name, event_type, payload_factory)
+
+    def _push_step(self,
+                   step_id: str,
+                   name: str | None,
+                   event_type: IntermediateStepType,
+                   payload_factory: Callable[[], IntermediateStepPayload]) -> None:
+
         active_span_id_stack = self._context_state.active_span_id_stack.get()
 
-        if (payload.event_state == IntermediateStepState.START):
+        event_state = event_type_state(event_type)
+
+        if (event_state == IntermediateStepState.START):
 
             prev_stack = active_span_id_stack
 
             parent_step_id = active_span_id_stack[-1]
 
             # Note, this must not mutate the active_span_id_stack in place
-            active_span_id_stack = active_span_id_stack + [payload.UUID]
+            active_span_id_stack = active_span_id_stack + [step_id]
             self._context_state.active_span_id_stack.set(active_span_id_stack)
 
-            self._outstanding_start_steps[payload.UUID] = OpenStep(step_id=payload.UUID,
-                                                                   step_name=payload.name or payload.UUID,
-                                                                   step_type=payload.event_type,
-                                                                   step_parent_id=parent_step_id,
-                                                                   prev_stack=prev_stack,
-                                                                   active_stack=active_span_id_stack)
+            self._outstanding_start_steps[step_id] = OpenStep(step_id=step_id,
+                                                              step_name=name or step_id,
+                                                              step_type=event_type,
+                                                              step_parent_id=parent_step_id,
+                                                              prev_stack=prev_stack,
+                                                              active_stack=active_span_id_stack)
 
             logger.debug("Pushed start step %s, name %s, type %s, parent %s, stack id %s",
-                         payload.UUID,
-                         payload.name,
-                         payload.event_type,
+                         step_id,
+                         name,
+                         event_type,
                          parent_step_id,
                          id(active_span_id_stack))
 
-        elif (payload.event_state == IntermediateStepState.END):
+        elif (event_state == IntermediateStepState.END):
 
             # Remove the current step from the outstanding steps
-            open_step = self._outstanding_start_steps.pop(payload.UUID, None)
+            open_step = self._outstanding_start_steps.pop(step_id, None)
 
             if (open_step is None):
                 logger.warning(
                     "Step id %s not found in outstanding start steps. "
                     "This may occur if the step was started in a different context or already completed.",
-                    payload.UUID)
+                    step_id)
                 return
 
             parent_step_id = open_step.step_parent_id
@@ -127,7 +238,7 @@ class IntermediateStepManager:
                 logger.warning(
                     "Step id %s not the last step in the stack. "
                     "Removing it from the stack but this is likely an error",
-                    payload.UUID)
+                    step_id)
 
             # Verify that the stack is now equal to the previous stack
             if (curr_stack != prev_stack):
@@ -135,16 +246,16 @@ class IntermediateStepManager:
                                "This is likely an error. Report this to the NeMo Agent toolkit team.")
 
             logger.debug("Popped end step %s, name %s, type %s, parent %s, stack id %s",
-                         payload.UUID,
-                         payload.name,
-                         payload.event_type,
+                         step_id,
+                         name,
+                         event_type,
                          parent_step_id,
                          id(curr_stack))
 
-        elif (payload.event_state == IntermediateStepState.CHUNK):
+        elif (event_state == IntermediateStepState.CHUNK):
 
             # Get the current step from the outstanding steps
-            open_step = self._outstanding_start_steps.get(payload.UUID, None)
+            open_step = self._outstanding_start_steps.get(step_id, None)
 
             # Generate a warning if the parent step id is not set to the current step id
             if (open_step is None):
@@ -152,27 +263,53 @@ class IntermediateStepManager:
                     "Created a chunk for step %s, but no matching start step was found. "
                     "Chunks must be created with the same ID as the start step. "
                     "This may occur if the step was started in a different context.",
-                    payload.UUID)
+                    step_id)
                 return
 
             parent_step_id = open_step.step_parent_id
         else:
             assert False, "Invalid event state"
 
+        event_stream = self._context_state.event_stream.get()
+
+        # Fast path: nobody is listening for this type of event, skip building the step entirely
+        if (not EventInterestRegistry.is_interested(event_stream, event_type)):
+            return
+
         active_function = self._context_state.active_function.get()
 
-        intermediate_step = IntermediateStep(parent_id=parent_step_id,
-                                             function_ancestry=active_function,
-                                             payload=payload)
+        payload = payload_factory()
+
+        if not isinstance(payload, IntermediateStepPayload):
+            raise TypeError(f"Payload must be of type IntermediateStepPayload, not {type(payload)}")
 
-        self._context_state.event_stream.get().on_next(intermediate_step)
+        # The pydantic step is only built if a subscriber asks for it, and then shared by all subscribers
+        event_stream.on_next(IntermediateStepRecord(parent_step_id, active_function, payload))
 
     def subscribe(self,
-                  on_next: OnNext[IntermediateStep],
+                  on_next: OnNext[IntermediateStep] | OnNext[IntermediateStepRecord],
                   on_error: OnError = None,
-                  on_complete: OnComplete = None) -> Subscription:
+                  on_complete: OnComplete = None,
+                  event_types: Iterable[IntermediateStepType] | None = None,
+                  records: bool = False) -> Subscription:
         """
-        Subscribes to the NAT Event Stream for intermediate steps
+        Subscribes to the NAT Event Stream for intermediate steps. If `event_types` is provided, only events of those
+        types are delivered and steps of other types are not built unless another subscriber is interested in them.
+
+        Subscribers receive `IntermediateStep` objects. If `records` is True they instead receive the
+        `IntermediateStepRecord` published on the stream, which avoids building the step for subscribers which do not
+        need it.
         """
 
-        return self._context_state.event_stream.get().subscribe(on_next, on_error, on_complete)
+        event_stream = self._context_state.event_stream.get()
+
+        if (not records):
+            on_step = on_next
+
+            def on_next(record: IntermediateStepRecord) -> None:
+                on_step(as_intermediate_step(record))
+
+        if (event_types is None):
+            return event_stream.subscribe(on_next, on_error, on_complete)
+
+        return event_stream.subscribe(EventTypeObserver(event_types, on_next, on_error, on_complete))
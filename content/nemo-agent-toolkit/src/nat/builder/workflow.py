@@ -69,7 +69,8 @@ class Workflow(FunctionBase[InputT, StreamingOutputT, SingleOutputT]):
         self.object_stores = object_stores or {}
         self.retrievers = retrievers or {}
 
-        self._exporter_manager = ExporterManager.from_exporters(self.telemetry_exporters)
+        self._exporter_manager = ExporterManager.from_exporters(self.telemetry_exporters,
+                                                                shared=config.general.telemetry.shared_exporters)
         self.ttc_strategies = ttc_strategies or {}
 
         self._entry_fn = entry_fn
@@ -14,21 +14,29 @@
 # limitations under the License.
 
 import asyncio
+import contextvars
 import dataclasses
 import inspect
 import logging
+import time
 import typing
 import warnings
+from collections.abc import Awaitable
+from collections.abc import Callable
 from collections.abc import Sequence
 from contextlib import AbstractAsyncContextManager
 from contextlib import AsyncExitStack
 from contextlib import asynccontextmanager
+from contextvars import ContextVar
 from typing import cast
 
 from nat.authentication.interfaces import AuthProviderBase
+from nat.builder.build_report import BuildTimingReport
+from nat.builder.build_report import ComponentBuildTiming
 from nat.builder.builder import Builder
 from nat.builder.builder import UserManagerHolder
 from nat.builder.component_utils import ComponentInstanceData
+from nat.builder.component_utils import build_dependency_map
 from nat.builder.component_utils import build_dependency_sequence
 from nat.builder.context import Context
 from nat.builder.context import ContextState
@@ -80,6 +88,64 @@ from nat.utils.type_utils import override
 
 logger = logging.getLogger(__name__)
 
+# Exit stack of the component currently being built concurrently. Set inside the task hosting that component so the
+# contexts it enters are also exited from that task.
+_component_exit_stack: ContextVar[AsyncExitStack | None] = ContextVar("_component_exit_stack", default=None)
+
+
+class _ComponentBuildTask:
+    """
+    Hosts the build of a single component in its own task when components are built concurrently.
+
+    Some component contexts (for example anyio task groups used by MCP clients) must be exited from the task that
+    entered them. The host task therefore enters all of the component's contexts on its own exit stack and keeps them
+    open until `close` is called, which then unwinds them from the same task.
+
+    The build runs in a copy of the builder's context. Context variables set by the build (for example the profiler
+    callback handler installed by the framework wrappers) are copied back into the builder's context by
+    `merge_context`, so they are visible just as if the component had been built sequentially.
+    """
+
+    def __init__(self, build: Callable[[], Awaitable[None]]):
+        self._release = asyncio.Event()
+        self.ready: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._context = contextvars.copy_context()
+        self._initial_values = dict(self._context.items())
+        self._task = asyncio.create_task(self._run(build), context=self._context)
+
+    async def _run(self, build: Callable[[], Awaitable[None]]) -> None:
+        async with AsyncExitStack() as stack:
+            _component_exit_stack.set(stack)
+
+            try:
+                await build()
+            except BaseException as e:
+                # Anything entered before the failure is unwound right away by the exit stack
+                self.ready.set_exception(e)
+                return
+
+            self.ready.set_result(None)
+
+            await self._release.wait()
+
+    def merge_context(self) -> None:
+        """
+        Set every context variable changed by the build in the calling context.
+        """
+        for var, value in self._context.items():
+            if var is _component_exit_stack:
+                continue
+
+            if var not in self._initial_values or self._initial_values[var] is not value:
+                var.set(value)
+
+    async def close(self) -> None:
+        self._release.set()
+        await self._task
+
+    def cancel(self) -> None:
+        self._task.cancel()
+
 
 @dataclasses.dataclass
 class ConfiguredTelemetryExporter:
@@ -181,6 +247,9 @@ class WorkflowBuilder(Builder, AbstractAsyncContextManager):
         self.current_function_building: str | None = None
         self.current_function_group_building: str | None = None
 
+        # Populated by `populate_builder`
+        self.build_report: BuildTimingReport | None = None
+
     async def __aenter__(self):
 
         self._exit_stack = AsyncExitStack()
@@ -375,10 +444,19 @@ class WorkflowBuilder(Builder, AbstractAsyncContextManager):
                                           },
                                           context_state=self._context_state)
 
+        if workflow.exporter_manager.is_shared:
+            # Stop the shared exporters before the exporters themselves are torn down by the exit stack
+            self._get_exit_stack().push_async_callback(workflow.exporter_manager.shutdown)
+
         return workflow
 
     def _get_exit_stack(self) -> AsyncExitStack:
 
+        component_exit_stack = _component_exit_stack.get()
+
+        if component_exit_stack is not None:
+            return component_exit_stack
+
         if self._exit_stack is None:
             raise ValueError(
                 "Exit stack not initialized. Did you forget to call `async with WorkflowBuilder() as builder`?")
@@ -399,7 +477,10 @@ class WorkflowBuilder(Builder, AbstractAsyncContextManager):
         llms = {k: v.instance for k, v in self._llms.items()}
         function_frameworks = detect_llm_frameworks_in_build_fn(registration)
 
-        build_fn = chain_wrapped_build_fn(registration.build_fn, llms, function_frameworks)
+        build_fn = chain_wrapped_build_fn(registration.build_fn,
+                                          llms,
+                                          function_frameworks,
+                                          token_coalescing=self.general_config.telemetry.token_coalescing)
 
         # Set the currently building function so the ChildBuilder can track dependencies
         self.current_function_building = config.type
@@ -446,7 +527,10 @@ class WorkflowBuilder(Builder, AbstractAsyncContextManager):
         llms = {k: v.instance for k, v in self._llms.items()}
         function_frameworks = detect_llm_frameworks_in_build_fn(registration)
 
-        build_fn = chain_wrapped_build_fn(registration.build_fn, llms, function_frameworks)
+        build_fn = chain_wrapped_build_fn(registration.build_fn,
+                                          llms,
+                                          function_frameworks,
+                                          token_coalescing=self.general_config.telemetry.token_coalescing)
 
         # Set the currently building function group so the ChildBuilder can track dependencies
         self.current_function_group_building = config.type
@@ -1062,92 +1146,248 @@ class WorkflowBuilder(Builder, AbstractAsyncContextManager):
         """
         self._log_build_failure("<workflow>", "workflow", completed_components, remaining_components, original_error)
 
+    async def _build_component(self, component_instance: ComponentInstanceData) -> None:
+        """
+        Instantiate a single non-root component from the build sequence.
+
+        Args:
+            component_instance (ComponentInstanceData): The component to add to the builder.
+        """
+        # Instantiate a the llm
+        if component_instance.component_group == ComponentGroup.LLMS:
+            await self.add_llm(component_instance.name, cast(LLMBaseConfig, component_instance.config))
+        # Instantiate a the embedder
+        elif component_instance.component_group == ComponentGroup.EMBEDDERS:
+            await self.add_embedder(component_instance.name, cast(EmbedderBaseConfig, component_instance.config))
+        # Instantiate a memory client
+        elif component_instance.component_group == ComponentGroup.MEMORY:
+            await self.add_memory_client(component_instance.name, cast(MemoryBaseConfig, component_instance.config))
+        # Instantiate a object store client
+        elif component_instance.component_group == ComponentGroup.OBJECT_STORES:
+            await self.add_object_store(component_instance.name,
+                                        cast(ObjectStoreBaseConfig, component_instance.config))
+        # Instantiate a retriever client
+        elif component_instance.component_group == ComponentGroup.RETRIEVERS:
+            await self.add_retriever(component_instance.name, cast(RetrieverBaseConfig, component_instance.config))
+        # Instantiate a function group
+        elif component_instance.component_group == ComponentGroup.FUNCTION_GROUPS:
+            await self.add_function_group(component_instance.name,
+                                          cast(FunctionGroupBaseConfig, component_instance.config))
+        # Instantiate a function
+        elif component_instance.component_group == ComponentGroup.FUNCTIONS:
+            await self.add_function(component_instance.name, cast(FunctionBaseConfig, component_instance.config))
+        elif component_instance.component_group == ComponentGroup.TTC_STRATEGIES:
+            await self.add_ttc_strategy(component_instance.name,
+                                        cast(TTCStrategyBaseConfig, component_instance.config))
+
+        elif component_instance.component_group == ComponentGroup.AUTHENTICATION:
+            await self.add_auth_provider(component_instance.name,
+                                         cast(AuthProviderBaseConfig, component_instance.config))
+        else:
+            raise ValueError(f"Unknown component group {component_instance.component_group}")
+
+    async def _build_components_sequentially(self,
+                                             components: list[ComponentInstanceData],
+                                             dependencies: dict[str, set[str]],
+                                             completed_components: list[tuple[str, str]],
+                                             remaining_components: list[tuple[str, str]],
+                                             report: BuildTimingReport,
+                                             build_start: float) -> None:
+
+        labels = {comp.instance_id: f"{comp.name} ({comp.component_group.value})" for comp in components}
+
+        for component_instance in components:
+            try:
+                # Remove from remaining as we start building
+                remaining_components.remove((str(component_instance.name), component_instance.component_group.value))
+
+                start = time.perf_counter()
+                await self._build_component(component_instance)
+
+                report.timings.append(
+                    ComponentBuildTiming(name=str(component_instance.name),
+                                         component_group=component_instance.component_group.value,
+                                         start=start - build_start,
+                                         duration=time.perf_counter() - start,
+                                         dependencies=tuple(labels[dep]
+                                                            for dep in dependencies[component_instance.instance_id])))
+
+                # Add to completed after successful build
+                completed_components.append((str(component_instance.name), component_instance.component_group.value))
+
+            except Exception as e:
+                self._log_build_failure_component(component_instance, completed_components, remaining_components, e)
+                raise
+
+    async def _build_components_concurrently(self,
+                                             components: list[ComponentInstanceData],
+                                             dependencies: dict[str, set[str]],
+                                             max_concurrency: int,
+                                             completed_components: list[tuple[str, str]],
+                                             remaining_components: list[tuple[str, str]],
+                                             report: BuildTimingReport,
+                                             build_start: float) -> None:
+
+        assert self._exit_stack is not None, "Exit stack not initialized"
+
+        labels = {comp.instance_id: f"{comp.name} ({comp.component_group.value})" for comp in components}
+        sequence_index = {comp.instance_id: i for i, comp in enumerate(components)}
+
+        pending = list(components)
+        built: set[str] = set()
+        running: dict[asyncio.Future, tuple[ComponentInstanceData, _ComponentBuildTask, float]] = {}
+        failures: list[tuple[ComponentInstanceData, BaseException]] = []
+
+        try:
+            while pending or running:
+
+                # Start everything whose dependencies are built, in build sequence order, up to the concurrency cap
+                if not failures:
+                    for component_instance in list(pending):
+                        if len(running) >= max_concurrency:
+                            break
+
+                        if not dependencies[component_instance.instance_id] <= built:
+                            continue
+
+                        pending.remove(component_instance)
+                        remaining_components.remove(
+                            (str(component_instance.name), component_instance.component_group.value))
+
+                        host = _ComponentBuildTask(lambda c=component_instance: self._build_component(c))
+                        running[host.ready] = (component_instance, host, time.perf_counter())
+
+                if not running:
+                    if pending and not failures:
+                        raise RuntimeError("Unable to resolve the build order of components: " +
+                                           ", ".join(labels[comp.instance_id] for comp in pending))
+                    break
+
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+
+                # Process completions in build sequence order so that reporting is deterministic
+                for ready in sorted(done, key=lambda f: sequence_index[running[f][0].instance_id]):
+                    component_instance, host, start = running.pop(ready)
+
+                    error = ready.exception()
+                    if error is not None:
+                        failures.append((component_instance, error))
+                        continue
+
+                    # Make context variables set by the build visible to the builder, as in a sequential build
+                    host.merge_context()
+
+                    # Unwind the component together with the rest of the builder, after anything built later
+                    self._exit_stack.push_async_callback(host.close)
+
+                    built.add(component_instance.instance_id)
+                    completed_components.append(
+                        (str(component_instance.name), component_instance.component_group.value))
+                    report.timings.append(
+                        ComponentBuildTiming(name=str(component_instance.name),
+                                             component_group=component_instance.component_group.value,
+                                             start=start - build_start,
+                                             duration=time.perf_counter() - start,
+                                             dependencies=tuple(
+                                                 labels[dep] for dep in dependencies[component_instance.instance_id])))
+
+        finally:
+            # Only reached with running builds if we were cancelled
+            for _, host, _ in running.values():
+                host.cancel()
+
+        if failures:
+            # Report the failure that comes first in the build sequence, regardless of timing
+            failing_component, error = min(failures, key=lambda f: sequence_index[f[0].instance_id])
+
+            remaining_components.extend((str(comp.name), comp.component_group.value) for comp, _ in failures
+                                        if comp is not failing_component)
+
+            self._log_build_failure_component(failing_component,
+                                              completed_components,
+                                              remaining_components,
+                                              typing.cast(Exception, error))
+            raise error
+
     async def populate_builder(self, config: Config, skip_workflow: bool = False):
         """
         Populate the builder with components and optionally set up the workflow.
 
+        Components are built in dependency order. When `general.build.max_concurrency` is greater than 1, independent
+        components are built concurrently, each starting as soon as the components it references are built.
+
         Args:
             config (Config): The configuration object containing component definitions.
             skip_workflow (bool): If True, skips the workflow instantiation step. Defaults to False.
 
         """
+        build_config = self.general_config.build
+        build_start = time.perf_counter()
+
         # Generate the build sequence
         build_sequence = build_dependency_sequence(config)
+        dependencies = build_dependency_map(config)
+
+        # The workflow is always set up last by `set_workflow`
+        components = [comp for comp in build_sequence if not comp.is_root]
+
+        # Functions from function groups are looked up by name, so functions wait for every function group
+        function_group_ids = {
+            comp.instance_id
+            for comp in components if comp.component_group == ComponentGroup.FUNCTION_GROUPS
+        }
+        for comp in components:
+            if comp.component_group == ComponentGroup.FUNCTIONS:
+                dependencies[comp.instance_id] |= function_group_ids
 
         # Initialize progress tracking
         completed_components = []
-        remaining_components = [(str(comp.name), comp.component_group.value) for comp in build_sequence
-                                if not comp.is_root]
+        remaining_components = [(str(comp.name), comp.component_group.value) for comp in components]
         if not skip_workflow:
             remaining_components.append(("<workflow>", "workflow"))
 
-        # Loop over all objects and add to the workflow builder
-        for component_instance in build_sequence:
-            try:
-                # Remove from remaining as we start building (if not root)
-                if not component_instance.is_root:
-                    remaining_components.remove(
-                        (str(component_instance.name), component_instance.component_group.value))
-
-                # Instantiate a the llm
-                if component_instance.component_group == ComponentGroup.LLMS:
-                    await self.add_llm(component_instance.name, cast(LLMBaseConfig, component_instance.config))
-                # Instantiate a the embedder
-                elif component_instance.component_group == ComponentGroup.EMBEDDERS:
-                    await self.add_embedder(component_instance.name,
-                                            cast(EmbedderBaseConfig, component_instance.config))
-                # Instantiate a memory client
-                elif component_instance.component_group == ComponentGroup.MEMORY:
-                    await self.add_memory_client(component_instance.name,
-                                                 cast(MemoryBaseConfig, component_instance.config))
-                # Instantiate a object store client
-                elif component_instance.component_group == ComponentGroup.OBJECT_STORES:
-                    await self.add_object_store(component_instance.name,
-                                                cast(ObjectStoreBaseConfig, component_instance.config))
-                # Instantiate a retriever client
-                elif component_instance.component_group == ComponentGroup.RETRIEVERS:
-                    await self.add_retriever(component_instance.name,
-                                             cast(RetrieverBaseConfig, component_instance.config))
-                # Instantiate a function group
-                elif component_instance.component_group == ComponentGroup.FUNCTION_GROUPS:
-                    await self.add_function_group(component_instance.name,
-                                                  cast(FunctionGroupBaseConfig, component_instance.config))
-                # Instantiate a function
-                elif component_instance.component_group == ComponentGroup.FUNCTIONS:
-                    # If the function is the root, set it as the workflow later
-                    if (not component_instance.is_root):
-                        await self.add_function(component_instance.name,
-                                                cast(FunctionBaseConfig, component_instance.config))
-                elif component_instance.component_group == ComponentGroup.TTC_STRATEGIES:
-                    await self.add_ttc_strategy(component_instance.name,
-                                                cast(TTCStrategyBaseConfig, component_instance.config))
-
-                elif component_instance.component_group == ComponentGroup.AUTHENTICATION:
-                    await self.add_auth_provider(component_instance.name,
-                                                 cast(AuthProviderBaseConfig, component_instance.config))
-                else:
-                    raise ValueError(f"Unknown component group {component_instance.component_group}")
-
-                # Add to completed after successful build (if not root)
-                if not component_instance.is_root:
-                    completed_components.append(
-                        (str(component_instance.name), component_instance.component_group.value))
+        report = BuildTimingReport()
 
-            except Exception as e:
-                self._log_build_failure_component(component_instance, completed_components, remaining_components, e)
-                raise
+        if build_config.max_concurrency > 1:
+            await self._build_components_concurrently(components,
+                                                      dependencies,
+                                                      build_config.max_concurrency,
+                                                      completed_components,
+                                                      remaining_components,
+                                                      report,
+                                                      build_start)
+        else:
+            await self._build_components_sequentially(components,
+                                                      dependencies,
+                                                      completed_components,
+                                                      remaining_components,
+                                                      report,
+                                                      build_start)
 
         # Instantiate the workflow
         if not skip_workflow:
             try:
                 # Remove workflow from remaining as we start building
                 remaining_components.remove(("<workflow>", "workflow"))
+                start = time.perf_counter()
                 await self.set_workflow(config.workflow)
+                report.timings.append(
+                    ComponentBuildTiming(name="<workflow>",
+                                         component_group="workflow",
+                                         start=start - build_start,
+                                         duration=time.perf_counter() - start,
+                                         dependencies=tuple(timing.label for timing in report.timings)))
                 completed_components.append(("<workflow>", "workflow"))
             except Exception as e:
                 self._log_build_failure_workflow(completed_components, remaining_components, e)
                 raise
 
+        report.total_duration = time.perf_counter() - build_start
+        self.build_report = report
+
+        if build_config.log_timings:
+            logger.info("%s", report.format())
+
     @classmethod
     @asynccontextmanager
     async def from_config(cls, config: Config):
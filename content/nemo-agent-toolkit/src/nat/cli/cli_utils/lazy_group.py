@@ -0,0 +1,68 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import importlib
+from collections.abc import Callable
+
+import click
+
+LazyCommandSpec = str | Callable[[], click.Command]
+"""
+Either an import path of the form ``"package.module:attribute"`` or a callable which returns the command.
+"""
+
+
+class LazyGroup(click.Group):
+    """
+    A click group whose subcommands are only imported when they are invoked, or when the help of the group is shown.
+    This keeps the import cost of heavy commands out of unrelated commands such as `nat --version`.
+
+    Args:
+        lazy_subcommands (dict[str, LazyCommandSpec] | None): Maps subcommand names to the command to load.
+    """
+
+    def __init__(self, *args, lazy_subcommands: dict[str, LazyCommandSpec] | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self.lazy_subcommands: dict[str, LazyCommandSpec] = dict(lazy_subcommands or {})
+
+    def add_lazy_command(self, spec: LazyCommandSpec, name: str) -> None:
+        self.lazy_subcommands[name] = spec
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted(set(super().list_commands(ctx)) | self.lazy_subcommands.keys())
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+
+        if (cmd_name not in self.commands and cmd_name in self.lazy_subcommands):
+            self.add_command(self._load_command(cmd_name), name=cmd_name)
+
+        return super().get_command(ctx, cmd_name)
+
+    def _load_command(self, cmd_name: str) -> click.Command:
+
+        spec = self.lazy_subcommands[cmd_name]
+
+        if (isinstance(spec, str)):
+            module_name, _, attribute = spec.partition(":")
+            command = getattr(importlib.import_module(module_name), attribute)
+        else:
+            command = spec()
+
+        if (not isinstance(command, click.Command)):
+            raise ValueError(f"Lazy subcommand `{cmd_name}` of `{self.name}` resolved to {command!r}, which is not a "
+                             "click command")
+
+        return command
@@ -0,0 +1,54 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import logging
+from pathlib import Path
+
+import click
+
+logger = logging.getLogger(__name__)
+
+
+async def _build_and_report(config_file: Path, max_concurrency: int | None) -> str:
+    from nat.builder.workflow_builder import WorkflowBuilder
+    from nat.runtime.loader import load_config
+
+    config = load_config(config_file)
+
+    if (max_concurrency is not None):
+        config.general.build.max_concurrency = max_concurrency
+
+    async with WorkflowBuilder.from_config(config=config) as builder:
+        assert builder.build_report is not None, "Build report is populated by populate_builder"
+
+        return builder.build_report.format()
+
+
+@click.command(name=__name__, help="Build a workflow and report the build time of each component.")
+@click.option("--config_file",
+              type=click.Path(exists=True, file_okay=True, dir_okay=False, path_type=Path),
+              required=True,
+              help="A JSON/YAML file that sets the parameters for the workflow.")
+@click.option("--max_concurrency",
+              type=click.IntRange(min=1),
+              default=None,
+              help="Override `general.build.max_concurrency` from the configuration file.")
+def build_timings(config_file: Path, max_concurrency: int | None):
+    try:
+        click.echo(asyncio.run(_build_and_report(config_file, max_concurrency)))
+    except Exception as e:
+        logger.exception("Error building workflow: %s", e)
+        raise click.ClickException(str(e)) from e
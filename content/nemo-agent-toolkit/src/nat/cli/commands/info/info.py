@@ -15,11 +15,18 @@
 
 import click
 
-from nat.cli.commands.info.list_channels import list_channels
-from nat.cli.commands.info.list_components import list_components
-
-
-@click.group(name=__name__, invoke_without_command=False, help="Provide information about the local NAT environment.")
+from nat.cli.cli_utils.lazy_group import LazyGroup
+
+
+@click.group(name=__name__,
+             cls=LazyGroup,
+             lazy_subcommands={
+                 "components": "nat.cli.commands.info.list_components:list_components",
+                 "channels": "nat.cli.commands.info.list_channels:list_channels",
+                 "build-timings": "nat.cli.commands.info.build_timings:build_timings",
+             },
+             invoke_without_command=False,
+             help="Provide information about the local NAT environment.")
 def info_command(**kwargs):
     """
     Provide information about the local NAT environment.
@@ -27,10 +34,6 @@ def info_command(**kwargs):
     pass
 
 
-info_command.add_command(list_components, name="components")
-info_command.add_command(list_channels, "channels")
-
-
 @click.command(
     name="mcp",
     help="Removed. Use 'nat mcp client' instead.",
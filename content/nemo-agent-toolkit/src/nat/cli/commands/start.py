@@ -180,19 +180,18 @@ class StartCommandGroup(click.Group):
                           override: tuple[tuple[str, str], ...],
                           **kwargs) -> int | None:
 
-        from nat.runtime.loader import PluginTypes
-        from nat.runtime.loader import discover_and_register_plugins
+        from nat.runtime.loader import discover_and_register_plugins_for_config
 
         if (config_file is None):
             raise click.ClickException("No config file provided.")
 
-        # Here we need to ensure all objects are loaded before we try to create the config object
-        discover_and_register_plugins(PluginTypes.CONFIG_OBJECT)
-
         logger.info("Starting NAT from config file: '%s'", config_file)
 
         config_dict = load_and_override_config(config_file, override)
 
+        # Here we need to ensure all objects are loaded before we try to create the config object
+        discover_and_register_plugins_for_config(config_dict)
+
         # Get the front end for the command
         front_end: RegisteredFrontEndInfo = self._registered_front_ends[cmd_name]
 
@@ -28,29 +28,51 @@ import sys
 import time
 
 import click
-import nest_asyncio
 from dotenv import load_dotenv
 
+from nat.cli.cli_utils.lazy_group import LazyGroup
 from nat.utils.log_levels import LOG_LEVELS
 
-from .commands.configure.configure import configure_command
-from .commands.evaluate import eval_command
-from .commands.info.info import info_command
-from .commands.mcp.mcp import mcp_command
-from .commands.object_store.object_store import object_store_command
-from .commands.optimize import optimizer_command
-from .commands.registry.registry import registry_command
-from .commands.sizing.sizing import sizing
-from .commands.start import start_command
-from .commands.uninstall import uninstall_command
-from .commands.validate import validate_command
-from .commands.workflow.workflow import workflow_command
-
 # Load environment variables from .env file, if it exists
 load_dotenv()
 
-# Apply at the beginning of the file to avoid issues with asyncio
-nest_asyncio.apply()
+# Subcommands are imported when they are first used, keeping commands such as `nat --version` fast
+_SUBCOMMANDS = {
+    "configure": "nat.cli.commands.configure.configure:configure_command",
+    "eval": "nat.cli.commands.evaluate:eval_command",
+    "info": "nat.cli.commands.info.info:info_command",
+    "registry": "nat.cli.commands.registry.registry:registry_command",
+    "start": "nat.cli.commands.start:start_command",
+    "uninstall": "nat.cli.commands.uninstall:uninstall_command",
+    "validate": "nat.cli.commands.validate:validate_command",
+    "workflow": "nat.cli.commands.workflow.workflow:workflow_command",
+    "sizing": "nat.cli.commands.sizing.sizing:sizing",
+    "optimize": "nat.cli.commands.optimize:optimizer_command",
+    "object-store": "nat.cli.commands.object_store.object_store:object_store_command",
+    "mcp": "nat.cli.commands.mcp.mcp:mcp_command",
+}
+
+
+def __getattr__(name: str):
+    # Keep the command objects importable from this module, e.g. `from nat.cli.entrypoint import start_command`
+    for spec in _SUBCOMMANDS.values():
+        module_name, _, attribute = spec.partition(":")
+        if (attribute == name):
+            import importlib
+
+            return getattr(importlib.import_module(module_name), attribute)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _front_end_alias(front_end: str):
+
+    def load_command() -> click.Command:
+        from nat.cli.commands.start import start_command
+
+        return start_command.get_command(None, front_end)  # type: ignore
+
+    return load_command
 
 
 def setup_logging(log_level: str):
@@ -74,7 +96,12 @@ def get_version():
         return "unknown"
 
 
-@click.group(name="nat", chain=False, invoke_without_command=True, no_args_is_help=True)
+@click.group(name="nat",
+             cls=LazyGroup,
+             lazy_subcommands=_SUBCOMMANDS,
+             chain=False,
+             invoke_without_command=True,
+             no_args_is_help=True)
 @click.version_option(version=get_version())
 @click.option('--log-level',
               type=click.Choice(LOG_LEVELS.keys(), case_sensitive=False),
@@ -84,6 +111,11 @@ def get_version():
 def cli(ctx: click.Context, log_level: str):
     """Main entrypoint for the NAT CLI"""
 
+    import nest_asyncio
+
+    # Apply before any subcommand runs to avoid issues with asyncio
+    nest_asyncio.apply()
+
     ctx_dict = ctx.ensure_object(dict)
 
     # Setup logging
@@ -102,22 +134,9 @@ def cli(ctx: click.Context, log_level: str):
     ctx_dict["log_level"] = log_level
 
 
-cli.add_command(configure_command, name="configure")
-cli.add_command(eval_command, name="eval")
-cli.add_command(info_command, name="info")
-cli.add_command(registry_command, name="registry")
-cli.add_command(start_command, name="start")
-cli.add_command(uninstall_command, name="uninstall")
-cli.add_command(validate_command, name="validate")
-cli.add_command(workflow_command, name="workflow")
-cli.add_command(sizing, name="sizing")
-cli.add_command(optimizer_command, name="optimize")
-cli.add_command(object_store_command, name="object-store")
-cli.add_command(mcp_command, name="mcp")
-
 # Aliases
-cli.add_command(start_command.get_command(None, "console"), name="run")  # type: ignore
-cli.add_command(start_command.get_command(None, "fastapi"), name="serve")  # type: ignore
+cli.add_lazy_command(_front_end_alias("console"), name="run")
+cli.add_lazy_command(_front_end_alias("fastapi"), name="serve")
 
 
 @cli.result_callback()
@@ -380,6 +380,8 @@ class TypeRegistry:
         self._registration_changed_hooks: list[Callable[[], None]] = []
         self._registration_changed_hooks_active: bool = True
 
+        self._registration_miss_hooks: list[Callable[[ComponentEnum, str | None, str | None], bool]] = []
+
         self._registered_channel_map = {}
 
     def _registration_changed(self):
@@ -396,6 +398,21 @@ class TypeRegistry:
 
         self._registration_changed_hooks.append(cb)
 
+    def add_registration_miss_hook(self, cb: Callable[[ComponentEnum, str | None, str | None], bool]) -> None:
+        """
+        Adds a hook which is called when a client or tool wrapper lookup fails. The hook receives the component type,
+        the full type of the provider config (None for tool wrappers) and the LLM framework, and returns True if it
+        registered something new, in which case the lookup is retried.
+        """
+
+        if (cb not in self._registration_miss_hooks):
+            self._registration_miss_hooks.append(cb)
+
+    def _registration_missed(self, component_type: ComponentEnum, config_type: str | None,
+                             llm_framework: str | None) -> bool:
+
+        return any(hook(component_type, config_type, llm_framework) for hook in self._registration_miss_hooks)
+
     @contextmanager
     def pause_registration_changed_hooks(self):
 
@@ -599,6 +616,9 @@ class TypeRegistry:
         try:
             client_info = self._llm_client_provider_to_framework[config_type][wrapper_type]
         except KeyError as err:
+            if (self._registration_missed(ComponentEnum.LLM_CLIENT, config_type.full_type, wrapper_type)):
+                return self.get_llm_client(config_type, wrapper_type)
+
             raise KeyError(f"An invalid LLM config and wrapper combination was supplied. Config: `{config_type}`, "
                            f"Wrapper: `{wrapper_type}`. The workflow is requesting a {wrapper_type} LLM client but "
                            f"there is no registered conversion from that LLM provider to LLM framework: "
@@ -648,6 +668,9 @@ class TypeRegistry:
         try:
             client_info = self._embedder_client_provider_to_framework[config_type][wrapper_type]
         except KeyError as err:
+            if (self._registration_missed(ComponentEnum.EMBEDDER_CLIENT, config_type.full_type, wrapper_type)):
+                return self.get_embedder_client(config_type, wrapper_type)
+
             raise KeyError(
                 f"An invalid Embedder config and wrapper combination was supplied. Config: `{config_type}`, "
                 f"Wrapper: `{wrapper_type}`. The workflow is requesting a {wrapper_type} Embedder client but "
@@ -763,6 +786,9 @@ class TypeRegistry:
         try:
             client_info = self._retriever_client_provider_to_framework[config_type][wrapper_type]
         except KeyError as err:
+            if (self._registration_missed(ComponentEnum.RETRIEVER_CLIENT, config_type.full_type, wrapper_type)):
+                return self.get_retriever_client(config_type, wrapper_type)
+
             raise KeyError(
                 f"An invalid Retriever config and wrapper combination was supplied. Config: `{config_type}`, "
                 f"Wrapper: `{wrapper_type}`. The workflow is requesting a {wrapper_type} Retriever client but "
@@ -787,6 +813,9 @@ class TypeRegistry:
         try:
             return self._registered_tool_wrappers[llm_framework]
         except KeyError as err:
+            if (self._registration_missed(ComponentEnum.TOOL_WRAPPER, None, llm_framework)):
+                return self.get_tool_wrapper(llm_framework)
+
             raise KeyError(f"Could not find a registered tool wrapper for LLM framework `{llm_framework}`. "
                            f"Registered LLM frameworks: {set(self._registered_tool_wrappers.keys())}") from err
 
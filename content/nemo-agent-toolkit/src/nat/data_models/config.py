@@ -137,10 +137,34 @@ def _process_validation_error(err: ValidationError, handler: ValidatorFunctionWr
         raise ValidationError.from_exception_data(title=err.title, line_errors=new_errors)
 
 
+class TokenCoalescingConfig(BaseModel):
+    """
+    Controls how streamed LLM tokens are turned into `LLM_NEW_TOKEN` intermediate steps by the framework callback
+    handlers. When enabled, tokens are buffered per LLM call and emitted as a single chunk event once one of the flush
+    conditions is met. Any remaining tokens are always flushed before the `LLM_END` event. Coalesced chunk events only
+    carry the chunk text, the LLM input and raw framework chunks are not repeated on every event.
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    enable: bool = False
+    flush_every_n_tokens: int | None = Field(default=16,
+                                             ge=1,
+                                             description="Flush once this many tokens have been buffered.")
+    flush_interval_ms: float | None = Field(default=100.0,
+                                            gt=0,
+                                            description="Flush once the oldest buffered token is this many "
+                                            "milliseconds old. Checked when a new token arrives.")
+
+
 class TelemetryConfig(BaseModel):
 
     logging: dict[str, LoggingBaseConfig] = Field(default_factory=dict)
     tracing: dict[str, TelemetryExporterBaseConfig] = Field(default_factory=dict)
+    token_coalescing: TokenCoalescingConfig = TokenCoalescingConfig()
+    shared_exporters: bool = Field(default=False,
+                                   description="Start the tracing exporters once and share them between workflow "
+                                   "runs, instead of creating and starting isolated copies of them for every run.")
 
     @field_validator("logging", "tracing", mode="wrap")
     @classmethod
@@ -185,6 +209,25 @@ class TelemetryConfig(BaseModel):
         return False
 
 
+class ComponentBuildConfig(BaseModel):
+    """
+    Controls how the workflow builder instantiates the components of a configuration. With `max_concurrency` above 1,
+    each component starts building as soon as the components it references are built. Only references declared with
+    the typed reference fields (`LLMRef`, `FunctionRef`, ...) are considered dependencies, and functions always wait
+    for every function group since groups expose functions by name.
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    max_concurrency: int = Field(default=1,
+                                 ge=1,
+                                 description="Maximum number of components built at the same time. The default of 1 "
+                                 "builds components one at a time in dependency order.")
+    log_timings: bool = Field(default=False,
+                              description="Log the build time of every component and the critical path once the "
+                              "workflow is built.")
+
+
 class GeneralConfig(BaseModel):
 
     model_config = ConfigDict(protected_namespaces=(), extra="forbid")
@@ -201,6 +244,8 @@ class GeneralConfig(BaseModel):
 
     telemetry: TelemetryConfig = TelemetryConfig()
 
+    build: ComponentBuildConfig = ComponentBuildConfig()
+
     # FrontEnd Configuration
     front_end: FrontEndBaseConfig = FastApiFrontEndConfig()
 
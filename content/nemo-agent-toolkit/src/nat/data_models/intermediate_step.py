@@ -64,6 +64,79 @@ class IntermediateStepState(str, Enum):
     END = "END"
 
 
+# Lookup tables indexed by event type. These are used instead of matching on the event type every time the category or
+# state of an event is requested since they are queried for every event by the step manager and exporters.
+_EVENT_TYPE_CATEGORY: dict[IntermediateStepType, IntermediateStepCategory] = {
+    IntermediateStepType.LLM_START: IntermediateStepCategory.LLM,
+    IntermediateStepType.LLM_END: IntermediateStepCategory.LLM,
+    IntermediateStepType.LLM_NEW_TOKEN: IntermediateStepCategory.LLM,
+    IntermediateStepType.TOOL_START: IntermediateStepCategory.TOOL,
+    IntermediateStepType.TOOL_END: IntermediateStepCategory.TOOL,
+    IntermediateStepType.WORKFLOW_START: IntermediateStepCategory.WORKFLOW,
+    IntermediateStepType.WORKFLOW_END: IntermediateStepCategory.WORKFLOW,
+    IntermediateStepType.TASK_START: IntermediateStepCategory.TASK,
+    IntermediateStepType.TASK_END: IntermediateStepCategory.TASK,
+    IntermediateStepType.FUNCTION_START: IntermediateStepCategory.FUNCTION,
+    IntermediateStepType.FUNCTION_END: IntermediateStepCategory.FUNCTION,
+    IntermediateStepType.CUSTOM_START: IntermediateStepCategory.CUSTOM,
+    IntermediateStepType.CUSTOM_END: IntermediateStepCategory.CUSTOM,
+    IntermediateStepType.SPAN_START: IntermediateStepCategory.SPAN,
+    IntermediateStepType.SPAN_CHUNK: IntermediateStepCategory.SPAN,
+    IntermediateStepType.SPAN_END: IntermediateStepCategory.SPAN,
+}
+
+_EVENT_TYPE_STATE: dict[IntermediateStepType, IntermediateStepState] = {
+    IntermediateStepType.LLM_START: IntermediateStepState.START,
+    IntermediateStepType.LLM_END: IntermediateStepState.END,
+    IntermediateStepType.LLM_NEW_TOKEN: IntermediateStepState.CHUNK,
+    IntermediateStepType.TOOL_START: IntermediateStepState.START,
+    IntermediateStepType.TOOL_END: IntermediateStepState.END,
+    IntermediateStepType.WORKFLOW_START: IntermediateStepState.START,
+    IntermediateStepType.WORKFLOW_END: IntermediateStepState.END,
+    IntermediateStepType.TASK_START: IntermediateStepState.START,
+    IntermediateStepType.TASK_END: IntermediateStepState.END,
+    IntermediateStepType.FUNCTION_START: IntermediateStepState.START,
+    IntermediateStepType.FUNCTION_END: IntermediateStepState.END,
+    IntermediateStepType.CUSTOM_START: IntermediateStepState.START,
+    IntermediateStepType.CUSTOM_END: IntermediateStepState.END,
+    IntermediateStepType.SPAN_START: IntermediateStepState.START,
+    IntermediateStepType.SPAN_CHUNK: IntermediateStepState.CHUNK,
+    IntermediateStepType.SPAN_END: IntermediateStepState.END,
+}
+
+
+def event_type_category(event_type: IntermediateStepType) -> IntermediateStepCategory:
+    """
+    Returns the category of the given event type.
+    """
+    try:
+        return _EVENT_TYPE_CATEGORY[event_type]
+    except KeyError:
+        raise ValueError(f"Unknown event type: {event_type}") from None
+
+
+def event_type_state(event_type: IntermediateStepType) -> IntermediateStepState:
+    """
+    Returns the state (start, chunk or end) of the given event type.
+    """
+    try:
+        return _EVENT_TYPE_STATE[event_type]
+    except KeyError:
+        raise ValueError(f"Unknown event type: {event_type}") from None
+
+
+# Offset used to convert monotonic timestamps into wall-clock timestamps. Computed once so that the timestamps of all
+# events created by this process share the same epoch and never go backwards, even if the system clock is adjusted.
+_MONOTONIC_TO_WALL_CLOCK_NS = time.time_ns() - time.monotonic_ns()
+
+
+def event_timestamp_now() -> float:
+    """
+    Returns the current time in seconds since the epoch, derived from the monotonic clock.
+    """
+    return (time.monotonic_ns() + _MONOTONIC_TO_WALL_CLOCK_NS) / 1e9
+
+
 class StreamEventData(BaseModel):
     """
     StreamEventData is a data model that represents the data field in an streaming event.
@@ -130,8 +203,8 @@ class IntermediateStepPayload(BaseModel):
     model_config = ConfigDict(extra="allow")
 
     event_type: IntermediateStepType
-    # Create an event timestamp field with the default being a lambda that returns the current time
-    event_timestamp: float = Field(default_factory=lambda: time.time())
+    # Create an event timestamp field with the default being the current (monotonic) time
+    event_timestamp: float = Field(default_factory=event_timestamp_now)
     span_event_timestamp: float | None = None  # Used for tracking the start time of a task if this is end
     framework: LLMFrameworkEnum | None = None
     name: str | None = None
@@ -143,79 +216,11 @@ class IntermediateStepPayload(BaseModel):
 
     @property
     def event_category(self) -> IntermediateStepCategory:
-        match self.event_type:
-            case IntermediateStepType.LLM_START:
-                return IntermediateStepCategory.LLM
-            case IntermediateStepType.LLM_END:
-                return IntermediateStepCategory.LLM
-            case IntermediateStepType.LLM_NEW_TOKEN:
-                return IntermediateStepCategory.LLM
-            case IntermediateStepType.TOOL_START:
-                return IntermediateStepCategory.TOOL
-            case IntermediateStepType.TOOL_END:
-                return IntermediateStepCategory.TOOL
-            case IntermediateStepType.WORKFLOW_START:
-                return IntermediateStepCategory.WORKFLOW
-            case IntermediateStepType.WORKFLOW_END:
-                return IntermediateStepCategory.WORKFLOW
-            case IntermediateStepType.TASK_START:
-                return IntermediateStepCategory.TASK
-            case IntermediateStepType.TASK_END:
-                return IntermediateStepCategory.TASK
-            case IntermediateStepType.FUNCTION_START:
-                return IntermediateStepCategory.FUNCTION
-            case IntermediateStepType.FUNCTION_END:
-                return IntermediateStepCategory.FUNCTION
-            case IntermediateStepType.CUSTOM_START:
-                return IntermediateStepCategory.CUSTOM
-            case IntermediateStepType.CUSTOM_END:
-                return IntermediateStepCategory.CUSTOM
-            case IntermediateStepType.SPAN_START:
-                return IntermediateStepCategory.SPAN
-            case IntermediateStepType.SPAN_CHUNK:
-                return IntermediateStepCategory.SPAN
-            case IntermediateStepType.SPAN_END:
-                return IntermediateStepCategory.SPAN
-            case _:
-                raise ValueError(f"Unknown event type: {self.event_type}")
+        return event_type_category(self.event_type)
 
     @property
     def event_state(self) -> IntermediateStepState:
-        match self.event_type:
-            case IntermediateStepType.LLM_START:
-                return IntermediateStepState.START
-            case IntermediateStepType.LLM_END:
-                return IntermediateStepState.END
-            case IntermediateStepType.LLM_NEW_TOKEN:
-                return IntermediateStepState.CHUNK
-            case IntermediateStepType.TOOL_START:
-                return IntermediateStepState.START
-            case IntermediateStepType.TOOL_END:
-                return IntermediateStepState.END
-            case IntermediateStepType.WORKFLOW_START:
-                return IntermediateStepState.START
-            case IntermediateStepType.WORKFLOW_END:
-                return IntermediateStepState.END
-            case IntermediateStepType.TASK_START:
-                return IntermediateStepState.START
-            case IntermediateStepType.TASK_END:
-                return IntermediateStepState.END
-            case IntermediateStepType.FUNCTION_START:
-                return IntermediateStepState.START
-            case IntermediateStepType.FUNCTION_END:
-                return IntermediateStepState.END
-            case IntermediateStepType.CUSTOM_START:
-                return IntermediateStepState.START
-            case IntermediateStepType.CUSTOM_END:
-                return IntermediateStepState.END
-            case IntermediateStepType.SPAN_START:
-                return IntermediateStepState.START
-            case IntermediateStepType.SPAN_CHUNK:
-                return IntermediateStepState.CHUNK
-            case IntermediateStepType.SPAN_END:
-                return IntermediateStepState.END
-            case _:
-                raise ValueError(f"Unknown event type: {self.event_type}")
+        return event_type_state(self.event_type)
 
     @model_validator(mode="after")
     def check_span_event_timestamp(self) -> "IntermediateStepPayload":
@@ -300,3 +305,76 @@ class IntermediateStep(BaseModel):
     @property
     def event_state(self) -> IntermediateStepState:
         return self.payload.event_state
+
+
+class IntermediateStepRecord:
+    """
+    Compact representation of an intermediate step as it is published on the NAT Event Stream.
+
+    A record is a plain `__slots__` object holding the already validated parts of a step. The pydantic
+    `IntermediateStep` is only built the first time a subscriber asks for it through `step` and is then shared by all
+    subscribers of the event. Subscribers which only need the common fields, or which hold on to a large number of
+    events, can use the record directly and never build the step.
+    """
+
+    __slots__ = ("parent_id", "function_ancestry", "payload", "_step")
+
+    def __init__(self, parent_id: str, function_ancestry: InvocationNode, payload: IntermediateStepPayload) -> None:
+        self.parent_id = parent_id
+        self.function_ancestry = function_ancestry
+        self.payload = payload
+        self._step: IntermediateStep | None = None
+
+    @classmethod
+    def from_intermediate_step(cls, step: IntermediateStep) -> "IntermediateStepRecord":
+        record = cls(step.parent_id, step.function_ancestry, step.payload)
+        record._step = step
+
+        return record
+
+    @property
+    def step(self) -> IntermediateStep:
+        step = self._step
+
+        if (step is None):
+            # All of the fields are already validated models, skip validating them again
+            step = IntermediateStep.model_construct(parent_id=self.parent_id,
+                                                    function_ancestry=self.function_ancestry,
+                                                    payload=self.payload)
+            self._step = step
+
+        return step
+
+    @property
+    def event_type(self) -> IntermediateStepType:
+        return self.payload.event_type
+
+    @property
+    def event_timestamp(self) -> float:
+        return self.payload.event_timestamp
+
+    @property
+    def name(self) -> str | None:
+        return self.payload.name
+
+    @property
+    def UUID(self) -> str:
+        return self.payload.UUID
+
+    @property
+    def event_category(self) -> IntermediateStepCategory:
+        return _EVENT_TYPE_CATEGORY[self.payload.event_type]
+
+    @property
+    def event_state(self) -> IntermediateStepState:
+        return _EVENT_TYPE_STATE[self.payload.event_type]
+
+
+def as_intermediate_step(event: IntermediateStepRecord | IntermediateStep) -> IntermediateStep:
+    """
+    Returns the `IntermediateStep` of an event received from the NAT Event Stream.
+    """
+    if (isinstance(event, IntermediateStepRecord)):
+        return event.step
+
+    return event
@@ -13,9 +13,22 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import typing
+
 from pydantic import BaseModel
 from pydantic import Field
 
+from nat.utils.exception_handlers.automatic_retries import BackoffStrategy
+from nat.utils.exception_handlers.automatic_retries import CircuitBreaker
+from nat.utils.exception_handlers.automatic_retries import DecorrelatedJitterBackoff
+from nat.utils.exception_handlers.automatic_retries import ExponentialBackoff
+from nat.utils.exception_handlers.automatic_retries import RetryBudget
+from nat.utils.exception_handlers.automatic_retries import get_circuit_breaker
+from nat.utils.exception_handlers.automatic_retries import get_global_retry_budget
+
+# Fields of the LLM, embedder and memory configurations which identify the endpoint their clients call
+_ENDPOINT_FIELDS = ("base_url", "azure_endpoint", "model_name", "azure_deployment")
+
 
 class RetryMixin(BaseModel):
     """Mixin class for retry configuration."""
@@ -33,3 +46,88 @@ class RetryMixin(BaseModel):
     retry_on_errors: list[str] | None = Field(default_factory=lambda: ["Too Many Requests"],
                                               description="List of error substrings that should trigger a retry.",
                                               exclude=True)
+    retry_backoff: typing.Literal["exponential", "full_jitter", "decorrelated_jitter"] = Field(
+        default="exponential",
+        description="Back-off between retries. 'exponential' doubles the delay after each retry, 'full_jitter' waits a"
+        " random delay up to the exponential delay and 'decorrelated_jitter' waits a random delay between"
+        " `retry_base_delay` and three times the previous delay.",
+        exclude=True)
+    retry_base_delay: float = Field(default=0.25,
+                                    gt=0,
+                                    description="Delay in seconds before the first retry.",
+                                    exclude=True)
+    retry_max_delay: float | None = Field(default=None,
+                                          gt=0,
+                                          description="Maximum delay in seconds between retries. Unlimited by default"
+                                          " for 'exponential' and 'full_jitter', 20 seconds for 'decorrelated_jitter'.",
+                                          exclude=True)
+    use_retry_budget: bool = Field(default=False,
+                                   description="Whether retries take a token from the process-wide retry budget, which"
+                                   " limits the rate of retries across every client using it.",
+                                   exclude=True)
+    circuit_breaker_threshold: int | None = Field(default=None,
+                                                  gt=0,
+                                                  description="Number of consecutive retryable failures after which"
+                                                  " calls fail immediately instead of calling the endpoint. The"
+                                                  " circuit breaker is disabled if not set.",
+                                                  exclude=True)
+    circuit_breaker_recovery_timeout: float = Field(default=30.0,
+                                                    gt=0,
+                                                    description="Seconds an open circuit breaker waits before letting a"
+                                                    " trial call through.",
+                                                    exclude=True)
+    circuit_breaker_name: str | None = Field(default=None,
+                                             description="Name of the circuit breaker. Clients with the same name"
+                                             " share a breaker. Defaults to the name of the configuration class"
+                                             " followed by the endpoint URL and the model, so that every client of"
+                                             " the same endpoint shares one.",
+                                             exclude=True)
+
+    @property
+    def backoff_strategy(self) -> BackoffStrategy:
+        """
+        Returns the back-off strategy configured by `retry_backoff`.
+
+        Returns:
+            BackoffStrategy: The strategy computing the delay before each retry.
+        """
+        if self.retry_backoff == "decorrelated_jitter":
+            return DecorrelatedJitterBackoff(base_delay=self.retry_base_delay,
+                                             max_delay=self.retry_max_delay if self.retry_max_delay is not None else 20.0)
+
+        return ExponentialBackoff(base_delay=self.retry_base_delay,
+                                  max_delay=self.retry_max_delay,
+                                  jitter=self.retry_backoff == "full_jitter")
+
+    @property
+    def retry_budget(self) -> RetryBudget | None:
+        """
+        Returns the process-wide retry budget if `use_retry_budget` is set.
+
+        Returns:
+            RetryBudget | None: The retry budget, or None if retries are not limited.
+        """
+        return get_global_retry_budget() if self.use_retry_budget else None
+
+    @property
+    def circuit_breaker(self) -> CircuitBreaker | None:
+        """
+        Returns the process-wide circuit breaker shared by clients with the same `circuit_breaker_name`, if
+        `circuit_breaker_threshold` is set. By default clients of the same endpoint and model share a breaker.
+
+        Returns:
+            CircuitBreaker | None: The circuit breaker, or None if it is disabled.
+        """
+        if self.circuit_breaker_threshold is None:
+            return None
+
+        return get_circuit_breaker(self.circuit_breaker_name or self._default_circuit_breaker_name(),
+                                   failure_threshold=self.circuit_breaker_threshold,
+                                   recovery_timeout=self.circuit_breaker_recovery_timeout)
+
+    def _default_circuit_breaker_name(self) -> str:
+        endpoint = [str(value) for field in _ENDPOINT_FIELDS if (value := getattr(self, field, None)) is not None]
+        if not endpoint:
+            return type(self).__name__
+
+        return f"{type(self).__name__}({', '.join(endpoint)})"
@@ -43,9 +43,13 @@ class StepAdaptorConfig(BaseModel):
         custom_event_types (list[IntermediateStepType]):
             If mode == 'custom', we only pass events whose event_type is in this list.
             Otherwise, this field is ignored.
+        stream_deltas (bool): If True, once an LLM step has sent its output, each further LLM_NEW_TOKEN event only
+            carries the new text, with a type of 'markdown_delta', instead of the full output so far. Clients append
+            the delta to the payload of the step with the same id. The LLM_END event still carries the full output.
     """
     mode: StepAdaptorMode = StepAdaptorMode.DEFAULT
     custom_event_types: list[IntermediateStepType] = Field(default_factory=list)
+    stream_deltas: bool = False
 
     @model_validator(mode="after")
     def check_custom_event_types(self) -> "StepAdaptorConfig":
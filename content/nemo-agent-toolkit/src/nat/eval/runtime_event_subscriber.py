@@ -17,7 +17,7 @@ import asyncio
 import logging
 
 from nat.builder.context import Context
-from nat.data_models.intermediate_step import IntermediateStep
+from nat.data_models.intermediate_step import IntermediateStepRecord
 
 logger = logging.getLogger(__name__)
 
@@ -29,12 +29,11 @@ def pull_intermediate() -> asyncio.Future[list[dict]]:
     with the list of dumped intermediate steps.
     """
     future = asyncio.Future()
-    intermediate_steps = []  # We'll store the dumped steps here.
+    records: list[IntermediateStepRecord] = []  # We'll store the compact records here until the stream completes.
     context = Context.get()
 
-    def on_next_cb(item: IntermediateStep):
-        # Append each new intermediate step (dumped to dict) to the list.
-        intermediate_steps.append(item.model_dump())
+    def on_next_cb(item: IntermediateStepRecord):
+        records.append(item)
 
     def on_error_cb(exc: Exception):
         logger.error("Hit on_error: %s", exc)
@@ -44,9 +43,13 @@ def pull_intermediate() -> asyncio.Future[list[dict]]:
     def on_complete_cb():
         logger.debug("Completed reading intermediate steps")
         if not future.done():
-            future.set_result(intermediate_steps)
+            # Dump the steps only once, when all of them have been received
+            future.set_result([record.step.model_dump() for record in records])
 
     # Subscribe with our callbacks.
-    context.intermediate_step_manager.subscribe(on_next=on_next_cb, on_error=on_error_cb, on_complete=on_complete_cb)
+    context.intermediate_step_manager.subscribe(on_next=on_next_cb,
+                                                on_error=on_error_cb,
+                                                on_complete=on_complete_cb,
+                                                records=True)
 
     return future
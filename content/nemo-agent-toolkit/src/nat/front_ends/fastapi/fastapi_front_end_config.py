@@ -222,6 +222,14 @@ class FastApiFrontEndConfig(FrontEndBaseConfig, name="fastapi"):
         default="WARNING",
         description="Logging level for Dask.",
     )
+    job_status_poll_interval: float | None = Field(
+        default=1.0,
+        description=(
+            "Seconds between checks for async job status changes made by other processes, such as process based Dask "
+            "workers. The check is done once per server process regardless of how many clients are waiting on job "
+            "status events. If None, only status changes made in the server process are delivered."),
+        gt=0,
+    )
     step_adaptor: StepAdaptorConfig = StepAdaptorConfig()
 
     workflow: typing.Annotated[EndpointBase, Field(description="Endpoint for the default workflow.")] = EndpointBase(
@@ -269,6 +277,18 @@ class FastApiFrontEndConfig(FrontEndBaseConfig, name="fastapi"):
             "Object store reference for the FastAPI app. If present, static files can be uploaded via a POST "
             "request to '/static' and files will be served from the object store. The files will be served from the "
             "object store at '/static/{file_name}'."))
+    static_files_max_concurrent_large_downloads: int | None = Field(
+        default=16,
+        description=(
+            "Maximum number of large static file downloads sent at the same time, further large downloads wait until "
+            "one finishes. If None, large downloads are not limited."),
+        ge=1,
+    )
+    static_files_large_download_threshold: int = Field(
+        default=64 * 1024 * 1024,
+        description="Size in bytes from which a static file download counts towards the large download limit.",
+        ge=0,
+    )
 
 
 # Compatibility aliases with previous releases
@@ -13,7 +13,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import asyncio
 import logging
 import os
 import sys
@@ -65,20 +64,14 @@ class FastApiFrontEndPlugin(DaskClientMixin, FrontEndBase[FastApiFrontEndConfig]
                                 db_url: str,
                                 sleep_time_sec: int = 300,
                                 log_level: int = logging.INFO):
-        from nat.front_ends.fastapi.job_store import JobStore
+        from nat.front_ends.fastapi.worker_cache import get_worker_cache
 
-        job_store = JobStore(scheduler_address=scheduler_address, db_url=db_url)
+        job_store = get_worker_cache().get_job_store(scheduler_address=scheduler_address, db_url=db_url)
 
         logging.basicConfig(level=log_level)
-        logger.info("Starting periodic cleanup of expired jobs every %d seconds", sleep_time_sec)
-        while True:
-            await asyncio.sleep(sleep_time_sec)
 
-            try:
-                await job_store.cleanup_expired_jobs()
-                logger.debug("Expired jobs cleaned up")
-            except:  # noqa: E722
-                logger.exception("Error during job cleanup")
+        # Runs until the Dask future is cancelled on shutdown
+        await job_store.start_expiry_task(interval=sleep_time_sec)
 
     async def _submit_cleanup_task(self, scheduler_address: str, db_url: str, log_level: int = logging.INFO):
         """Submit a cleanup task to the cluster to remove the job after expiry."""
@@ -145,12 +138,11 @@ class FastApiFrontEndPlugin(DaskClientMixin, FrontEndBase[FastApiFrontEndConfig]
             if self._scheduler_address is not None:
                 # If we are here then either the user provided a scheduler address, or we created a LocalCluster
 
-                from nat.front_ends.fastapi.job_store import Base
+                from nat.front_ends.fastapi.job_store import create_tables
                 from nat.front_ends.fastapi.job_store import get_db_engine
 
                 db_engine = get_db_engine(self.front_end_config.db_url, use_async=True)
-                async with db_engine.begin() as conn:
-                    await conn.run_sync(Base.metadata.create_all, checkfirst=True)  # create tables if they do not exist
+                await create_tables(db_engine)  # create tables and indexes if they do not exist
 
                 # If self.front_end_config.db_url is None, then we need to get the actual url from the engine
                 db_url = str(db_engine.url)
@@ -243,7 +235,15 @@ class FastApiFrontEndPlugin(DaskClientMixin, FrontEndBase[FastApiFrontEndConfig]
                     await client.cancel([self._periodic_cleanup_future], asynchronous=True, force=True)
 
             if self._cluster is not None:
-                # Only shut down the cluster if we created it
+                # Only shut down the cluster if we created it. Tear down the workflows cached by async jobs first.
+                from nat.front_ends.fastapi.worker_cache import close_worker_cache
+
+                try:
+                    async with self.client(self._scheduler_address) as client:
+                        await client.run(close_worker_cache)
+                except Exception:
+                    logger.exception("Failed to close the Dask worker caches")
+
                 logger.debug("Closing Local Dask cluster.")
                 self._cluster.close()
 
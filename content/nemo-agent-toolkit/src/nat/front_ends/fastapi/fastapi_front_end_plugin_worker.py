@@ -23,6 +23,7 @@ from abc import abstractmethod
 from collections.abc import Awaitable
 from collections.abc import Callable
 from contextlib import asynccontextmanager
+from datetime import datetime
 from pathlib import Path
 
 import httpx
@@ -30,6 +31,7 @@ from authlib.common.errors import AuthlibBaseError as OAuthError
 from fastapi import Body
 from fastapi import FastAPI
 from fastapi import HTTPException
+from fastapi import Query
 from fastapi import Request
 from fastapi import Response
 from fastapi import UploadFile
@@ -64,17 +66,20 @@ from nat.front_ends.fastapi.message_handler import WebSocketMessageHandler
 from nat.front_ends.fastapi.response_helpers import generate_single_response
 from nat.front_ends.fastapi.response_helpers import generate_streaming_response_as_str
 from nat.front_ends.fastapi.response_helpers import generate_streaming_response_full_as_str
+from nat.front_ends.fastapi.static_files import StaticFileServer
 from nat.front_ends.fastapi.step_adaptor import StepAdaptor
 from nat.front_ends.fastapi.utils import get_config_file_path
-from nat.object_store.models import ObjectStoreItem
+from nat.front_ends.fastapi.worker_cache import get_worker_cache
 from nat.runtime.loader import load_workflow
 from nat.runtime.session import SessionManager
+from nat.utils.exception_handlers import automatic_retries
 
 logger = logging.getLogger(__name__)
 
 _DASK_AVAILABLE = False
 
 try:
+    from nat.front_ends.fastapi.job_status_hub import JobStatusHub
     from nat.front_ends.fastapi.job_store import JobInfo
     from nat.front_ends.fastapi.job_store import JobStatus
     from nat.front_ends.fastapi.job_store import JobStore
@@ -82,6 +87,7 @@ try:
 except ImportError:
     JobInfo = None
     JobStatus = None
+    JobStatusHub = None
     JobStore = None
 
 
@@ -96,6 +102,7 @@ class FastApiFrontEndPluginWorkerBase(ABC):
         self._front_end_config = config.general.front_end
         self._dask_available = False
         self._job_store = None
+        self._job_status_hub = None
         self._http_flow_handler: HTTPAuthenticationFlowHandler | None = HTTPAuthenticationFlowHandler()
         self._scheduler_address = os.environ.get("NAT_DASK_SCHEDULER_ADDRESS")
         self._db_url = os.environ.get("NAT_JOB_STORE_DB_URL")
@@ -111,6 +118,8 @@ class FastApiFrontEndPluginWorkerBase(ABC):
 
             try:
                 self._job_store = JobStore(scheduler_address=self._scheduler_address, db_url=self._db_url)
+                self._job_status_hub = JobStatusHub(self._job_store,
+                                                    poll_interval=self._front_end_config.job_status_poll_interval)
                 self._dask_available = True
                 logger.debug("Connected to Dask scheduler at %s", self._scheduler_address)
             except Exception as e:
@@ -140,6 +149,9 @@ class FastApiFrontEndPluginWorkerBase(ABC):
 
                 yield
 
+            if self._job_status_hub is not None:
+                await self._job_status_hub.close()
+
             logger.debug("Closing NAT server from process %s", os.getpid())
 
         nat_app = FastAPI(lifespan=lifespan)
@@ -245,6 +257,7 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
         await self.add_static_files_route(app, builder)
         await self.add_authorization_route(app)
         await self.add_mcp_client_tool_list_route(app, builder)
+        await self.add_retry_stats_route(app)
 
         for ep in self.front_end_config.endpoints:
 
@@ -278,7 +291,7 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
                                  eval_config_file: str,
                                  reps: int):
             """Background task to run the evaluation."""
-            job_store = JobStore(scheduler_address=scheduler_address, db_url=db_url)
+            job_store = get_worker_cache().get_job_store(scheduler_address=scheduler_address, db_url=db_url)
 
             try:
                 # We have two config files, one for the workflow and one for the evaluation
@@ -372,20 +385,36 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
                 logger.info("Found last job %s with status %s", job.job_id, job.status)
                 return translate_job_to_response(job)
 
-        async def get_jobs(http_request: Request, status: str | None = None) -> list[EvaluateStatusResponse]:
-            """Get all jobs, optionally filtered by status."""
+        async def get_jobs(http_request: Request,
+                           response: Response,
+                           status: str | None = None,
+                           limit: int | None = Query(default=None, ge=1, le=1000),
+                           cursor: str | None = None,
+                           created_after: datetime | None = None,
+                           created_before: datetime | None = None) -> list[EvaluateStatusResponse]:
+            """
+            Get jobs, most recently created first, optionally filtered by status and creation time. When `limit` is
+            set, at most that many jobs are returned and the cursor of the next page is returned in the X-Next-Cursor
+            header.
+            """
 
             async with session_manager.session(http_connection=http_request):
 
-                if status is None:
-                    logger.info("Getting all jobs")
-                    jobs = await self._job_store.get_all_jobs()
-                else:
-                    logger.info("Getting jobs with status %s", status)
-                    jobs = await self._job_store.get_jobs_by_status(JobStatus(status))
+                logger.info("Getting jobs with status %s", status)
+                try:
+                    page = await self._job_store.get_jobs(None if status is None else JobStatus(status),
+                                                          created_after=created_after,
+                                                          created_before=created_before,
+                                                          limit=limit,
+                                                          cursor=cursor)
+                except ValueError as e:
+                    raise HTTPException(status_code=400, detail=str(e)) from e
+
+                if page.next_cursor is not None:
+                    response.headers["X-Next-Cursor"] = page.next_cursor
 
-                logger.info("Found %d jobs", len(jobs))
-                return [translate_job_to_response(job) for job in jobs]
+                logger.info("Found %d jobs", len(page.jobs))
+                return [translate_job_to_response(job) for job in page.jobs]
 
         if self.front_end_config.evaluate.path:
             if self._dask_available:
@@ -423,8 +452,12 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
                     endpoint=get_jobs,
                     methods=["GET"],
                     response_model=list[EvaluateStatusResponse],
-                    description="Get all jobs, optionally filtered by status",
-                    responses={500: response_500},
+                    description="Get jobs, optionally filtered by status and creation time and paginated with a cursor",
+                    responses={
+                        400: {
+                            "description": "Invalid status or cursor"
+                        }, 500: response_500
+                    },
                 )
 
                 # Add HTTP endpoint for evaluation
@@ -456,14 +489,17 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
                 raise HTTPException(status_code=400, detail="Filename cannot be empty.")
             return sanitized_path
 
+        static_file_server = StaticFileServer(
+            object_store_client,
+            max_concurrent_large_downloads=self.front_end_config.static_files_max_concurrent_large_downloads,
+            large_download_threshold=self.front_end_config.static_files_large_download_threshold)
+
         # Upload static files to the object store; if key is present, it will fail with 409 Conflict
         async def add_static_file(file_path: str, file: UploadFile):
             sanitized_file_path = sanitize_path(file_path)
-            file_data = await file.read()
 
             try:
-                await object_store_client.put_object(sanitized_file_path,
-                                                     ObjectStoreItem(data=file_data, content_type=file.content_type))
+                await static_file_server.put_file(sanitized_file_path, file)
             except KeyAlreadyExistsError as e:
                 raise HTTPException(status_code=409, detail=str(e)) from e
 
@@ -472,29 +508,14 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
         # Upsert static files to the object store; if key is present, it will overwrite the file
         async def upsert_static_file(file_path: str, file: UploadFile):
             sanitized_file_path = sanitize_path(file_path)
-            file_data = await file.read()
 
-            await object_store_client.upsert_object(sanitized_file_path,
-                                                    ObjectStoreItem(data=file_data, content_type=file.content_type))
+            await static_file_server.put_file(sanitized_file_path, file, overwrite=True)
 
             return {"filename": sanitized_file_path}
 
-        # Get static files from the object store
-        async def get_static_file(file_path: str):
-
-            try:
-                file_data = await object_store_client.get_object(file_path)
-            except NoSuchKeyError as e:
-                raise HTTPException(status_code=404, detail=str(e)) from e
-
-            filename = file_path.split("/")[-1]
-
-            async def reader():
-                yield file_data.data
-
-            return StreamingResponse(reader(),
-                                     media_type=file_data.content_type,
-                                     headers={"Content-Disposition": f"attachment; filename={filename}"})
+        # Get static files from the object store, supports range and conditional requests
+        async def get_static_file(file_path: str, request: Request):
+            return await static_file_server.get_file(file_path, request)
 
         async def delete_static_file(file_path: str):
             try:
@@ -738,9 +759,11 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
                                  job_id: str,
                                  payload: typing.Any):
             """Background task to run the workflow."""
-            job_store = JobStore(scheduler_address=scheduler_address, db_url=db_url)
+            # The workflow, job store and database engine are built once per Dask worker and reused across jobs
+            worker_cache = get_worker_cache()
+            job_store = worker_cache.get_job_store(scheduler_address=scheduler_address, db_url=db_url)
             try:
-                async with load_workflow(config_file_path) as local_session_manager:
+                async with worker_cache.session_manager(config_file_path) as local_session_manager:
                     result = await generate_single_response(
                         payload, local_session_manager, result_type=local_session_manager.workflow.single_output_schema)
 
@@ -801,6 +824,39 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
                 logger.info("Found job %s with status %s", job_id, job.status)
                 return _job_status_to_response(job)
 
+        async def stream_async_job_status(job_id: str, http_request: Request) -> StreamingResponse:
+            """
+            Stream the status of an async job as server-sent events, starting with the current status and ending once
+            the job has finished.
+            """
+            logger.info("Streaming status for job %s", job_id)
+
+            async with session_manager.session(http_connection=http_request):
+
+                job_updates = self._job_status_hub.watch(job_id, heartbeat_interval=15)
+                job = await anext(job_updates, None)
+                if job is None:
+                    logger.warning("Job %s not found", job_id)
+                    raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+
+            async def status_events():
+                try:
+                    yield f"event: status\ndata: {_job_status_to_response(job).model_dump_json()}\n\n"
+                    async for updated_job in job_updates:
+                        if updated_job is None:
+                            # Keep the connection open while the job is running
+                            yield ": keep-alive\n\n"
+                        else:
+                            yield f"event: status\ndata: {_job_status_to_response(updated_job).model_dump_json()}\n\n"
+                finally:
+                    # Stop watching the job if the client disconnects
+                    await job_updates.aclose()
+
+            return StreamingResponse(headers={
+                "Content-Type": "text/event-stream; charset=utf-8", "Cache-Control": "no-cache"
+            },
+                                     content=status_events())
+
         async def websocket_endpoint(websocket: WebSocket):
 
             # Universal cookie handling: works for both cross-origin and same-origin connections
@@ -950,6 +1006,19 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
                     },
                 )
 
+                app.add_api_route(
+                    path=f"{endpoint.path}/async/job/{{job_id}}/events",
+                    endpoint=stream_async_job_status,
+                    methods=["GET"],
+                    response_class=StreamingResponse,
+                    description="Stream the status changes of an async job as server-sent events until it finishes",
+                    responses={
+                        404: {
+                            "description": "Job not found"
+                        }, 500: response_500
+                    },
+                )
+
         if (endpoint.openai_api_path):
             if (endpoint.method == "GET"):
 
@@ -1073,6 +1142,18 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
                 methods=["GET"],
                 description="Handles the authorization code and state returned from the Authorization Code Grant Flow.")
 
+    async def add_retry_stats_route(self, app: FastAPI):
+        """Add an endpoint reporting the state of the retry budget and circuit breakers used by automatic retries."""
+
+        async def get_retry_stats() -> dict[str, typing.Any]:
+            return automatic_retries.get_retry_stats()
+
+        app.add_api_route(path="/retry/stats",
+                          endpoint=get_retry_stats,
+                          methods=["GET"],
+                          description="Get the statistics of the retry budget and of every circuit breaker used by"
+                          " automatic retries of LLM, embedder and memory clients.")
+
     async def add_mcp_client_tool_list_route(self, app: FastAPI, builder: WorkflowBuilder):
         """Add the MCP client tool list endpoint to the FastAPI app."""
         from typing import Any
@@ -15,45 +15,134 @@
 
 import asyncio
 import logging
+from collections import deque
 
 from nat.builder.context import Context
-from nat.data_models.api_server import ResponseIntermediateStep
-from nat.data_models.intermediate_step import IntermediateStep
+from nat.data_models.intermediate_step import IntermediateStepRecord
+from nat.data_models.intermediate_step import IntermediateStepType
+from nat.front_ends.fastapi.step_serializer import SerializedIntermediateStep
+from nat.utils.producer_consumer_queue import AsyncIOProducerConsumerQueue
+from nat.utils.producer_consumer_queue import QueueClosed
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on intermediate steps held back by the bridge while the stream queue is full. Event-stream callbacks are
+# synchronous and cannot wait for the client, so once this is reached the oldest pending steps are dropped.
+BRIDGE_BACKLOG_MAXSIZE = 4096
 
-async def pull_intermediate(_q, adapter):
+
+class _QueueBridge:
+    """
+    Bridges synchronous event-stream callbacks onto an `AsyncIOProducerConsumerQueue`.
+
+    Items are placed directly into the queue with `put_nowait` whenever it has room and no writer is running.
+    Otherwise they are appended to an ordered backlog which a single writer task drains with `await put`, so a
+    bounded queue applies back-pressure without spawning one task per event. The backlog holds at most `max_backlog`
+    items; when a slow client lets it fill up, the oldest pending items are dropped and counted in `dropped`.
+    Callbacks arriving from another thread are marshalled onto the owning loop first, which keeps the queue itself
+    single-threaded.
+    """
+
+    def __init__(self,
+                 queue: AsyncIOProducerConsumerQueue,
+                 loop: asyncio.AbstractEventLoop,
+                 max_backlog: int = BRIDGE_BACKLOG_MAXSIZE):
+        self._queue = queue
+        self._loop = loop
+        self._backlog: deque = deque(maxlen=max_backlog)
+        self.dropped = 0
+        self._writer: asyncio.Task | None = None
+        self._finished = False
+        self.done = asyncio.Event()
+
+    def _on_loop_thread(self) -> bool:
+        try:
+            return asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            return False
+
+    def put(self, item) -> None:
+        if (not self._on_loop_thread()):
+            self._loop.call_soon_threadsafe(self.put, item)
+            return
+
+        if (self._queue.is_closed()):
+            return
+
+        # While the writer is running it may still be awaiting an item it took off the backlog, which must reach the
+        # queue before this one
+        if (self._writer is None and not self._queue.full()):
+            self._queue.put_nowait(item)
+            return
+
+        if (len(self._backlog) == self._backlog.maxlen):
+            # Appending to a full deque discards its oldest item
+            self.dropped += 1
+
+        self._backlog.append(item)
+        self._ensure_writer()
+
+    def finish(self) -> None:
+        """
+        Signal that no more items will be produced. `done` is set once every pending item has reached the queue.
+        """
+        if (not self._on_loop_thread()):
+            self._loop.call_soon_threadsafe(self.finish)
+            return
+
+        self._finished = True
+
+        if (self._writer is None):
+            self._set_done()
+
+    def _ensure_writer(self) -> None:
+        if (self._writer is None):
+            self._writer = self._loop.create_task(self._drain())
+
+    async def _drain(self) -> None:
+        try:
+            while self._backlog:
+                await self._queue.put(self._backlog.popleft())
+        except QueueClosed:
+            # The consumer went away, anything still pending has nowhere to go
+            self._backlog.clear()
+        finally:
+            self._writer = None
+
+            if (self._finished):
+                self._set_done()
+
+    def _set_done(self) -> None:
+        if (self.dropped):
+            logger.warning("Dropped %d intermediate steps for a slow client", self.dropped)
+
+        self.done.set()
+
+
+async def pull_intermediate(_q, adapter, event_types: frozenset[IntermediateStepType] | None = None):
     """
     Subscribes to the runner's event stream (which is now a simplified Observable)
     using direct callbacks. Processes each event with the adapter and enqueues
-    results to `_q`.
+    results to `_q`. If `event_types` is provided, only steps of those types are
+    delivered, so filtered steps are never built or serialized for this subscriber.
     """
-    intermediate_done = asyncio.Event()
     context = Context.get()
-    loop = asyncio.get_running_loop()
-
-    async def set_intermediate_done():
-        intermediate_done.set()
+    bridge = _QueueBridge(_q, asyncio.get_running_loop())
 
-    def on_next_cb(item: IntermediateStep):
+    def on_next_cb(item: IntermediateStepRecord):
         """
         Synchronously called whenever the runner publishes an event.
-        We process it, then place it into the async queue (via a small async task).
-        If adapter is None, convert the raw IntermediateStep into the complete
-        ResponseIntermediateStep and place it into the queue.
+        We process it, then hand it to the queue bridge which preserves publication order.
+        If adapter is None, serialize the raw record straight into its stream
+        representation, without building the IntermediateStep, and place it into the queue.
         """
         if adapter is None:
-            adapted = ResponseIntermediateStep(id=item.UUID,
-                                               type=item.event_type,
-                                               name=item.name or "",
-                                               parent_id=item.parent_id,
-                                               payload=item.payload.model_dump_json())
+            adapted = SerializedIntermediateStep.from_intermediate_step(item)
         else:
-            adapted = adapter.process(item)
+            adapted = adapter.process(item.step)
 
         if adapted is not None:
-            loop.create_task(_q.put(adapted))
+            bridge.put(adapted)
 
     def on_error_cb(exc: Exception):
         """
@@ -61,20 +150,22 @@ async def pull_intermediate(_q, adapter):
         """
         logger.error("Hit on_error: %s", exc)
 
-        loop.create_task(set_intermediate_done())
+        bridge.finish()
 
     def on_complete_cb():
         """
-        Called once the runner signals no more items. We unblock our wait.
+        Called once the runner signals no more items. We unblock our wait once everything has been enqueued.
         """
         logger.debug("Completed reading intermediate steps")
 
-        loop.create_task(set_intermediate_done())
+        bridge.finish()
 
     # Subscribe to the runner's "reactive_event_stream" (now a simple Observable)
     _ = context.intermediate_step_manager.subscribe(on_next=on_next_cb,
                                                     on_error=on_error_cb,
-                                                    on_complete=on_complete_cb)
+                                                    on_complete=on_complete_cb,
+                                                    event_types=event_types,
+                                                    records=True)
 
-    # Wait until on_complete or on_error sets intermediate_done
-    return intermediate_done
+    # Wait until on_complete or on_error sets done
+    return bridge.done
@@ -0,0 +1,280 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import logging
+import math
+import typing
+from collections.abc import AsyncGenerator
+from datetime import UTC
+from datetime import datetime
+from datetime import timedelta
+
+from nat.front_ends.fastapi.job_store import JobInfo
+from nat.front_ends.fastapi.job_store import JobStatus
+from nat.front_ends.fastapi.job_store import JobStore
+from nat.front_ends.fastapi.job_store import as_utc
+
+logger = logging.getLogger(__name__)
+
+
+class JobStatusHub:
+    """
+    Pushes job status changes to the clients waiting on them, so that waiting clients do not each poll the database.
+
+    Status changes committed by a `JobStore` in this process are delivered as soon as they are committed, with one
+    query per batch of changed jobs. Status changes committed by other processes (e.g. Dask workers) are found by a
+    single poller which queries the recently updated jobs every `poll_interval` seconds, no matter how many clients are
+    waiting. The poller only finds jobs by their `updated_at` timestamp, so as a safety net for changes it misses (e.g.
+    from a worker whose clock is behind) each watched job is also reloaded every `refresh_interval` seconds while its
+    status does not change.
+
+    Parameters
+    ----------
+    job_store : JobStore
+        The job store to load jobs from.
+    poll_interval : float | None, optional, default=1.0
+        Seconds between queries for jobs updated by other processes, or None to only deliver changes made in this
+        process.
+    refresh_interval : float | None, optional, default=30.0
+        Seconds without a status change after which a watched job is reloaded, or None to never reload it.
+    """
+
+    # Jobs updated this many seconds before the most recent update already seen are queried again, this catches
+    # transactions which commit in a different order than their updated_at timestamps
+    POLL_OVERLAP = 2.0
+
+    FINISHED_STATUS = {JobStatus.SUCCESS, JobStatus.FAILURE, JobStatus.INTERRUPTED}
+
+    def __init__(self, job_store: JobStore, poll_interval: float | None = 1.0, refresh_interval: float | None = 30.0):
+        self._job_store = job_store
+        self._poll_interval = poll_interval
+        self._refresh_interval = refresh_interval
+
+        self._subscribers: dict[str, set[asyncio.Queue[JobInfo | None]]] = {}
+        self._last_published: dict[str, tuple[str, datetime]] = {}
+        self._pending: set[str] = set()
+
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._wakeup: asyncio.Event | None = None
+        self._tasks: list[asyncio.Task] = []
+        self._watermark: datetime | None = None
+
+        # Statistics
+        self._queries = 0
+        self._notifications = 0
+
+    def _ensure_started(self):
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+
+        self._loop = loop
+        self._wakeup = asyncio.Event()
+        self._watermark = datetime.now(UTC)
+        self._tasks = [loop.create_task(self._run_fetcher(), name="job_status_fetcher")]
+        if self._poll_interval is not None:
+            self._tasks.append(loop.create_task(self._run_poller(), name="job_status_poller"))
+
+        JobStore.add_status_listener(self._on_status_change)
+
+    async def close(self):
+        """Stop delivering status changes, and end every `watch` which is waiting for one."""
+        JobStore.remove_status_listener(self._on_status_change)
+
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+        for queues in self._subscribers.values():
+            for queue in queues:
+                queue.put_nowait(None)
+
+        self._tasks = []
+        self._loop = None
+
+    def _on_status_change(self, job_ids: list[str]):
+        # Called by JobStore.update_status, possibly from a Dask worker thread
+        loop = self._loop
+        if loop is None:
+            return
+
+        try:
+            loop.call_soon_threadsafe(self._queue_fetch, job_ids)
+        except RuntimeError:
+            # The event loop is closed
+            pass
+
+    def _queue_fetch(self, job_ids: list[str]):
+        job_ids = [job_id for job_id in job_ids if job_id in self._subscribers]
+        if job_ids:
+            self._pending.update(job_ids)
+            self._wakeup.set()
+
+    def _publish(self, job: JobInfo):
+        queues = self._subscribers.get(job.job_id)
+        if not queues:
+            return
+
+        state = (job.status, as_utc(job.updated_at))
+        last_state = self._last_published.get(job.job_id)
+        if last_state is not None and (state == last_state or state[1] < last_state[1]):
+            return
+
+        self._last_published[job.job_id] = state
+        self._notifications += 1
+        for queue in queues:
+            queue.put_nowait(job)
+
+    async def _run_fetcher(self):
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+
+            job_ids = list(self._pending)
+            self._pending.clear()
+
+            try:
+                self._queries += 1
+                for job in await self._job_store.get_jobs_by_id(job_ids):
+                    self._publish(job)
+            except Exception:
+                logger.exception("Failed to load jobs %s after a status change", job_ids)
+
+    async def _run_poller(self):
+        while True:
+            await asyncio.sleep(self._poll_interval)
+
+            if not self._subscribers:
+                continue
+
+            try:
+                self._queries += 1
+                jobs = await self._job_store.get_jobs_updated_since(self._watermark -
+                                                                    timedelta(seconds=self.POLL_OVERLAP))
+            except Exception:
+                logger.exception("Failed to poll for job status changes")
+                continue
+
+            for job in jobs:
+                self._watermark = max(self._watermark, as_utc(job.updated_at))
+                self._publish(job)
+
+    def _subscribe(self, job_id: str) -> asyncio.Queue[JobInfo | None]:
+        self._ensure_started()
+
+        queue = asyncio.Queue()
+        self._subscribers.setdefault(job_id, set()).add(queue)
+        return queue
+
+    def _unsubscribe(self, job_id: str, queue: asyncio.Queue[JobInfo | None]):
+        queues = self._subscribers.get(job_id)
+        if queues is None:
+            return
+
+        queues.discard(queue)
+        if not queues:
+            del self._subscribers[job_id]
+            self._last_published.pop(job_id, None)
+
+    async def watch(self, job_id: str, heartbeat_interval: float | None = None) -> AsyncGenerator[JobInfo | None]:
+        """
+        Yield the current state of a job, then its state after every status change until it finishes.
+
+        Parameters
+        ----------
+        job_id : str
+            The unique identifier of the job to watch.
+        heartbeat_interval : float | None, optional, default=None
+            If set, None is yielded whenever the status has not changed for this many seconds, allowing the caller to
+            keep its connection alive.
+
+        Yields
+        ------
+        JobInfo | None
+            The job after each status change, or None for a heartbeat. Nothing is yielded if the job does not exist.
+        """
+        # Subscribe before loading the job so that no change is missed in between
+        queue = self._subscribe(job_id)
+        try:
+            job = await self._job_store.get_job(job_id)
+            if job is None:
+                return
+
+            loop = asyncio.get_running_loop()
+            heartbeat_at = math.inf
+            last_state = None
+            reloaded = False
+            while True:
+                state = (job.status, as_utc(job.updated_at))
+
+                # Skip states which are not newer than the last one yielded. A reloaded job is the current state of the
+                # job, so a different status is yielded even if the clock of the process which updated it is behind.
+                if (last_state is None or state[1] > last_state[1] or (state[0] != last_state[0] and
+                                                                       (state[1] == last_state[1] or reloaded))):
+                    last_state = state
+                    yield job
+
+                    if heartbeat_interval is not None:
+                        heartbeat_at = loop.time() + heartbeat_interval
+
+                if JobStatus(last_state[0]) in self.FINISHED_STATUS:
+                    return
+
+                refresh_at = loop.time() + self._refresh_interval if self._refresh_interval is not None else math.inf
+                reloaded = False
+                while True:
+                    deadline = min(heartbeat_at, refresh_at)
+                    try:
+                        job = await asyncio.wait_for(queue.get(),
+                                                     timeout=deadline - loop.time() if deadline < math.inf else None)
+                        break
+                    except TimeoutError:
+                        pass
+
+                    if loop.time() >= heartbeat_at:
+                        heartbeat_at = loop.time() + heartbeat_interval
+                        yield None
+
+                    if loop.time() >= refresh_at:
+                        job = await self._reload_job(job_id)
+                        if job is not None:
+                            reloaded = True
+                            break
+
+                        refresh_at = loop.time() + self._refresh_interval
+
+                if job is None:
+                    # The hub was closed
+                    return
+        finally:
+            self._unsubscribe(job_id, queue)
+
+    async def _reload_job(self, job_id: str) -> JobInfo | None:
+        try:
+            self._queries += 1
+            return await self._job_store.get_job(job_id)
+        except Exception:
+            logger.exception("Failed to reload job %s", job_id)
+            return None
+
+    def get_stats(self) -> dict[str, typing.Any]:
+        """Get job status notification statistics."""
+        return {
+            "watched_jobs": len(self._subscribers),
+            "watchers": sum(len(queues) for queues in self._subscribers.values()),
+            "queries": self._queries,
+            "notifications": self._notifications,
+        }
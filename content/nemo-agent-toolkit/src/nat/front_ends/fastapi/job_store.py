@@ -13,6 +13,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import base64
+import binascii
 import json
 import logging
 import os
@@ -21,7 +24,11 @@ import typing
 from asyncio import current_task
 from collections.abc import AsyncGenerator
 from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Sequence
 from contextlib import asynccontextmanager
+from contextlib import suppress
+from dataclasses import dataclass
 from datetime import UTC
 from datetime import datetime
 from datetime import timedelta
@@ -34,8 +41,10 @@ from dask.distributed import Variable
 from dask.distributed import fire_and_forget
 from pydantic import BaseModel
 from sqlalchemy import DateTime
+from sqlalchemy import Index
 from sqlalchemy import String
 from sqlalchemy import and_
+from sqlalchemy import or_
 from sqlalchemy import select
 from sqlalchemy import update
 from sqlalchemy.ext.asyncio import async_scoped_session
@@ -117,6 +126,15 @@ class JobInfo(Base):
         Flag indicating if the job has been marked as expired.
     """
     __tablename__ = "job_info"
+    __table_args__ = (
+        # Listing jobs newest first, optionally filtered by status, with (created_at, job_id) as the page cursor
+        Index("ix_job_info_created_at_job_id", "created_at", "job_id"),
+        Index("ix_job_info_status_created_at_job_id", "status", "created_at", "job_id"),
+        # Finding expiry candidates, oldest update first
+        Index("ix_job_info_is_expired_updated_at", "is_expired", "updated_at"),
+        # Finding recently updated jobs to notify clients waiting on them
+        Index("ix_job_info_updated_at", "updated_at"),
+    )
 
     job_id: Mapped[str] = mapped_column(primary_key=True)
     status: Mapped[JobStatus] = mapped_column(String(11))
@@ -135,6 +153,52 @@ class JobInfo(Base):
         return f"JobInfo(job_id={self.job_id}, status={self.status})"
 
 
+@dataclass
+class JobPage:
+    """
+    A page of jobs returned by `JobStore.get_jobs`.
+
+    Attributes
+    ----------
+    jobs : list[JobInfo]
+        The jobs in this page, most recently created first.
+    next_cursor : str, optional
+        Opaque cursor which retrieves the next page when passed to `JobStore.get_jobs`, None if this is the last page.
+    """
+    jobs: list[JobInfo]
+    next_cursor: str | None = None
+
+
+def as_utc(value: datetime) -> datetime:
+    """
+    Make a datetime loaded from the database timezone aware.
+
+    Parameters
+    ----------
+    value : datetime
+        The datetime, naive datetimes are assumed to be in UTC.
+
+    Returns
+    -------
+    datetime
+        The datetime with a timezone.
+    """
+    if value.tzinfo is None:
+        # Not all DB backends support timezone aware datetimes
+        return value.replace(tzinfo=UTC)
+
+    return value
+
+
+def _remove_output_path(output_path: str) -> None:
+    # If it is a file remove it
+    if os.path.isfile(output_path):
+        os.remove(output_path)
+    # If it is a directory remove it
+    elif os.path.isdir(output_path):
+        shutil.rmtree(output_path)
+
+
 class JobStore(DaskClientMixin):
     """
     Tracks and manages jobs submitted to the Dask scheduler, along with persisting job metadata (JobInfo objects) in a
@@ -158,6 +222,15 @@ class JobStore(DaskClientMixin):
     # active jobs are exempt from expiry
     ACTIVE_STATUS = {JobStatus.RUNNING, JobStatus.SUBMITTED}
 
+    # Maximum number of job IDs in a single UPDATE statement, SQLite limits the number of bound parameters
+    UPDATE_BATCH_SIZE = 500
+
+    # Number of expiry candidates loaded from the database at a time
+    EXPIRY_BATCH_SIZE = 500
+
+    # Called with the IDs of jobs whose status changed, shared by every job store in the process
+    _status_listeners: set[Callable[[list[str]], None]] = set()
+
     def __init__(
         self,
         scheduler_address: str,
@@ -180,6 +253,8 @@ class JobStore(DaskClientMixin):
         # within the same task, and that no two tasks share the same session.
         self._session = async_scoped_session(session_maker, scopefunc=current_task)
 
+        self._expiry_task: asyncio.Task | None = None
+
     @asynccontextmanager
     async def client(self) -> AsyncGenerator[DaskClient]:
         """
@@ -353,28 +428,97 @@ class JobStore(DaskClientMixin):
             If the specified job_id does not exist in the job store.
         """
 
+        if not isinstance(status, JobStatus):
+            status = JobStatus(status)
+
+        if isinstance(output, BaseModel):
+            # Convert BaseModel to JSON string for storage
+            output = output.model_dump_json(round_trip=True)
+
+        if isinstance(output, dict | list):
+            # Convert dict or list to JSON string for storage
+            output = json.dumps(output)
+
+        # A single UPDATE statement, rather than loading the job first
+        stmt = update(JobInfo).where(JobInfo.job_id == job_id).values(status=status.value,
+                                                                      error=error,
+                                                                      output_path=output_path,
+                                                                      output=output,
+                                                                      updated_at=datetime.now(UTC))
         async with self.session() as session:
-            job: JobInfo = await session.get(JobInfo, job_id)
-            if job is None:
+            result = await session.execute(stmt, execution_options={"synchronize_session": False})
+            if result.rowcount == 0:
                 raise ValueError(f"Job {job_id} not found in job store")
 
-            if not isinstance(status, JobStatus):
-                status = JobStatus(status)
+        self._notify_status_listeners([job_id])
+
+    async def update_statuses(self, job_ids: Sequence[str], status: str | JobStatus, error: str | None = None) -> int:
+        """
+        Update the status of many jobs at once, for example to mark every running job as interrupted. Jobs are updated
+        with one UPDATE statement per `UPDATE_BATCH_SIZE` jobs in a single transaction.
+
+        Parameters
+        ----------
+        job_ids : Sequence[str]
+            The unique identifiers of the jobs to update. Unknown job IDs are ignored.
+        status : str | JobStatus
+            The new status to set for the jobs.
+        error : str, optional, default=None
+            Error message to store for the jobs.
+
+        Returns
+        -------
+        int
+            The number of jobs which were updated.
+        """
+        if not isinstance(status, JobStatus):
+            status = JobStatus(status)
+
+        now = datetime.now(UTC)
+        num_updated = 0
+        async with self.session() as session:
+            for start in range(0, len(job_ids), self.UPDATE_BATCH_SIZE):
+                stmt = update(JobInfo).where(JobInfo.job_id.in_(job_ids[start:start + self.UPDATE_BATCH_SIZE])).values(
+                    status=status.value, error=error, updated_at=now)
+                result = await session.execute(stmt, execution_options={"synchronize_session": False})
+                num_updated += result.rowcount
 
-            job.status = status.value
-            job.error = error
-            job.output_path = output_path
-            job.updated_at = datetime.now(UTC)
+        self._notify_status_listeners(list(job_ids))
+        return num_updated
 
-            if isinstance(output, BaseModel):
-                # Convert BaseModel to JSON string for storage
-                output = output.model_dump_json(round_trip=True)
+    @classmethod
+    def add_status_listener(cls, listener: Callable[[list[str]], None]):
+        """
+        Register a callback which is called with the IDs of jobs whose status changed, after the change is committed.
 
-            if isinstance(output, dict | list):
-                # Convert dict or list to JSON string for storage
-                output = json.dumps(output)
+        Listeners are shared by every job store in the process, and are only notified of changes made in this process.
+        They may be called from any thread, and must not block.
 
-            job.output = output
+        Parameters
+        ----------
+        listener : Callable[[list[str]], None]
+            The callback to register.
+        """
+        cls._status_listeners.add(listener)
+
+    @classmethod
+    def remove_status_listener(cls, listener: Callable[[list[str]], None]):
+        """
+        Unregister a callback registered with `add_status_listener`.
+
+        Parameters
+        ----------
+        listener : Callable[[list[str]], None]
+            The callback to unregister.
+        """
+        cls._status_listeners.discard(listener)
+
+    def _notify_status_listeners(self, job_ids: list[str]):
+        for listener in list(self._status_listeners):
+            try:
+                listener(job_ids)
+            except Exception:
+                logger.exception("Error notifying job status listener %s", listener)
 
     async def get_all_jobs(self) -> list[JobInfo]:
         """
@@ -389,11 +533,136 @@ class JobStore(DaskClientMixin):
         Warning
         -------
         This method loads all jobs into memory and should be used with caution in production environments with large
-        job stores.
+        job stores, prefer `get_jobs` which returns one page at a time.
         """
         async with self.session() as session:
             return (await session.scalars(select(JobInfo))).all()
 
+    async def get_jobs_by_id(self, job_ids: Sequence[str]) -> list[JobInfo]:
+        """
+        Retrieve several jobs by their unique identifiers.
+
+        Parameters
+        ----------
+        job_ids : Sequence[str]
+            The unique identifiers of the jobs to retrieve.
+
+        Returns
+        -------
+        list[JobInfo]
+            The jobs which exist, in no particular order.
+        """
+        jobs = []
+        async with self.session() as session:
+            for start in range(0, len(job_ids), self.UPDATE_BATCH_SIZE):
+                stmt = select(JobInfo).where(JobInfo.job_id.in_(job_ids[start:start + self.UPDATE_BATCH_SIZE]))
+                jobs.extend((await session.scalars(stmt)).all())
+
+        return jobs
+
+    async def get_jobs_updated_since(self, updated_after: datetime) -> list[JobInfo]:
+        """
+        Retrieve the jobs which were updated after the given time.
+
+        Parameters
+        ----------
+        updated_after : datetime
+            Only return jobs updated after this time. Naive datetimes are assumed to be in UTC.
+
+        Returns
+        -------
+        list[JobInfo]
+            The jobs updated after the given time, least recently updated first.
+        """
+        stmt = select(JobInfo).where(JobInfo.updated_at > as_utc(updated_after)).order_by(JobInfo.updated_at)
+        async with self.session() as session:
+            return list((await session.scalars(stmt)).all())
+
+    @staticmethod
+    def _encode_cursor(job: JobInfo) -> str:
+        cursor = json.dumps([as_utc(job.created_at).isoformat(), job.job_id])
+        return base64.urlsafe_b64encode(cursor.encode()).decode()
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> tuple[datetime, str]:
+        try:
+            (created_at, job_id) = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            return (datetime.fromisoformat(created_at), str(job_id))
+        except (binascii.Error, TypeError, ValueError) as e:
+            raise ValueError(f"Invalid job cursor: {cursor}") from e
+
+    async def get_jobs(self,
+                       status: str | JobStatus | Iterable[str | JobStatus] | None = None,
+                       *,
+                       created_after: datetime | None = None,
+                       created_before: datetime | None = None,
+                       limit: int | None = 100,
+                       cursor: str | None = None) -> JobPage:
+        """
+        Retrieve one page of jobs, most recently created first.
+
+        Pages are selected with a cursor on (created_at, job_id) rather than an offset, so retrieving a page costs the
+        same regardless of how many jobs precede it. The status and creation time filters are served by indexes.
+
+        Parameters
+        ----------
+        status : str | JobStatus | Iterable[str | JobStatus], optional, default=None
+            Only return jobs with this status, or with any of these statuses.
+        created_after : datetime, optional, default=None
+            Only return jobs created at or after this time. Naive datetimes are assumed to be in UTC.
+        created_before : datetime, optional, default=None
+            Only return jobs created before this time. Naive datetimes are assumed to be in UTC.
+        limit : int, optional, default=100
+            The maximum number of jobs in the page, or None to return every matching job.
+        cursor : str, optional, default=None
+            The `next_cursor` of the previous page, or None to retrieve the first page.
+
+        Returns
+        -------
+        JobPage
+            The jobs in the page, and the cursor of the next page if there are more matching jobs.
+
+        Raises
+        ------
+        ValueError
+            If the limit is less than 1, or the cursor is invalid.
+        """
+        if limit is not None and limit < 1:
+            raise ValueError(f"limit must be at least 1, got {limit}")
+
+        stmt = select(JobInfo)
+
+        if status is not None:
+            statuses = [status] if isinstance(status, str) else list(status)
+            stmt = stmt.where(JobInfo.status.in_([JobStatus(s).value for s in statuses]))
+
+        if created_after is not None:
+            stmt = stmt.where(JobInfo.created_at >= as_utc(created_after))
+
+        if created_before is not None:
+            stmt = stmt.where(JobInfo.created_at < as_utc(created_before))
+
+        if cursor is not None:
+            (cursor_created_at, cursor_job_id) = self._decode_cursor(cursor)
+            stmt = stmt.where(
+                or_(JobInfo.created_at < cursor_created_at,
+                    and_(JobInfo.created_at == cursor_created_at, JobInfo.job_id < cursor_job_id)))
+
+        stmt = stmt.order_by(JobInfo.created_at.desc(), JobInfo.job_id.desc())
+
+        if limit is not None:
+            # Fetch one extra job to find out if there is a next page
+            stmt = stmt.limit(limit + 1)
+
+        async with self.session() as session:
+            jobs = list((await session.scalars(stmt)).all())
+
+        if limit is not None and len(jobs) > limit:
+            jobs = jobs[:limit]
+            return JobPage(jobs=jobs, next_cursor=self._encode_cursor(jobs[-1]))
+
+        return JobPage(jobs=jobs)
+
     async def get_job(self, job_id: str) -> JobInfo | None:
         """
         Retrieve a specific job by its unique identifier.
@@ -441,7 +710,7 @@ class JobStore(DaskClientMixin):
             The JobInfo object for the most recently created job based on the created_at timestamp, or None if no jobs
             exist in the store.
         """
-        stmt = select(JobInfo).order_by(JobInfo.created_at.desc())
+        stmt = select(JobInfo).order_by(JobInfo.created_at.desc(), JobInfo.job_id.desc()).limit(1)
         async with self.session() as session:
             last_job = (await session.scalars(stmt)).first()
 
@@ -495,67 +764,189 @@ class JobStore(DaskClientMixin):
         if job.status in self.ACTIVE_STATUS:
             return None
 
-        updated_at = job.updated_at
-        if updated_at.tzinfo is None:
-            # Not all DB backends support timezone aware datetimes
-            updated_at = updated_at.replace(tzinfo=UTC)
+        return as_utc(job.updated_at) + timedelta(seconds=job.expiry_seconds)
+
+    async def _expire_job(self,
+                          client: DaskClient,
+                          job: JobInfo,
+                          semaphore: asyncio.Semaphore,
+                          variable_timeout: float) -> bool:
+        async with semaphore:
+            try:
+                # cleanup output dir if present, without blocking the event loop
+                if job.output_path:
+                    logger.info("Cleaning up output directory for job %s at %s", job.job_id, job.output_path)
+                    await asyncio.to_thread(_remove_output_path, job.output_path)
+
+                var = Variable(name=job.job_id, client=client)
+                try:
+                    future = await var.get(timeout=variable_timeout)
+                    if isinstance(future, Future):
+                        await client.cancel([future], asynchronous=True, force=True)
+
+                except TimeoutError:
+                    pass
 
-        return updated_at + timedelta(seconds=job.expiry_seconds)
+                var.delete()
+                return True
+            except Exception:
+                logger.exception("Failed to expire %s", job.job_id)
+                return False
 
-    async def cleanup_expired_jobs(self):
+    async def _mark_expired(self, job_ids: Sequence[str]):
+        async with self.session() as session:
+            for start in range(0, len(job_ids), self.UPDATE_BATCH_SIZE):
+                await session.execute(update(JobInfo).where(
+                    JobInfo.job_id.in_(job_ids[start:start + self.UPDATE_BATCH_SIZE])).values(is_expired=True),
+                                      execution_options={"synchronize_session": False})
+
+    async def cleanup_expired_jobs(self,
+                                   batch_size: int | None = None,
+                                   max_concurrency: int = 8,
+                                   variable_timeout: float = 5.0) -> int:
         """
         Cleanup expired jobs, keeping the most recent one.
 
         Updated_at is used instead of created_at to determine the most recent job. This is because jobs may not be
         processed in the order they are created.
+
+        Expiry candidates are loaded in batches, oldest update first. Up to `max_concurrency` jobs of a batch are expired
+        at a time, removing their output files in a worker thread, and each batch is marked as expired before the next
+        one is loaded.
+
+        Parameters
+        ----------
+        batch_size : int, optional, default=None
+            Number of expiry candidates loaded at a time, defaults to `EXPIRY_BATCH_SIZE`.
+        max_concurrency : int, optional, default=8
+            Maximum number of jobs being expired at the same time.
+        variable_timeout : float, optional, default=5.0
+            Seconds to wait for the Dask future of a job to be retrieved so it can be cancelled.
+
+        Returns
+        -------
+        int
+            The number of jobs which were expired.
         """
+        batch_size = batch_size or self.EXPIRY_BATCH_SIZE
         now = datetime.now(UTC)
 
-        stmt = select(JobInfo).where(
-            and_(JobInfo.is_expired == sa_expr.false(),
-                 JobInfo.status.not_in(self.ACTIVE_STATUS))).order_by(JobInfo.updated_at.desc())
         # Filter out active jobs
-        async with (self.client() as client, self.session() as session):
-            finished_jobs = (await session.execute(stmt)).scalars().all()
+        finished = and_(JobInfo.is_expired == sa_expr.false(), JobInfo.status.not_in(self.ACTIVE_STATUS))
 
+        async with self.session() as session:
             # Always keep the most recent finished job
-            jobs_to_check = finished_jobs[1:]
-
-            expired_ids = []
-            for job in jobs_to_check:
-                expires_at = self.get_expires_at(job)
-                if expires_at and now > expires_at:
-                    expired_ids.append(job.job_id)
-                    # cleanup output dir if present
-                    if job.output_path:
-                        logger.info("Cleaning up output directory for job %s at %s", job.job_id, job.output_path)
-                        # If it is a file remove it
-                        if os.path.isfile(job.output_path):
-                            os.remove(job.output_path)
-                        # If it is a directory remove it
-                        elif os.path.isdir(job.output_path):
-                            shutil.rmtree(job.output_path)
-
-            if len(expired_ids) > 0:
-                successfully_expired = []
-                for job_id in expired_ids:
-                    try:
-                        var = Variable(name=job_id, client=client)
-                        try:
-                            future = await var.get(timeout=5)
-                            if isinstance(future, Future):
-                                await client.cancel([future], asynchronous=True, force=True)
-
-                        except TimeoutError:
-                            pass
-
-                        var.delete()
-                        successfully_expired.append(job_id)
-                    except Exception:
-                        logger.exception("Failed to expire %s", job_id)
-
-                await session.execute(
-                    update(JobInfo).where(JobInfo.job_id.in_(successfully_expired)).values(is_expired=True))
+            keep_job_id = await session.scalar(
+                select(JobInfo.job_id).where(finished).order_by(JobInfo.updated_at.desc()).limit(1))
+
+        # No job expires sooner than MIN_EXPIRY seconds after its last update, this lets the database skip recent jobs
+        candidates = select(JobInfo).where(finished, JobInfo.updated_at <= now - timedelta(seconds=self.MIN_EXPIRY))
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+        num_expired = 0
+        last_job: JobInfo | None = None
+
+        async with self.client() as client:
+            while True:
+                stmt = candidates
+                if last_job is not None:
+                    stmt = stmt.where(
+                        or_(JobInfo.updated_at > last_job.updated_at,
+                            and_(JobInfo.updated_at == last_job.updated_at, JobInfo.job_id > last_job.job_id)))
+
+                async with self.session() as session:
+                    jobs = (await session.scalars(
+                        stmt.order_by(JobInfo.updated_at, JobInfo.job_id).limit(batch_size))).all()
+
+                if not jobs:
+                    break
+
+                last_job = jobs[-1]
+
+                expired_jobs = []
+                for job in jobs:
+                    expires_at = self.get_expires_at(job)
+                    if job.job_id != keep_job_id and expires_at and now > expires_at:
+                        expired_jobs.append(job)
+
+                results = await asyncio.gather(
+                    *(self._expire_job(client, job, semaphore, variable_timeout) for job in expired_jobs))
+
+                successfully_expired = [job.job_id for (job, expired) in zip(expired_jobs, results) if expired]
+                if successfully_expired:
+                    await self._mark_expired(successfully_expired)
+                    num_expired += len(successfully_expired)
+
+                if len(jobs) < batch_size:
+                    break
+
+        return num_expired
+
+    async def _run_expiry_loop(self, interval: float, **cleanup_kwargs):
+        logger.info("Starting periodic cleanup of expired jobs every %s seconds", interval)
+        while True:
+            await asyncio.sleep(interval)
+
+            try:
+                num_expired = await self.cleanup_expired_jobs(**cleanup_kwargs)
+                logger.debug("Expired %d jobs", num_expired)
+            except Exception:
+                logger.exception("Error during job cleanup")
+
+    def start_expiry_task(self, interval: float = 300, **cleanup_kwargs) -> asyncio.Task:
+        """
+        Start a background task on the running event loop which calls `cleanup_expired_jobs` every `interval` seconds.
+        If the task is already running, it is returned as-is.
+
+        Parameters
+        ----------
+        interval : float, optional, default=300
+            Seconds to wait between cleanups.
+        cleanup_kwargs : dict[str, typing.Any]
+            Keyword arguments passed to `cleanup_expired_jobs`.
+
+        Returns
+        -------
+        asyncio.Task
+            The background task, cancelling it stops the periodic cleanup.
+        """
+        if self._expiry_task is None or self._expiry_task.done():
+            self._expiry_task = asyncio.create_task(self._run_expiry_loop(interval, **cleanup_kwargs),
+                                                    name="job_store_expiry")
+
+        return self._expiry_task
+
+    async def stop_expiry_task(self):
+        """Stop the background task started by `start_expiry_task`, if any."""
+        if self._expiry_task is None:
+            return
+
+        self._expiry_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._expiry_task
+
+        self._expiry_task = None
+
+
+async def create_tables(db_engine: "AsyncEngine"):
+    """
+    Create the job store tables and indexes if they do not exist.
+
+    Parameters
+    ----------
+    db_engine: AsyncEngine
+        The database engine for the job store.
+    """
+
+    def _create_all(connection):
+        Base.metadata.create_all(connection, checkfirst=True)
+
+        # create_all skips the indexes of tables which already exist, add indexes introduced after the table was created
+        for index in JobInfo.__table__.indexes:
+            index.create(connection, checkfirst=True)
+
+    async with db_engine.begin() as conn:
+        await conn.run_sync(_create_all)
 
 
 def get_db_engine(db_url: str | None = None, echo: bool = False, use_async: bool = True) -> "Engine | AsyncEngine":
@@ -599,4 +990,4 @@ def get_db_engine(db_url: str | None = None, echo: bool = False, use_async: bool
 
 
 # Prevent Sphinx from attempting to document the Base class which produces warnings
-__all__ = ["get_db_engine", "JobInfo", "JobStatus", "JobStore"]
+__all__ = ["create_tables", "get_db_engine", "JobInfo", "JobPage", "JobStatus", "JobStore"]
@@ -329,7 +329,7 @@ class WebSocketMessageHandler:
                 async for value in generate_streaming_response(payload,
                                                                session_manager=session,
                                                                streaming=True,
-                                                               step_adaptor=self._step_adaptor,
+                                                               step_adaptor=StepAdaptor(self._step_adaptor.config),
                                                                result_type=result_type,
                                                                output_type=output_type):
 
@@ -17,73 +17,123 @@ import asyncio
 import typing
 from collections.abc import AsyncGenerator
 
-from nat.data_models.api_server import ResponseIntermediateStep
 from nat.data_models.api_server import ResponsePayloadOutput
 from nat.data_models.api_server import ResponseSerializable
 from nat.data_models.step_adaptor import StepAdaptorConfig
 from nat.front_ends.fastapi.intermediate_steps_subscriber import pull_intermediate
 from nat.front_ends.fastapi.step_adaptor import StepAdaptor
+from nat.front_ends.fastapi.step_serializer import SerializedIntermediateStep
+from nat.front_ends.fastapi.step_serializer import parse_filter_steps
 from nat.runtime.session import SessionManager
 from nat.utils.producer_consumer_queue import AsyncIOProducerConsumerQueue
+from nat.utils.producer_consumer_queue import QueueClosed
+
+# Upper bound on items buffered between the workflow and the network writer. Once reached, result chunks wait for the
+# client to catch up instead of accumulating in memory.
+STREAM_QUEUE_MAXSIZE = 1024
+
+# Maximum number of already-queued items flushed together in a single network write.
+STREAM_MAX_BATCH_SIZE = 64
+
+
+async def _iter_queue_batches(q: AsyncIOProducerConsumerQueue, max_batch_size: int) -> AsyncGenerator[list]:
+    """
+    Yield items from `q` in batches. Each batch waits for at least one item and then takes whatever else is already
+    available, up to `max_batch_size`, so bursts are flushed together without delaying a lone item.
+    """
+    while True:
+        try:
+            batch = [await q.get()]
+        except QueueClosed:
+            return
+
+        while len(batch) < max_batch_size and not q.empty():
+            batch.append(q.get_nowait())
+
+        yield batch
+
+
+def _join_stream_data(batch: list[ResponseSerializable]) -> str:
+    parts = []
+
+    for item in batch:
+        if (isinstance(item, ResponseSerializable)):
+            parts.append(item.get_stream_data())
+        else:
+            raise ValueError("Unexpected item type in stream. Expected ChatResponseSerializable, got: " +
+                             str(type(item)))
+
+    return "".join(parts)
 
 
 async def generate_streaming_response_as_str(payload: typing.Any,
                                              *,
                                              session_manager: SessionManager,
                                              streaming: bool,
-                                             step_adaptor: StepAdaptor = StepAdaptor(StepAdaptorConfig()),
+                                             step_adaptor: StepAdaptor | None = None,
                                              result_type: type | None = None,
                                              output_type: type | None = None) -> AsyncGenerator[str]:
 
-    async for item in generate_streaming_response(payload,
-                                                  session_manager=session_manager,
-                                                  streaming=streaming,
-                                                  step_adaptor=step_adaptor,
-                                                  result_type=result_type,
-                                                  output_type=output_type):
-
-        if (isinstance(item, ResponseSerializable)):
-            yield item.get_stream_data()
-        else:
-            raise ValueError("Unexpected item type in stream. Expected ChatResponseSerializable, got: " +
-                             str(type(item)))
+    async for batch in _generate_streaming_response_batches(payload,
+                                                            session_manager=session_manager,
+                                                            streaming=streaming,
+                                                            step_adaptor=step_adaptor,
+                                                            result_type=result_type,
+                                                            output_type=output_type):
+        yield _join_stream_data(batch)
 
 
 async def generate_streaming_response(payload: typing.Any,
                                       *,
                                       session_manager: SessionManager,
                                       streaming: bool,
-                                      step_adaptor: StepAdaptor = StepAdaptor(StepAdaptorConfig()),
+                                      step_adaptor: StepAdaptor | None = None,
                                       result_type: type | None = None,
                                       output_type: type | None = None) -> AsyncGenerator[ResponseSerializable]:
 
+    async for batch in _generate_streaming_response_batches(payload,
+                                                            session_manager=session_manager,
+                                                            streaming=streaming,
+                                                            step_adaptor=step_adaptor,
+                                                            result_type=result_type,
+                                                            output_type=output_type):
+        for item in batch:
+            yield item
+
+
+async def _generate_streaming_response_batches(payload: typing.Any,
+                                               *,
+                                               session_manager: SessionManager,
+                                               streaming: bool,
+                                               step_adaptor: StepAdaptor | None,
+                                               result_type: type | None,
+                                               output_type: type | None) -> AsyncGenerator[list[ResponseSerializable]]:
+
+    # The adaptor holds the state of the steps in a run, so it is never shared between runs
+    if (step_adaptor is None):
+        step_adaptor = StepAdaptor(StepAdaptorConfig())
+
     async with session_manager.run(payload) as runner:
 
-        q: AsyncIOProducerConsumerQueue[ResponseSerializable] = AsyncIOProducerConsumerQueue()
+        q: AsyncIOProducerConsumerQueue[ResponseSerializable] = AsyncIOProducerConsumerQueue(
+            maxsize=STREAM_QUEUE_MAXSIZE)
 
         # Start the intermediate stream
         intermediate_complete = await pull_intermediate(q, step_adaptor)
 
         async def pull_result():
-            if session_manager.workflow.has_streaming_output and streaming:
-                async for chunk in runner.result_stream(to_type=output_type):
-                    await q.put(chunk)
-            else:
-                result = await runner.result(to_type=result_type)
-                await q.put(runner.convert(result, output_type))
-
-            # Wait until the intermediate subscription is done before closing q
-            # But we have no direct "intermediate_done" reference here
-            # because it's encapsulated in pull_intermediate. So we can do:
-            #    await some_event.wait()
-            # If needed. Alternatively, you can skip that if the intermediate
-            # subscriber won't block the main flow.
-            #
-            # For example, if you *need* to guarantee the subscriber is done before
-            # closing the queue, you can structure the code to store or return
-            # the 'intermediate_done' event from pull_intermediate.
-            #
+            try:
+                if session_manager.workflow.has_streaming_output and streaming:
+                    async for chunk in runner.result_stream(to_type=output_type):
+                        await q.put(chunk)
+                else:
+                    result = await runner.result(to_type=result_type)
+                    await q.put(runner.convert(result, output_type))
+            except QueueClosed:
+                # The client went away, there is nobody left to deliver the result to
+                return
 
+            # Wait until every intermediate step has been handed to the queue before closing it
             await intermediate_complete.wait()
 
             await q.close()
@@ -92,12 +142,11 @@ async def generate_streaming_response(payload: typing.Any,
             # Start the result stream
             asyncio.create_task(pull_result())
 
-            async for item in q:
-
-                if (isinstance(item, ResponseSerializable)):
-                    yield item
-                else:
-                    yield ResponsePayloadOutput(payload=item)
+            async for batch in _iter_queue_batches(q, STREAM_MAX_BATCH_SIZE):
+                yield [
+                    item if isinstance(item, ResponseSerializable) else ResponsePayloadOutput(payload=item)
+                    for item in batch
+                ]
         except Exception:
             # Handle exceptions here
             raise
@@ -125,31 +174,48 @@ async def generate_streaming_response_full(payload: typing.Any,
                                            output_type: type | None = None,
                                            filter_steps: str | None = None) -> AsyncGenerator[ResponseSerializable]:
     """
-    Similar to generate_streaming_response but provides raw ResponseIntermediateStep objects
+    Similar to generate_streaming_response but provides raw, pre-serialized intermediate steps
     without any step adaptor translations.
     """
-    # Parse filter_steps into a set of allowed types if provided
-    # Special case: if filter_steps is "none", suppress all steps
-    allowed_types = None
-    if filter_steps:
-        if filter_steps.lower() == "none":
-            allowed_types = set()  # Empty set means no steps allowed
-        else:
-            allowed_types = set(filter_steps.split(','))
+    async for batch in _generate_streaming_response_full_batches(payload,
+                                                                 session_manager=session_manager,
+                                                                 streaming=streaming,
+                                                                 result_type=result_type,
+                                                                 output_type=output_type,
+                                                                 filter_steps=filter_steps):
+        for item in batch:
+            yield item
+
+
+async def _generate_streaming_response_full_batches(
+        payload: typing.Any,
+        *,
+        session_manager: SessionManager,
+        streaming: bool,
+        result_type: type | None,
+        output_type: type | None,
+        filter_steps: str | None) -> AsyncGenerator[list[ResponseSerializable]]:
+    # Resolve the filter up front so that excluded steps are dropped by the subscription itself
+    allowed_types = parse_filter_steps(filter_steps)
 
     async with session_manager.run(payload) as runner:
-        q: AsyncIOProducerConsumerQueue[ResponseSerializable] = AsyncIOProducerConsumerQueue()
+        q: AsyncIOProducerConsumerQueue[ResponseSerializable] = AsyncIOProducerConsumerQueue(
+            maxsize=STREAM_QUEUE_MAXSIZE)
 
         # Start the intermediate stream without step adaptor
-        intermediate_complete = await pull_intermediate(q, None)
+        intermediate_complete = await pull_intermediate(q, None, event_types=allowed_types)
 
         async def pull_result():
-            if session_manager.workflow.has_streaming_output and streaming:
-                async for chunk in runner.result_stream(to_type=output_type):
-                    await q.put(chunk)
-            else:
-                result = await runner.result(to_type=result_type)
-                await q.put(runner.convert(result, output_type))
+            try:
+                if session_manager.workflow.has_streaming_output and streaming:
+                    async for chunk in runner.result_stream(to_type=output_type):
+                        await q.put(chunk)
+                else:
+                    result = await runner.result(to_type=result_type)
+                    await q.put(runner.convert(result, output_type))
+            except QueueClosed:
+                # The client went away, there is nobody left to deliver the result to
+                return
 
             await intermediate_complete.wait()
             await q.close()
@@ -158,13 +224,11 @@ async def generate_streaming_response_full(payload: typing.Any,
             # Start the result stream
             asyncio.create_task(pull_result())
 
-            async for item in q:
-                if (isinstance(item, ResponseIntermediateStep)):
-                    # Filter intermediate steps if filter_steps is provided
-                    if allowed_types is None or item.type in allowed_types:
-                        yield item
-                else:
-                    yield ResponsePayloadOutput(payload=item)
+            async for batch in _iter_queue_batches(q, STREAM_MAX_BATCH_SIZE):
+                yield [
+                    item if isinstance(item, SerializedIntermediateStep) else ResponsePayloadOutput(payload=item)
+                    for item in batch
+                ]
         except Exception:
             # Handle exceptions here
             raise
@@ -180,16 +244,13 @@ async def generate_streaming_response_full_as_str(payload: typing.Any,
                                                   output_type: type | None = None,
                                                   filter_steps: str | None = None) -> AsyncGenerator[str]:
     """
-    Similar to generate_streaming_response but converts the response to a string format.
+    Similar to generate_streaming_response but converts the response to a string format. Items that are already
+    queued are joined into a single chunk so that bursts of events are flushed with one network write.
     """
-    async for item in generate_streaming_response_full(payload,
-                                                       session_manager=session_manager,
-                                                       streaming=streaming,
-                                                       result_type=result_type,
-                                                       output_type=output_type,
-                                                       filter_steps=filter_steps):
-        if (isinstance(item, ResponseIntermediateStep) or isinstance(item, ResponsePayloadOutput)):
-            yield item.get_stream_data()
-        else:
-            raise ValueError("Unexpected item type in stream. Expected ChatResponseSerializable, got: " +
-                             str(type(item)))
+    async for batch in _generate_streaming_response_full_batches(payload,
+                                                                 session_manager=session_manager,
+                                                                 streaming=streaming,
+                                                                 result_type=result_type,
+                                                                 output_type=output_type,
+                                                                 filter_steps=filter_steps):
+        yield _join_stream_data(batch)
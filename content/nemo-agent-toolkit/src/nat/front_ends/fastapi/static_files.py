@@ -0,0 +1,401 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import contextlib
+import logging
+import os
+import typing
+from collections.abc import AsyncGenerator
+
+from fastapi import HTTPException
+from fastapi import Request
+from fastapi import Response
+from fastapi import UploadFile
+from starlette.types import Receive
+from starlette.types import Scope
+from starlette.types import Send
+
+from nat.data_models.object_store import NoSuchKeyError
+from nat.object_store.interfaces import ObjectStore
+from nat.object_store.models import ObjectStoreItemInfo
+
+logger = logging.getLogger(__name__)
+
+# ASGI extension for sending part of a file without copying it through the application, e.g. with sendfile
+ZERO_COPY_SEND_EXTENSION = "http.response.zerocopysend"
+
+
+class RangeNotSatisfiableError(ValueError):
+    """Raised when a byte range starts past the end of the file."""
+    pass
+
+
+def parse_range_header(value: str, size: int) -> tuple[int, int] | None:
+    """
+    Parse the value of a `Range` header requesting a single byte range.
+
+    Parameters
+    ----------
+    value : str
+        The value of the header, e.g. "bytes=0-499", "bytes=500-" or "bytes=-500".
+    size : int
+        The size of the file in bytes.
+
+    Returns
+    -------
+    tuple[int, int] | None
+        The offsets of the first byte in the range and of the byte after the range, or None if the header is invalid
+        or requests multiple ranges, in which case it should be ignored and the whole file sent.
+
+    Raises
+    ------
+    RangeNotSatisfiableError
+        If the range does not overlap the file.
+    """
+    (unit, _, ranges) = value.partition("=")
+    if unit.strip().lower() != "bytes" or "," in ranges:
+        return None
+
+    (first, separator, last) = ranges.strip().partition("-")
+    if not separator:
+        return None
+
+    try:
+        if not first:
+            # The last N bytes of the file
+            suffix_length = int(last)
+            if suffix_length <= 0 or size == 0:
+                raise RangeNotSatisfiableError(value)
+
+            return (max(size - suffix_length, 0), size)
+
+        start = int(first)
+        end = int(last) + 1 if last else None
+    except RangeNotSatisfiableError:
+        raise
+    except ValueError:
+        return None
+
+    if start < 0 or (end is not None and end <= start):
+        return None
+
+    if start >= size:
+        raise RangeNotSatisfiableError(value)
+
+    return (start, size if end is None else min(end, size))
+
+
+def etag_matches(header_value: str, etag: str) -> bool:
+    """
+    Check whether an `If-None-Match` header matches an entity tag, using the weak comparison of RFC 9110.
+
+    Parameters
+    ----------
+    header_value : str
+        The value of the header, a comma separated list of entity tags or "*".
+    etag : str
+        The quoted entity tag of the file.
+
+    Returns
+    -------
+    bool
+        True if any of the entity tags in the header matches.
+    """
+    tags = [tag.strip() for tag in header_value.split(",")]
+    return any(tag == "*" or tag.removeprefix("W/") == etag for tag in tags)
+
+
+class StaticFileResponse(Response):
+    """
+    Streams the data of a static file from the object store, or from a local file when the object store keeps the
+    object in one.
+
+    Local files are sent with the `http.response.zerocopysend` ASGI extension when the server supports it, so that the
+    data never passes through the application. Otherwise they are read in chunks with `os.pread`.
+
+    Parameters
+    ----------
+    object_store : ObjectStore
+        The object store holding the file.
+    key : str
+        The key of the file in the object store.
+    start : int
+        Offset of the first byte to send.
+    end : int
+        Offset after the last byte to send.
+    local_path : str | None
+        Path of the local file holding the data, if any.
+    limiter : asyncio.Semaphore | None
+        Semaphore to hold while sending the data, used to cap the number of concurrent large downloads.
+    chunk_size : int
+        Size of the chunks the data is sent in, when it is not sent with zero copy.
+    """
+
+    def __init__(self,
+                 object_store: ObjectStore,
+                 key: str,
+                 *,
+                 start: int,
+                 end: int,
+                 local_path: str | None,
+                 limiter: asyncio.Semaphore | None,
+                 chunk_size: int,
+                 status_code: int = 200,
+                 headers: typing.Mapping[str, str] | None = None,
+                 media_type: str | None = None):
+        self._object_store = object_store
+        self._key = key
+        self._start = start
+        self._end = end
+        self._local_path = local_path
+        self._limiter = limiter
+        self._chunk_size = chunk_size
+
+        self.status_code = status_code
+        self.media_type = media_type
+        self.background = None
+        self.init_headers(headers)
+
+    @staticmethod
+    async def _listen_for_disconnect(receive: Receive) -> None:
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                return
+
+    async def _read_local_file(self) -> AsyncGenerator[bytes]:
+        fd = await asyncio.to_thread(os.open, self._local_path, os.O_RDONLY)
+        try:
+            offset = self._start
+            while offset < self._end:
+                chunk = await asyncio.to_thread(os.pread, fd, min(self._chunk_size, self._end - offset), offset)
+                if not chunk:
+                    # The file was truncated
+                    break
+
+                offset += len(chunk)
+                yield chunk
+        finally:
+            os.close(fd)
+
+    async def _send_body(self, scope: Scope, send: Send) -> None:
+        await send({"type": "http.response.start", "status": self.status_code, "headers": self.raw_headers})
+
+        if self._start == self._end:
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+            return
+
+        if self._local_path is not None and ZERO_COPY_SEND_EXTENSION in scope.get("extensions", {}):
+            with open(self._local_path, "rb") as local_file:
+                await send({
+                    "type": ZERO_COPY_SEND_EXTENSION,
+                    "file": local_file,
+                    "offset": self._start,
+                    "count": self._end - self._start,
+                    "more_body": False,
+                })
+            return
+
+        if self._local_path is not None:
+            chunks = self._read_local_file()
+        else:
+            chunks = self._object_store.stream_object(self._key, self._start, self._end, chunk_size=self._chunk_size)
+
+        try:
+            async for chunk in chunks:
+                await send({"type": "http.response.body", "body": chunk, "more_body": True})
+        finally:
+            # Release the file or connection held by the stream, also when the client disconnects
+            await chunks.aclose()
+
+        await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        async with (self._limiter if self._limiter is not None else contextlib.nullcontext()):
+            send_task = asyncio.create_task(self._send_body(scope, send))
+            disconnect_task = asyncio.create_task(self._listen_for_disconnect(receive))
+            try:
+                await asyncio.wait((send_task, disconnect_task), return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                for task in (send_task, disconnect_task):
+                    task.cancel()
+                await asyncio.gather(disconnect_task, return_exceptions=True)
+
+            if not send_task.cancelled():
+                try:
+                    send_task.result()
+                except OSError:
+                    # The client disconnected
+                    pass
+
+
+class StaticFileServer:
+    """
+    Serves static files from an object store.
+
+    Files are streamed in chunks rather than read into memory. `Range` requests are answered with partial content and
+    `If-None-Match` requests with 304 Not Modified when the object store provides entity tags. Files kept in local files
+    by the object store are sent without passing through the object store. Uploads are streamed into the object store.
+
+    Parameters
+    ----------
+    object_store : ObjectStore
+        The object store to serve the files from.
+    max_concurrent_large_downloads : int | None, optional, default=16
+        Maximum number of large downloads sent at the same time, further large downloads wait for one to finish. None
+        for no limit.
+    large_download_threshold : int, optional, default=64 MiB
+        Size in bytes from which a download counts as large.
+    chunk_size : int, optional, default=1 MiB
+        Size of the chunks files are sent and uploaded in.
+    """
+
+    def __init__(self,
+                 object_store: ObjectStore,
+                 *,
+                 max_concurrent_large_downloads: int | None = 16,
+                 large_download_threshold: int = 64 * 1024 * 1024,
+                 chunk_size: int = 1024 * 1024):
+        self._object_store = object_store
+        self._large_download_threshold = large_download_threshold
+        self._chunk_size = chunk_size
+        self._limiter = (asyncio.Semaphore(max_concurrent_large_downloads)
+                         if max_concurrent_large_downloads is not None else None)
+
+        # Statistics
+        self._downloads = 0
+        self._not_modified = 0
+        self._partial = 0
+        self._local_files = 0
+
+    @staticmethod
+    def _quote_etag(info: ObjectStoreItemInfo) -> str | None:
+        return f'"{info.etag}"' if info.etag is not None else None
+
+    async def get_file(self, key: str, request: Request) -> Response:
+        """
+        Build the response to a request for a static file.
+
+        Parameters
+        ----------
+        key : str
+            The key of the file in the object store.
+        request : Request
+            The request, whose `Range`, `If-Range` and `If-None-Match` headers are honored.
+
+        Returns
+        -------
+        Response
+            The response streaming the file, 206 Partial Content for a range, or 304 Not Modified.
+
+        Raises
+        ------
+        HTTPException
+            404 if the file does not exist, or 416 if the requested range does not overlap the file.
+        """
+        try:
+            info = await self._object_store.get_object_info(key)
+        except NoSuchKeyError as e:
+            raise HTTPException(status_code=404, detail=str(e)) from e
+
+        filename = key.split("/")[-1]
+        etag = self._quote_etag(info)
+        headers = {"Accept-Ranges": "bytes", "Content-Disposition": f"attachment; filename={filename}"}
+        if etag is not None:
+            headers["ETag"] = etag
+
+        if_none_match = request.headers.get("if-none-match")
+        if etag is not None and if_none_match is not None and etag_matches(if_none_match, etag):
+            self._not_modified += 1
+            return Response(status_code=304, headers={"ETag": etag})
+
+        (start, end) = (0, info.size)
+        status_code = 200
+
+        range_header = request.headers.get("range")
+        if_range = request.headers.get("if-range")
+        if range_header is not None and (if_range is None or (etag is not None and if_range == etag)):
+            try:
+                byte_range = parse_range_header(range_header, info.size)
+            except RangeNotSatisfiableError as e:
+                raise HTTPException(status_code=416, detail="Requested range not satisfiable",
+                                    headers={"Content-Range": f"bytes */{info.size}"}) from e
+
+            if byte_range is not None:
+                (start, end) = byte_range
+                status_code = 206
+                headers["Content-Range"] = f"bytes {start}-{end - 1}/{info.size}"
+                self._partial += 1
+
+        headers["Content-Length"] = str(end - start)
+
+        try:
+            local_path = await self._object_store.get_local_path(key)
+        except NoSuchKeyError as e:
+            raise HTTPException(status_code=404, detail=str(e)) from e
+
+        if local_path is not None:
+            self._local_files += 1
+
+        self._downloads += 1
+        return StaticFileResponse(self._object_store,
+                                  key,
+                                  start=start,
+                                  end=end,
+                                  local_path=local_path,
+                                  limiter=self._limiter if end - start >= self._large_download_threshold else None,
+                                  chunk_size=self._chunk_size,
+                                  status_code=status_code,
+                                  headers=headers,
+                                  media_type=info.content_type)
+
+    async def _read_upload(self, file: UploadFile) -> AsyncGenerator[bytes]:
+        while (chunk := await file.read(self._chunk_size)):
+            yield chunk
+
+    async def put_file(self, key: str, file: UploadFile, overwrite: bool = False) -> int:
+        """
+        Stream an uploaded file into the object store.
+
+        Parameters
+        ----------
+        key : str
+            The key to save the file under.
+        file : UploadFile
+            The uploaded file.
+        overwrite : bool, optional, default=False
+            Whether to replace an existing file, otherwise KeyAlreadyExistsError is raised if the key exists.
+
+        Returns
+        -------
+        int
+            The size of the file in bytes.
+        """
+        if overwrite:
+            return await self._object_store.upsert_object_stream(key,
+                                                                 self._read_upload(file),
+                                                                 content_type=file.content_type)
+
+        return await self._object_store.put_object_stream(key, self._read_upload(file), content_type=file.content_type)
+
+    def get_stats(self) -> dict[str, typing.Any]:
+        """Get static file serving statistics."""
+        return {
+            "downloads": self._downloads,
+            "not_modified": self._not_modified,
+            "partial_content": self._partial,
+            "local_file_downloads": self._local_files,
+        }
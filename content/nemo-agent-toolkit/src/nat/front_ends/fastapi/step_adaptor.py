@@ -13,9 +13,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import dataclasses
 import html
 import logging
-from functools import reduce
 from textwrap import dedent
 
 from nat.data_models.api_server import ResponseIntermediateStep
@@ -23,6 +23,7 @@ from nat.data_models.api_server import ResponseSerializable
 from nat.data_models.intermediate_step import IntermediateStep
 from nat.data_models.intermediate_step import IntermediateStepCategory
 from nat.data_models.intermediate_step import IntermediateStepPayload
+from nat.data_models.intermediate_step import IntermediateStepState
 from nat.data_models.intermediate_step import IntermediateStepType
 from nat.data_models.invocation_node import InvocationNode
 from nat.data_models.step_adaptor import StepAdaptorConfig
@@ -31,12 +32,40 @@ from nat.utils.type_utils import is_valid_json
 
 logger = logging.getLogger(__name__)
 
+# Categories whose END (or LLM_NEW_TOKEN) events are rendered together with the data of their START event
+_PAIRED_CATEGORIES = frozenset(
+    (IntermediateStepCategory.LLM, IntermediateStepCategory.TOOL, IntermediateStepCategory.FUNCTION))
+
+
+@dataclasses.dataclass
+class _OpenStep:
+    """
+    State kept for a step between its START and END events.
+    """
+    start: IntermediateStep
+
+    # Rendered `**Input:**` block of an LLM step, built once on first use
+    llm_input_payload: str | None = None
+    llm_has_input: bool = False
+
+    # Escaped LLM_NEW_TOKEN chunks received so far
+    output_chunks: list[str] = dataclasses.field(default_factory=list)
+
+    # Whether a payload containing the output has been sent, after which deltas can be sent
+    output_sent: bool = False
+
 
 class StepAdaptor:
+    """
+    Converts intermediate steps into `ResponseIntermediateStep` events for streaming clients.
+
+    The adaptor only keeps state for steps which have started but not yet ended, so a new adaptor should be created for
+    each workflow run.
+    """
 
     def __init__(self, config: StepAdaptorConfig):
 
-        self._history: list[IntermediateStep] = []
+        self._open_steps: dict[str, _OpenStep] = {}
         self.config = config
 
     def _step_matches_filter(self, step: IntermediateStep, config: StepAdaptorConfig) -> bool:
@@ -63,47 +92,66 @@ class StepAdaptor:
 
         return False
 
+    def _get_open_step(self, step: IntermediateStepPayload, start_type: IntermediateStepType) -> _OpenStep | None:
+        open_step = self._open_steps.get(step.UUID)
+
+        if (open_step is None or open_step.start.event_type != start_type):
+            return None
+
+        return open_step
+
     def _handle_llm(self, step: IntermediateStepPayload, ancestry: InvocationNode) -> ResponseSerializable | None:
-        input_str: str | None = None
-        output_str: str | None = None
+        escaped_output: str | None = None
 
-        # Find the start in the history with matching run_id
-        start_step = next(
-            (x for x in self._history if x.event_type == IntermediateStepType.LLM_START and x.UUID == step.UUID), None)
+        # Find the start with matching run_id
+        open_step = self._get_open_step(step, IntermediateStepType.LLM_START)
 
-        if not start_step:
+        if not open_step:
             # If we don't have a start step, we can't do anything
             return None
 
-        input_str = str(start_step.data.input)
-
         if step.event_type == IntermediateStepType.LLM_NEW_TOKEN:
+            chunk = html.escape(str(step.data.chunk), quote=False)
 
-            # Find all of the previous LLM chunks and concatenate them
-            output_str = reduce(
-                lambda x, y: x + y,
-                (str(x.data.chunk)
-                 for x in self._history if x.event_type == IntermediateStepType.LLM_NEW_TOKEN and x.UUID == step.UUID),
-                "")
+            if (self.config.stream_deltas and open_step.output_sent):
+                # The client already has everything before this chunk
+                if not chunk:
+                    return None
+
+                return ResponseIntermediateStep(id=step.UUID,
+                                                name=step.name or "",
+                                                type="markdown_delta",
+                                                payload=chunk,
+                                                parent_id=ancestry.function_id)
+
+            # html.escape works character by character, so escaping each chunk is the same as escaping the whole output
+            open_step.output_chunks.append(chunk)
+            escaped_output = "".join(open_step.output_chunks)
 
         elif step.event_type == IntermediateStepType.LLM_END:
-            output_str = str(step.data.output)
+            escaped_output = html.escape(str(step.data.output), quote=False)
 
-        if not input_str and not output_str:
-            return None
+        if (open_step.llm_input_payload is None):
+            input_str = str(open_step.start.data.input)
 
-        escaped_input = html.escape(input_str, quote=False)
+            open_step.llm_has_input = bool(input_str)
+            escaped_input = html.escape(input_str, quote=False)
 
-        # Dont use f-strings here because the payload is markdown and screws up the dedent
-        payload = dedent("""
-        **Input:**
-        ```python
-        {input_value}
-        ```
-        """).strip("\n").format(input_value=escaped_input)
+            # Dont use f-strings here because the payload is markdown and screws up the dedent
+            open_step.llm_input_payload = dedent("""
+            **Input:**
+            ```python
+            {input_value}
+            ```
+            """).strip("\n").format(input_value=escaped_input)
+
+        if not open_step.llm_has_input and not escaped_output:
+            return None
 
-        if (output_str):
-            escaped_output = html.escape(output_str, quote=False) if output_str else ""
+        payload = open_step.llm_input_payload
+
+        if (escaped_output):
+            open_step.output_sent = True
 
             # Dont use f-strings here because the payload is markdown and screws up the dedent
             payload = dedent("""
@@ -127,15 +175,14 @@ class StepAdaptor:
         input_str: str | None = None
         output_str: str | None = None
 
-        # Find the start in the history with matching run_id
-        start_step = next(
-            (x for x in self._history if x.event_type == IntermediateStepType.TOOL_START and x.UUID == step.UUID), None)
+        # Find the start with matching run_id
+        open_step = self._get_open_step(step, IntermediateStepType.TOOL_START)
 
-        if not start_step:
+        if not open_step:
             # If we don't have a start step, we can't do anything
             return None
 
-        input_str = str(start_step.data.input)
+        input_str = str(open_step.start.data.input)
 
         if step.event_type == IntermediateStepType.TOOL_END:
             output_str = str(step.data.output)
@@ -211,10 +258,8 @@ class StepAdaptor:
 
         if step.event_type == IntermediateStepType.FUNCTION_END:
             # Find the start event with matching UUID
-            start_step = next(
-                (x
-                 for x in self._history if x.event_type == IntermediateStepType.FUNCTION_START and x.UUID == step.UUID),
-                None)
+            open_step = self._get_open_step(step, IntermediateStepType.FUNCTION_START)
+            start_step = open_step.start if open_step else None
 
             # For function end events, display output data
             if step.data and hasattr(step.data, 'output'):
@@ -291,15 +336,18 @@ class StepAdaptor:
 
     def process(self, step: IntermediateStep) -> ResponseSerializable | None:
 
-        # Track the chunk
-        self._history.append(step)
         payload = step.payload
         ancestry = step.function_ancestry
 
-        if not self._step_matches_filter(step, self.config):
+        if self.config.mode == StepAdaptorMode.OFF:
             return None
 
+        if step.event_category in _PAIRED_CATEGORIES and step.event_state == IntermediateStepState.START:
+            self._open_steps[payload.UUID] = _OpenStep(start=step)
+
         try:
+            if not self._step_matches_filter(step, self.config):
+                return None
 
             if step.event_category == IntermediateStepCategory.LLM:
                 return self._handle_llm(payload, ancestry)
@@ -316,4 +364,9 @@ class StepAdaptor:
         except Exception as e:
             logger.exception("Error processing intermediate step: %s", e)
 
+        finally:
+            # Nothing refers back to a step once it has ended
+            if step.event_state == IntermediateStepState.END:
+                self._open_steps.pop(payload.UUID, None)
+
         return None
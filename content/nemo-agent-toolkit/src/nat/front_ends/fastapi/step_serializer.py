@@ -0,0 +1,107 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import functools
+import json
+import logging
+import typing
+from collections.abc import Callable
+
+from nat.data_models.api_server import ResponseSerializable
+from nat.data_models.intermediate_step import IntermediateStep
+from nat.data_models.intermediate_step import IntermediateStepRecord
+from nat.data_models.intermediate_step import IntermediateStepType
+
+logger = logging.getLogger(__name__)
+
+
+def _resolve_json_dumps() -> tuple[str, Callable[[typing.Any], str]]:
+    """
+    Pick the fastest available JSON encoder for the stream envelope. `orjson` and `msgspec` are used when installed,
+    otherwise the standard library encoder is configured to produce the same compact output as pydantic.
+    """
+    try:
+        import orjson
+
+        return "orjson", lambda obj: orjson.dumps(obj).decode()
+    except ImportError:
+        pass
+
+    try:
+        import msgspec
+
+        encoder = msgspec.json.Encoder()
+
+        return "msgspec", lambda obj: encoder.encode(obj).decode()
+    except ImportError:
+        pass
+
+    return "json", functools.partial(json.dumps, ensure_ascii=False, separators=(",", ":"))
+
+
+JSON_ENCODER_NAME, _json_dumps = _resolve_json_dumps()
+
+
+class SerializedIntermediateStep(ResponseSerializable):
+    """
+    An intermediate step that has already been rendered into its stream representation. The wire format is identical
+    to `ResponseIntermediateStep.get_stream_data`, but the step payload is encoded exactly once, when the step is
+    received, and no intermediate pydantic model is built.
+    """
+
+    __slots__ = ("event_type", "_stream_data")
+
+    def __init__(self, event_type: IntermediateStepType, stream_data: str):
+        self.event_type = event_type
+        self._stream_data = stream_data
+
+    @classmethod
+    def from_intermediate_step(cls, step: IntermediateStep | IntermediateStepRecord) -> "SerializedIntermediateStep":
+        envelope = {
+            "id": step.UUID,
+            "parent_id": step.parent_id,
+            "type": step.event_type,
+            "name": step.name or "",
+            "payload": step.payload.model_dump_json(),
+        }
+
+        return cls(step.event_type, f"intermediate_data: {_json_dumps(envelope)}\n\n")
+
+    def get_stream_data(self) -> str:
+        return self._stream_data
+
+
+def parse_filter_steps(filter_steps: str | None) -> frozenset[IntermediateStepType] | None:
+    """
+    Parse the `filter_steps` query parameter of the raw streaming endpoints.
+
+    Returns None when every step should be streamed, an empty set when `filter_steps` is ``"none"`` and otherwise the
+    set of requested step types. Unknown step types are ignored since they can never match.
+    """
+    if (not filter_steps):
+        return None
+
+    if (filter_steps.lower() == "none"):
+        return frozenset()
+
+    allowed_types = set()
+
+    for name in filter_steps.split(','):
+        try:
+            allowed_types.add(IntermediateStepType(name))
+        except ValueError:
+            logger.debug("Ignoring unknown intermediate step type in filter_steps: %s", name)
+
+    return frozenset(allowed_types)
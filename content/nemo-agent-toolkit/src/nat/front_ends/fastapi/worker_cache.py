@@ -0,0 +1,229 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Resources which are reused by the async jobs that run inside a Dask worker.
+
+Building a workflow and connecting to the job store database are expensive compared to most jobs, so each worker keeps
+the built `SessionManager` for every config file it has run, along with one `JobStore` (and database engine) per
+database. Async resources are bound to the event loop they were created on, so there is one cache per event loop.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import typing
+import weakref
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+
+from nat.runtime.session import SessionManager
+
+if typing.TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine
+
+    from nat.front_ends.fastapi.job_store import JobStore
+
+logger = logging.getLogger(__name__)
+
+
+def _hash_file(path: str) -> str:
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+class _CachedWorkflow:
+    """
+    A workflow built from a config file. The workflow is hosted by its own task so that it is torn down from the same
+    task that built it, regardless of which job triggers the teardown.
+    """
+
+    def __init__(self, config_file_path: str, content_hash: str):
+        self.config_file_path = config_file_path
+        self.content_hash = content_hash
+        self.active_jobs = 0
+        self.stale = False
+
+        self._ready: asyncio.Future[SessionManager] = asyncio.get_running_loop().create_future()
+        self._closing = asyncio.Event()
+        self._task = asyncio.create_task(self._host())
+
+    async def _host(self):
+        from nat.runtime.loader import load_workflow
+
+        try:
+            async with load_workflow(self.config_file_path) as session_manager:
+                self._ready.set_result(session_manager)
+
+                await self._closing.wait()
+        except asyncio.CancelledError:
+            # The worker is shutting down
+            if (not self._ready.done()):
+                self._ready.cancel()
+            raise
+        except Exception as e:
+            if (not self._ready.done()):
+                self._ready.set_exception(e)
+            else:
+                logger.exception("Error while shutting down the workflow for '%s'", self.config_file_path)
+
+    async def wait_ready(self) -> SessionManager:
+        return await asyncio.shield(self._ready)
+
+    async def close(self):
+        self._closing.set()
+
+        await asyncio.gather(self._task, return_exceptions=True)
+
+
+class WorkerCache:
+    """
+    Caches the workflows, job stores and database engines used by async jobs on one event loop.
+    """
+
+    def __init__(self):
+        self._workflows: dict[str, _CachedWorkflow] = {}
+        self._build_lock = asyncio.Lock()
+
+        self._engines: dict[str, "AsyncEngine"] = {}
+        self._job_stores: dict[tuple[str, str], "JobStore"] = {}
+
+    @asynccontextmanager
+    async def session_manager(self, config_file_path: str) -> AsyncGenerator[SessionManager]:
+        """
+        Yields the `SessionManager` for a config file, building the workflow the first time the config file is used.
+        The workflow is rebuilt if the contents of the config file change; the previous workflow is torn down once the
+        jobs using it finish.
+        """
+        entry = await self._get_workflow(os.path.realpath(config_file_path))
+
+        entry.active_jobs += 1
+
+        try:
+            yield await entry.wait_ready()
+        finally:
+            entry.active_jobs -= 1
+
+            if (entry.stale and entry.active_jobs == 0):
+                await entry.close()
+
+    async def _get_workflow(self, config_file_path: str) -> _CachedWorkflow:
+
+        content_hash = await asyncio.to_thread(_hash_file, config_file_path)
+
+        entry = self._workflows.get(config_file_path)
+
+        if (entry is not None and entry.content_hash == content_hash):
+            return entry
+
+        async with self._build_lock:
+
+            # Another job may have started the build while we were waiting for the lock
+            entry = self._workflows.get(config_file_path)
+
+            if (entry is not None and entry.content_hash == content_hash):
+                return entry
+
+            new_entry = _CachedWorkflow(config_file_path, content_hash)
+
+            try:
+                await new_entry.wait_ready()
+            except Exception:
+                # Do not cache failed builds, the next job will try again
+                await new_entry.close()
+                raise
+
+            self._workflows[config_file_path] = new_entry
+
+            if (entry is not None):
+                logger.info("Config file '%s' changed, rebuilding the workflow", config_file_path)
+                entry.stale = True
+
+                if (entry.active_jobs == 0):
+                    await entry.close()
+
+            return new_entry
+
+    def get_db_engine(self, db_url: str) -> "AsyncEngine":
+        """
+        Returns the async database engine for a database URL, creating it on first use.
+        """
+        from nat.front_ends.fastapi.job_store import get_db_engine
+
+        engine = self._engines.get(db_url)
+
+        if (engine is None):
+            engine = get_db_engine(db_url, use_async=True)
+            self._engines[db_url] = engine
+
+        return engine
+
+    def get_job_store(self, scheduler_address: str, db_url: str) -> "JobStore":
+        """
+        Returns the job store for a scheduler and database, creating it on first use.
+        """
+        from nat.front_ends.fastapi.job_store import JobStore
+
+        key = (scheduler_address, db_url)
+        job_store = self._job_stores.get(key)
+
+        if (job_store is None):
+            job_store = JobStore(scheduler_address=scheduler_address, db_engine=self.get_db_engine(db_url))
+            self._job_stores[key] = job_store
+
+        return job_store
+
+    async def close(self):
+        """
+        Tears down every cached workflow and disposes of the database engines.
+        """
+        workflows = list(self._workflows.values())
+        engines = list(self._engines.values())
+
+        self._workflows.clear()
+        self._job_stores.clear()
+        self._engines.clear()
+
+        await asyncio.gather(*(entry.close() for entry in workflows))
+        await asyncio.gather(*(engine.dispose() for engine in engines))
+
+
+_worker_caches: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, WorkerCache]" = weakref.WeakKeyDictionary()
+
+
+def get_worker_cache() -> WorkerCache:
+    """
+    Returns the cache for the running event loop.
+    """
+    loop = asyncio.get_running_loop()
+
+    cache = _worker_caches.get(loop)
+
+    if (cache is None):
+        cache = WorkerCache()
+        _worker_caches[loop] = cache
+
+    return cache
+
+
+async def close_worker_cache():
+    """
+    Closes the cache for the running event loop, if any. Intended to be run on each Dask worker with `Client.run`
+    before the cluster is shut down.
+    """
+    cache = _worker_caches.pop(asyncio.get_running_loop(), None)
+
+    if (cache is not None):
+        await cache.close()
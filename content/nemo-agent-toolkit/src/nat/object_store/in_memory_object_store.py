@@ -14,6 +14,8 @@
 # limitations under the License.
 
 import asyncio
+import uuid
+from collections.abc import AsyncGenerator
 
 from nat.builder.builder import Builder
 from nat.cli.register_workflow import register_object_store
@@ -22,8 +24,10 @@ from nat.data_models.object_store import NoSuchKeyError
 from nat.data_models.object_store import ObjectStoreBaseConfig
 from nat.utils.type_utils import override
 
+from .interfaces import DEFAULT_CHUNK_SIZE
 from .interfaces import ObjectStore
 from .models import ObjectStoreItem
+from .models import ObjectStoreItemInfo
 
 
 class InMemoryObjectStoreConfig(ObjectStoreBaseConfig, name="in_memory"):
@@ -41,6 +45,7 @@ class InMemoryObjectStore(ObjectStore):
     def __init__(self) -> None:
         self._lock = asyncio.Lock()
         self._store: dict[str, ObjectStoreItem] = {}
+        self._etags: dict[str, str] = {}
 
     @override
     async def put_object(self, key: str, item: ObjectStoreItem) -> None:
@@ -48,11 +53,13 @@ class InMemoryObjectStore(ObjectStore):
             if key in self._store:
                 raise KeyAlreadyExistsError(key)
             self._store[key] = item
+            self._etags[key] = uuid.uuid4().hex
 
     @override
     async def upsert_object(self, key: str, item: ObjectStoreItem) -> None:
         async with self._lock:
             self._store[key] = item
+            self._etags[key] = uuid.uuid4().hex
 
     @override
     async def get_object(self, key: str) -> ObjectStoreItem:
@@ -67,9 +74,36 @@ class InMemoryObjectStore(ObjectStore):
         try:
             async with self._lock:
                 self._store.pop(key)
+                self._etags.pop(key, None)
         except KeyError:
             raise NoSuchKeyError(key)
 
+    @override
+    async def get_object_info(self, key: str) -> ObjectStoreItemInfo:
+        async with self._lock:
+            item = self._store.get(key)
+            if item is None:
+                raise NoSuchKeyError(key)
+            return ObjectStoreItemInfo(size=len(item.data),
+                                       content_type=item.content_type,
+                                       metadata=item.metadata,
+                                       etag=self._etags[key])
+
+    @override
+    async def stream_object(self,
+                            key: str,
+                            start: int = 0,
+                            end: int | None = None,
+                            chunk_size: int = DEFAULT_CHUNK_SIZE) -> AsyncGenerator[bytes]:
+        self._check_range(start, end)
+        self._check_chunk_size(chunk_size)
+
+        # Slice the stored data without copying it, only one chunk is copied at a time
+        data = memoryview((await self.get_object(key)).data)[start:end]
+
+        for offset in range(0, len(data), chunk_size):
+            yield bytes(data[offset:offset + chunk_size])
+
 
 @register_object_store(config_type=InMemoryObjectStoreConfig)
 async def in_memory_object_store(config: InMemoryObjectStoreConfig, builder: Builder):
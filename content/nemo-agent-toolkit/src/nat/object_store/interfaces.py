@@ -15,8 +15,95 @@
 
 from abc import ABC
 from abc import abstractmethod
+from collections.abc import AsyncGenerator
+from collections.abc import AsyncIterable
 
 from .models import ObjectStoreItem
+from .models import ObjectStoreItemInfo
+
+# Default size of the chunks yielded when streaming an object
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+
+class ObjectStoreUpload(ABC):
+    """
+    An object being uploaded in parts, created by `ObjectStore.open_upload`.
+
+    The object is not visible in the object store until the upload is completed. When used as an async context manager,
+    the upload is completed when the context exits normally, and aborted when it exits with an exception.
+    """
+
+    @abstractmethod
+    async def write(self, data: bytes) -> None:
+        """
+        Append data to the object.
+
+        Args:
+            data (bytes): The data to append.
+        """
+        pass
+
+    @abstractmethod
+    async def complete(self) -> None:
+        """
+        Finish the upload, making the object visible in the object store.
+
+        Raises:
+            KeyAlreadyExistsError: If the upload may not overwrite an existing object and the key already exists.
+        """
+        pass
+
+    @abstractmethod
+    async def abort(self) -> None:
+        """
+        Cancel the upload, discarding the data written so far.
+        """
+        pass
+
+    async def __aenter__(self) -> "ObjectStoreUpload":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            await self.complete()
+        else:
+            await self.abort()
+
+
+class BufferedObjectStoreUpload(ObjectStoreUpload):
+    """
+    Upload which buffers the whole object in memory, and saves it with `put_object` or `upsert_object` on completion.
+    Used by object stores which do not implement uploads in parts.
+    """
+
+    def __init__(self,
+                 store: "ObjectStore",
+                 key: str,
+                 *,
+                 content_type: str | None = None,
+                 metadata: dict[str, str] | None = None,
+                 overwrite: bool = False):
+        self._store = store
+        self._key = key
+        self._content_type = content_type
+        self._metadata = metadata
+        self._overwrite = overwrite
+        self._buffer = bytearray()
+
+    async def write(self, data: bytes) -> None:
+        self._buffer += data
+
+    async def complete(self) -> None:
+        item = ObjectStoreItem(data=bytes(self._buffer), content_type=self._content_type, metadata=self._metadata)
+        self._buffer = bytearray()
+
+        if self._overwrite:
+            await self._store.upsert_object(self._key, item)
+        else:
+            await self._store.put_object(self._key, item)
+
+    async def abort(self) -> None:
+        self._buffer = bytearray()
 
 
 class ObjectStore(ABC):
@@ -82,3 +169,190 @@ class ObjectStore(ABC):
             NoSuchKeyError: If the item does not exist.
         """
         pass
+
+    @staticmethod
+    def _check_range(start: int, end: int | None) -> None:
+        if start < 0:
+            raise ValueError(f"start must not be negative, got {start}")
+        if end is not None and end < start:
+            raise ValueError(f"end must not be less than start, got start={start} and end={end}")
+
+    @staticmethod
+    def _check_chunk_size(chunk_size: int) -> None:
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
+
+    async def get_object_info(self, key: str) -> ObjectStoreItemInfo:
+        """
+        Get the size, content type and metadata of an object without its data.
+
+        The default implementation retrieves the whole object, object stores should override it when the information
+        can be retrieved on its own.
+
+        Args:
+            key (str): The key of the object.
+
+        Returns:
+            ObjectStoreItemInfo: Information about the object.
+
+        Raises:
+            NoSuchKeyError: If the item does not exist.
+        """
+        item = await self.get_object(key)
+        return ObjectStoreItemInfo(size=len(item.data), content_type=item.content_type, metadata=item.metadata)
+
+    async def get_object_range(self, key: str, start: int = 0, end: int | None = None) -> bytes:
+        """
+        Get a range of the data of an object, the same bytes as `(await get_object(key)).data[start:end]`.
+
+        The default implementation retrieves the whole object, object stores should override it when a range can be
+        retrieved on its own.
+
+        Args:
+            key (str): The key of the object.
+            start (int): Offset of the first byte to get.
+            end (int | None): Offset after the last byte to get, or None to get the data up to the end of the object.
+
+        Returns:
+            bytes: The data in the range, shorter than requested if the range extends past the end of the object.
+
+        Raises:
+            NoSuchKeyError: If the item does not exist.
+            ValueError: If start is negative or end is less than start.
+        """
+        self._check_range(start, end)
+
+        item = await self.get_object(key)
+        return item.data[start:end]
+
+    async def stream_object(self,
+                            key: str,
+                            start: int = 0,
+                            end: int | None = None,
+                            chunk_size: int = DEFAULT_CHUNK_SIZE) -> AsyncGenerator[bytes]:
+        """
+        Yield the data of an object, or a range of it, in chunks.
+
+        The default implementation retrieves the whole range at once, object stores should override it to only hold
+        about one chunk in memory at a time.
+
+        Args:
+            key (str): The key of the object.
+            start (int): Offset of the first byte to yield.
+            end (int | None): Offset after the last byte to yield, or None to yield the data up to the end of the
+                object.
+            chunk_size (int): Maximum size of each chunk in bytes.
+
+        Yields:
+            bytes: The next chunk of data.
+
+        Raises:
+            NoSuchKeyError: If the item does not exist, when iteration starts.
+            ValueError: If start is negative or end is less than start.
+        """
+        self._check_chunk_size(chunk_size)
+
+        data = memoryview(await self.get_object_range(key, start, end))
+
+        for offset in range(0, len(data), chunk_size):
+            yield bytes(data[offset:offset + chunk_size])
+
+    async def get_local_path(self, key: str) -> str | None:
+        """
+        Get the path of a local file holding the data of an object, so that the data can be sent without reading it
+        through the object store (e.g. with sendfile).
+
+        Args:
+            key (str): The key of the object.
+
+        Returns:
+            str | None: The path of the file, or None if the object store does not keep objects in local files.
+
+        Raises:
+            NoSuchKeyError: If the item does not exist, only raised when the object store keeps objects in local files.
+        """
+        return None
+
+    def open_upload(self,
+                    key: str,
+                    *,
+                    content_type: str | None = None,
+                    metadata: dict[str, str] | None = None,
+                    overwrite: bool = False) -> ObjectStoreUpload:
+        """
+        Start uploading an object in parts, for objects which are too large to hold in memory at once.
+
+        The default implementation buffers the whole object in memory, object stores should override it to send parts
+        as they are written.
+
+        Args:
+            key (str): The key to save the object under.
+            content_type (str | None): The content type of the data.
+            metadata (dict[str, str] | None): Metadata of the object.
+            overwrite (bool): Whether the upload replaces an existing object with the same key, otherwise completing the
+                upload raises KeyAlreadyExistsError.
+
+        Returns:
+            ObjectStoreUpload: The upload, data is added with `write` and saved by `complete`.
+        """
+        return BufferedObjectStoreUpload(self, key, content_type=content_type, metadata=metadata, overwrite=overwrite)
+
+    async def put_object_stream(self,
+                                key: str,
+                                data: AsyncIterable[bytes],
+                                *,
+                                content_type: str | None = None,
+                                metadata: dict[str, str] | None = None) -> int:
+        """
+        Save an object from a stream of chunks with the given key.
+        If the key already exists, raise an error.
+
+        Args:
+            key (str): The key to save the object under.
+            data (AsyncIterable[bytes]): The data of the object.
+            content_type (str | None): The content type of the data.
+            metadata (dict[str, str] | None): Metadata of the object.
+
+        Returns:
+            int: The size of the object in bytes.
+
+        Raises:
+            KeyAlreadyExistsError: If the key already exists.
+        """
+        return await self._upload_stream(key, data, content_type=content_type, metadata=metadata, overwrite=False)
+
+    async def upsert_object_stream(self,
+                                   key: str,
+                                   data: AsyncIterable[bytes],
+                                   *,
+                                   content_type: str | None = None,
+                                   metadata: dict[str, str] | None = None) -> int:
+        """
+        Save an object from a stream of chunks with the given key.
+        If the key already exists, update the object.
+
+        Args:
+            key (str): The key to save the object under.
+            data (AsyncIterable[bytes]): The data of the object.
+            content_type (str | None): The content type of the data.
+            metadata (dict[str, str] | None): Metadata of the object.
+
+        Returns:
+            int: The size of the object in bytes.
+        """
+        return await self._upload_stream(key, data, content_type=content_type, metadata=metadata, overwrite=True)
+
+    async def _upload_stream(self,
+                             key: str,
+                             data: AsyncIterable[bytes],
+                             *,
+                             content_type: str | None,
+                             metadata: dict[str, str] | None,
+                             overwrite: bool) -> int:
+        size = 0
+        async with self.open_upload(key, content_type=content_type, metadata=metadata, overwrite=overwrite) as upload:
+            async for chunk in data:
+                await upload.write(chunk)
+                size += len(chunk)
+
+        return size
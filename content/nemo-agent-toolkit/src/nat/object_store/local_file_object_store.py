@@ -0,0 +1,281 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import json
+import os
+import tempfile
+from collections.abc import AsyncGenerator
+
+from pydantic import Field
+
+from nat.builder.builder import Builder
+from nat.cli.register_workflow import register_object_store
+from nat.data_models.object_store import KeyAlreadyExistsError
+from nat.data_models.object_store import NoSuchKeyError
+from nat.data_models.object_store import ObjectStoreBaseConfig
+from nat.utils.type_utils import override
+
+from .interfaces import DEFAULT_CHUNK_SIZE
+from .interfaces import ObjectStore
+from .interfaces import ObjectStoreUpload
+from .models import ObjectStoreItem
+from .models import ObjectStoreItemInfo
+
+
+class LocalFileObjectStoreConfig(ObjectStoreBaseConfig, name="local_file"):
+    """
+    Object store that stores objects as files in a local directory.
+    """
+    base_path: str = Field(description="Directory to store the objects in, it is created if it does not exist.")
+
+
+def _etag(stat_result: os.stat_result) -> str:
+    return f"{stat_result.st_ino:x}-{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}"
+
+
+class LocalFileUpload(ObjectStoreUpload):
+    """
+    Uploads an object to a temporary file, which is moved into place when the upload is completed.
+    """
+
+    def __init__(self,
+                 store: "LocalFileObjectStore",
+                 key: str,
+                 *,
+                 content_type: str | None,
+                 metadata: dict[str, str] | None,
+                 overwrite: bool):
+        self._store = store
+        self._key = key
+        self._content_type = content_type
+        self._metadata = metadata
+        self._overwrite = overwrite
+
+        self._file = None
+
+    async def _open(self) -> None:
+        if self._file is None:
+            self._file = await asyncio.to_thread(tempfile.NamedTemporaryFile,
+                                                 dir=self._store._tmp_dir,
+                                                 delete=False)
+
+    async def write(self, data: bytes) -> None:
+        await self._open()
+        await asyncio.to_thread(self._file.write, data)
+
+    def _complete(self) -> None:
+        self._file.close()
+        temp_path = self._file.name
+        self._file = None
+
+        data_path = self._store._data_path(self._key)
+        meta_path = self._store._meta_path(self._key)
+
+        try:
+            os.makedirs(os.path.dirname(data_path), exist_ok=True)
+            if self._overwrite:
+                os.replace(temp_path, data_path)
+            else:
+                # Linking fails if the file exists, unlike renaming
+                try:
+                    os.link(temp_path, data_path)
+                except FileExistsError as e:
+                    raise KeyAlreadyExistsError(
+                        key=self._key, additional_message=f"File {data_path} already exists") from e
+        finally:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+
+        self._store._write_meta(meta_path, self._content_type, self._metadata)
+
+    async def complete(self) -> None:
+        await self._open()
+        await asyncio.to_thread(self._complete)
+
+    def _abort(self) -> None:
+        self._file.close()
+        os.unlink(self._file.name)
+        self._file = None
+
+    async def abort(self) -> None:
+        if self._file is not None:
+            await asyncio.to_thread(self._abort)
+
+
+class LocalFileObjectStore(ObjectStore):
+    """
+    Implementation of ObjectStore that stores objects as files in a local directory.
+
+    The data of each object is stored in the file "{base_path}/data/{key}" and its content type and metadata in the JSON
+    file "{base_path}/meta/{key}.json". Files placed in the data directory by other means are served as objects without
+    a content type or metadata. Objects are written to a temporary file which is moved into place, so that readers never
+    see a partially written object.
+    """
+
+    def __init__(self, *, base_path: str) -> None:
+        self._data_dir = os.path.abspath(os.path.join(base_path, "data"))
+        self._meta_dir = os.path.abspath(os.path.join(base_path, "meta"))
+        self._tmp_dir = os.path.abspath(os.path.join(base_path, "tmp"))
+
+        for directory in (self._data_dir, self._meta_dir, self._tmp_dir):
+            os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def _relative_path(key: str) -> str:
+        path = os.path.normpath(key.strip("/"))
+        if path in (".", "..") or path.startswith("../") or os.path.isabs(path):
+            raise ValueError(f"Invalid object key: {key}")
+
+        return path
+
+    def _data_path(self, key: str) -> str:
+        return os.path.join(self._data_dir, self._relative_path(key))
+
+    def _meta_path(self, key: str) -> str:
+        return os.path.join(self._meta_dir, self._relative_path(key) + ".json")
+
+    def _write_meta(self, meta_path: str, content_type: str | None, metadata: dict[str, str] | None) -> None:
+        os.makedirs(os.path.dirname(meta_path), exist_ok=True)
+        with tempfile.NamedTemporaryFile("w", dir=self._tmp_dir, delete=False) as meta_file:
+            json.dump({"content_type": content_type, "metadata": metadata}, meta_file)
+        os.replace(meta_file.name, meta_path)
+
+    def _read_meta(self, key: str) -> tuple[str | None, dict[str, str] | None]:
+        try:
+            with open(self._meta_path(key), encoding="utf-8") as meta_file:
+                meta = json.load(meta_file)
+        except FileNotFoundError:
+            return (None, None)
+
+        return (meta.get("content_type"), meta.get("metadata"))
+
+    def _stat(self, key: str) -> os.stat_result:
+        try:
+            return os.stat(self._data_path(key))
+        except (FileNotFoundError, NotADirectoryError, IsADirectoryError) as e:
+            raise NoSuchKeyError(key=key, additional_message=str(e)) from e
+
+    def _open_data(self, key: str):
+        try:
+            return open(self._data_path(key), "rb")
+        except (FileNotFoundError, NotADirectoryError, IsADirectoryError) as e:
+            raise NoSuchKeyError(key=key, additional_message=str(e)) from e
+
+    @override
+    async def put_object(self, key: str, item: ObjectStoreItem) -> None:
+        async with self.open_upload(key, content_type=item.content_type, metadata=item.metadata) as upload:
+            await upload.write(item.data)
+
+    @override
+    async def upsert_object(self, key: str, item: ObjectStoreItem) -> None:
+        async with self.open_upload(key, content_type=item.content_type, metadata=item.metadata,
+                                    overwrite=True) as upload:
+            await upload.write(item.data)
+
+    def _get_object(self, key: str) -> ObjectStoreItem:
+        with self._open_data(key) as data_file:
+            data = data_file.read()
+
+        (content_type, metadata) = self._read_meta(key)
+        return ObjectStoreItem(data=data, content_type=content_type, metadata=metadata)
+
+    @override
+    async def get_object(self, key: str) -> ObjectStoreItem:
+        return await asyncio.to_thread(self._get_object, key)
+
+    def _delete_object(self, key: str) -> None:
+        try:
+            os.unlink(self._data_path(key))
+        except (FileNotFoundError, NotADirectoryError, IsADirectoryError) as e:
+            raise NoSuchKeyError(key=key, additional_message=str(e)) from e
+
+        try:
+            os.unlink(self._meta_path(key))
+        except FileNotFoundError:
+            pass
+
+    @override
+    async def delete_object(self, key: str) -> None:
+        await asyncio.to_thread(self._delete_object, key)
+
+    def _get_object_info(self, key: str) -> ObjectStoreItemInfo:
+        stat_result = self._stat(key)
+        (content_type, metadata) = self._read_meta(key)
+        return ObjectStoreItemInfo(size=stat_result.st_size,
+                                   content_type=content_type,
+                                   metadata=metadata,
+                                   etag=_etag(stat_result))
+
+    @override
+    async def get_object_info(self, key: str) -> ObjectStoreItemInfo:
+        return await asyncio.to_thread(self._get_object_info, key)
+
+    def _get_object_range(self, key: str, start: int, end: int | None) -> bytes:
+        with self._open_data(key) as data_file:
+            data_file.seek(start)
+            return data_file.read(-1 if end is None else end - start)
+
+    @override
+    async def get_object_range(self, key: str, start: int = 0, end: int | None = None) -> bytes:
+        self._check_range(start, end)
+
+        return await asyncio.to_thread(self._get_object_range, key, start, end)
+
+    @override
+    async def stream_object(self,
+                            key: str,
+                            start: int = 0,
+                            end: int | None = None,
+                            chunk_size: int = DEFAULT_CHUNK_SIZE) -> AsyncGenerator[bytes]:
+        self._check_range(start, end)
+        self._check_chunk_size(chunk_size)
+
+        data_file = await asyncio.to_thread(self._open_data, key)
+        try:
+            offset = start
+            while end is None or offset < end:
+                length = chunk_size if end is None else min(chunk_size, end - offset)
+                chunk = await asyncio.to_thread(os.pread, data_file.fileno(), length, offset)
+                if not chunk:
+                    break
+
+                offset += len(chunk)
+                yield chunk
+        finally:
+            data_file.close()
+
+    @override
+    async def get_local_path(self, key: str) -> str | None:
+        await asyncio.to_thread(self._stat, key)
+
+        return self._data_path(key)
+
+    @override
+    def open_upload(self,
+                    key: str,
+                    *,
+                    content_type: str | None = None,
+                    metadata: dict[str, str] | None = None,
+                    overwrite: bool = False) -> ObjectStoreUpload:
+        # Validate the key before any data is written
+        self._relative_path(key)
+
+        return LocalFileUpload(self, key, content_type=content_type, metadata=metadata, overwrite=overwrite)
+
+
+@register_object_store(config_type=LocalFileObjectStoreConfig)
+async def local_file_object_store(config: LocalFileObjectStoreConfig, builder: Builder):
+    yield LocalFileObjectStore(base_path=config.base_path)
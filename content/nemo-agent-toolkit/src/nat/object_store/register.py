@@ -16,4 +16,5 @@
 # flake8: noqa
 # isort:skip_file
 
-from . import in_memory_object_store
\ No newline at end of file
+from . import in_memory_object_store
+from . import local_file_object_store
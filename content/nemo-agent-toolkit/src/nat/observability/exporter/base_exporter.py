@@ -28,6 +28,8 @@ from typing import overload
 
 from nat.builder.context import ContextState
 from nat.data_models.intermediate_step import IntermediateStep
+from nat.data_models.intermediate_step import IntermediateStepRecord
+from nat.data_models.intermediate_step import as_intermediate_step
 from nat.observability.exporter.exporter import Exporter
 from nat.utils.reactive.subject import Subject
 from nat.utils.type_utils import override
@@ -296,8 +298,8 @@ class BaseExporter(Exporter):
             logger.error("Event stream subject does not support subscription")
             return None
 
-        def on_next_wrapper(event: IntermediateStep) -> None:
-            self.export(event)
+        def on_next_wrapper(event: IntermediateStepRecord) -> None:
+            self.export(as_intermediate_step(event))
 
         self._subscription = subject.subscribe(
             on_next=on_next_wrapper,
@@ -336,6 +338,25 @@ class BaseExporter(Exporter):
         finally:
             await self.stop()
 
+    @asynccontextmanager
+    async def start_shared(self) -> AsyncGenerator[None]:
+        """Start the exporter without subscribing to an event stream.
+
+        Used when a single exporter instance is shared by every workflow run. Instead of subscribing to the event
+        stream of one run, the owner of the exporter passes the events of each run to `export`. Any state kept between
+        events must therefore be keyed by the event (e.g. its UUID) rather than assume a single run.
+        """
+        try:
+            await self._pre_start()
+
+            self._running = True
+            self._ready_event.set()
+
+            yield
+
+        finally:
+            await self.stop()
+
     async def _cleanup(self):
         """Clean up any resources."""
         pass
@@ -0,0 +1,284 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import contextvars
+import itertools
+import logging
+import time
+from collections import deque
+from collections.abc import Coroutine
+from collections.abc import Hashable
+from enum import StrEnum
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class ExportOverflowPolicy(StrEnum):
+    """What to do with a new export when the queue of an ExportScheduler is full."""
+
+    # Discard the new export
+    DROP_NEWEST = "drop_newest"
+
+    # Discard the export which has been queued the longest to make room for the new one
+    DROP_OLDEST = "drop_oldest"
+
+
+class _QueuedExport:
+
+    __slots__ = ("coro", "context", "sequence", "enqueued_at")
+
+    def __init__(self, coro: Coroutine, context: contextvars.Context, sequence: int):
+        self.coro = coro
+        self.context = context
+        self.sequence = sequence
+        self.enqueued_at = time.monotonic()
+
+
+class ExportScheduler:
+    """Runs export coroutines on a fixed number of workers with a bounded queue.
+
+    Exports with the same key (e.g. the trace ID) are always handled by the same worker, in the order they were
+    submitted. Exports without a key are spread across the workers. Each export runs in the context that was current
+    when it was submitted, so processors can still read the context state of the workflow run.
+
+    Exports are submitted synchronously from the event stream, so the producer cannot wait for room in the queue.
+    Instead, once `max_queue_size` exports are waiting, exports are dropped according to the overflow policy.
+
+    Args:
+        num_workers: Number of exports which can run concurrently (default: 4)
+        max_queue_size: Maximum number of exports waiting for a worker (default: 10000)
+        overflow_policy: What to drop when the queue is full (default: drop the new export)
+        name: Name used in log messages and worker task names
+    """
+
+    def __init__(self,
+                 num_workers: int = 4,
+                 max_queue_size: int = 10000,
+                 overflow_policy: ExportOverflowPolicy = ExportOverflowPolicy.DROP_NEWEST,
+                 name: str = "exporter"):
+        if num_workers < 1:
+            raise ValueError(f"num_workers must be at least 1, got {num_workers}")
+        if max_queue_size < 1:
+            raise ValueError(f"max_queue_size must be at least 1, got {max_queue_size}")
+
+        self._num_workers = num_workers
+        self._max_queue_size = max_queue_size
+        self._overflow_policy = ExportOverflowPolicy(overflow_policy)
+        self._name = name
+
+        self._lanes: list[deque[_QueuedExport]] = [deque() for _ in range(num_workers)]
+        self._sequence = itertools.count()
+        self._round_robin = itertools.cycle(range(num_workers))
+
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._workers: list[asyncio.Task] = []
+        self._wakeups: list[asyncio.Event] = []
+        self._idle: asyncio.Event | None = None
+        self._queued = 0
+        self._in_flight = 0
+        self._closed = False
+
+        # Statistics
+        self._items_submitted = 0
+        self._items_processed = 0
+        self._items_failed = 0
+        self._items_dropped = 0
+        self._queue_overflows = 0
+        self._peak_queue_size = 0
+        self._total_queue_wait = 0.0
+
+    def _ensure_workers(self) -> None:
+        loop = asyncio.get_running_loop()
+
+        if self._loop is loop:
+            return
+
+        # Workers are bound to the event loop they were started on, exports queued on another loop can not run
+        stale = 0
+        for lane in self._lanes:
+            while lane:
+                lane.popleft().coro.close()
+                stale += 1
+
+        if stale:
+            self._items_dropped += stale
+            logger.warning("%s: Dropping %d exports queued on a previous event loop", self._name, stale)
+
+        self._queued = 0
+        self._in_flight = 0
+
+        self._loop = loop
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._wakeups = [asyncio.Event() for _ in range(self._num_workers)]
+        self._workers = [
+            loop.create_task(self._run_worker(i), name=f"{self._name}_export_worker_{i}", context=contextvars.Context())
+            for i in range(self._num_workers)
+        ]
+
+    def _drop_oldest(self) -> None:
+        oldest_lane = min((lane for lane in self._lanes if lane), key=lambda lane: lane[0].sequence)
+        oldest_lane.popleft().coro.close()
+        self._queued -= 1
+
+    def submit(self, coro: Coroutine, key: Hashable | None = None) -> bool:
+        """Queue an export coroutine. Must be called from the event loop thread.
+
+        Args:
+            coro: The coroutine to run.
+            key: Exports with the same key run one at a time in submission order. If None, the export may run
+                concurrently with any other export.
+
+        Returns:
+            bool: True if the export was queued, False if it was dropped.
+        """
+        if self._closed:
+            coro.close()
+            self._items_dropped += 1
+            logger.warning("%s: Dropping export submitted after shutdown", self._name)
+            return False
+
+        self._ensure_workers()
+        self._items_submitted += 1
+
+        if self._queued >= self._max_queue_size:
+            self._queue_overflows += 1
+            self._items_dropped += 1
+
+            if self._overflow_policy == ExportOverflowPolicy.DROP_NEWEST:
+                coro.close()
+                logger.warning("%s: Export queue full, dropping new export (dropped: %d)",
+                               self._name,
+                               self._items_dropped)
+                return False
+
+            self._drop_oldest()
+            logger.warning("%s: Export queue full, dropping oldest export (dropped: %d)",
+                           self._name,
+                           self._items_dropped)
+
+        if key is None:
+            index = next(self._round_robin)
+        else:
+            index = hash(key) % self._num_workers
+
+        self._lanes[index].append(_QueuedExport(coro, contextvars.copy_context(), next(self._sequence)))
+        self._queued += 1
+        self._peak_queue_size = max(self._peak_queue_size, self._queued)
+        self._idle.clear()
+        self._wakeups[index].set()
+
+        return True
+
+    async def _run_worker(self, index: int) -> None:
+        lane = self._lanes[index]
+        wakeup = self._wakeups[index]
+
+        while True:
+            if not lane:
+                wakeup.clear()
+                await wakeup.wait()
+                continue
+
+            queued = lane.popleft()
+            self._queued -= 1
+            self._in_flight += 1
+            self._total_queue_wait += time.monotonic() - queued.enqueued_at
+
+            try:
+                # Run in the context the export was submitted from
+                await asyncio.create_task(queued.coro, context=queued.context)
+                self._items_processed += 1
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Exports log their own errors, only count them here
+                self._items_failed += 1
+                logger.debug("%s: Export failed: %s", self._name, e)
+            finally:
+                self._in_flight -= 1
+
+                if self._queued == 0 and self._in_flight == 0:
+                    self._idle.set()
+
+    async def drain(self, timeout: float | None = None) -> bool:
+        """Wait until every queued export has run.
+
+        Args:
+            timeout: Maximum seconds to wait, or None to wait indefinitely.
+
+        Returns:
+            bool: True if the queue was drained, False if the timeout expired first.
+        """
+        if self._idle is None or self._loop is not asyncio.get_running_loop():
+            return True
+
+        try:
+            await asyncio.wait_for(self._idle.wait(), timeout=timeout)
+            return True
+        except TimeoutError:
+            return False
+
+    async def shutdown(self, timeout: float | None = 10.0) -> None:
+        """Run the queued exports, then stop the workers. Exports which do not finish within the timeout are dropped.
+
+        Args:
+            timeout: Maximum seconds to wait for the queued exports (default: 10.0)
+        """
+        self._closed = True
+
+        if not await self.drain(timeout):
+            logger.warning("%s: Export queue did not drain within %s seconds, dropping %d exports",
+                           self._name,
+                           timeout,
+                           self._queued)
+
+        for worker in self._workers:
+            worker.cancel()
+
+        await asyncio.gather(*self._workers, return_exceptions=True)
+
+        for lane in self._lanes:
+            while lane:
+                lane.popleft().coro.close()
+                self._items_dropped += 1
+
+        self._queued = 0
+        self._workers = []
+        self._loop = None
+        self._idle = None
+        self._closed = False
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get export scheduling statistics."""
+        started = self._items_processed + self._items_failed
+
+        return {
+            "num_workers": self._num_workers,
+            "max_queue_size": self._max_queue_size,
+            "overflow_policy": self._overflow_policy.value,
+            "current_queue_size": self._queued,
+            "in_flight": self._in_flight,
+            "peak_queue_size": self._peak_queue_size,
+            "items_submitted": self._items_submitted,
+            "items_processed": self._items_processed,
+            "items_failed": self._items_failed,
+            "items_dropped": self._items_dropped,
+            "queue_overflows": self._queue_overflows,
+            "avg_queue_wait_ms": self._total_queue_wait / max(1, started + self._in_flight) * 1000,
+            "drop_rate": self._items_dropped / self._items_submitted * 100 if self._items_submitted else 0
+        }
@@ -24,6 +24,8 @@ from typing import TypeVar
 from nat.builder.context import ContextState
 from nat.data_models.intermediate_step import IntermediateStep
 from nat.observability.exporter.base_exporter import BaseExporter
+from nat.observability.exporter.export_scheduler import ExportOverflowPolicy
+from nat.observability.exporter.export_scheduler import ExportScheduler
 from nat.observability.mixin.type_introspection_mixin import TypeIntrospectionMixin
 from nat.observability.processor.callback_processor import CallbackProcessor
 from nat.observability.processor.processor import Processor
@@ -52,6 +54,8 @@ class ProcessingExporter(Generic[PipelineInputT, PipelineOutputT], BaseExporter,
     - Pipeline processing with error handling
     - Configurable None filtering: processors returning None can drop items from pipeline
     - Automatic type validation before export
+    - Optional bounded execution: by default each export runs in its own task, `configure_export_workers()` runs
+      them on a fixed number of workers with a bounded queue and per-trace ordering instead
     """
     # All ProcessingExporter instances automatically use this for signature checking
     _signature_method = '_process_pipeline'
@@ -68,6 +72,43 @@ class ProcessingExporter(Generic[PipelineInputT, PipelineOutputT], BaseExporter,
         self._processor_names: dict[str, int] = {}  # Maps processor names to their positions
         self._pipeline_locked: bool = False  # Prevents modifications after startup
         self._drop_nones: bool = drop_nones  # Whether to drop None values between processors
+        self._export_scheduler: ExportScheduler | None = None  # Shared with isolated instances
+
+    def configure_export_workers(self,
+                                 num_workers: int = 4,
+                                 max_queue_size: int = 10000,
+                                 overflow_policy: ExportOverflowPolicy = ExportOverflowPolicy.DROP_NEWEST) -> None:
+        """Run exports on a fixed number of workers instead of creating a task for every export.
+
+        Exports of the same trace are handled by the same worker in the order they were produced. When
+        `max_queue_size` exports are waiting for a worker, exports are dropped according to `overflow_policy`.
+        Isolated instances share the workers of the exporter they were created from.
+
+        Args:
+            num_workers (int): Number of exports which can run concurrently.
+            max_queue_size (int): Maximum number of exports waiting for a worker.
+            overflow_policy (ExportOverflowPolicy): What to drop when the queue is full.
+
+        Raises:
+            RuntimeError: If pipeline is locked (after startup)
+        """
+        self._check_pipeline_locked()
+
+        self._export_scheduler = ExportScheduler(num_workers=num_workers,
+                                                 max_queue_size=max_queue_size,
+                                                 overflow_policy=overflow_policy,
+                                                 name=self.name)
+
+    def get_export_stats(self) -> dict[str, Any] | None:
+        """Get the statistics of the export workers.
+
+        Returns:
+            dict[str, Any] | None: The statistics, or None if `configure_export_workers()` was not called.
+        """
+        if self._export_scheduler is None:
+            return None
+
+        return self._export_scheduler.get_stats()
 
     def add_processor(self,
                       processor: Processor,
@@ -513,6 +554,11 @@ class ProcessingExporter(Generic[PipelineInputT, PipelineOutputT], BaseExporter,
         """
         if not self._running:
             logger.warning("%s: Attempted to create export task while not running", self.name)
+            coro.close()
+            return
+
+        if self._export_scheduler is not None:
+            self._export_scheduler.submit(coro, key=self._context_state.workflow_trace_id.get())
             return
 
         try:
@@ -546,5 +592,21 @@ class ProcessingExporter(Generic[PipelineInputT, PipelineOutputT], BaseExporter,
             except Exception as e:
                 logger.exception("Error shutting down processors: %s", e)
 
+        # Isolated instances share the export workers, only the original exporter stops them
+        if self._export_scheduler is not None and not self._is_isolated_instance:
+            await self._export_scheduler.shutdown()
+
         # Call parent cleanup
         await super()._cleanup()
+
+    @override
+    async def wait_for_tasks(self, timeout: float = 5.0):
+        """Wait for all tracked tasks, and any exports queued for the export workers, to complete with a timeout.
+
+        Args:
+            timeout (float, optional): The timeout in seconds. Defaults to 5.0.
+        """
+        await super().wait_for_tasks(timeout=timeout)
+
+        if self._export_scheduler is not None and not await self._export_scheduler.drain(timeout):
+            logger.warning("%s: Some queued exports did not complete within %s seconds", self.name, timeout)
@@ -14,15 +14,132 @@
 # limitations under the License.
 
 import asyncio
+import contextvars
 import logging
 from contextlib import asynccontextmanager
 
 from nat.builder.context import ContextState
+from nat.data_models.intermediate_step import IntermediateStep
+from nat.data_models.intermediate_step import as_intermediate_step
 from nat.observability.exporter.base_exporter import BaseExporter
+from nat.utils.reactive.subscription import Subscription
 
 logger = logging.getLogger(__name__)
 
 
+class _SharedExporterPipeline:
+    """Exporters which are started once and receive the events of every workflow run.
+
+    The pipeline is shared by an ExporterManager and every copy created with `ExporterManager.get()`. Exporters are
+    started the first time a run uses them and keep running until `ExporterManager.shutdown()` is called.
+    """
+
+    def __init__(self):
+        self.loop: asyncio.AbstractEventLoop | None = None
+        self.lock: asyncio.Lock | None = None
+        self.shutdown_event: asyncio.Event | None = None
+
+        # Keyed by the id of the exporter, the same exporter may be registered under several names
+        self.exporters: dict[int, BaseExporter] = {}
+        self.tasks: dict[int, asyncio.Task] = {}
+
+    def _bind_to_running_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+
+        if self.loop is not loop:
+            if self.loop is not None:
+                logger.warning("Shared exporters were started on a different event loop, restarting them")
+
+            self.loop = loop
+            self.lock = asyncio.Lock()
+            self.shutdown_event = asyncio.Event()
+            self.exporters = {}
+            self.tasks = {}
+
+    async def ensure_started(self, exporters: dict[str, BaseExporter], shutdown_timeout: int) -> None:
+        """Start any of the given exporters which are not already running."""
+        self._bind_to_running_loop()
+
+        if all(id(exporter) in self.tasks for exporter in exporters.values()):
+            return
+
+        async with self.lock:
+            started: list[BaseExporter] = []
+
+            for name, exporter in exporters.items():
+                if id(exporter) in self.tasks:
+                    continue
+
+                # Run the exporter in an empty context so it does not hold on to the context of the run which
+                # happened to start it
+                task = asyncio.create_task(self._run_exporter(name, exporter),
+                                           name=f"shared_exporter_{name}",
+                                           context=contextvars.Context())
+
+                self.exporters[id(exporter)] = exporter
+                self.tasks[id(exporter)] = task
+                started.append(exporter)
+
+            for exporter in started:
+                ready = asyncio.ensure_future(exporter.wait_ready())
+                task = self.tasks[id(exporter)]
+
+                await asyncio.wait([ready, task], timeout=shutdown_timeout, return_when=asyncio.FIRST_COMPLETED)
+
+                if not ready.done():
+                    # The exporter failed to start (or is stuck), the next run will try again
+                    ready.cancel()
+                    task.cancel()
+                    del self.exporters[id(exporter)]
+                    del self.tasks[id(exporter)]
+                    logger.error("Shared exporter '%s' failed to start", exporter.name)
+
+    async def _run_exporter(self, name: str, exporter: BaseExporter) -> None:
+        shutdown_event = self.shutdown_event
+
+        try:
+            async with exporter.start_shared():
+                logger.info("Started shared exporter '%s'", name)
+                await shutdown_event.wait()
+
+                # Unlike isolated exporters, shared exporters are only stopped when the process is done with them,
+                # so give the pending exports a chance to finish
+                await exporter.wait_for_tasks()
+                logger.info("Stopped shared exporter '%s'", name)
+        except asyncio.CancelledError:
+            logger.debug("Shared exporter '%s' task cancelled", name)
+            raise
+        except Exception as e:
+            logger.error("Failed to run shared exporter '%s': %s", name, str(e))
+            raise
+
+    def dispatch(self, exporters: tuple[BaseExporter, ...], event: IntermediateStep) -> None:
+        """Pass an event of a run to each of its exporters."""
+        for exporter in exporters:
+            try:
+                exporter.export(event)
+            except Exception as e:
+                logger.exception("Exporter '%s' failed to export event: %s", exporter.name, e)
+
+    async def shutdown(self, shutdown_timeout: int) -> None:
+        """Stop all of the shared exporters."""
+        if self.loop is None or not self.tasks:
+            return
+
+        tasks = dict(self.tasks)
+        self.shutdown_event.set()
+
+        try:
+            await asyncio.wait_for(asyncio.gather(*tasks.values(), return_exceptions=True), timeout=shutdown_timeout)
+        except TimeoutError:
+            stuck = [self.exporters[key].name for key, task in tasks.items() if not task.done()]
+            logger.warning("Shared exporters did not shut down in time: %s", ", ".join(stuck))
+
+        self.loop = None
+        self.exporters = {}
+        self.tasks = {}
+
+
 class ExporterManager:
     """
     Manages the lifecycle of asynchronous exporters.
@@ -38,12 +155,20 @@ class ExporterManager:
     Exporters added after `start()` is called will not be started automatically. They will only be
     started on the next lifecycle (i.e., after a stop and subsequent start).
 
+    When `shared` is enabled, exporters are not copied and started for each workflow execution. Instead they are
+    started once, the first time they are needed, and shared by every execution; `start()` only subscribes them to the
+    event stream of the execution. Events are exported from the context of the execution which produced them, so
+    exporters can still read the run and trace identifiers from the context state. The shared exporters keep running
+    until `shutdown()` is called.
+
     Args:
         shutdown_timeout (int, optional): Maximum time in seconds to wait for exporters to shut down gracefully.
         Defaults to 120 seconds.
+        shared (bool, optional): Share the exporters between workflow executions instead of creating isolated
+        exporters for each execution. Defaults to False.
     """
 
-    def __init__(self, shutdown_timeout: int = 120):
+    def __init__(self, shutdown_timeout: int = 120, shared: bool = False):
         """Initialize the ExporterManager."""
         self._tasks: dict[str, asyncio.Task] = {}
         self._running: bool = False
@@ -54,10 +179,14 @@ class ExporterManager:
         self._shutdown_timeout: int = shutdown_timeout
         # Track isolated exporters for proper cleanup
         self._active_isolated_exporters: dict[str, BaseExporter] = {}
+        self._shared_pipeline: _SharedExporterPipeline | None = _SharedExporterPipeline() if shared else None
+        self._shared_subscription: Subscription | None = None
 
     @classmethod
-    def _create_with_shared_registry(cls, shutdown_timeout: int,
-                                     shared_registry: dict[str, BaseExporter]) -> "ExporterManager":
+    def _create_with_shared_registry(cls,
+                                     shutdown_timeout: int,
+                                     shared_registry: dict[str, BaseExporter],
+                                     shared_pipeline: _SharedExporterPipeline | None = None) -> "ExporterManager":
         """Internal factory method for creating instances with shared registry."""
         instance = cls.__new__(cls)
         instance._tasks = {}
@@ -68,8 +197,19 @@ class ExporterManager:
         instance._shutdown_event = asyncio.Event()
         instance._shutdown_timeout = shutdown_timeout
         instance._active_isolated_exporters = {}
+        instance._shared_pipeline = shared_pipeline
+        instance._shared_subscription = None
         return instance
 
+    @property
+    def is_shared(self) -> bool:
+        """Whether the exporters are shared between workflow executions.
+
+        Returns:
+            bool: True if the exporters are started once and shared, False if they are isolated per execution.
+        """
+        return self._shared_pipeline is not None
+
     def _ensure_registry_owned(self):
         """Ensure we own the registry (copy-on-write)."""
         if self._is_registry_shared:
@@ -215,6 +355,11 @@ class ExporterManager:
         Raises:
             RuntimeError: If the manager is already running.
         """
+        if self._shared_pipeline is not None:
+            async with self._start_shared(context_state):
+                yield self
+            return
+
         async with self._lock:
             if self._running:
                 raise RuntimeError("Exporter manager is already running")
@@ -256,6 +401,35 @@ class ExporterManager:
             # Then stop the manager tasks
             await self.stop()
 
+    @asynccontextmanager
+    async def _start_shared(self, context_state: ContextState | None):
+        """Subscribe the shared exporters to the event stream of a single workflow execution."""
+        async with self._lock:
+            if self._running:
+                raise RuntimeError("Exporter manager is already running")
+            self._running = True
+
+        try:
+            await self._shared_pipeline.ensure_started(self._exporter_registry, self._shutdown_timeout)
+
+            if context_state is None:
+                context_state = ContextState.get()
+
+            # One subscription per execution which passes each event to all of the exporters
+            exporters = tuple(self._exporter_registry.values())
+            pipeline = self._shared_pipeline
+
+            self._shared_subscription = context_state.event_stream.get().subscribe(
+                on_next=lambda event: pipeline.dispatch(exporters, as_intermediate_step(event)))
+        except BaseException:
+            self._running = False
+            raise
+
+        try:
+            yield
+        finally:
+            await self.stop()
+
     async def _run_exporter(self, name: str, exporter: BaseExporter):
         """
         Run an exporter in its own task.
@@ -292,6 +466,11 @@ class ExporterManager:
             self._running = False
             self._shutdown_event.set()
 
+        if self._shared_subscription is not None:
+            # Shared exporters keep running, they are only stopped by `shutdown()`
+            self._shared_subscription.unsubscribe()
+            self._shared_subscription = None
+
         # Create a copy of tasks to prevent modification during iteration
         tasks_to_cancel = dict(self._tasks)
         self._tasks.clear()
@@ -312,12 +491,24 @@ class ExporterManager:
         if stuck_tasks:
             logger.warning("Exporters did not shut down in time: %s", ", ".join(stuck_tasks))
 
+    async def shutdown(self) -> None:
+        """
+        Stop the shared exporters. This is a no-op unless the manager was created with `shared=True`.
+
+        The shared exporters are stopped for this manager and all of its copies. If another workflow execution is
+        started afterwards, the exporters are started again.
+        """
+        if self._shared_pipeline is not None:
+            await self._shared_pipeline.shutdown(self._shutdown_timeout)
+
     @staticmethod
-    def from_exporters(exporters: dict[str, BaseExporter], shutdown_timeout: int = 120) -> "ExporterManager":
+    def from_exporters(exporters: dict[str, BaseExporter],
+                       shutdown_timeout: int = 120,
+                       shared: bool = False) -> "ExporterManager":
         """
         Create an ExporterManager from a dictionary of exporters.
         """
-        exporter_manager = ExporterManager(shutdown_timeout=shutdown_timeout)
+        exporter_manager = ExporterManager(shutdown_timeout=shutdown_timeout, shared=shared)
         for name, exporter in exporters.items():
             exporter_manager.add_exporter(name, exporter)
 
@@ -332,4 +523,4 @@ class ExporterManager:
         Returns:
             ExporterManager: A new ExporterManager instance with shared exporters (copy-on-write).
         """
-        return self._create_with_shared_registry(self._shutdown_timeout, self._exporter_registry)
+        return self._create_with_shared_registry(self._shutdown_timeout, self._exporter_registry, self._shared_pipeline)
@@ -0,0 +1,34 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from pydantic import BaseModel
+from pydantic import Field
+
+from nat.observability.exporter.export_scheduler import ExportOverflowPolicy
+
+
+class ExportWorkersConfigMixin(BaseModel):
+    """Mixin for telemetry exporters which can run their exports on a bounded pool of workers."""
+    export_workers: int | None = Field(
+        default=None,
+        ge=1,
+        description="If set, run exports on this many workers with a bounded queue and per-trace ordering, instead "
+        "of creating a task for every event.")
+    export_queue_size: int = Field(default=10000,
+                                   ge=1,
+                                   description="The maximum number of exports waiting for a worker.")
+    export_overflow_policy: ExportOverflowPolicy = Field(
+        default=ExportOverflowPolicy.DROP_NEWEST,
+        description="Which export to drop when the queue is full: 'drop_newest' or 'drop_oldest'.")
@@ -14,16 +14,64 @@
 # limitations under the License.
 
 import asyncio
+import dataclasses
 import logging
+import os
+import shutil
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Any
+from typing import BinaryIO
 
+from nat.observability.mixin.file_compression import FileCompression
 from nat.observability.mixin.file_mode import FileMode
 from nat.observability.mixin.resource_conflict_mixin import ResourceConflictMixin
+from nat.utils.optional_imports import optional_import
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of queued writes handled by one pass of the writer, which are written with a single system call
+_MAX_WRITE_BATCH_SIZE = 1024
+
+
+@dataclasses.dataclass
+class _WriteRequest:
+    lines: list[str]
+    done: asyncio.Future[None]
+
+    # Close the file once the lines are written
+    close: bool = False
+
+    # Only sync the file to disk if the fsync policy requires it
+    sync: bool = False
+
+
+class _WriterState:
+    """State of the background writer of a FileExportMixin.
+
+    Isolated exporter instances are shallow copies of the original, so they share this object and with it the open
+    file, the queue of pending writes and the writer task.
+    """
+
+    def __init__(self, first_write: bool):
+        self.loop: asyncio.AbstractEventLoop | None = None
+        self.queue: asyncio.Queue[_WriteRequest] | None = None
+        self.task: asyncio.Task | None = None
+
+        self.file: BinaryIO | None = None
+        self.first_write = first_write
+
+        # Size of the current file, tracked as it is written instead of calling stat() before each write
+        self.file_size = 0
+
+        self.unsynced_bytes = 0
+        self.last_fsync = time.monotonic()
+
+        # Timer and task syncing data left unsynced once the fsync interval elapses
+        self.sync_timer: asyncio.TimerHandle | None = None
+        self.sync_task: asyncio.Task | None = None
+
 
 class FileExportMixin(ResourceConflictMixin):
     """Mixin for file-based exporters.
@@ -45,6 +93,10 @@ class FileExportMixin(ResourceConflictMixin):
             max_file_size: int = 10 * 1024 * 1024,  # 10MB default
             max_files: int = 5,
             cleanup_on_init: bool = False,
+            compression: FileCompression = FileCompression.NONE,
+            max_queue_size: int = 10000,
+            fsync_interval: float | None = None,
+            fsync_bytes: int | None = None,
             **kwargs):
         """Initialize the file exporter with the specified output_path and project.
 
@@ -56,6 +108,13 @@ class FileExportMixin(ResourceConflictMixin):
             max_file_size (int): Maximum file size in bytes before rolling. Defaults to 10MB.
             max_files (int): Maximum number of rolled files to keep. Defaults to 5.
             cleanup_on_init (bool): Clean up old files during initialization. Defaults to False.
+            compression (FileCompression): Compression applied to rolled files. Defaults to no compression.
+            max_queue_size (int): Maximum number of exports waiting to be written before callers wait for the writer.
+                Defaults to 10000.
+            fsync_interval (float | None): If set, the file is synced to disk at most this many seconds after data is
+                written to it. Defaults to None.
+            fsync_bytes (int | None): If set, the file is synced to disk whenever this many bytes have been written
+                since the last sync. Defaults to None.
 
         Raises:
             ResourceConflictError: If another FileExportMixin instance is already using
@@ -68,8 +127,15 @@ class FileExportMixin(ResourceConflictMixin):
         self._max_file_size = max_file_size
         self._max_files = max_files
         self._cleanup_on_init = cleanup_on_init
-        self._lock = asyncio.Lock()
-        self._first_write = True
+        self._compression = FileCompression(compression)
+        self._max_queue_size = max_queue_size
+        self._fsync_interval = fsync_interval
+        self._fsync_bytes = fsync_bytes
+        self._writer_state = _WriterState(first_write=True)
+
+        if self._compression == FileCompression.ZSTD:
+            # Fail early rather than when the first file is rolled
+            optional_import("zstandard")
 
         # Initialize file paths first, then check for conflicts via ResourceConflictMixin
         self._setup_file_paths()
@@ -138,12 +204,21 @@ class FileExportMixin(ResourceConflictMixin):
             case _:
                 return f"Unknown file resource conflict: {resource_type} = {identifier}"
 
+    def _get_rolled_files(self) -> list[Path]:
+        """Return the rolled files, including compressed ones."""
+        pattern = f"{self._base_filename}_*{self._file_extension}"
+        rolled_files = list(self._base_dir.glob(pattern))
+
+        if self._compression != FileCompression.NONE:
+            rolled_files.extend(self._base_dir.glob(f"{pattern}{self._compression.suffix}"))
+
+        return rolled_files
+
     def _cleanup_old_files_sync(self) -> None:
         """Synchronous version of cleanup for use during initialization."""
         try:
             # Find all rolled files matching our pattern
-            pattern = f"{self._base_filename}_*{self._file_extension}"
-            rolled_files = list(self._base_dir.glob(pattern))
+            rolled_files = self._get_rolled_files()
 
             # Sort by modification time (newest first)
             rolled_files.sort(key=lambda f: f.stat().st_mtime, reverse=True)
@@ -159,93 +234,278 @@ class FileExportMixin(ResourceConflictMixin):
         except Exception as e:
             logger.exception("Error during initialization cleanup: %s", e)
 
-    async def _should_roll_file(self) -> bool:
-        """Check if the current file should be rolled based on size."""
-        if not self._enable_rolling:
-            return False
+    def _open_file(self) -> BinaryIO:
+        """Open the current file for writing. Only the first file opened in overwrite mode is truncated."""
+        state = self._writer_state
+
+        if state.first_write and self._mode == FileMode.OVERWRITE:
+            file_mode = "wb"
+        else:
+            file_mode = "ab"
+
+        state.first_write = False
+
+        return open(self._current_file_path, file_mode)  # noqa: SIM115 - kept open by the writer
+
+    def _get_file(self) -> BinaryIO:
+        """Return the open current file, opening it if needed."""
+        state = self._writer_state
+
+        if state.file is None:
+            state.file = self._open_file()
+            # Files opened for appending are positioned at their end
+            state.file_size = state.file.tell()
+            state.unsynced_bytes = 0
+
+        return state.file
+
+    def _sync_file(self, force: bool = False) -> None:
+        """Sync the current file to disk if required by the fsync policy, or if forced and a policy is set."""
+        state = self._writer_state
+
+        if state.file is None or state.unsynced_bytes == 0:
+            return
+
+        if force:
+            due = self._fsync_interval is not None or self._fsync_bytes is not None
+        else:
+            due = ((self._fsync_bytes is not None and state.unsynced_bytes >= self._fsync_bytes)
+                   or (self._fsync_interval is not None
+                       and time.monotonic() - state.last_fsync >= self._fsync_interval))
+
+        if due:
+            os.fsync(state.file.fileno())
+            state.unsynced_bytes = 0
+            state.last_fsync = time.monotonic()
+
+    def _close_file_sync(self) -> None:
+        """Flush, sync and close the current file if it is open."""
+        state = self._writer_state
+
+        if state.file is None:
+            return
 
         try:
-            if self._current_file_path.exists():
-                stat = self._current_file_path.stat()
-                return stat.st_size >= self._max_file_size
-        except OSError:
-            pass
-        return False
+            state.file.flush()
+            self._sync_file(force=True)
+        finally:
+            state.file.close()
+            state.file = None
+
+    def _write_batch(self, requests: list[_WriteRequest]) -> None:
+        """Write the lines of the given requests, rolling the file between requests when it is full.
+
+        Runs in a worker thread. All lines written to the same file are joined and written with a single call.
+        """
+        state = self._writer_state
+        pending: list[bytes] = []
+
+        for request in requests:
+            if request.sync:
+                continue
+
+            if request.close:
+                if pending:
+                    state.file.write(b"".join(pending))
+                    pending.clear()
+
+                self._close_file_sync()
+                continue
+
+            self._get_file()
+
+            if self._enable_rolling and state.file_size >= self._max_file_size:
+                state.file.write(b"".join(pending))
+                pending.clear()
+
+                self._roll_file_sync()
+                self._get_file()
+
+            for line in request.lines:
+                data = f"{line}\n".encode("utf-8")
+                pending.append(data)
+                state.file_size += len(data)
+                state.unsynced_bytes += len(data)
+
+        if state.file is None:
+            return
+
+        if pending:
+            state.file.write(b"".join(pending))
 
-    async def _roll_file(self) -> None:
+        state.file.flush()
+        self._sync_file()
+
+    async def _run_writer(self) -> None:
+        """Write queued requests in batches until the queue is empty."""
+        state = self._writer_state
+
+        while not state.queue.empty():
+            batch = []
+            while not state.queue.empty() and len(batch) < _MAX_WRITE_BATCH_SIZE:
+                batch.append(state.queue.get_nowait())
+
+            try:
+                await asyncio.to_thread(self._write_batch, batch)
+            except Exception as e:
+                for request in batch:
+                    if not request.done.done():
+                        request.done.set_exception(e)
+            else:
+                for request in batch:
+                    if not request.done.done():
+                        request.done.set_result(None)
+
+            self._schedule_sync()
+
+    def _schedule_sync(self) -> None:
+        """Start a timer syncing the file once the fsync interval has elapsed, if written data is left unsynced."""
+        state = self._writer_state
+
+        if self._fsync_interval is None or state.unsynced_bytes == 0 or state.sync_timer is not None:
+            return
+
+        delay = max(0.0, state.last_fsync + self._fsync_interval - time.monotonic())
+        state.sync_timer = state.loop.call_later(delay, self._on_sync_timer)
+
+    def _on_sync_timer(self) -> None:
+        state = self._writer_state
+
+        state.sync_timer = None
+        state.sync_task = state.loop.create_task(self._sync_pending())
+
+    async def _sync_pending(self) -> None:
+        """Have the writer sync the file, so that the fsync interval is honored even when nothing else is written."""
+        try:
+            done = await self._enqueue_write([], sync=True)
+            await done
+        except Exception as e:
+            logger.exception("Error syncing file %s: %s", self._current_file_path, e)
+
+    def _cancel_sync(self) -> None:
+        """Cancel any pending timed sync."""
+        state = self._writer_state
+
+        if state.sync_timer is not None:
+            state.sync_timer.cancel()
+            state.sync_timer = None
+
+        if state.sync_task is not None:
+            state.sync_task.cancel()
+            state.sync_task = None
+
+    async def _enqueue_write(self, lines: list[str], close: bool = False, sync: bool = False) -> asyncio.Future[None]:
+        """Queue lines for the writer, starting the writer task if it is not running.
+
+        Returns:
+            asyncio.Future[None]: Resolved once the lines have been written.
+        """
+        state = self._writer_state
+        loop = asyncio.get_running_loop()
+
+        if state.loop is not loop:
+            # Anything scheduled on the previous loop can no longer run
+            state.sync_timer = None
+            state.sync_task = None
+            state.loop = loop
+            state.queue = asyncio.Queue(maxsize=self._max_queue_size)
+            state.task = None
+
+        # The writer exits once the queue is empty, so make sure it is running before queueing the request
+        if state.task is None or state.task.done():
+            state.task = loop.create_task(self._run_writer())
+
+        done = loop.create_future()
+        await state.queue.put(_WriteRequest(lines=lines, done=done, close=close, sync=sync))
+
+        return done
+
+    def _compress_file(self, path: Path) -> Path:
+        """Compress a rolled file, replacing it with the compressed file."""
+        compressed_path = path.with_name(f"{path.name}{self._compression.suffix}")
+
+        with open(path, "rb") as src:
+            if self._compression == FileCompression.GZIP:
+                import gzip
+
+                with gzip.open(compressed_path, "wb") as dst:
+                    shutil.copyfileobj(src, dst)
+            else:
+                zstandard = optional_import("zstandard")
+
+                with open(compressed_path, "wb") as dst:
+                    zstandard.ZstdCompressor().copy_stream(src, dst)
+
+        path.unlink()
+
+        return compressed_path
+
+    def _roll_file_sync(self) -> None:
         """Roll the current file by renaming it with a timestamp and cleaning up old files."""
+        self._close_file_sync()
+
         if not self._current_file_path.exists():
             return
 
         # Generate timestamped filename with microsecond precision
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
-        rolled_filename = f"{self._base_filename}_{timestamp}{self._file_extension}"
-        rolled_path = self._base_dir / rolled_filename
+        rolled_path = self._current_file_path
+        while rolled_path.exists():
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+            rolled_filename = f"{self._base_filename}_{timestamp}{self._file_extension}"
+            rolled_path = self._base_dir / rolled_filename
 
         try:
             # Rename current file
             self._current_file_path.rename(rolled_path)
             logger.info("Rolled log file to: %s", rolled_path)
 
+            if self._compression != FileCompression.NONE:
+                rolled_path = self._compress_file(rolled_path)
+                logger.info("Compressed rolled log file to: %s", rolled_path)
+
             # Clean up old files
-            await self._cleanup_old_files()
+            self._cleanup_old_files_sync()
 
         except OSError as e:
             logger.exception("Error rolling file %s: %s", self._current_file_path, e)
 
-    async def _cleanup_old_files(self) -> None:
-        """Remove old rolled files beyond the maximum count."""
-        try:
-            # Find all rolled files matching our pattern
-            pattern = f"{self._base_filename}_*{self._file_extension}"
-            rolled_files = list(self._base_dir.glob(pattern))
+    async def _close_file(self) -> None:
+        """Write any queued exports and close the file. It is reopened if more items are exported afterwards."""
+        # Closing syncs the file, which makes a pending timed sync redundant
+        self._cancel_sync()
 
-            # Sort by modification time (newest first)
-            rolled_files.sort(key=lambda f: f.stat().st_mtime, reverse=True)
+        if self._writer_state.file is None and self._writer_state.task is None:
+            return
 
-            # Remove files beyond max_files limit
-            for old_file in rolled_files[self._max_files:]:
-                try:
-                    old_file.unlink()
-                    logger.info("Cleaned up old log file: %s", old_file)
-                except OSError as e:
-                    logger.exception("Error removing old file %s: %s", old_file, e)
+        done = await self._enqueue_write([], close=True)
+        await done
 
-        except Exception as e:
-            logger.exception("Error during cleanup: %s", e)
+    async def _cleanup(self) -> None:
+        """Close the file when the exporter stops. Isolated instances share the file of the original exporter."""
+        if not getattr(self, "_is_isolated_instance", False):
+            try:
+                await self._close_file()
+            except Exception as e:
+                logger.exception("Error closing file %s: %s", self._current_file_path, e)
+
+        parent_cleanup = getattr(super(), "_cleanup", None)
+        if parent_cleanup is not None:
+            await parent_cleanup()
 
     async def export_processed(self, item: str | list[str]) -> None:
         """Export a processed string or list of strings.
 
+        The item is handed to a background writer which batches concurrent exports into a single write. This method
+        returns once the item has been written to the file.
+
         Args:
             item (str | list[str]): The string or list of strings to export.
         """
         try:
-            # Lazy import to avoid slow startup times
-            import aiofiles
-
-            async with self._lock:
-                # Check if we need to roll the file
-                if await self._should_roll_file():
-                    await self._roll_file()
-
-                # Determine file mode
-                if self._first_write and self._mode == FileMode.OVERWRITE:
-                    file_mode = "w"
-                    self._first_write = False
-                else:
-                    file_mode = "a"
-
-                async with aiofiles.open(self._current_file_path, mode=file_mode) as f:
-                    if isinstance(item, list):
-                        # Handle list of strings
-                        for single_item in item:
-                            await f.write(single_item)
-                            await f.write("\n")
-                    else:
-                        # Handle single string
-                        await f.write(item)
-                        await f.write("\n")
+            lines = item if isinstance(item, list) else [item]
+
+            done = await self._enqueue_write(lines)
+            await done
 
         except Exception as e:
             logger.exception("Error exporting event: %s", e)
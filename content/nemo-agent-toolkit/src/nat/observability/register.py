@@ -22,12 +22,14 @@ from nat.cli.register_workflow import register_logging_method
 from nat.cli.register_workflow import register_telemetry_exporter
 from nat.data_models.logging import LoggingBaseConfig
 from nat.data_models.telemetry_exporter import TelemetryExporterBaseConfig
+from nat.observability.mixin.export_workers_config_mixin import ExportWorkersConfigMixin
+from nat.observability.mixin.file_compression import FileCompression
 from nat.observability.mixin.file_mode import FileMode
 
 logger = logging.getLogger(__name__)
 
 
-class FileTelemetryExporterConfig(TelemetryExporterBaseConfig, name="file"):
+class FileTelemetryExporterConfig(ExportWorkersConfigMixin, TelemetryExporterBaseConfig, name="file"):
     """A telemetry exporter that writes runtime traces to local files with optional rolling."""
 
     output_path: str = Field(description="Output path for logs. When rolling is disabled: exact file path. "
@@ -42,6 +44,18 @@ class FileTelemetryExporterConfig(TelemetryExporterBaseConfig, name="file"):
         description="Maximum file size in bytes before rolling to a new file.")
     max_files: int = Field(default=5, description="Maximum number of rolled files to keep.")
     cleanup_on_init: bool = Field(default=False, description="Clean up old files during initialization.")
+    compression: FileCompression = Field(
+        default=FileCompression.NONE,
+        description="Compression applied to rolled files: 'none', 'gzip' or 'zstd' (requires the zstandard package).")
+    max_queue_size: int = Field(default=10000,
+                                description="Maximum number of traces waiting to be written to the file.",
+                                gt=0)
+    fsync_interval: float | None = Field(
+        default=None,
+        description="If set, sync the file to disk at most this many seconds after data is written to it.",
+        gt=0)
+    fsync_bytes: int | None = Field(
+        default=None, description="If set, sync the file to disk after this many bytes have been written.", gt=0)
 
 
 @register_telemetry_exporter(config_type=FileTelemetryExporterConfig)
@@ -52,13 +66,24 @@ async def file_telemetry_exporter(config: FileTelemetryExporterConfig, builder:
 
     from nat.observability.exporter.file_exporter import FileExporter
 
-    yield FileExporter(output_path=config.output_path,
-                       project=config.project,
-                       mode=config.mode,
-                       enable_rolling=config.enable_rolling,
-                       max_file_size=config.max_file_size,
-                       max_files=config.max_files,
-                       cleanup_on_init=config.cleanup_on_init)
+    exporter = FileExporter(output_path=config.output_path,
+                            project=config.project,
+                            mode=config.mode,
+                            enable_rolling=config.enable_rolling,
+                            max_file_size=config.max_file_size,
+                            max_files=config.max_files,
+                            cleanup_on_init=config.cleanup_on_init,
+                            compression=config.compression,
+                            max_queue_size=config.max_queue_size,
+                            fsync_interval=config.fsync_interval,
+                            fsync_bytes=config.fsync_bytes)
+
+    if config.export_workers is not None:
+        exporter.configure_export_workers(num_workers=config.export_workers,
+                                          max_queue_size=config.export_queue_size,
+                                          overflow_policy=config.export_overflow_policy)
+
+    yield exporter
 
 
 class ConsoleLoggingMethodConfig(LoggingBaseConfig, name="console"):
@@ -19,6 +19,7 @@ import copy
 import logging
 import threading
 import time
+import typing
 from typing import Any
 from uuid import UUID
 from uuid import uuid4
@@ -38,8 +39,13 @@ from nat.data_models.intermediate_step import ToolSchema
 from nat.data_models.intermediate_step import TraceMetadata
 from nat.data_models.intermediate_step import UsageInfo
 from nat.profiler.callbacks.base_callback_class import BaseProfilerCallback
+from nat.profiler.callbacks.token_coalescer import CoalescedChunk
+from nat.profiler.callbacks.token_coalescer import TokenCoalescer
 from nat.profiler.callbacks.token_usage_base_model import TokenUsageBaseModel
 
+if typing.TYPE_CHECKING:
+    from nat.data_models.config import TokenCoalescingConfig
+
 logger = logging.getLogger(__name__)
 
 
@@ -63,10 +69,11 @@ class LangchainProfilerHandler(AsyncCallbackHandler, BaseProfilerCallback):
     raise_error = True  # Override to raise error and run inline
     run_inline = True
 
-    def __init__(self) -> None:
+    def __init__(self, token_coalescing: "TokenCoalescingConfig | None" = None) -> None:
         super().__init__()
         self._lock = threading.Lock()
         self.last_call_ts = time.time()
+        self._token_coalescer = TokenCoalescer.from_config(token_coalescing)
 
         self.step_manager = Context.get().intermediate_step_manager
         self._state = IntermediateStepType.LLM_END
@@ -169,9 +176,17 @@ class LangchainProfilerHandler(AsyncCallbackHandler, BaseProfilerCallback):
 
     async def on_llm_new_token(self, token: str, **kwargs: Any) -> None:
         """Collect stats for just the token"""
+        run_id = str(kwargs.get("run_id", ""))
+
+        if (self._token_coalescer is not None):
+            coalesced = self._token_coalescer.add(run_id, token, kwargs.get("chunk"))
+            if (coalesced is not None):
+                self._push_coalesced_chunk(run_id, coalesced)
+            return
+
         model_name = ""
         try:
-            model_name = self._run_id_to_model_name.get(str(kwargs.get("run_id", "")), "")
+            model_name = self._run_id_to_model_name.get(run_id, "")
         except Exception as e:
             logger.exception("Error getting model name: %s", e)
 
@@ -186,7 +201,7 @@ class LangchainProfilerHandler(AsyncCallbackHandler, BaseProfilerCallback):
             framework=LLMFrameworkEnum.LANGCHAIN,
             name=model_name,
             UUID=str(kwargs.get("run_id", str(uuid4()))),
-            data=StreamEventData(input=self._run_id_to_llm_input.get(str(kwargs.get("run_id", "")), ""), chunk=token),
+            data=StreamEventData(input=self._run_id_to_llm_input.get(run_id, ""), chunk=token),
             usage_info=UsageInfo(token_usage=self._extract_token_base_model(usage_metadata),
                                  num_llm_calls=1,
                                  seconds_between_calls=int(time.time() - self.last_call_ts)),
@@ -194,9 +209,49 @@ class LangchainProfilerHandler(AsyncCallbackHandler, BaseProfilerCallback):
 
         self.step_manager.push_intermediate_step(stats)
 
+    def _push_coalesced_chunk(self, run_id: str, coalesced: CoalescedChunk) -> None:
+        """
+        Emits a single LLM_NEW_TOKEN event for a batch of coalesced tokens. Only the chunk text is included, the LLM
+        input and the raw framework chunks are omitted since they would be repeated on every chunk event.
+        """
+        usage_metadata = {}
+        try:
+            usage_metadata = coalesced.last_chunk.message.usage_metadata if coalesced.last_chunk else {}
+        except Exception as e:
+            logger.exception("Error getting usage metadata: %s", e)
+
+        stats = IntermediateStepPayload(event_type=IntermediateStepType.LLM_NEW_TOKEN,
+                                        framework=LLMFrameworkEnum.LANGCHAIN,
+                                        name=self._run_id_to_model_name.get(run_id, ""),
+                                        UUID=run_id or str(uuid4()),
+                                        data=StreamEventData(chunk=coalesced.text),
+                                        usage_info=UsageInfo(token_usage=self._extract_token_base_model(usage_metadata),
+                                                             num_llm_calls=1,
+                                                             seconds_between_calls=int(time.time() -
+                                                                                       self.last_call_ts)))
+
+        self.step_manager.push_intermediate_step(stats)
+
+    def _flush_coalesced_tokens(self, run_id: str) -> None:
+        """
+        Emits any tokens which are still buffered for the given run.
+        """
+        if (self._token_coalescer is not None):
+            coalesced = self._token_coalescer.flush(run_id)
+            if (coalesced is not None):
+                self._push_coalesced_chunk(run_id, coalesced)
+
+    async def on_llm_error(self, error: BaseException, **kwargs: Any) -> None:
+        """Emit the tokens streamed before the LLM call failed."""
+
+        self._flush_coalesced_tokens(str(kwargs.get("run_id", "")))
+
     async def on_llm_end(self, response: LLMResult, **kwargs: Any) -> None:
         """Collect token usage."""
 
+        # Emit any tokens which are still buffered before the end event
+        self._flush_coalesced_tokens(str(kwargs.get("run_id", "")))
+
         usage_metadata = {}
 
         model_name = ""
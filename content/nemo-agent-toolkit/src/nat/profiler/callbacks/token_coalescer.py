@@ -0,0 +1,106 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import dataclasses
+import threading
+import time
+import typing
+
+if typing.TYPE_CHECKING:
+    from nat.data_models.config import TokenCoalescingConfig
+
+
+@dataclasses.dataclass
+class CoalescedChunk:
+    """
+    The tokens buffered for a single LLM call which are ready to be emitted as one chunk event.
+    """
+    text: str
+    num_tokens: int
+    last_chunk: typing.Any | None = None
+
+
+@dataclasses.dataclass
+class _TokenBuffer:
+    tokens: list[str] = dataclasses.field(default_factory=list)
+    first_token_ns: int = 0
+    last_chunk: typing.Any | None = None
+
+
+class TokenCoalescer:
+    """
+    Buffers streamed LLM tokens per run and decides when they should be flushed as a single chunk event.
+
+    Tokens are flushed once `flush_every_n_tokens` tokens are buffered or once the oldest buffered token is older than
+    `flush_interval_ms`. Both conditions are evaluated when a token is added. Callers must call `flush` when the LLM call
+    ends or fails to emit any remaining tokens and release the buffer of the run. This class is thread-safe and shared by all framework callback handlers which
+    receive streamed tokens.
+    """
+
+    def __init__(self, flush_every_n_tokens: int | None = None, flush_interval_ms: float | None = None) -> None:
+        self._flush_every_n_tokens = flush_every_n_tokens
+        self._flush_interval_ns = int(flush_interval_ms * 1e6) if flush_interval_ms is not None else None
+        self._lock = threading.Lock()
+        self._buffers: dict[str, _TokenBuffer] = {}
+
+    @staticmethod
+    def from_config(config: "TokenCoalescingConfig | None") -> "TokenCoalescer | None":
+        """
+        Creates a coalescer for the given config, or returns None if token coalescing is disabled.
+        """
+        if (config is None or not config.enable):
+            return None
+
+        return TokenCoalescer(flush_every_n_tokens=config.flush_every_n_tokens,
+                              flush_interval_ms=config.flush_interval_ms)
+
+    def add(self, run_id: str, token: str, chunk: typing.Any | None = None) -> CoalescedChunk | None:
+        """
+        Buffers a token for the given run. Returns the coalesced chunk if a flush condition was met, otherwise None.
+        """
+        now = time.monotonic_ns()
+
+        with self._lock:
+            buffer = self._buffers.get(run_id)
+            if (buffer is None):
+                buffer = _TokenBuffer(first_token_ns=now)
+                self._buffers[run_id] = buffer
+
+            buffer.tokens.append(token)
+            if (chunk is not None):
+                buffer.last_chunk = chunk
+
+            if ((self._flush_every_n_tokens is not None and len(buffer.tokens) >= self._flush_every_n_tokens)
+                    or (self._flush_interval_ns is not None and now - buffer.first_token_ns >= self._flush_interval_ns)):
+                del self._buffers[run_id]
+                return self._to_chunk(buffer)
+
+        return None
+
+    def flush(self, run_id: str) -> CoalescedChunk | None:
+        """
+        Removes and returns any tokens buffered for the given run, or None if there are none.
+        """
+        with self._lock:
+            buffer = self._buffers.pop(run_id, None)
+
+        if (buffer is None or not buffer.tokens):
+            return None
+
+        return self._to_chunk(buffer)
+
+    @staticmethod
+    def _to_chunk(buffer: _TokenBuffer) -> CoalescedChunk:
+        return CoalescedChunk(text="".join(buffer.tokens), num_tokens=len(buffer.tokens), last_chunk=buffer.last_chunk)
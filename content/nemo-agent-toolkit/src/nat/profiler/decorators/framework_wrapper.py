@@ -22,10 +22,14 @@ from collections.abc import Callable
 from contextlib import AbstractAsyncContextManager as AsyncContextManager
 from contextlib import asynccontextmanager
 from contextvars import ContextVar
+from typing import TYPE_CHECKING
 from typing import Any
 
 from nat.builder.framework_enum import LLMFrameworkEnum
 
+if TYPE_CHECKING:
+    from nat.data_models.config import TokenCoalescingConfig
+
 logger = logging.getLogger(__name__)
 
 _library_instrumented = {
@@ -42,6 +46,7 @@ callback_handler_var: ContextVar[Any | None] = ContextVar("callback_handler_var"
 def set_framework_profiler_handler(
     workflow_llms: dict | None = None,
     frameworks: list[LLMFrameworkEnum] | None = None,
+    token_coalescing: TokenCoalescingConfig | None = None,
 ) -> Callable[[Callable[..., AsyncContextManager[Any]]], Callable[..., AsyncContextManager[Any]]]:
     """
     Decorator that wraps an async context manager function to set up framework-specific profiling.
@@ -49,6 +54,8 @@ def set_framework_profiler_handler(
     Args:
         workflow_llms (dict | None): A dictionary of workflow LLM configurations.
         frameworks (list[LLMFrameworkEnum] | None): A list of LLM frameworks used in the workflow functions.
+        token_coalescing (TokenCoalescingConfig | None): Controls coalescing of streamed tokens into chunk events for
+            the handlers which receive streamed tokens.
 
     Returns:
         Callable[[Callable[..., AsyncContextManager[Any]]], Callable[..., AsyncContextManager[Any]]]:
@@ -74,7 +81,7 @@ def set_framework_profiler_handler(
                 # route to the active run. Only register the hook once globally.
                 from nat.profiler.callbacks.langchain_callback_handler import LangchainProfilerHandler
 
-                handler = LangchainProfilerHandler()
+                handler = LangchainProfilerHandler(token_coalescing=token_coalescing)
                 callback_handler_var.set(handler)
 
                 if not _library_instrumented["langchain"]:
@@ -144,6 +151,7 @@ def chain_wrapped_build_fn(
     original_build_fn: Callable[..., AsyncContextManager],
     workflow_llms: dict,
     function_frameworks: list[LLMFrameworkEnum],
+    token_coalescing: TokenCoalescingConfig | None = None,
 ) -> Callable[..., AsyncContextManager]:
     """
     Convert an original build function into an async context manager that
@@ -154,6 +162,7 @@ def chain_wrapped_build_fn(
         original_build_fn (Callable[..., AsyncContextManager]): The original build function to wrap.
         workflow_llms (dict): A dictionary of workflow LLM configurations.
         function_frameworks (list[LLMFrameworkEnum]): A list of LLM frameworks used in the workflow functions.
+        token_coalescing (TokenCoalescingConfig | None): Controls coalescing of streamed tokens into chunk events.
 
     Returns:
         Callable[..., AsyncContextManager]: The wrapped build function.
@@ -176,5 +185,5 @@ def chain_wrapped_build_fn(
 
     # Instead of wrapping iteratively, we now call the decorator once,
     # passing the entire list of frameworks along with the workflow_llms.
-    wrapped_fn = set_framework_profiler_handler(workflow_llms, function_frameworks)(base_fn)
+    wrapped_fn = set_framework_profiler_handler(workflow_llms, function_frameworks, token_coalescing)(base_fn)
     return wrapped_fn
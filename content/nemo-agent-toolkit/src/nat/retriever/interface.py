@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 from abc import ABC
 from abc import abstractmethod
 
@@ -36,6 +37,14 @@ class Retriever(ABC):
         """
         raise NotImplementedError
 
+    async def search_many(self, queries: list[str], **kwargs) -> list[RetrieverOutput]:
+        """
+        Retrieve items for several queries. By default the queries are searched for concurrently, implementations may
+        override this to batch the queries into fewer requests to the data store.
+
+        """
+        return list(await asyncio.gather(*(self.search(query, **kwargs) for query in queries)))
+
 
 # Compatibility aliases with previous releases
 AIQRetriever = Retriever
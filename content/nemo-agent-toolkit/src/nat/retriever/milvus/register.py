@@ -48,6 +48,9 @@ class MilvusRetrieverConfig(RetrieverBaseConfig, name="milvus_retriever"):
     description: str | None = Field(default=None,
                                     description="If present it will be used as the tool description",
                                     alias="collection_description")
+    use_async_client: bool = Field(
+        default=False,
+        description="Search using pymilvus.AsyncMilvusClient. If 'False', blocking client calls run in a worker thread.")
 
 
 @register_retriever_provider(config_type=MilvusRetrieverConfig)
@@ -65,10 +68,18 @@ async def milvus_retriever_client(config: MilvusRetrieverConfig, builder: Builde
     embedder = await builder.get_embedder(embedder_name=config.embedding_model, wrapper_type=LLMFrameworkEnum.LANGCHAIN)
 
     milvus_client = MilvusClient(uri=str(config.uri), **config.connection_args)
+
+    async_client = None
+    if config.use_async_client:
+        from pymilvus import AsyncMilvusClient
+
+        async_client = AsyncMilvusClient(uri=str(config.uri), **config.connection_args)
+
     retriever = MilvusRetriever(
         client=milvus_client,
         embedder=embedder,
         content_field=config.content_field,
+        async_client=async_client,
     )
 
     # Using parameters in the config to set default values which can be overridden during the function call.
@@ -78,4 +89,8 @@ async def milvus_retriever_client(config: MilvusRetrieverConfig, builder: Builde
 
     retriever.bind(**optional_args)
 
-    yield retriever
+    try:
+        yield retriever
+    finally:
+        if async_client is not None:
+            await async_client.close()
@@ -13,7 +13,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import logging
+import time
+import typing
 from functools import partial
 
 from langchain_core.embeddings import Embeddings
@@ -25,8 +28,14 @@ from nat.retriever.models import Document
 from nat.retriever.models import RetrieverError
 from nat.retriever.models import RetrieverOutput
 
+if typing.TYPE_CHECKING:
+    from pymilvus import AsyncMilvusClient
+
 logger = logging.getLogger(__name__)
 
+# How long the list of collections and their schemas are cached for, so that a search does not need three round trips
+_COLLECTION_CACHE_TTL_SECONDS = 60.0
+
 
 class CollectionNotFoundError(RetrieverError):
     pass
@@ -43,23 +52,35 @@ class MilvusRetriever(Retriever):
         embedder: Embeddings,
         content_field: str = "text",
         use_iterator: bool = False,
+        async_client: "AsyncMilvusClient | None" = None,
     ) -> None:
         """
         Initialize the Milvus Retriever using a preconfigured MilvusClient
 
         Args:
            client (MilvusClient): Preinstantiate pymilvus.MilvusClient object.
+           async_client (AsyncMilvusClient | None): Optional pymilvus.AsyncMilvusClient connected to the same service.
+               If provided it is used for searches, otherwise the blocking calls of `client` are run in a worker
+               thread so that they do not block the event loop.
         """
         self._client = client
+        self._async_client = async_client
         self._embedder = embedder
 
         if use_iterator and "search_iterator" not in dir(self._client):
             raise ValueError("This version of the pymilvus.MilvusClient does not support the search iterator.")
 
         self._search_func = self._search if not use_iterator else self._search_with_iterator
+        self._use_iterator = use_iterator
         self._default_params = None
         self._bound_params = []
+        self._bound_kwargs = {}
         self.content_field = content_field
+
+        self._collections: set[str] = set()
+        self._collections_expire_at = 0.0
+        self._schemas: dict[str, tuple[float, dict]] = {}
+
         logger.info("Mivlus Retriever using %s for search.", self._search_func.__name__)
 
     def bind(self, **kwargs) -> None:
@@ -73,6 +94,7 @@ class MilvusRetriever(Retriever):
             kwargs = {k: v for k, v in kwargs.items() if k != "query"}
         self._search_func = partial(self._search_func, **kwargs)
         self._bound_params = list(kwargs.keys())
+        self._bound_kwargs.update(kwargs)
         logger.debug("Binding paramaters for search function: %s", kwargs)
 
     def get_unbound_params(self) -> list[str]:
@@ -81,12 +103,60 @@ class MilvusRetriever(Retriever):
         """
         return [param for param in ["query", "collection_name", "top_k", "filters"] if param not in self._bound_params]
 
-    def _validate_collection(self, collection_name: str) -> bool:
-        return collection_name in self._client.list_collections()
+    async def _call_client(self, method: str, *args, **kwargs):
+        """
+        Call a method of the Milvus client without blocking the event loop.
+        """
+        if self._async_client is not None:
+            return await getattr(self._async_client, method)(*args, **kwargs)
+
+        return await asyncio.to_thread(getattr(self._client, method), *args, **kwargs)
+
+    async def _validate_collection(self, collection_name: str) -> bool:
+        if collection_name in self._collections and time.monotonic() < self._collections_expire_at:
+            return True
+
+        # Refresh the list when a collection is missing, it may have been created since the list was fetched
+        self._collections = set(await self._call_client("list_collections"))
+        self._collections_expire_at = time.monotonic() + _COLLECTION_CACHE_TTL_SECONDS
+
+        return collection_name in self._collections
+
+    async def _describe_collection(self, collection_name: str) -> dict:
+        cached = self._schemas.get(collection_name)
+
+        if cached is not None and time.monotonic() < cached[0]:
+            return cached[1]
+
+        schema = await self._call_client("describe_collection", collection_name)
+        self._schemas[collection_name] = (time.monotonic() + _COLLECTION_CACHE_TTL_SECONDS, schema)
+
+        return schema
+
+    async def _embed_queries(self, queries: list[str]) -> list[list[float]]:
+        # Queries are embedded individually since `embed_documents` may embed them as passages instead of queries
+        return list(await asyncio.gather(*(self._embedder.aembed_query(query) for query in queries)))
 
     async def search(self, query: str, **kwargs):
         return await self._search_func(query=query, **kwargs)
 
+    async def search_many(self, queries: list[str], **kwargs) -> list[RetrieverOutput]:
+        """
+        Retrieve document chunks for several queries. The queries are embedded concurrently and searched for with a
+        single request to Milvus.
+
+        Args:
+          queries (list[str]): The queries to search for.
+          kwargs (dict): Search parameters, which override the bound default values.
+
+        Returns:
+          list[RetrieverOutput]: The results of each query, in the same order as the queries.
+        """
+        if self._use_iterator:
+            return await super().search_many(queries, **kwargs)
+
+        return await self._search_many(queries, **{**self._bound_kwargs, **kwargs})
+
     async def _search_with_iterator(self,
                                     query: str,
                                     *,
@@ -108,34 +178,34 @@ class MilvusRetriever(Retriever):
                      collection_name,
                      top_k)
 
-        if not self._validate_collection(collection_name):
+        if not await self._validate_collection(collection_name):
             raise CollectionNotFoundError(f"Collection: {collection_name} does not exist")
 
         # If no output fields are specified, return all of them
         if not output_fields:
-            collection_schema = self._client.describe_collection(collection_name)
+            collection_schema = await self._describe_collection(collection_name)
             output_fields = [
                 field["name"] for field in collection_schema.get("fields") if field["name"] != vector_field_name
             ]
 
-        search_vector = self._embedder.embed_query(query)
-
-        search_iterator = self._client.search_iterator(
-            collection_name=collection_name,
-            data=[search_vector],
-            batch_size=kwargs.get("batch_size", 1000),
-            filter=filters,
-            limit=top_k,
-            output_fields=output_fields,
-            search_params=search_params if search_params else {"metric_type": "L2"},
-            timeout=timeout,
-            anns_field=vector_field_name,
-            round_decimal=kwargs.get("round_decimal", -1),
-            partition_names=kwargs.get("partition_names", None),
-        )
-
-        results = []
-        try:
+        search_vector = await self._embedder.aembed_query(query)
+
+        def _iterate():
+            search_iterator = self._client.search_iterator(
+                collection_name=collection_name,
+                data=[search_vector],
+                batch_size=kwargs.get("batch_size", 1000),
+                filter=filters,
+                limit=top_k,
+                output_fields=output_fields,
+                search_params=search_params if search_params else {"metric_type": "L2"},
+                timeout=timeout,
+                anns_field=vector_field_name,
+                round_decimal=kwargs.get("round_decimal", -1),
+                partition_names=kwargs.get("partition_names", None),
+            )
+
+            results = []
             while True:
                 _res = search_iterator.next()
                 res = _res.get_res()
@@ -151,7 +221,15 @@ class MilvusRetriever(Retriever):
                     break
                 results.extend(res[0])
 
-                return _wrap_milvus_results(results, content_field=self.content_field)
+                return results
+
+            return results
+
+        try:
+            # The iterator is only available on the blocking client, iterate over it in a worker thread
+            results = await asyncio.to_thread(_iterate)
+
+            return _wrap_milvus_results(results, content_field=self.content_field)
 
         except Exception as e:
             logger.error("Exception when retrieving results from milvus for query %s: %s", query, e)
@@ -171,15 +249,39 @@ class MilvusRetriever(Retriever):
         """
         Retrieve document chunks from a Milvus vectorstore
         """
-        logger.debug("MilvusRetriever searching query: %s, for collection: %s. Returning max %s results",
-                     query,
+        results = await self._search_many([query],
+                                          collection_name=collection_name,
+                                          top_k=top_k,
+                                          filters=filters,
+                                          output_fields=output_fields,
+                                          search_params=search_params,
+                                          timeout=timeout,
+                                          vector_field_name=vector_field_name,
+                                          **kwargs)
+
+        return results[0]
+
+    async def _search_many(self,
+                           queries: list[str],
+                           *,
+                           collection_name: str,
+                           top_k: int,
+                           filters: str | None = None,
+                           output_fields: list[str] | None = None,
+                           search_params: dict | None = None,
+                           timeout: float | None = None,
+                           vector_field_name: str | None = "vector",
+                           **kwargs) -> list[RetrieverOutput]:
+        logger.debug("MilvusRetriever searching queries: %s, for collection: %s. Returning max %s results",
+                     queries,
                      collection_name,
                      top_k)
 
-        if not self._validate_collection(collection_name):
+        if not await self._validate_collection(collection_name):
             raise CollectionNotFoundError(f"Collection: {collection_name} does not exist")
 
-        available_fields = [v.get("name") for v in self._client.describe_collection(collection_name).get("fields", {})]
+        collection_schema = await self._describe_collection(collection_name)
+        available_fields = [v.get("name") for v in collection_schema.get("fields", {})]
 
         if self.content_field not in available_fields:
             raise ValueError(f"The specified content field: {self.content_field} is not part of the schema.")
@@ -192,12 +294,14 @@ class MilvusRetriever(Retriever):
             output_fields = [field for field in available_fields if field != vector_field_name]
 
         if self.content_field not in output_fields:
-            output_fields.append(self.content_field)
+            # Do not modify the list of the caller, which may be a bound default
+            output_fields = [*output_fields, self.content_field]
 
-        search_vector = self._embedder.embed_query(query)
-        res = self._client.search(
+        search_vectors = await self._embed_queries(queries)
+        res = await self._call_client(
+            "search",
             collection_name=collection_name,
-            data=[search_vector],
+            data=search_vectors,
             filter=filters,
             output_fields=output_fields,
             search_params=search_params if search_params else {"metric_type": "L2"},
@@ -206,7 +310,7 @@ class MilvusRetriever(Retriever):
             limit=top_k,
         )
 
-        return _wrap_milvus_results(res[0], content_field=self.content_field)
+        return [_wrap_milvus_results(hits, content_field=self.content_field) for hits in res]
 
 
 def _wrap_milvus_results(res: list[Hit], content_field: str):
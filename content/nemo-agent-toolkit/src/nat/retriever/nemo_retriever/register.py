@@ -38,6 +38,14 @@ class NemoRetrieverConfig(RetrieverBaseConfig, name="nemo_retriever"):
         description="API key used to authenticate with the service. If 'None', will use ENV Variable 'NVIDIA_API_KEY'",
         default=None,
     )
+    http2: bool = Field(default=False,
+                        description="Whether to use HTTP/2 when connecting to the service. Requires the 'h2' package.")
+    max_connections: int = Field(default=100,
+                                 gt=0,
+                                 description="Maximum number of pooled connections to the service.")
+    collection_cache_ttl: float = Field(default=60.0,
+                                        ge=0,
+                                        description="Number of seconds to cache the collections of the service for.")
 
 
 @register_retriever_provider(config_type=NemoRetrieverConfig)
@@ -57,4 +65,5 @@ async def nemo_retriever_client(config: NemoRetrieverConfig, builder: Builder):
 
     retriever.bind(**optional_args)
 
-    yield retriever
+    async with retriever:
+        yield retriever
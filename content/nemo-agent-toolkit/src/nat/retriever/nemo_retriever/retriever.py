@@ -13,9 +13,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import json
 import logging
 import os
+import time
 import typing
 from functools import partial
 from urllib.parse import urljoin
@@ -30,6 +32,7 @@ from nat.retriever.interface import Retriever
 from nat.retriever.models import Document
 from nat.retriever.models import RetrieverError
 from nat.retriever.models import RetrieverOutput
+from nat.utils.http_client_utils import close_client_on_loop
 
 logger = logging.getLogger(__name__)
 
@@ -56,16 +59,69 @@ class NemoRetriever(Retriever):
     Client for retrieving document chunks from a Nemo Retriever service.
     """
 
-    def __init__(self, uri: str | HttpUrl, timeout: int = 60, nvidia_api_key: str = None, **kwargs):
+    def __init__(self,
+                 uri: str | HttpUrl,
+                 timeout: int = 60,
+                 nvidia_api_key: str = None,
+                 http2: bool = False,
+                 max_connections: int = 100,
+                 collection_cache_ttl: float = 60.0,
+                 **kwargs):
 
         self.base_url = str(uri)
         self.timeout = timeout
+        self.http2 = http2
+        self.max_connections = max_connections
+        self.collection_cache_ttl = collection_cache_ttl
         self._search_func = self._search
         self.api_key = nvidia_api_key if nvidia_api_key else os.getenv('NVIDIA_API_KEY')
         self._bound_params = []
+        self._bound_kwargs = {}
         if not self.api_key:
             logger.warning("No API key was specified as part of configuration or as an environment variable.")
 
+        self._client: httpx.AsyncClient | None = None
+        self._client_loop: asyncio.AbstractEventLoop | None = None
+        self._collections: dict[str, Collection] = {}
+        self._collections_expire_at = 0.0
+
+    async def __aenter__(self) -> "NemoRetriever":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """
+        The pooled HTTP client used for all requests to the service. Created on first use, and recreated if used from
+        a different event loop since connections can not be shared between event loops. The replaced client is closed
+        on its own event loop.
+        """
+        loop = asyncio.get_running_loop()
+
+        if self._client is None or self._client.is_closed or self._client_loop is not loop:
+            if self._client is not None:
+                close_client_on_loop(self._client, self._client_loop)
+
+            self._client = httpx.AsyncClient(headers={"Authorization": f"Bearer {self.api_key}"},
+                                             timeout=self.timeout,
+                                             http2=self.http2,
+                                             limits=httpx.Limits(max_connections=self.max_connections,
+                                                                 max_keepalive_connections=self.max_connections))
+            self._client_loop = loop
+
+        return self._client
+
+    async def aclose(self) -> None:
+        """
+        Close the pooled HTTP client and its connections.
+        """
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._client_loop = None
+
     def bind(self, **kwargs) -> None:
         """
         Bind default values to the search method. Cannot bind the 'query' parameter.
@@ -77,6 +133,7 @@ class NemoRetriever(Retriever):
             kwargs = {k: v for k, v in kwargs.items() if k != "query"}
         self._search_func = partial(self._search_func, **kwargs)
         self._bound_params = list(kwargs.keys())
+        self._bound_kwargs.update(kwargs)
         logger.debug("Binding paramaters for search function: %s", kwargs)
 
     def get_unbound_params(self) -> list[str]:
@@ -85,10 +142,11 @@ class NemoRetriever(Retriever):
         """
         return [param for param in ["query", "collection_name", "top_k"] if param not in self._bound_params]
 
-    async def get_collections(self, client) -> list[Collection]:
+    async def get_collections(self, client: httpx.AsyncClient | None = None) -> list[Collection]:
         """
         Get a list of all available collections as pydantic `Collection` objects
         """
+        client = client if client is not None else self.client
         collection_response = await client.get(urljoin(self.base_url, "/v1/collections"))
         collection_response.raise_for_status()
         if not collection_response or len(collection_response.json().get('collections', [])) == 0:
@@ -100,18 +158,51 @@ class NemoRetriever(Retriever):
 
         return collections
 
-    async def get_collection_by_name(self, collection_name, client) -> Collection:
+    async def get_collection_by_name(self, collection_name, client: httpx.AsyncClient | None = None) -> Collection:
         """
         Retrieve a collection using it's name. Will return the first collection found if the name is ambiguous.
+
+        Collections are cached for `collection_cache_ttl` seconds. The cache is refreshed when a collection is not found
+        since it may have been created after the collections were fetched.
         """
+        if collection_name in self._collections and time.monotonic() < self._collections_expire_at:
+            return self._collections[collection_name]
+
         collections = await self.get_collections(client)
-        if (collection := next((c for c in collections if c.name == collection_name), None)) is None:
+
+        self._collections = {}
+        for c in reversed(collections):
+            self._collections[c.name] = c
+        self._collections_expire_at = time.monotonic() + self.collection_cache_ttl
+
+        if (collection := self._collections.get(collection_name)) is None:
             raise CollectionUnavailableError(f"Collection {collection_name} not found")
         return collection
 
+    def invalidate_collections(self) -> None:
+        """
+        Clear the cached collections, they will be fetched from the service on the next search.
+        """
+        self._collections = {}
+        self._collections_expire_at = 0.0
+
     async def search(self, query: str, **kwargs):
         return await self._search_func(query=query, **kwargs)
 
+    async def search_many(self, queries: list[str], **kwargs) -> list[RetrieverOutput]:
+        """
+        Retrieve document chunks for several queries. The collection is resolved once, and the queries are sent
+        concurrently over the pooled connections.
+
+        Args:
+          queries (list[str]): The queries to search for.
+          kwargs (dict): Search parameters, which override the bound default values.
+
+        Returns:
+          list[RetrieverOutput]: The results of each query, in the same order as the queries.
+        """
+        return await self._search_many(queries, **{**self._bound_kwargs, **kwargs})
+
     async def _search(
         self,
         query: str,
@@ -122,27 +213,52 @@ class NemoRetriever(Retriever):
         """
         Retrieve document chunks from the configured Nemo Retriever Service.
         """
-        output = []
+        results = await self._search_many([query],
+                                          collection_name=collection_name,
+                                          top_k=top_k,
+                                          output_fields=output_fields)
+        return results[0]
+
+    async def _search_many(
+        self,
+        queries: list[str],
+        collection_name: str,
+        top_k: str,
+        output_fields: list[str] = None,
+    ) -> list[RetrieverOutput]:
         try:
-            async with httpx.AsyncClient(headers={"Authorization": f"Bearer {self.api_key}"},
-                                         timeout=self.timeout) as client:
-                collection = await self.get_collection_by_name(collection_name, client)
-                url = urljoin(self.base_url, f"/v1/collections/{collection.id}/search")
+            collection = await self.get_collection_by_name(collection_name)
+        except Exception as e:
+            logger.error("Encountered an error when retrieving results from Nemo Retriever: %s", e)
+            raise CollectionUnavailableError(
+                f"Error when retrieving documents from {collection_name} for queries {queries}") from e
 
-                payload = RetrieverPayload(query=query, top_k=top_k)
-                response = await client.post(url, content=json.dumps(payload.model_dump(mode="python")))
+        url = urljoin(self.base_url, f"/v1/collections/{collection.id}/search")
 
-                logger.debug("response.status_code=%s", response.status_code)
+        return list(await asyncio.gather(*(self._search_collection(url, query, collection_name, top_k, output_fields)
+                                           for query in queries)))
 
-                response.raise_for_status()
-                output = response.json().get("chunks")
+    async def _search_collection(self, url: str, query: str, collection_name: str, top_k: str,
+                                 output_fields: list[str] | None) -> RetrieverOutput:
+        try:
+            payload = RetrieverPayload(query=query, top_k=top_k)
+            response = await self.client.post(url, content=json.dumps(payload.model_dump(mode="python")))
+
+            logger.debug("response.status_code=%s", response.status_code)
 
-                # Handle output fields
-                output = [_flatten(chunk, output_fields) for chunk in output]
+            response.raise_for_status()
+            output = response.json().get("chunks")
 
-                return _wrap_nemo_results(output=output, content_field="content")
+            # Handle output fields
+            output = [_flatten(chunk, output_fields) for chunk in output]
+
+            return _wrap_nemo_results(output=output, content_field="content")
 
         except Exception as e:
+            if isinstance(e, httpx.HTTPStatusError) and e.response.status_code == 404:
+                # The collection may have been deleted or recreated with a new ID
+                self.invalidate_collections()
+
             logger.error("Encountered an error when retrieving results from Nemo Retriever: %s", e)
             raise CollectionUnavailableError(
                 f"Error when retrieving documents from {collection_name} for query '{query}'") from e
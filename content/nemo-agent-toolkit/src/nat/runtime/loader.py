@@ -17,6 +17,7 @@ from __future__ import annotations
 
 import importlib.metadata
 import logging
+import sys
 import time
 from contextlib import asynccontextmanager
 from enum import IntFlag
@@ -26,7 +27,18 @@ from functools import reduce
 
 from nat.builder.workflow_builder import WorkflowBuilder
 from nat.cli.type_registry import GlobalTypeRegistry
+from nat.data_models.component import ComponentEnum
 from nat.data_models.config import Config
+from nat.runtime.plugin_index import PluginIndex
+from nat.runtime.plugin_index import PluginIndexEntry
+from nat.runtime.plugin_index import RegistrySnapshot
+from nat.runtime.plugin_index import collect_config_types
+from nat.runtime.plugin_index import compute_fingerprint
+from nat.runtime.plugin_index import entry_point_id
+from nat.runtime.plugin_index import get_plugin_index_path
+from nat.runtime.plugin_index import is_lazy_discovery_enabled
+from nat.runtime.plugin_index import read_plugin_index
+from nat.runtime.plugin_index import write_plugin_index
 from nat.runtime.session import SessionManager
 from nat.utils.data_models.schema_validator import validate_schema
 from nat.utils.debugging_utils import is_debugger_attached
@@ -66,7 +78,7 @@ class PluginTypes(IntFlag):
     """
 
 
-def load_config(config_file: StrPath) -> Config:
+def load_config(config_file: StrPath, lazy: bool | None = None) -> Config:
     """
     This is the primary entry point for loading a NAT configuration file. It ensures that all plugins are
     loaded and then validates the configuration file against the Config schema.
@@ -75,6 +87,9 @@ def load_config(config_file: StrPath) -> Config:
     ----------
     config_file : StrPath
         The path to the configuration file
+    lazy : bool | None, optional
+        Only load the plugins referenced by the configuration file. See `discover_and_register_plugins_for_config`.
+        By default None, which enables lazy loading when the ``NAT_LAZY_PLUGIN_DISCOVERY`` environment variable is set
 
     Returns
     -------
@@ -82,11 +97,11 @@ def load_config(config_file: StrPath) -> Config:
         The validated Config object
     """
 
-    # Ensure all of the plugins are loaded
-    discover_and_register_plugins(PluginTypes.CONFIG_OBJECT)
-
     config_yaml = yaml_load(config_file)
 
+    # Ensure all of the plugins used by the configuration are loaded
+    discover_and_register_plugins_for_config(config_yaml, lazy=lazy)
+
     # Validate configuration adheres to NAT schemas
     validated_nat_config = validate_schema(config_yaml, Config)
 
@@ -165,6 +180,53 @@ def get_all_entrypoints_distro_mapping() -> dict[str, str]:
     return mapping
 
 
+class _LazyDiscoveryState:
+
+    def __init__(self) -> None:
+        self.loaded: set[str] = set()
+        self.index: PluginIndex | None = None
+
+
+_lazy_state = _LazyDiscoveryState()
+
+# The plugin types which are covered by the plugin index
+_LAZY_PLUGIN_TYPES = PluginTypes.COMPONENT | PluginTypes.EVALUATOR | PluginTypes.AUTHENTICATION
+
+
+def _load_entry_point(entry_point: importlib.metadata.EntryPoint, is_first: bool):
+    try:
+        logger.debug("Loading module '%s' from entry point '%s'...", entry_point.module, entry_point.name)
+
+        start_time = time.time()
+
+        entry_point.load()
+
+        elapsed_time = (time.time() - start_time) * 1000
+
+        logger.debug("Loading module '%s' from entry point '%s'...Complete (%f ms)",
+                     entry_point.module,
+                     entry_point.name,
+                     elapsed_time)
+
+        # Log a warning if the plugin took a long time to load. This can be useful for debugging slow imports.
+        # The threshold is 300 ms if no plugins have been loaded yet, and 100 ms otherwise. Triple the threshold
+        # if a debugger is attached.
+        if (elapsed_time > (300.0 if is_first else 150.0) * (3 if is_debugger_attached() else 1)):
+            logger.debug(
+                "Loading module '%s' from entry point '%s' took a long time (%f ms). "
+                "Ensure all imports are inside your registered functions.",
+                entry_point.module,
+                entry_point.name,
+                elapsed_time)
+
+    except ImportError:
+        logger.warning("Failed to import plugin '%s'", entry_point.name, exc_info=True)
+        # Optionally, you can mark the plugin as unavailable or take other actions
+
+    except Exception:
+        logger.exception("An error occurred while loading plugin '%s'", entry_point.name)
+
+
 def discover_and_register_plugins(plugin_type: PluginTypes):
     """
     Discover all the requested plugin types which were registered via an entry point group and register them into the
@@ -174,46 +236,168 @@ def discover_and_register_plugins(plugin_type: PluginTypes):
     # Get the entry points for the specified groups
     nat_plugins = discover_entrypoints(plugin_type)
 
-    count = 0
-
     # Pause registration hooks for performance. This is useful when loading a large number of plugins.
     with GlobalTypeRegistry.get().pause_registration_changed_hooks():
 
-        for entry_point in nat_plugins:
-            try:
-                logger.debug("Loading module '%s' from entry point '%s'...", entry_point.module, entry_point.name)
+        for count, entry_point in enumerate(nat_plugins):
+            _load_entry_point(entry_point, is_first=(count == 0))
+
+            _lazy_state.loaded.add(entry_point_id(entry_point))
+
+
+def discover_and_register_plugins_for_config(config: dict, lazy: bool | None = None):
+    """
+    Register the plugins needed by a configuration dictionary into the GlobalTypeRegistry.
+
+    By default every plugin which can be specified in a configuration file is loaded. When lazy discovery is enabled,
+    a persisted index of the component types registered by each entry point is used to load only the entry points
+    which provide the ``_type`` values in the configuration, along with the LLM, embedder and retriever clients and
+    tool wrappers for the LLM frameworks used by its functions. Any other client or tool wrapper requested while the
+    workflow is built is loaded on demand. If the configuration references a type which is not in the index, all
+    plugins are loaded.
+
+    Parameters
+    ----------
+    config : dict
+        The configuration dictionary, as loaded from the configuration file
+    lazy : bool | None, optional
+        Whether to only load the referenced plugins. By default None, which enables lazy loading when the
+        ``NAT_LAZY_PLUGIN_DISCOVERY`` environment variable is set to a true value
+    """
+
+    if (lazy is None):
+        lazy = is_lazy_discovery_enabled()
+
+    if (not lazy):
+        discover_and_register_plugins(PluginTypes.CONFIG_OBJECT)
+        return
+
+    # Front ends are always needed to start a workflow and are inexpensive to load
+    discover_and_register_plugins(PluginTypes.FRONT_END)
+
+    registry = GlobalTypeRegistry.get()
+    entry_points = _get_lazy_entry_points()
+
+    index = _get_plugin_index(entry_points)
+
+    registry.add_registration_miss_hook(_load_missing_registration)
+
+    config_types, config_aliases = collect_config_types(config)
+    referenced_types = config_types | {type_name for type_name in config_aliases if index.has_type(type_name)}
+
+    snapshot = RegistrySnapshot.from_registry(registry)
+    missing_types = {type_name for type_name in referenced_types if not snapshot.has_type(type_name)}
+    unknown_types = {type_name for type_name in missing_types if not index.has_type(type_name)}
+
+    if (unknown_types):
+        logger.info("Plugin index does not contain the types %s. Loading all plugins.", sorted(unknown_types))
+        _index_entry_points(entry_points, index)
+        return
 
-                start_time = time.time()
+    _load_indexed_entry_points(entry_points, index.find_types(missing_types))
+
+    # Load the clients and tool wrappers for the LLM frameworks used by the referenced functions
+    frameworks: set[str | None] = set()
+
+    for info in registry.get_registered_functions() + registry.get_registered_function_groups():
+        if (info.full_type in referenced_types or info.local_name in referenced_types):
+            frameworks.update(info.framework_wrappers)
+
+    _load_indexed_entry_points(entry_points, index.find_clients(referenced_types, frameworks))
+
+
+def _get_lazy_entry_points() -> dict[str, importlib.metadata.EntryPoint]:
+
+    return {entry_point_id(ep): ep for ep in discover_entrypoints(_LAZY_PLUGIN_TYPES)}
+
+
+def _get_plugin_index(entry_points: dict[str, importlib.metadata.EntryPoint]) -> PluginIndex:
+
+    fingerprint = compute_fingerprint(entry_points.values())
+
+    if (_lazy_state.index is not None and _lazy_state.index.fingerprint == fingerprint):
+        return _lazy_state.index
+
+    index_path = get_plugin_index_path()
+    index = read_plugin_index(index_path, fingerprint)
+
+    if (index is None):
+        logger.info("Building the plugin index at '%s'. This loads all plugins once.", index_path)
+
+        index = PluginIndex(fingerprint=fingerprint)
+        _index_entry_points(entry_points, index)
+
+    _lazy_state.index = index
+
+    return index
+
+
+def _index_entry_points(entry_points: dict[str, importlib.metadata.EntryPoint], index: PluginIndex):
+    """
+    Loads every entry point which has not been loaded yet, recording what each one registers into the index. The index
+    is only persisted if none of the entry point modules had been imported beforehand, since their registrations can
+    not be attributed otherwise.
+    """
+
+    registry = GlobalTypeRegistry.get()
+    changed = False
+
+    # Imports made by other entry points while indexing are fine since loading those entry points reproduces them
+    attributable = not any(entry_point.module in sys.modules and ep_id not in _lazy_state.loaded
+                           for ep_id, entry_point in entry_points.items())
+
+    with registry.pause_registration_changed_hooks():
+
+        for count, (ep_id, entry_point) in enumerate(entry_points.items()):
+
+            if (ep_id in _lazy_state.loaded):
+                attributable = attributable and ep_id in index.entries
+                continue
+
+            before = RegistrySnapshot.from_registry(registry)
+
+            _load_entry_point(entry_point, is_first=(count == 0))
+            _lazy_state.loaded.add(ep_id)
+
+            if (ep_id in index.entries):
+                continue
+
+            index.entries[ep_id] = PluginIndexEntry.from_snapshot(
+                entry_point,
+                RegistrySnapshot.from_registry(registry).difference(before))
+            changed = True
+
+    if (changed and attributable):
+        write_plugin_index(index, get_plugin_index_path())
+
+
+def _load_indexed_entry_points(entry_points: dict[str, importlib.metadata.EntryPoint], entry_ids: set[str]) -> bool:
+
+    # Keep the discovery order so that plugins are loaded in the same order as they would be without the index
+    to_load = [ep_id for ep_id in entry_points if ep_id in entry_ids and ep_id not in _lazy_state.loaded]
+
+    if (not to_load):
+        return False
+
+    with GlobalTypeRegistry.get().pause_registration_changed_hooks():
 
-                entry_point.load()
+        for count, ep_id in enumerate(to_load):
+            _load_entry_point(entry_points[ep_id], is_first=(count == 0))
+            _lazy_state.loaded.add(ep_id)
 
-                elapsed_time = (time.time() - start_time) * 1000
+    logger.debug("Lazily loaded plugins: %s", to_load)
 
-                logger.debug("Loading module '%s' from entry point '%s'...Complete (%f ms)",
-                             entry_point.module,
-                             entry_point.name,
-                             elapsed_time)
+    return True
 
-                # Log a warning if the plugin took a long time to load. This can be useful for debugging slow imports.
-                # The threshold is 300 ms if no plugins have been loaded yet, and 100 ms otherwise. Triple the threshold
-                # if a debugger is attached.
-                if (elapsed_time > (300.0 if count == 0 else 150.0) * (3 if is_debugger_attached() else 1)):
-                    logger.debug(
-                        "Loading module '%s' from entry point '%s' took a long time (%f ms). "
-                        "Ensure all imports are inside your registered functions.",
-                        entry_point.module,
-                        entry_point.name,
-                        elapsed_time)
 
-            except ImportError:
-                logger.warning("Failed to import plugin '%s'", entry_point.name, exc_info=True)
-                # Optionally, you can mark the plugin as unavailable or take other actions
+def _load_missing_registration(component_type: ComponentEnum, config_type: str | None,
+                               llm_framework: str | None) -> bool:
 
-            except Exception:
-                logger.exception("An error occurred while loading plugin '%s'", entry_point.name)
+    if (_lazy_state.index is None):
+        return False
 
-            finally:
-                count += 1
+    return _load_indexed_entry_points(_get_lazy_entry_points(),
+                                      _lazy_state.index.find_client(component_type, config_type, llm_framework))
 
 
 # Compatibility alias
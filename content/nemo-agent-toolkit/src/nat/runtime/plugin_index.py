@@ -0,0 +1,287 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+A persisted index of the component types registered by each plugin entry point.
+
+The index allows `nat.runtime.loader` to import only the plugins that a configuration file references instead of every
+installed plugin. It is keyed by a fingerprint of the installed entry points and distributions, so installing, removing
+or upgrading a plugin package invalidates it.
+"""
+
+import dataclasses
+import hashlib
+import importlib.metadata
+import logging
+import os
+import typing
+from collections.abc import Iterable
+from pathlib import Path
+
+from platformdirs import user_cache_dir
+from pydantic import BaseModel
+from pydantic import Field
+from pydantic import ValidationError
+
+from nat.cli.type_registry import TypeRegistry
+from nat.data_models.component import ComponentEnum
+
+logger = logging.getLogger(__name__)
+
+PLUGIN_INDEX_VERSION = 1
+
+LAZY_DISCOVERY_ENV_VAR = "NAT_LAZY_PLUGIN_DISCOVERY"
+PLUGIN_INDEX_PATH_ENV_VAR = "NAT_PLUGIN_INDEX_PATH"
+
+_CLIENT_COMPONENT_TYPES = (ComponentEnum.LLM_CLIENT, ComponentEnum.EMBEDDER_CLIENT, ComponentEnum.RETRIEVER_CLIENT)
+_SKIPPED_COMPONENT_TYPES = (ComponentEnum.PACKAGE, ComponentEnum.TOOL_WRAPPER, ComponentEnum.UNDEFINED)
+
+ClientKey = tuple[str, str, str | None]
+"""
+A client registration: (component type, full type of the provider config, LLM framework).
+"""
+
+
+def is_lazy_discovery_enabled() -> bool:
+    """
+    Returns True if lazy plugin discovery has been enabled with the ``NAT_LAZY_PLUGIN_DISCOVERY`` environment variable.
+    """
+    return os.getenv(LAZY_DISCOVERY_ENV_VAR, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def get_plugin_index_path() -> Path:
+    """
+    Returns the location of the plugin index. Defaults to ``plugin_index.json`` in the user cache directory and can be
+    overridden with the ``NAT_PLUGIN_INDEX_PATH`` environment variable.
+    """
+    index_path = os.getenv(PLUGIN_INDEX_PATH_ENV_VAR)
+
+    if (index_path):
+        return Path(index_path)
+
+    return Path(user_cache_dir(appname="nat")) / "plugin_index.json"
+
+
+def entry_point_id(entry_point: importlib.metadata.EntryPoint) -> str:
+    return f"{entry_point.group}:{entry_point.name}"
+
+
+def compute_fingerprint(entry_points: Iterable[importlib.metadata.EntryPoint]) -> str:
+    """
+    Computes a fingerprint of the given entry points and the distributions which provide them.
+    """
+    parts = []
+
+    for entry_point in entry_points:
+        dist = entry_point.dist
+        dist_id = f"{dist.name}=={dist.version}" if dist is not None else ""
+
+        parts.append(f"{entry_point_id(entry_point)}={entry_point.value}@{dist_id}")
+
+    digest = hashlib.sha256()
+    digest.update(str(PLUGIN_INDEX_VERSION).encode())
+
+    for part in sorted(parts):
+        digest.update(b"\0")
+        digest.update(part.encode())
+
+    return digest.hexdigest()
+
+
+@dataclasses.dataclass
+class RegistrySnapshot:
+    """
+    The set of registrations in a `TypeRegistry` which can be requested by a configuration file or a builder.
+    """
+
+    types: set[str] = dataclasses.field(default_factory=set)
+    clients: set[ClientKey] = dataclasses.field(default_factory=set)
+    tool_wrappers: set[str] = dataclasses.field(default_factory=set)
+
+    @staticmethod
+    def from_registry(registry: TypeRegistry) -> "RegistrySnapshot":
+
+        snapshot = RegistrySnapshot()
+
+        for component_type in ComponentEnum:
+
+            if (component_type in _SKIPPED_COMPONENT_TYPES):
+                continue
+
+            for info in registry.get_infos_by_type(component_type).values():
+                if (component_type in _CLIENT_COMPONENT_TYPES):
+                    snapshot.clients.add((component_type.value, info.config_type.full_type, info.llm_framework))
+                else:
+                    snapshot.types.add(info.full_type)
+
+        snapshot.tool_wrappers.update(registry.get_infos_by_type(ComponentEnum.TOOL_WRAPPER).keys())
+
+        return snapshot
+
+    def difference(self, other: "RegistrySnapshot") -> "RegistrySnapshot":
+        return RegistrySnapshot(types=self.types - other.types,
+                                clients=self.clients - other.clients,
+                                tool_wrappers=self.tool_wrappers - other.tool_wrappers)
+
+    def has_type(self, type_name: str) -> bool:
+        return any(_type_matches(full_type, type_name) for full_type in self.types)
+
+
+class PluginIndexEntry(BaseModel):
+    """
+    The registrations made by loading a single entry point.
+    """
+
+    group: str
+    name: str
+    value: str
+    types: list[str] = Field(default_factory=list)
+    clients: list[ClientKey] = Field(default_factory=list)
+    tool_wrappers: list[str] = Field(default_factory=list)
+
+    @staticmethod
+    def from_snapshot(entry_point: importlib.metadata.EntryPoint, snapshot: RegistrySnapshot) -> "PluginIndexEntry":
+        return PluginIndexEntry(group=entry_point.group,
+                                name=entry_point.name,
+                                value=entry_point.value,
+                                types=sorted(snapshot.types),
+                                clients=sorted(snapshot.clients, key=str),
+                                tool_wrappers=sorted(snapshot.tool_wrappers))
+
+
+class PluginIndex(BaseModel):
+    """
+    Maps every installed plugin entry point to the component types, clients and tool wrappers it registers.
+    """
+
+    version: int = PLUGIN_INDEX_VERSION
+    fingerprint: str
+    entries: dict[str, PluginIndexEntry] = Field(default_factory=dict)
+
+    def has_type(self, type_name: str) -> bool:
+        return any(
+            _type_matches(full_type, type_name) for entry in self.entries.values() for full_type in entry.types)
+
+    def find_types(self, type_names: Iterable[str]) -> set[str]:
+        """
+        Returns the ids of the entry points which register any of the given ``_type`` names. Names can be either local
+        names (``react_agent``) or full types (``nat.agent.react_agent/react_agent``).
+        """
+        type_names = set(type_names)
+
+        return {
+            entry_id
+            for entry_id, entry in self.entries.items()
+            if any(_type_matches(full_type, type_name) for full_type in entry.types for type_name in type_names)
+        }
+
+    def find_clients(self, config_types: Iterable[str], frameworks: Iterable[str | None]) -> set[str]:
+        """
+        Returns the ids of the entry points which register a client for any combination of the given provider config
+        types and LLM frameworks, or a tool wrapper for any of the LLM frameworks.
+        """
+        config_types = set(config_types)
+        frameworks = set(frameworks)
+
+        return {
+            entry_id
+            for entry_id, entry in self.entries.items()
+            if any((_type_in(config_type, config_types) and framework in frameworks)
+                   for _, config_type, framework in entry.clients)
+            or any(framework in frameworks for framework in entry.tool_wrappers)
+        }
+
+    def find_client(self, component_type: ComponentEnum, config_type: str | None, framework: str | None) -> set[str]:
+        """
+        Returns the ids of the entry points which register a single client or, if ``config_type`` is None, a tool wrapper.
+        """
+        if (config_type is None):
+            return {entry_id for entry_id, entry in self.entries.items() if framework in entry.tool_wrappers}
+
+        key = (component_type.value, config_type, framework)
+
+        return {entry_id for entry_id, entry in self.entries.items() if key in entry.clients}
+
+
+def read_plugin_index(index_path: Path, fingerprint: str) -> PluginIndex | None:
+    """
+    Reads the plugin index from disk. Returns None if it does not exist, can not be parsed or is out of date.
+    """
+    try:
+        index = PluginIndex.model_validate_json(index_path.read_bytes())
+    except FileNotFoundError:
+        return None
+    except (OSError, ValidationError, ValueError):
+        logger.debug("Ignoring unreadable plugin index at '%s'", index_path, exc_info=True)
+        return None
+
+    if (index.version != PLUGIN_INDEX_VERSION or index.fingerprint != fingerprint):
+        logger.debug("Plugin index at '%s' is out of date", index_path)
+        return None
+
+    return index
+
+
+def write_plugin_index(index: PluginIndex, index_path: Path) -> None:
+    """
+    Atomically writes the plugin index to disk. Failures are logged and otherwise ignored since the index is only a
+    cache.
+    """
+    tmp_path = index_path.with_name(f"{index_path.name}.{os.getpid()}.tmp")
+
+    try:
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(index.model_dump_json(), encoding="utf-8")
+        os.replace(tmp_path, index_path)
+    except OSError:
+        logger.warning("Failed to write the plugin index to '%s'", index_path, exc_info=True)
+        tmp_path.unlink(missing_ok=True)
+
+
+def collect_config_types(config: typing.Any) -> tuple[set[str], set[str]]:
+    """
+    Recursively collects the component type names referenced by a configuration dictionary.
+
+    Returns:
+        tuple[set[str], set[str]]: The values of all ``_type`` keys, and the values of all ``type`` keys. The latter is
+        an accepted alias for ``_type`` but is also a common field name, so it should only be trusted when it matches
+        a known component type.
+    """
+    types: set[str] = set()
+    aliases: set[str] = set()
+
+    stack = [config]
+
+    while stack:
+        value = stack.pop()
+
+        if isinstance(value, dict):
+            for key, item in value.items():
+                if (isinstance(item, str) and key in ("_type", "type")):
+                    (types if key == "_type" else aliases).add(item)
+                else:
+                    stack.append(item)
+
+        elif isinstance(value, list):
+            stack.extend(value)
+
+    return types, aliases
+
+
+def _type_matches(full_type: str, type_name: str) -> bool:
+    return full_type == type_name or full_type.rsplit("/", 1)[-1] == type_name
+
+
+def _type_in(full_type: str, type_names: set[str]) -> bool:
+    return full_type in type_names or full_type.rsplit("/", 1)[-1] in type_names
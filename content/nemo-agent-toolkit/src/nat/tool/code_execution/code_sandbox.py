@@ -13,16 +13,17 @@
 # limitations under the License.
 
 import abc
+import asyncio
 import json
 import logging
 import textwrap
 from typing import Any
 from urllib.parse import urljoin
 
-import requests
-import requests.adapters
+import httpx
 from pydantic import HttpUrl
 
+from nat.utils.http_client_utils import close_client_on_loop
 from nat.utils.type_utils import override
 
 logger = logging.getLogger(__file__)
@@ -41,35 +42,66 @@ class Sandbox(abc.ABC):
             Can also be specified through NEMO_SKILLS_SSH_SERVER env var.
         ssh_key_path: Optional[str] = None - Path to the ssh key for tunneling.
             Can also be specified through NEMO_SKILLS_SSH_KEY_PATH env var.
+
+    Requests are sent with a pooled `httpx.AsyncClient`, so waiting for code to execute does not block the event loop.
+    Call `aclose` to close the pooled connections.
     """
 
     def __init__(
         self,
         *,
         uri: HttpUrl,
+        max_connections: int = 1500,
     ):
         self.url: str = self._get_execute_url(uri)
-        session = requests.Session()
-        adapter = requests.adapters.HTTPAdapter(pool_maxsize=1500, pool_connections=1500, max_retries=3)
-        session.mount('http://', adapter)
-        session.mount('https://', adapter)
-        self.http_session: requests.Session = session
-
-    def _send_request(self, request: dict[str, Any], timeout_seconds: float) -> dict[str, str]:
-        output = self.http_session.post(
+        self.max_connections = max_connections
+        self._http_client: httpx.AsyncClient | None = None
+        self._http_client_loop: asyncio.AbstractEventLoop | None = None
+
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        """
+        The pooled HTTP client used to send requests. Created on first use, and recreated if used from a different
+        event loop since connections can not be shared between event loops. The replaced client is closed on its own
+        event loop.
+        """
+        loop = asyncio.get_running_loop()
+
+        if self._http_client is None or self._http_client.is_closed or self._http_client_loop is not loop:
+            if self._http_client is not None:
+                close_client_on_loop(self._http_client, self._http_client_loop)
+
+            # Retry failed connection attempts, as the requests adapter did previously
+            transport = httpx.AsyncHTTPTransport(retries=3,
+                                                 limits=httpx.Limits(max_connections=self.max_connections,
+                                                                     max_keepalive_connections=self.max_connections))
+            self._http_client = httpx.AsyncClient(transport=transport)
+            self._http_client_loop = loop
+
+        return self._http_client
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client and its connections."""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+            self._http_client_loop = None
+
+    async def _send_request(self, request: dict[str, Any], timeout_seconds: float) -> dict[str, str]:
+        output = await self.http_client.post(
             url=self.url,
-            data=json.dumps(request),
+            content=json.dumps(request),
             timeout=timeout_seconds,
             headers={"Content-Type": "application/json"},
         )
         # retrying 502 errors
         if output.status_code == 502:
-            raise requests.exceptions.Timeout
+            raise httpx.TimeoutException("Bad gateway", request=output.request)
 
         return self._parse_request_output(output)
 
     @abc.abstractmethod
-    def _parse_request_output(self, output: requests.Response) -> dict[str, str]:
+    def _parse_request_output(self, output: httpx.Response) -> dict[str, str]:
         pass
 
     @abc.abstractmethod
@@ -131,23 +163,23 @@ class Sandbox(abc.ABC):
         """).strip()
         request = self._prepare_request(code_to_execute, timeout_seconds)
         try:
-            return self._send_request(request, timeout_seconds)
-        except requests.exceptions.Timeout:
+            return await self._send_request(request, timeout_seconds)
+        except httpx.TimeoutException:
             return {"process_status": "timeout", "stdout": "", "stderr": "Timed out\n"}
 
 
 class LocalSandbox(Sandbox):
     """Locally hosted sandbox."""
 
-    def __init__(self, *, uri: HttpUrl):
-        super().__init__(uri=uri)
+    def __init__(self, *, uri: HttpUrl, **kwargs):
+        super().__init__(uri=uri, **kwargs)
 
     @override
     def _get_execute_url(self, uri: HttpUrl) -> str:
         return urljoin(str(uri), "execute")
 
     @override
-    def _parse_request_output(self, output: requests.Response) -> dict[str, str]:
+    def _parse_request_output(self, output: httpx.Response) -> dict[str, str]:
         try:
             output_json = output.json()
             assert isinstance(output_json, dict)
@@ -215,8 +247,8 @@ class LocalSandbox(Sandbox):
         # Our server already handles stdout/stderr capture and error handling
         request = self._prepare_request(actual_code, timeout_seconds, language)
         try:
-            return self._send_request(request, timeout_seconds)
-        except requests.exceptions.Timeout:
+            return await self._send_request(request, timeout_seconds)
+        except httpx.TimeoutException:
             return {"process_status": "timeout", "stdout": "", "stderr": "Timed out\n"}
 
 
@@ -228,7 +260,7 @@ class PistonSandbox(Sandbox):
         return urljoin(str(uri), "execute")
 
     @override
-    def _parse_request_output(self, output: requests.Response) -> dict[str, str]:
+    def _parse_request_output(self, output: httpx.Response) -> dict[str, str]:
         output_json = output.json()
         assert isinstance(output_json, dict)
         assert 'run' in output_json
@@ -15,12 +15,16 @@
 from __future__ import annotations
 
 import contextlib
+import importlib
 import logging
 import multiprocessing
 import os
+import queue
 import resource
+import threading
 from enum import Enum
 from io import StringIO
+from multiprocessing.connection import Connection
 
 from flask import Flask
 from flask import Request
@@ -33,6 +37,9 @@ app = Flask(__name__)
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.WARNING)
 
+# need to memory-limit to avoid common errors of allocating too much
+MEMORY_LIMIT_BYTES = 1024 * 1024 * 1024 * 10  # 10gb - somehow with a smaller limit the server dies when numpy is used
+
 
 class CodeExecutionStatus(str, Enum):
     """
@@ -81,6 +88,9 @@ def execute_python(generated_code: str, timeout: float) -> CodeExecutionResult:
     """
     Execute Python code in a subprocess.
 
+    If the worker pool is enabled with the `SANDBOX_WORKERS` environment variable, the code runs in one of the
+    pre-forked worker processes, otherwise a new process is started for the request.
+
     Args:
         generated_code: The code to execute
         timeout: The timeout for the execution
@@ -88,6 +98,9 @@ def execute_python(generated_code: str, timeout: float) -> CodeExecutionResult:
     Returns:
         CodeExecutionResult object containing the execution result
     """
+    pool = get_worker_pool()
+    if pool is not None:
+        return pool.execute(generated_code, timeout)
 
     # running in a separate process to ensure any kind of crashes are properly handled
     queue = multiprocessing.Queue()
@@ -103,42 +116,214 @@ def execute_python(generated_code: str, timeout: float) -> CodeExecutionResult:
     return queue.get()
 
 
-# need to memory-limit to avoid common errors of allocating too much
-# but this has to be done in a subprocess to not crush server itself
-def execute_code_subprocess(generated_code: str, queue):
-    """
-    Execute code in a subprocess.
-
-    Args:
-        generated_code: The code to execute
-        queue: The queue to put the result in
-    """
-
-    logger.debug("execute_code_subprocess started, PID: %s", os.getpid())
-
+def _set_resource_limits() -> None:
     try:
-        limit = 1024 * 1024 * 1024 * 10  # 10gb - somehow with a smaller limit the server dies when numpy is used
-        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
-        resource.setrlimit(resource.RLIMIT_DATA, (limit, limit))
+        resource.setrlimit(resource.RLIMIT_AS, (MEMORY_LIMIT_BYTES, MEMORY_LIMIT_BYTES))
+        resource.setrlimit(resource.RLIMIT_DATA, (MEMORY_LIMIT_BYTES, MEMORY_LIMIT_BYTES))
     except Exception as e:
         logger.exception("Failed to set resource limits, PID: %s, error: %s", os.getpid(), e)
 
+
+def _run_code(generated_code: str) -> CodeExecutionResult:
     stdout_capture = StringIO()
     stderr_capture = StringIO()
     try:
         with contextlib.redirect_stdout(stdout_capture), contextlib.redirect_stderr(stderr_capture):
             exec(generated_code, {})
         logger.debug("execute_code_subprocess finished, PID: %s", os.getpid())
-        queue.put(CodeExecutionResult(stdout=stdout_capture.getvalue(), stderr=stderr_capture.getvalue()))
-    except Exception as e:
+        return CodeExecutionResult(stdout=stdout_capture.getvalue(), stderr=stderr_capture.getvalue())
+    except BaseException as e:
         import traceback
         with contextlib.redirect_stderr(stderr_capture):
             traceback.print_exc()
         logger.debug("execute_code_subprocess failed, PID: %s, error: %s", os.getpid(), e)
-        queue.put(
-            CodeExecutionResult(process_status=CodeExecutionStatus.ERROR,
-                                stdout=stdout_capture.getvalue(),
-                                stderr=stderr_capture.getvalue()))
+        return CodeExecutionResult(process_status=CodeExecutionStatus.ERROR,
+                                   stdout=stdout_capture.getvalue(),
+                                   stderr=stderr_capture.getvalue())
+
+
+# this has to be done in a subprocess to not crush server itself
+def execute_code_subprocess(generated_code: str, queue):
+    """
+    Execute code in a subprocess.
+
+    Args:
+        generated_code: The code to execute
+        queue: The queue to put the result in
+    """
+
+    logger.debug("execute_code_subprocess started, PID: %s", os.getpid())
+
+    _set_resource_limits()
+    queue.put(_run_code(generated_code))
+
+
+def worker_process_main(conn: Connection, preload_modules: list[str]):
+    """
+    Main loop of a pre-forked worker process. Runs the code received on the connection one request at a time and
+    sends back the result.
+
+    Args:
+        conn: Connection to the server process
+        preload_modules: Modules imported when the worker starts, so that requests using them do not pay for the import
+    """
+    _set_resource_limits()
+
+    for module in preload_modules:
+        try:
+            importlib.import_module(module)
+        except Exception as e:
+            logger.warning("Failed to preload module %s in worker, PID: %s, error: %s", module, os.getpid(), e)
+
+    while True:
+        try:
+            generated_code = conn.recv()
+        except EOFError:
+            break
+
+        # Exceptions raised by the code, including SystemExit, are reported in the result
+        conn.send(_run_code(generated_code))
+
+
+class _Worker:
+
+    def __init__(self, ctx, preload_modules: list[str]):
+        self.conn, child_conn = ctx.Pipe()
+        self.process = ctx.Process(target=worker_process_main, args=(child_conn, preload_modules), daemon=True)
+        self.process.start()
+        child_conn.close()
+        self.num_jobs = 0
+
+    def stop(self, kill: bool = False):
+        self.conn.close()
+        if kill:
+            self.process.kill()
+        self.process.join(timeout=5)
+        if self.process.exitcode is None:
+            self.process.kill()
+            self.process.join()
+
+
+class WorkerPool:
+    """
+    Pool of pre-forked worker processes which execute code.
+
+    Starting a process for every request costs more than running most snippets, and every request pays for importing
+    heavy modules again. Workers instead run many requests each, with `preload_modules` already imported. Each worker
+    runs one request at a time with the same memory limits as a per-request process. A worker which times out or
+    crashes is killed and replaced, and workers are replaced after `max_jobs_per_worker` requests so that state
+    leaked by previous requests, for example patched modules, does not accumulate.
+
+    Args:
+        num_workers: Number of worker processes
+        max_jobs_per_worker: Number of requests a worker runs before it is replaced
+        preload_modules: Modules to import in each worker when it starts
+    """
+
+    def __init__(self, num_workers: int, max_jobs_per_worker: int = 100, preload_modules: list[str] | None = None):
+        if num_workers < 1:
+            raise ValueError(f"num_workers must be at least 1, got {num_workers}")
+
+        self.num_workers = num_workers
+        self.max_jobs_per_worker = max_jobs_per_worker
+        self.preload_modules = preload_modules or []
+        self._ctx = multiprocessing.get_context()
+        self._idle: queue.Queue[_Worker] = queue.Queue()
+        self._closed = False
+
+        for _ in range(num_workers):
+            self._idle.put(self._start_worker())
+
+    def _start_worker(self) -> _Worker:
+        return _Worker(self._ctx, self.preload_modules)
+
+    def execute(self, generated_code: str, timeout: float) -> CodeExecutionResult:
+        """
+        Execute code in the next available worker.
+
+        Args:
+            generated_code: The code to execute
+            timeout: The timeout for the execution, not including the time spent waiting for a worker
+
+        Returns:
+            CodeExecutionResult object containing the execution result
+        """
+        if self._closed:
+            raise RuntimeError("Worker pool has been shut down")
+
+        worker = self._idle.get()
+        replace = False
+
+        try:
+            worker.conn.send(generated_code)
+
+            if not worker.conn.poll(timeout):
+                replace = True
+                return CodeExecutionResult(process_status=CodeExecutionStatus.TIMEOUT, stdout="", stderr="Timed out\n")
+
+            result = worker.conn.recv()
+            worker.num_jobs += 1
+            replace = worker.num_jobs >= self.max_jobs_per_worker
+
+            return result
+
+        except (EOFError, OSError) as e:
+            # The worker died while running the code, e.g. it was killed for exceeding the memory limit
+            replace = True
+            logger.debug("Worker process %s failed: %s", worker.process.pid, e)
+            return CodeExecutionResult(process_status=CodeExecutionStatus.ERROR,
+                                       stdout="",
+                                       stderr=f"Execution process exited unexpectedly: {e}\n")
+
+        finally:
+            if replace:
+                worker.stop(kill=True)
+                worker = self._start_worker()
+
+            if self._closed:
+                worker.stop()
+            else:
+                self._idle.put(worker)
+
+    def shutdown(self):
+        """
+        Stop the idle workers. Workers running a request are stopped once it finishes.
+        """
+        self._closed = True
+
+        while True:
+            try:
+                self._idle.get_nowait().stop()
+            except queue.Empty:
+                break
+
+
+_worker_pool: WorkerPool | None = None
+_worker_pool_lock = threading.Lock()
+
+
+def get_worker_pool() -> WorkerPool | None:
+    """
+    Get the worker pool of the server, which is created on first use from the `SANDBOX_WORKERS`,
+    `SANDBOX_MAX_JOBS_PER_WORKER` and `SANDBOX_PRELOAD_MODULES` environment variables.
+
+    Returns:
+        The worker pool, or None if `SANDBOX_WORKERS` is not set to a positive number.
+    """
+    global _worker_pool
+
+    num_workers = int(os.environ.get("SANDBOX_WORKERS", "0"))
+    if num_workers <= 0:
+        return None
+
+    with _worker_pool_lock:
+        if _worker_pool is None:
+            preload_modules = [m.strip() for m in os.environ.get("SANDBOX_PRELOAD_MODULES", "").split(",") if m.strip()]
+            _worker_pool = WorkerPool(num_workers=num_workers,
+                                      max_jobs_per_worker=int(os.environ.get("SANDBOX_MAX_JOBS_PER_WORKER", "100")),
+                                      preload_modules=preload_modules)
+
+    return _worker_pool
 
 
 def do_execute(request: Request) -> CodeExecutionResponse:
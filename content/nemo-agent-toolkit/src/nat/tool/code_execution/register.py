@@ -66,9 +66,12 @@ async def code_execution_tool(config: CodeExecutionToolConfig, builder: Builder)
             return {"process_status": "error", "stdout": "", "stderr": str(e)}
         return output
 
-    yield FunctionInfo.from_fn(
-        fn=_execute_code,
-        input_schema=CodeExecutionInputSchema,
-        description="""Executes the provied 'generated_code' in a python sandbox environment and returns
+    try:
+        yield FunctionInfo.from_fn(
+            fn=_execute_code,
+            input_schema=CodeExecutionInputSchema,
+            description="""Executes the provied 'generated_code' in a python sandbox environment and returns
         a dictionary containing stdout, stderr, and the execution status, as well as a session_id. The
         session_id can be used to append to code that was previously executed.""")
+    finally:
+        await sandbox.aclose()
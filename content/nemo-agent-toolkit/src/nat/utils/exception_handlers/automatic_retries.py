@@ -12,17 +12,24 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import abc
 import asyncio
 import copy
+import email.utils
 import functools
 import inspect
 import logging
+import random
 import re
+import threading
 import time
 import types
 from collections.abc import Callable
 from collections.abc import Iterable
 from collections.abc import Sequence
+from datetime import datetime
+from datetime import timezone
+from enum import StrEnum
 from typing import Any
 from typing import TypeVar
 
@@ -106,6 +113,408 @@ def _want_retry(
     return False
 
 
+# ──────────────────────────────────────────────────────────────────────────────
+#  Server retry hints
+# ──────────────────────────────────────────────────────────────────────────────
+def _parse_retry_after(value: Any) -> float | None:
+    """Parse a Retry-After value, either a number of seconds or an HTTP date."""
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(str(value))
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def _extract_retry_after(exc: BaseException) -> float | None:
+    """
+    Return the number of seconds the server asked us to wait before retrying, else None.
+
+    Looks for a `Retry-After` (or `retry-after-ms`) header on the exception or on its `response`, as raised by
+    httpx, requests and the OpenAI client, and for a numeric `retry_after` attribute.
+    """
+    for source in (exc, getattr(exc, "response", None)):
+        headers = getattr(source, "headers", None)
+        if not headers or not hasattr(headers, "get"):
+            continue
+        try:
+            retry_after_ms = headers.get("retry-after-ms") or headers.get("Retry-After-Ms")
+            if retry_after_ms is not None:
+                return max(0.0, float(retry_after_ms) / 1000)
+            retry_after = _parse_retry_after(headers.get("retry-after") or headers.get("Retry-After"))
+            if retry_after is not None:
+                return retry_after
+        except (TypeError, ValueError):
+            continue
+
+    return _parse_retry_after(getattr(exc, "retry_after", None))
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+#  Back-off strategies
+# ──────────────────────────────────────────────────────────────────────────────
+class BackoffStrategy(abc.ABC):
+    """Computes how long to wait before each retry. Strategies hold no per-call state and can be shared."""
+
+    @abc.abstractmethod
+    def next_delay(self, attempt: int, previous_delay: float | None) -> float:
+        """
+        Return the delay in seconds before retry number *attempt* (starting at 0). *previous_delay* is the delay
+        returned for the previous retry of the same call, or None before the first retry.
+        """
+
+
+class ExponentialBackoff(BackoffStrategy):
+    """
+    Exponential back-off: `base_delay * factor**attempt`, capped at `max_delay`.
+
+    With `jitter`, a random delay between 0 and the exponential delay is used instead ("full jitter"), so that
+    clients which failed at the same time do not retry at the same time.
+    """
+
+    def __init__(self,
+                 base_delay: float = 0.25,
+                 factor: float = 2.0,
+                 max_delay: float | None = None,
+                 jitter: bool = False):
+        self.base_delay = base_delay
+        self.factor = factor
+        self.max_delay = max_delay
+        self.jitter = jitter
+
+    def next_delay(self, attempt: int, previous_delay: float | None) -> float:
+        delay = self.base_delay * self.factor**attempt
+        if self.max_delay is not None:
+            delay = min(delay, self.max_delay)
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        return delay
+
+
+class DecorrelatedJitterBackoff(BackoffStrategy):
+    """
+    Decorrelated jitter back-off: a random delay between `base_delay` and three times the previous delay, capped at
+    `max_delay`. Spreads retries out like full jitter while still growing the delay between attempts.
+    """
+
+    def __init__(self, base_delay: float = 0.25, max_delay: float = 20.0):
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def next_delay(self, attempt: int, previous_delay: float | None) -> float:
+        previous = previous_delay if previous_delay is not None else self.base_delay
+        return min(self.max_delay, random.uniform(self.base_delay, max(self.base_delay, previous * 3)))
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+#  Retry budget
+# ──────────────────────────────────────────────────────────────────────────────
+class RetryBudget:
+    """
+    Token bucket which limits the number of retries per second, shared by every call using it.
+
+    Each retry takes a token, and tokens are added at `retries_per_second` up to `max_tokens`. When a backend is
+    failing every request, retries are limited to the refill rate instead of multiplying the load on the backend by
+    the number of retries. Calls which find the budget empty fail with their last error instead of retrying.
+
+    Args:
+        retries_per_second: Rate at which tokens are added.
+        max_tokens: Size of the bucket, the number of retries which can happen in a burst.
+    """
+
+    def __init__(self, retries_per_second: float = 10.0, max_tokens: float = 100.0):
+        self.retries_per_second = retries_per_second
+        self.max_tokens = max_tokens
+        self._tokens = max_tokens
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+        self._retries_allowed = 0
+        self._retries_rejected = 0
+
+    def try_acquire(self) -> bool:
+        """Take a token for a retry. Returns False if the budget is exhausted."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.max_tokens, self._tokens + (now - self._last_refill) * self.retries_per_second)
+            self._last_refill = now
+
+            if self._tokens < 1:
+                self._retries_rejected += 1
+                return False
+
+            self._tokens -= 1
+            self._retries_allowed += 1
+            return True
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get retry budget statistics."""
+        with self._lock:
+            return {
+                "tokens": self._tokens,
+                "max_tokens": self.max_tokens,
+                "retries_per_second": self.retries_per_second,
+                "retries_allowed": self._retries_allowed,
+                "retries_rejected": self._retries_rejected,
+            }
+
+
+_global_retry_budget: RetryBudget | None = None
+_global_retry_budget_lock = threading.Lock()
+
+
+def get_global_retry_budget() -> RetryBudget:
+    """Return the process-wide retry budget, creating it with default settings on first use."""
+    global _global_retry_budget
+    with _global_retry_budget_lock:
+        if _global_retry_budget is None:
+            _global_retry_budget = RetryBudget()
+        return _global_retry_budget
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+#  Circuit breaker
+# ──────────────────────────────────────────────────────────────────────────────
+class CircuitState(StrEnum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling an endpoint whose circuit breaker is open."""
+
+    def __init__(self, name: str, retry_in: float):
+        self.name = name
+        self.retry_after = retry_in
+        super().__init__(f"Circuit breaker '{name}' is open, not calling the endpoint for another {retry_in:.1f}s")
+
+
+class CircuitBreaker:
+    """
+    Stops calling an endpoint which keeps failing.
+
+    After `failure_threshold` consecutive retryable failures the circuit opens, and calls fail immediately with
+    `CircuitOpenError` for `recovery_timeout` seconds. Then up to `half_open_max_calls` trial calls are let through:
+    if one succeeds the circuit closes, if one fails it opens again.
+
+    Args:
+        name: Name of the endpoint, used in errors and statistics.
+        failure_threshold: Number of consecutive failures which open the circuit.
+        recovery_timeout: Seconds the circuit stays open before trial calls are allowed.
+        half_open_max_calls: Number of concurrent trial calls while half open.
+    """
+
+    def __init__(self,
+                 name: str,
+                 failure_threshold: int = 5,
+                 recovery_timeout: float = 30.0,
+                 half_open_max_calls: int = 1):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+
+        self._lock = threading.Lock()
+        self._state = CircuitState.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._half_open_calls = 0
+
+        # Statistics
+        self._successes = 0
+        self._failures = 0
+        self._rejected = 0
+        self._times_opened = 0
+
+    @property
+    def state(self) -> CircuitState:
+        with self._lock:
+            self._update_state()
+            return self._state
+
+    def _update_state(self) -> None:
+        if (self._state == CircuitState.OPEN and time.monotonic() - self._opened_at >= self.recovery_timeout):
+            self._state = CircuitState.HALF_OPEN
+            self._half_open_calls = 0
+
+    def _open(self) -> None:
+        self._state = CircuitState.OPEN
+        self._opened_at = time.monotonic()
+        self._times_opened += 1
+        logger.warning("Circuit breaker '%s' opened after %d consecutive failures",
+                       self.name,
+                       self._consecutive_failures)
+
+    def before_call(self) -> None:
+        """Raise `CircuitOpenError` if the endpoint should not be called now."""
+        with self._lock:
+            self._update_state()
+
+            if self._state == CircuitState.OPEN:
+                self._rejected += 1
+                raise CircuitOpenError(self.name, self.recovery_timeout - (time.monotonic() - self._opened_at))
+
+            if self._state == CircuitState.HALF_OPEN:
+                if self._half_open_calls >= self.half_open_max_calls:
+                    self._rejected += 1
+                    raise CircuitOpenError(self.name, 0.0)
+                self._half_open_calls += 1
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._successes += 1
+            self._consecutive_failures = 0
+            if self._state != CircuitState.CLOSED:
+                logger.info("Circuit breaker '%s' closed", self.name)
+            self._state = CircuitState.CLOSED
+
+    def record_aborted(self) -> None:
+        """Record a call which ended without a result, freeing its trial slot when half open."""
+        with self._lock:
+            if self._state == CircuitState.HALF_OPEN:
+                self._half_open_calls = max(0, self._half_open_calls - 1)
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            self._consecutive_failures += 1
+            if (self._state == CircuitState.HALF_OPEN
+                    or (self._state == CircuitState.CLOSED and self._consecutive_failures >= self.failure_threshold)):
+                self._open()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get circuit breaker statistics."""
+        with self._lock:
+            self._update_state()
+            return {
+                "name": self.name,
+                "state": self._state.value,
+                "consecutive_failures": self._consecutive_failures,
+                "successes": self._successes,
+                "failures": self._failures,
+                "rejected": self._rejected,
+                "times_opened": self._times_opened,
+            }
+
+
+_circuit_breakers: dict[str, CircuitBreaker] = {}
+_circuit_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(name: str, **kwargs) -> CircuitBreaker:
+    """
+    Return the process-wide circuit breaker for the endpoint *name*, creating it with *kwargs* on first use.
+    Clients of the same endpoint should share a breaker, so that they all stop calling it when it fails. A warning is
+    logged if the breaker exists with settings which differ from *kwargs*.
+    """
+    with _circuit_breakers_lock:
+        breaker = _circuit_breakers.get(name)
+        if breaker is None:
+            breaker = _circuit_breakers[name] = CircuitBreaker(name, **kwargs)
+            return breaker
+
+    conflicts = {key: value for key, value in kwargs.items() if getattr(breaker, key) != value}
+    if conflicts:
+        logger.warning("Circuit breaker %s already exists, ignoring the different settings %s", name, conflicts)
+
+    return breaker
+
+
+def get_circuit_breaker_stats() -> dict[str, dict[str, Any]]:
+    """Get the statistics of every process-wide circuit breaker, by endpoint name."""
+    with _circuit_breakers_lock:
+        breakers = list(_circuit_breakers.values())
+    return {breaker.name: breaker.get_stats() for breaker in breakers}
+
+
+def get_retry_stats() -> dict[str, Any]:
+    """
+    Get the statistics of the process-wide retry budget and circuit breakers. The budget statistics are None until a
+    client uses the budget.
+    """
+    with _global_retry_budget_lock:
+        budget = _global_retry_budget
+    return {
+        "retry_budget": budget.get_stats() if budget is not None else None,
+        "circuit_breakers": get_circuit_breaker_stats(),
+    }
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+#  Retry policy shared by all wrappers
+# ──────────────────────────────────────────────────────────────────────────────
+class _RetryPolicy:
+    """Decides whether and when to retry a failed attempt, and keeps the circuit breaker up to date."""
+
+    def __init__(
+        self,
+        *,
+        retries: int,
+        retry_codes: Sequence[CodePattern] | None,
+        retry_on_messages: Sequence[str] | None,
+        backoff_strategy: BackoffStrategy,
+        retry_budget: RetryBudget | None,
+        circuit_breaker: CircuitBreaker | None,
+        respect_retry_after: bool,
+        max_retry_after: float,
+    ):
+        self.retries = retries
+        self.retry_codes = retry_codes
+        self.retry_on_messages = retry_on_messages
+        self.backoff_strategy = backoff_strategy
+        self.retry_budget = retry_budget
+        self.circuit_breaker = circuit_breaker
+        self.respect_retry_after = respect_retry_after
+        self.max_retry_after = max_retry_after
+
+    def before_attempt(self) -> None:
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.before_call()
+
+    def on_success(self) -> None:
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.record_success()
+
+    def on_abort(self) -> None:
+        # The attempt was interrupted, e.g. cancelled, without telling us anything about the endpoint
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.record_aborted()
+
+    def on_error(self, exc: BaseException, attempt: int, previous_delay: float | None) -> float | None:
+        """Return the delay before the next attempt, or None if *exc* should be raised."""
+        if not _want_retry(exc, code_patterns=self.retry_codes, msg_substrings=self.retry_on_messages):
+            # The endpoint answered, with an error we do not retry on
+            self.on_success()
+            return None
+
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.record_failure()
+
+        if attempt == self.retries - 1:
+            return None
+
+        delay = self.backoff_strategy.next_delay(attempt, previous_delay)
+
+        if self.respect_retry_after and (retry_after := _extract_retry_after(exc)) is not None:
+            if retry_after > self.max_retry_after:
+                logger.info("Not retrying on exception %s, the server asked to wait %.1fs", exc, retry_after)
+                return None
+            delay = max(delay, retry_after)
+
+        if self.retry_budget is not None and not self.retry_budget.try_acquire():
+            logger.info("Not retrying on exception %s, the retry budget is exhausted", exc)
+            return None
+
+        return delay
+
+
 # ──────────────────────────────────────────────────────────────────────────────
 #  Core decorator factory (sync / async / (a)gen)
 # ──────────────────────────────────────────────────────────────────────────────
@@ -119,15 +528,33 @@ def _retry_decorator(
     retry_on_messages: Sequence[str] | None = None,
     deepcopy: bool = False,
     instance_context_aware: bool = False,
+    backoff_strategy: BackoffStrategy | None = None,
+    retry_budget: RetryBudget | None = None,
+    circuit_breaker: CircuitBreaker | None = None,
+    respect_retry_after: bool = True,
+    max_retry_after: float = 60.0,
 ) -> Callable[[Callable[..., T]], Callable[..., T]]:
     """
-    Build a decorator that retries with exponential back-off *iff*:
+    Build a decorator that retries with back-off *iff*:
 
       • the raised exception is an instance of one of `retry_on`
       • AND `_want_retry()` returns True (i.e. matches codes/messages filters)
+      • AND the `retry_budget`, if any, has a token left
 
     If both `retry_codes` and `retry_on_messages` are None, all exceptions are retried.
 
+    backoff_strategy:
+        Computes the delay before each retry. Defaults to exponential back-off
+        from `base_delay` by a factor of `backoff`.
+
+    respect_retry_after:
+        If True, wait at least as long as a `Retry-After` hint on the exception.
+        Hints longer than `max_retry_after` seconds are not retried.
+
+    circuit_breaker:
+        If set, retryable failures are recorded on the breaker, and calls fail
+        with `CircuitOpenError` while it is open.
+
     deepcopy:
         If True, each retry receives deep‑copied *args and **kwargs* to avoid
         mutating shared state between attempts.
@@ -137,6 +564,16 @@ def _retry_decorator(
         argument (assumed to be 'self'). If the flag is set, retries are skipped
         to prevent retry storms in nested method calls.
     """
+    policy = _RetryPolicy(
+        retries=retries,
+        retry_codes=retry_codes,
+        retry_on_messages=retry_on_messages,
+        backoff_strategy=backoff_strategy or ExponentialBackoff(base_delay=base_delay, factor=backoff),
+        retry_budget=retry_budget,
+        circuit_breaker=circuit_breaker,
+        respect_retry_after=respect_retry_after,
+        max_retry_after=max_retry_after,
+    )
 
     def decorate(fn: Callable[..., T]) -> Callable[..., T]:
         use_deepcopy = deepcopy
@@ -178,18 +615,24 @@ def _retry_decorator(
             with _RetryContext(args) as already_in_context:
                 if already_in_context:
                     return await fn(*args, **kw)
-                delay = base_delay
+                delay = None
                 for attempt in range(retries):
                     call_args = copy.deepcopy(args) if use_deepcopy else args
                     call_kwargs = copy.deepcopy(kw) if use_deepcopy else kw
+                    policy.before_attempt()
                     try:
-                        return await fn(*call_args, **call_kwargs)
+                        result = await fn(*call_args, **call_kwargs)
                     except retry_on as exc:
-                        if (not _want_retry(exc, code_patterns=retry_codes, msg_substrings=retry_on_messages)
-                                or attempt == retries - 1):
+                        delay = policy.on_error(exc, attempt, delay)
+                        if delay is None:
                             raise
                         await asyncio.sleep(delay)
-                        delay *= backoff
+                    except BaseException:
+                        policy.on_abort()
+                        raise
+                    else:
+                        policy.on_success()
+                        return result
 
         async def _agen_with_retry(*args, **kw):
             with _RetryContext(args) as already_in_context:
@@ -197,56 +640,72 @@ def _retry_decorator(
                     async for item in fn(*args, **kw):
                         yield item
                     return
-                delay = base_delay
+                delay = None
                 for attempt in range(retries):
                     call_args = copy.deepcopy(args) if use_deepcopy else args
                     call_kwargs = copy.deepcopy(kw) if use_deepcopy else kw
+                    policy.before_attempt()
                     try:
                         async for item in fn(*call_args, **call_kwargs):
                             yield item
-                        return
                     except retry_on as exc:
-                        if (not _want_retry(exc, code_patterns=retry_codes, msg_substrings=retry_on_messages)
-                                or attempt == retries - 1):
+                        delay = policy.on_error(exc, attempt, delay)
+                        if delay is None:
                             raise
                         await asyncio.sleep(delay)
-                        delay *= backoff
+                    except BaseException:
+                        policy.on_abort()
+                        raise
+                    else:
+                        policy.on_success()
+                        return
 
         def _gen_with_retry(*args, **kw) -> Iterable[Any]:
             with _RetryContext(args) as already_in_context:
                 if already_in_context:
                     yield from fn(*args, **kw)
                     return
-                delay = base_delay
+                delay = None
                 for attempt in range(retries):
                     call_args = copy.deepcopy(args) if use_deepcopy else args
                     call_kwargs = copy.deepcopy(kw) if use_deepcopy else kw
+                    policy.before_attempt()
                     try:
                         yield from fn(*call_args, **call_kwargs)
-                        return
                     except retry_on as exc:
-                        if (not _want_retry(exc, code_patterns=retry_codes, msg_substrings=retry_on_messages)
-                                or attempt == retries - 1):
+                        delay = policy.on_error(exc, attempt, delay)
+                        if delay is None:
                             raise
                         time.sleep(delay)
-                        delay *= backoff
+                    except BaseException:
+                        policy.on_abort()
+                        raise
+                    else:
+                        policy.on_success()
+                        return
 
         def _sync_with_retry(*args, **kw) -> T:
             with _RetryContext(args) as already_in_context:
                 if already_in_context:
                     return fn(*args, **kw)
-                delay = base_delay
+                delay = None
                 for attempt in range(retries):
                     call_args = copy.deepcopy(args) if use_deepcopy else args
                     call_kwargs = copy.deepcopy(kw) if use_deepcopy else kw
+                    policy.before_attempt()
                     try:
-                        return fn(*call_args, **call_kwargs)
+                        result = fn(*call_args, **call_kwargs)
                     except retry_on as exc:
-                        if (not _want_retry(exc, code_patterns=retry_codes, msg_substrings=retry_on_messages)
-                                or attempt == retries - 1):
+                        delay = policy.on_error(exc, attempt, delay)
+                        if delay is None:
                             raise
                         time.sleep(delay)
-                        delay *= backoff
+                    except BaseException:
+                        policy.on_abort()
+                        raise
+                    else:
+                        policy.on_success()
+                        return result
 
         # Decide which wrapper to return
         if inspect.iscoroutinefunction(fn):
@@ -266,6 +725,26 @@ def _retry_decorator(
 # ──────────────────────────────────────────────────────────────────────────────
 #  Public helper : patch_with_retry
 # ──────────────────────────────────────────────────────────────────────────────
+# Methods of the LLM, embedder and memory clients supported by the toolkit which call the endpoint
+ENDPOINT_METHODS = frozenset({
+    # LangChain
+    "invoke", "ainvoke", "stream", "astream", "batch", "abatch", "generate", "agenerate",
+    "embed_query", "aembed_query", "embed_documents", "aembed_documents",
+    # LlamaIndex
+    "chat", "achat", "stream_chat", "astream_chat", "complete", "acomplete", "stream_complete", "astream_complete",
+    "get_query_embedding", "aget_query_embedding", "get_text_embedding", "aget_text_embedding",
+    "get_text_embedding_batch", "aget_text_embedding_batch",
+    # Agno
+    "invoke_stream", "ainvoke_stream", "response", "aresponse", "response_stream", "aresponse_stream",
+    # CrewAI
+    "call",
+    # Semantic Kernel
+    "get_chat_message_contents", "get_streaming_chat_message_contents",
+    # Memory editors
+    "add_items", "search", "remove_items",
+})
+
+
 def patch_with_retry(
     obj: Any,
     *,
@@ -276,6 +755,12 @@ def patch_with_retry(
     retry_codes: Sequence[CodePattern] | None = None,
     retry_on_messages: Sequence[str] | None = None,
     deepcopy: bool = False,
+    backoff_strategy: BackoffStrategy | None = None,
+    retry_budget: RetryBudget | None = None,
+    circuit_breaker: CircuitBreaker | None = None,
+    circuit_breaker_methods: Iterable[str] = ENDPOINT_METHODS,
+    respect_retry_after: bool = True,
+    max_retry_after: float = 60.0,
 ) -> Any:
     """
     Patch *obj* instance-locally so **every public method** retries on failure.
@@ -290,8 +775,26 @@ def patch_with_retry(
     deepcopy:
         If True, each retry receives deep‑copied *args and **kwargs* to avoid
         mutating shared state between attempts.
+    backoff_strategy:
+        Computes the delay before each retry, e.g. `DecorrelatedJitterBackoff`.
+        Defaults to exponential back-off from `base_delay` by a factor of `backoff`.
+    retry_budget:
+        Token bucket limiting retries across every client sharing it, see
+        `get_global_retry_budget`. If None, retries are not limited.
+    circuit_breaker:
+        Breaker for the endpoint the methods call, see `get_circuit_breaker`.
+        While it is open, methods fail with `CircuitOpenError` without calling
+        the endpoint.
+    circuit_breaker_methods:
+        Names of the methods which call the endpoint. Only these are guarded
+        by `circuit_breaker` and record their outcome on it, so that local
+        methods such as `bind_tools` neither fail while it is open nor reset
+        its failure count. Defaults to `ENDPOINT_METHODS`.
+    respect_retry_after:
+        If True, wait at least as long as a `Retry-After` hint returned by the
+        server. Hints longer than `max_retry_after` seconds are not retried.
     """
-    deco = _retry_decorator(
+    decorator_kwargs = dict(
         retries=retries,
         base_delay=base_delay,
         backoff=backoff,
@@ -300,7 +803,15 @@ def patch_with_retry(
         retry_on_messages=retry_on_messages,
         deepcopy=deepcopy,
         instance_context_aware=True,  # Prevent retry storms
+        backoff_strategy=backoff_strategy,
+        retry_budget=retry_budget,
+        respect_retry_after=respect_retry_after,
+        max_retry_after=max_retry_after,
     )
+    deco = _retry_decorator(**decorator_kwargs)
+    endpoint_deco = deco if circuit_breaker is None else _retry_decorator(**decorator_kwargs,
+                                                                           circuit_breaker=circuit_breaker)
+    circuit_breaker_methods = frozenset(circuit_breaker_methods)
 
     # Choose attribute source: the *class* to avoid triggering __getattr__
     cls = obj if inspect.isclass(obj) else type(obj)
@@ -314,7 +825,7 @@ def patch_with_retry(
             continue
 
         original = descriptor.__func__ if isinstance(descriptor, types.MethodType) else descriptor
-        wrapped = deco(original)
+        wrapped = (endpoint_deco if name in circuit_breaker_methods else deco)(original)
 
         try:  # instance‑level first
             if not inspect.isclass(obj):
@@ -0,0 +1,47 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import logging
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+
+def close_client_on_loop(client: httpx.AsyncClient, loop: asyncio.AbstractEventLoop | None) -> None:
+    """Close an HTTP client which is being replaced because it was created on a different event loop.
+
+    The connections of a client can only be closed on the event loop they were opened on. If that loop is still
+    running, the client is closed on it without waiting for the result. Otherwise the client is discarded and its
+    connections are left to be garbage collected.
+
+    Args:
+        client (httpx.AsyncClient): The client to close.
+        loop (asyncio.AbstractEventLoop | None): The event loop the client was created on.
+    """
+    if client.is_closed:
+        return
+
+    if loop is not None and loop.is_running():
+        try:
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+            return
+        except RuntimeError:
+            # The event loop was closed in the meantime
+            pass
+
+    logger.warning("Discarding an HTTP client created on an event loop which is no longer running, "
+                   "its connections are not closed")
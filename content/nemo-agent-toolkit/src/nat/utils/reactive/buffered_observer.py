@@ -0,0 +1,334 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import dataclasses
+import logging
+import threading
+from collections import deque
+from enum import Enum
+from typing import TypeVar
+
+from nat.utils.reactive.base.observer_base import ObserverBase
+
+logger = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+
+class OverflowPolicy(str, Enum):
+    """
+    What a `BufferedObserver` does with a new event when its buffer is full.
+    """
+    BLOCK = "block"
+    """The producer waits for space in the buffer. On the event loop thread the buffer is drained inline instead."""
+    DROP_OLDEST = "drop_oldest"
+    """The oldest buffered event is dropped to make room for the new event."""
+    DROP_NEWEST = "drop_newest"
+    """The new event is dropped."""
+    SAMPLE = "sample"
+    """Only every `sample_every`-th overflowing event is kept, replacing the oldest buffered event."""
+
+
+@dataclasses.dataclass(frozen=True)
+class BufferedDeliveryConfig:
+    """
+    Configuration for asynchronous, buffered delivery of events to observers.
+    """
+    max_size: int = 1024
+    overflow_policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST
+    sample_every: int = 10
+
+    def __post_init__(self):
+        if (self.max_size < 1):
+            raise ValueError("max_size must be at least 1")
+        if (self.sample_every < 1):
+            raise ValueError("sample_every must be at least 1")
+
+
+@dataclasses.dataclass
+class DeliveryStats:
+    """
+    Delivery counters for a single buffered observer.
+    """
+    delivered: int = 0
+    dropped: int = 0
+    lag: int = 0
+    """Number of events currently buffered and not yet delivered."""
+    max_lag: int = 0
+    """Largest number of events buffered at the same time."""
+
+
+_COMPLETE = object()
+
+
+class _Error:
+    __slots__ = ("exc", )
+
+    def __init__(self, exc: Exception) -> None:
+        self.exc = exc
+
+
+class BufferedObserver(ObserverBase[_T]):
+    """
+    Wraps an observer so that events are delivered from a bounded buffer by an asyncio task instead of on the
+    producer's call stack. Events, errors and completion are delivered in the order they were produced.
+
+    The drain task is started on the running event loop the first time an event is produced. If no event loop is
+    running, events are delivered synchronously. The drain task ends once completion has been delivered, or when the
+    observer is disposed.
+    """
+
+    def __init__(self, observer: ObserverBase[_T], config: BufferedDeliveryConfig | None = None) -> None:
+        self._observer = observer
+        self._config = config or BufferedDeliveryConfig()
+        self._buffer: deque = deque()
+        self._lock = threading.Lock()
+        self._space_available = threading.Condition(self._lock)
+        self._overflow_count = 0
+        self._undelivered = 0
+        self._stats = DeliveryStats()
+
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread: int | None = None
+        self._wakeup: asyncio.Event | None = None
+        self._drain_task: asyncio.Task | None = None
+        self._completed = False
+
+    @property
+    def observer(self) -> ObserverBase[_T]:
+        return self._observer
+
+    @property
+    def event_types(self):
+        # Forward any event interest declared by the wrapped observer
+        return getattr(self._observer, "event_types", None)
+
+    @property
+    def stats(self) -> DeliveryStats:
+        """
+        A snapshot of the delivery counters for this observer.
+        """
+        with self._lock:
+            return dataclasses.replace(self._stats, lag=len(self._buffer))
+
+    # ==========================================================================
+    # ObserverBase[T]
+    # ==========================================================================
+    def on_next(self, value: _T) -> None:
+        self._enqueue(value)
+
+    def on_error(self, exc: Exception) -> None:
+        # Errors are never dropped
+        self._enqueue(_Error(exc), force=True)
+
+    def on_complete(self) -> None:
+        # Completion is never dropped and no events are accepted afterwards
+        self._enqueue(_COMPLETE, force=True)
+
+    async def drain(self) -> None:
+        """
+        Waits until every event produced so far has been delivered.
+        """
+        while True:
+            with self._lock:
+                if (self._undelivered == 0):
+                    return
+                task = self._drain_task
+
+            if (task is None or task.done() or task.get_loop() is not asyncio.get_running_loop()):
+                self._deliver_pending()
+                return
+
+            await asyncio.sleep(0)
+
+    def dispose(self) -> None:
+        """
+        Stops delivering events. Buffered events are discarded and the drain task is cancelled.
+        """
+        with self._lock:
+            self._completed = True
+            self._undelivered -= len(self._buffer)
+            self._buffer.clear()
+            # Release any producers blocked on a full buffer
+            self._space_available.notify_all()
+            task = self._drain_task
+            self._drain_task = None
+
+        if (task is None or task.done()):
+            return
+
+        if (threading.get_ident() == self._loop_thread):
+            task.cancel()
+        else:
+            try:
+                task.get_loop().call_soon_threadsafe(task.cancel)
+            except RuntimeError:
+                # The event loop is closed
+                pass
+
+    # ==========================================================================
+    # Internals
+    # ==========================================================================
+    def _enqueue(self, item: object, force: bool = False) -> None:
+
+        with self._lock:
+            if (self._completed):
+                return
+            if (item is _COMPLETE):
+                self._completed = True
+
+        if (not self._ensure_drain_task()):
+            # No event loop to deliver from, fall back to synchronous delivery
+            self._deliver_pending()
+            with self._lock:
+                self._undelivered += 1
+            self._deliver(item)
+            return
+
+        on_loop_thread = threading.get_ident() == self._loop_thread
+
+        with self._lock:
+            if (force or len(self._buffer) < self._config.max_size):
+                self._append(item)
+            elif (self._config.overflow_policy == OverflowPolicy.BLOCK):
+                if (on_loop_thread):
+                    while (len(self._buffer) >= self._config.max_size):
+                        self._make_room_inline()
+                else:
+                    while (len(self._buffer) >= self._config.max_size and not self._completed):
+                        self._space_available.wait()
+                if (self._completed):
+                    # Completed or disposed while waiting for space
+                    return
+                self._append(item)
+            elif (self._config.overflow_policy == OverflowPolicy.DROP_NEWEST):
+                self._stats.dropped += 1
+            elif (self._config.overflow_policy == OverflowPolicy.DROP_OLDEST):
+                self._drop_oldest()
+                self._append(item)
+            else:
+                self._overflow_count += 1
+                if (self._overflow_count % self._config.sample_every == 0):
+                    self._drop_oldest()
+                    self._append(item)
+                else:
+                    self._stats.dropped += 1
+
+        self._wake(on_loop_thread)
+
+    def _append(self, item: object) -> None:
+        # Must be called with the lock held
+        self._buffer.append(item)
+        self._undelivered += 1
+        self._stats.max_lag = max(self._stats.max_lag, len(self._buffer))
+
+    def _drop_oldest(self) -> None:
+        # Must be called with the lock held. Signals are kept, only regular events are dropped
+        for index, buffered in enumerate(self._buffer):
+            if (buffered is not _COMPLETE and not isinstance(buffered, _Error)):
+                del self._buffer[index]
+                self._undelivered -= 1
+                self._stats.dropped += 1
+                return
+
+    def _make_room_inline(self) -> None:
+        # Must be called with the lock held. The drain task runs on this thread so waiting for it would deadlock.
+        # Instead, the producer pays for delivering the oldest event to free up space.
+        oldest = self._buffer.popleft()
+        self._space_available.notify()
+        self._lock.release()
+        try:
+            self._deliver(oldest)
+        finally:
+            self._lock.acquire()
+
+    def _ensure_drain_task(self) -> bool:
+        if (self._drain_task is not None and not self._drain_task.done()):
+            return True
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        if (loop is None):
+            if (self._loop is not None and self._loop.is_running()):
+                # Produced from another thread, start the drain task on the loop it belongs to
+                self._loop.call_soon_threadsafe(self._start_drain_task)
+                return True
+            return False
+
+        if (self._loop is not loop):
+            self._loop = loop
+            self._loop_thread = threading.get_ident()
+            self._wakeup = asyncio.Event()
+
+        self._start_drain_task()
+        return True
+
+    def _start_drain_task(self) -> None:
+        if (self._drain_task is None or self._drain_task.done()):
+            self._drain_task = self._loop.create_task(self._drain_loop())
+
+    def _wake(self, on_loop_thread: bool) -> None:
+        if (self._wakeup is None):
+            return
+        if (on_loop_thread):
+            self._wakeup.set()
+        else:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    async def _drain_loop(self) -> None:
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+
+            if (self._deliver_pending()):
+                return
+
+    def _deliver_pending(self) -> bool:
+        """
+        Delivers all buffered events. Returns True once completion has been delivered.
+        """
+        while True:
+            with self._lock:
+                if (not self._buffer):
+                    return False
+                item = self._buffer.popleft()
+                self._space_available.notify()
+
+            if (self._deliver(item)):
+                return True
+
+    def _deliver(self, item: object) -> bool:
+        try:
+            if (item is _COMPLETE):
+                self._observer.on_complete()
+                return True
+
+            if (isinstance(item, _Error)):
+                self._observer.on_error(item.exc)
+            else:
+                self._observer.on_next(item)
+                with self._lock:
+                    self._stats.delivered += 1
+        except Exception as e:
+            logger.exception("Error delivering event to observer %s: %s", self._observer, e)
+        finally:
+            with self._lock:
+                self._undelivered -= 1
+
+        return False
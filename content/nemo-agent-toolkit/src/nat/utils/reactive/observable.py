@@ -18,6 +18,8 @@ from typing import TypeVar
 
 from nat.utils.reactive.base.observable_base import ObservableBase
 from nat.utils.reactive.base.observer_base import ObserverBase
+from nat.utils.reactive.buffered_observer import BufferedDeliveryConfig
+from nat.utils.reactive.buffered_observer import BufferedObserver
 from nat.utils.reactive.observer import Observer
 from nat.utils.reactive.subscription import Subscription
 from nat.utils.type_utils import override
@@ -51,9 +53,17 @@ class Observable(ObservableBase[_T_out_co]):
     def subscribe(self,
                   on_next: ObserverBase[_T_out_co] | OnNext[_T_out_co] | None = None,
                   on_error: OnError | None = None,
-                  on_complete: OnComplete | None = None) -> "Subscription":
+                  on_complete: OnComplete | None = None,
+                  *,
+                  delivery_config: BufferedDeliveryConfig | None = None) -> "Subscription":
+        """
+        Subscribes an Observer or callbacks to this Observable. If `delivery_config` is provided, events are delivered
+        to this subscriber asynchronously from a bounded buffer instead of on the producer's call stack.
+        """
+
+        observer = on_next if isinstance(on_next, ObserverBase) else Observer(on_next, on_error, on_complete)
 
-        if isinstance(on_next, ObserverBase):
-            return self._subscribe_core(on_next)
+        if (delivery_config is not None and not isinstance(observer, BufferedObserver)):
+            observer = BufferedObserver(observer, delivery_config)
 
-        return self._subscribe_core(Observer(on_next, on_error, on_complete))
+        return self._subscribe_core(observer)
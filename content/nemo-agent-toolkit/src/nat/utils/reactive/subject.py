@@ -18,6 +18,9 @@ from collections.abc import Callable
 from typing import TypeVar
 
 from nat.utils.reactive.base.subject_base import SubjectBase
+from nat.utils.reactive.buffered_observer import BufferedDeliveryConfig
+from nat.utils.reactive.buffered_observer import BufferedObserver
+from nat.utils.reactive.buffered_observer import DeliveryStats
 from nat.utils.reactive.observable import Observable
 from nat.utils.reactive.observer import Observer
 from nat.utils.reactive.subscription import Subscription
@@ -35,18 +38,32 @@ class Subject(Observable[T], Observer[T], SubjectBase[T]):
     - Maintains a list of ObserverBase[T].
     - No internal buffering or replay; events are only delivered to current subscribers.
     - Thread-safe via a lock.
+    - Events are delivered synchronously on the producer's call stack unless a `delivery_config` is provided, in
+      which case every observer receives events asynchronously from its own bounded buffer.
 
     Once on_error or on_complete is called, the Subject is closed.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, delivery_config: BufferedDeliveryConfig | None = None) -> None:
         super().__init__()
+        self._delivery_config = delivery_config
         self._lock = threading.RLock()
         self._closed = False
         self._error: Exception | None = None
         self._observers: list[Observer[T]] = []
+        # Immutable snapshot of the observer list, replaced whenever the list changes. Avoids copying the list on every
+        # emission and lets producers cheaply detect subscription changes by identity.
+        self._observers_snapshot: tuple[Observer[T], ...] = ()
         self._disposed = False
 
+    @property
+    def observers(self) -> tuple[Observer[T], ...]:
+        """
+        Snapshot of the currently subscribed observers. A new tuple is created every time an observer is added or
+        removed, so the identity of the returned tuple can be used to detect subscription changes.
+        """
+        return self._observers_snapshot
+
     # ==========================================================================
     # Observable[T] - for consumers
     # ==========================================================================
@@ -60,7 +77,11 @@ class Subject(Observable[T], Observer[T], SubjectBase[T]):
                 # Already disposed => no subscription
                 return Subscription(self, None)
 
+            if (self._delivery_config is not None and not isinstance(observer, BufferedObserver)):
+                observer = BufferedObserver(observer, self._delivery_config)
+
             self._observers.append(observer)
+            self._observers_snapshot = tuple(self._observers)
             return Subscription(self, observer)
 
     # ==========================================================================
@@ -74,8 +95,8 @@ class Subject(Observable[T], Observer[T], SubjectBase[T]):
         with self._lock:
             if self._closed or self._disposed:
                 return
-            # Copy the current observers to avoid mutation issues
-            current_observers = list(self._observers)
+            # The snapshot is immutable so it is safe to iterate while observers are added or removed
+            current_observers = self._observers_snapshot
 
         # Deliver outside the lock
         for obs in current_observers:
@@ -88,7 +109,7 @@ class Subject(Observable[T], Observer[T], SubjectBase[T]):
         with self._lock:
             if self._closed or self._disposed:
                 return
-            current_obs = list(self._observers)
+            current_obs = self._observers_snapshot
 
         for obs in current_obs:
             obs.on_error(exc)
@@ -101,19 +122,42 @@ class Subject(Observable[T], Observer[T], SubjectBase[T]):
         with self._lock:
             if self._closed or self._disposed:
                 return
-            current_observers = list(self._observers)
-            self.dispose()
+            current_observers = self._observers_snapshot
+            # Buffered observers are not disposed, they stop by themselves once completion has been delivered
+            self._clear()
 
         for obs in current_observers:
             obs.on_complete()
 
+    # ==========================================================================
+    # Buffered delivery
+    # ==========================================================================
+    def delivery_stats(self) -> list[DeliveryStats]:
+        """
+        Returns the delivery counters (delivered, dropped and lag) of each observer with buffered delivery.
+        """
+        return [obs.stats for obs in self._observers_snapshot if isinstance(obs, BufferedObserver)]
+
+    async def drain(self) -> None:
+        """
+        Waits until every buffered observer has received all of the events produced so far.
+        """
+        for obs in self._observers_snapshot:
+            if isinstance(obs, BufferedObserver):
+                await obs.drain()
+
     # ==========================================================================
     # SubjectBase - internal unsubscribing
     # ==========================================================================
     def _unsubscribe_observer(self, observer: Observer[T]) -> None:
         with self._lock:
-            if not self._disposed and observer in self._observers:
-                self._observers.remove(observer)
+            if self._disposed or observer not in self._observers:
+                return
+            self._observers.remove(observer)
+            self._observers_snapshot = tuple(self._observers)
+
+        if isinstance(observer, BufferedObserver):
+            observer.dispose()
 
     # ==========================================================================
     # Disposal
@@ -121,11 +165,22 @@ class Subject(Observable[T], Observer[T], SubjectBase[T]):
     def dispose(self) -> None:
         """
         Immediately close the Subject. No future on_next, on_error, or on_complete.
-        Clears all observers.
+        Clears all observers and stops the delivery of any events still buffered for them.
         """
         with self._lock:
-            if not self._disposed:
-                self._disposed = True
-                self._observers.clear()
-                self._closed = True
-                self._error = None
+            if self._disposed:
+                return
+            current_observers = self._observers_snapshot
+            self._clear()
+
+        for obs in current_observers:
+            if isinstance(obs, BufferedObserver):
+                obs.dispose()
+
+    def _clear(self) -> None:
+        # Must be called with the lock held
+        self._disposed = True
+        self._observers.clear()
+        self._observers_snapshot = ()
+        self._closed = True
+        self._error = None
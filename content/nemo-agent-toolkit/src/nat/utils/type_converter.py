@@ -25,14 +25,32 @@ logger = logging.getLogger(__name__)
 
 _T = typing.TypeVar("_T")
 
+# Marks a pair of types whose indirect conversion path has not been searched for yet
+_NOT_SEARCHED = object()
+
 
 class ConvertException(Exception):
     pass
 
 
+def _may_be_instance(source_type: type, root_type: type) -> bool:
+    """
+    Returns False only if instances of `source_type` can never be instances of `root_type`.
+    """
+    try:
+        return issubclass(source_type, root_type)
+    except TypeError:
+        # Some types only support `isinstance`, which is checked when converting
+        return True
+
+
 class TypeConverter:
     _global_initialized = False
 
+    # Incremented whenever a converter is added to any TypeConverter. Compiled conversion paths include the converters
+    # of the parents, so every TypeConverter discards them when this changes.
+    _generation = 0
+
     def __init__(self, converters: list[Callable[[typing.Any], typing.Any]], parent: "TypeConverter | None" = None):
         """
         Parameters
@@ -46,6 +64,11 @@ class TypeConverter:
         self._converters: OrderedDict[type, OrderedDict[type, Callable]] = OrderedDict()
         self._indirect_warnings_shown: set[tuple[type, type]] = set()
 
+        # Conversion paths compiled for (source type, target type) pairs, valid for `_cache_generation`
+        self._cache_generation = -1
+        self._direct_cache: dict[tuple[type, type], tuple[tuple[type, Callable], ...]] = {}
+        self._indirect_cache: dict[tuple[type, type], tuple[tuple[type, Callable], ...] | None] = {}
+
         for converter in converters:
             self.add_converter(converter)
 
@@ -83,6 +106,18 @@ class TypeConverter:
         self._converters.setdefault(to_type, OrderedDict())[from_type] = converter
         # to do(MDD): If needed, sort by specificity here.
 
+        TypeConverter._generation += 1
+
+    def _validate_cache(self) -> None:
+        """
+        Discards the compiled conversion paths if a converter has been added to this converter or any other since they
+        were compiled.
+        """
+        if self._cache_generation != TypeConverter._generation:
+            self._direct_cache.clear()
+            self._indirect_cache.clear()
+            self._cache_generation = TypeConverter._generation
+
     def _convert(self, data: typing.Any, to_type: type[_T]) -> _T | None:
         """
         Attempts to convert `data` into `to_type`. Returns None if no path is found.
@@ -180,21 +215,48 @@ class TypeConverter:
         If no match here, we forward to parent's direct conversion
         for recursion up the chain.
         """
+        for convert_from_root, from_type_converter in self._get_direct_converters(type(data), target_root_type):
+            if isinstance(data, convert_from_root):
+                try:
+                    return from_type_converter(data)
+                except ConvertException:
+                    pass
+
+        return None
+
+    def _get_direct_converters(self, source_type: type, target_root_type: type) -> tuple[tuple[type, Callable], ...]:
+        """
+        Returns the converters which can convert instances of `source_type` directly into `target_root_type`, paired
+        with the root type of their argument. They are ordered as they are tried: this converter's registry first,
+        followed by the parent's. The result is compiled once per pair of types.
+        """
+        self._validate_cache()
+
+        key = (source_type, target_root_type)
+        converters = self._direct_cache.get(key)
+
+        if converters is not None:
+            return converters
+
+        candidates: list[tuple[type, Callable]] = []
+
         for convert_to_type, to_type_converters in self._converters.items():
             # e.g. if Derived is a subclass of Base, this is valid
             if issubclass(DecomposedType(convert_to_type).root, target_root_type):
                 for convert_from_type, from_type_converter in to_type_converters.items():
-                    if isinstance(data, DecomposedType(convert_from_type).root):
-                        try:
-                            return from_type_converter(data)
-                        except ConvertException:
-                            pass
+                    convert_from_root = DecomposedType(convert_from_type).root
+
+                    if _may_be_instance(source_type, convert_from_root):
+                        candidates.append((convert_from_root, from_type_converter))
 
         # If we can't convert directly here, try parent
         if self._parent is not None:
-            return self._parent._try_direct_conversion(data, target_root_type)
+            candidates.extend(self._parent._get_direct_converters(source_type, target_root_type))
 
-        return None
+        converters = tuple(candidates)
+        self._direct_cache[key] = converters
+
+        return converters
 
     # -------------------------------------------------
     # INTERNAL INDIRECT CONVERSION (with parent fallback)
@@ -204,8 +266,7 @@ class TypeConverter:
         Attempt indirect conversion (DFS) in *this* converter.
         If no success, fallback to parent's indirect attempt.
         """
-        visited = set()
-        final = self._try_indirect_conversion(data, to_type, visited)
+        final = self._try_compiled_indirect_conversion(data, to_type)
         src_type = type(data)
         if final is not None:
             # Warn once if found a chain
@@ -221,10 +282,63 @@ class TypeConverter:
 
         return None
 
-    def _try_indirect_conversion(self, data: typing.Any, to_type: type[_T], visited: set[type]) -> _T | None:
+    def _try_compiled_indirect_conversion(self, data: typing.Any, to_type: type[_T]) -> _T | None:
+        """
+        Indirect conversion in *this* converter using the chain of converters previously found for the type of `data`,
+        ignoring parent. The chain is searched for on the first conversion between the two types, and again if
+        following it fails for a particular value. Chains, and the absence of one, are only remembered when no
+        converter raised `ConvertException` during the search, since the outcome then only depends on the types.
+        """
+        self._validate_cache()
+
+        key = (type(data), to_type)
+        path = self._indirect_cache.get(key, _NOT_SEARCHED)
+
+        if path is None:
+            return None
+
+        if path is not _NOT_SEARCHED:
+            final = self._follow_path(data, to_type, path)
+            if final is not None:
+                return final
+
+        found_path: list[tuple[type, Callable]] = []
+        raised: list[Callable] = []
+
+        final = self._try_indirect_conversion(data, to_type, set(), found_path, raised)
+
+        if not raised:
+            self._indirect_cache[key] = tuple(found_path) if final is not None else None
+
+        return final
+
+    @staticmethod
+    def _follow_path(data: typing.Any, to_type: type[_T], path: tuple[tuple[type, Callable], ...]) -> _T | None:
+        """
+        Applies a chain of converters found by `_try_indirect_conversion`. Returns None if the chain does not apply to
+        this value.
+        """
+        try:
+            for convert_from_type, from_type_converter in path:
+                if not isinstance(data, convert_from_type):
+                    return None
+
+                data = from_type_converter(data)
+        except ConvertException:
+            return None
+
+        return data if isinstance(data, to_type) else None
+
+    def _try_indirect_conversion(self,
+                                 data: typing.Any,
+                                 to_type: type[_T],
+                                 visited: set[type],
+                                 path: list[tuple[type, Callable]],
+                                 raised: list[Callable]) -> _T | None:
         """
         DFS attempt to find a chain of conversions from type(data) to to_type,
-        ignoring parent. If not found, returns None.
+        ignoring parent. If not found, returns None. The chain is left in `path` and
+        converters which raised `ConvertException` are appended to `raised`.
         """
         # 1) If data is already correct type
         if isinstance(data, to_type):
@@ -240,16 +354,18 @@ class TypeConverter:
         for _, to_type_converters in self._converters.items():
             for convert_from_type, from_type_converter in to_type_converters.items():
                 if isinstance(data, convert_from_type):
+                    path.append((convert_from_type, from_type_converter))
                     try:
                         next_data = from_type_converter(data)
                         if isinstance(next_data, to_type):
                             return next_data
                         # else keep going
-                        deeper = self._try_indirect_conversion(next_data, to_type, visited)
+                        deeper = self._try_indirect_conversion(next_data, to_type, visited, path, raised)
                         if deeper is not None:
                             return deeper
                     except ConvertException:
-                        pass
+                        raised.append(from_type_converter)
+                    path.pop()
 
         return None
 
@@ -19,9 +19,10 @@ import inspect
 import json
 import os
 import sys
+import threading
 import types
 import typing
-from functools import lru_cache
+from functools import cached_property
 from typing import TypeAlias
 
 from pydantic import BaseModel
@@ -57,17 +58,84 @@ else:
         return func
 
 
+# Upper bound on the number of interned `DecomposedType` objects. Types are usually defined once, so this only comes into
+# play when types are created dynamically.
+_INTERNED_TYPES_MAXSIZE = 4096
+
+
 class DecomposedType:
+    """
+    Decomposes a type annotation into its origin, arguments and base type.
+
+    Instances are interned: calling `DecomposedType` again with an equal type returns the same instance, so each
+    property is only computed once per type. Types which are not hashable are decomposed without being interned.
+    """
+
+    # Interned instances keyed by `_intern_key` of the type they were created for
+    _interned: typing.ClassVar[dict[typing.Hashable, "DecomposedType"]] = {}
+    _interned_lock: typing.ClassVar[threading.Lock] = threading.Lock()
+
+    type: typing.Any
+
+    def __new__(cls, original: type) -> "DecomposedType":
+
+        key = cls._intern_key(original)
+
+        if (key is None):
+            return cls._create(original)
+
+        interned = cls._interned.get(key)
+
+        if (interned is None):
+            interned = cls._intern(original, key)
+
+        return interned
+
+    def __reduce__(self):
+        # Recreate through `__new__` so that copies and unpickled objects are interned as well
+        return (DecomposedType, (self.type, ))
+
+    @staticmethod
+    def _intern_key(original: type) -> typing.Hashable | None:
+        # Unions compare equal regardless of the order of their arguments and `X | Y` compares equal to
+        # `typing.Union[X, Y]`, so the kind of type and the ordered arguments are part of the key.
+        key = (type(original), original, typing.get_args(original))
+
+        try:
+            hash(key)
+        except TypeError:
+            return None
+
+        return key
+
+    @classmethod
+    def _create(cls, original: type) -> "DecomposedType":
+
+        instance = super().__new__(cls)
+        instance.type = types.NoneType if inspect.Signature.empty == original else original
+
+        return instance
+
+    @classmethod
+    def _intern(cls, original: type, key: typing.Hashable) -> "DecomposedType":
+
+        with cls._interned_lock:
+            interned = cls._interned.get(key)
+
+            if (interned is not None):
+                return interned
+
+            interned = cls._create(original)
 
-    def __init__(self, original: type):
+            if (len(cls._interned) >= _INTERNED_TYPES_MAXSIZE):
+                # Evict the oldest entry
+                del cls._interned[next(iter(cls._interned))]
 
-        if (inspect.Signature.empty == original):
-            original = types.NoneType
+            cls._interned[key] = interned
 
-        self.type = original
+        return interned
 
-    @property
-    @lru_cache
+    @cached_property
     def origin(self):
         """
         Get the origin of the current type using `typing.get_origin`. For example, if the current type is `list[int]`,
@@ -81,8 +149,7 @@ class DecomposedType:
 
         return typing.get_origin(self.type)
 
-    @property
-    @lru_cache
+    @cached_property
     def args(self):
         """
         Get the arguments of the current type using `typing.get_args`. For example, if the current type is `list[int,
@@ -96,8 +163,7 @@ class DecomposedType:
 
         return typing.get_args(self.type)
 
-    @property
-    @lru_cache
+    @cached_property
     def root(self):
         """
         Get the root type of the current type. This is the type without any annotations or async generators.
@@ -110,8 +176,7 @@ class DecomposedType:
 
         return self.origin if self.origin is not None else self.type
 
-    @property
-    @lru_cache
+    @cached_property
     def is_empty(self):
         """
         Check if the current type is eqivalent to `NoneType`.
@@ -123,8 +188,7 @@ class DecomposedType:
         """
         return self.type is types.NoneType
 
-    @property
-    @lru_cache
+    @cached_property
     def is_class(self):
         """
         Check if the current type is a class using `inspect.isclass`. For example, `list[int]` would return False, but
@@ -138,8 +202,7 @@ class DecomposedType:
 
         return inspect.isclass(self.type)
 
-    @property
-    @lru_cache
+    @cached_property
     def is_generic(self):
         """
         Check if the current type is a generic using `typing.GenericMeta`. For example, `list[int]` would return True,
@@ -153,8 +216,7 @@ class DecomposedType:
 
         return self.origin is not None
 
-    @property
-    @lru_cache
+    @cached_property
     def is_annotated(self):
         """
         Check if the current type is an annotated type using `typing.Annotated`. For example, `Annotated[int, str]`
@@ -168,8 +230,7 @@ class DecomposedType:
 
         return self.origin is typing.Annotated
 
-    @property
-    @lru_cache
+    @cached_property
     def is_union(self):
         """
         Check if the current type is a union type using `typing.Union`. For example, `Union[int, str]` would return
@@ -183,8 +244,7 @@ class DecomposedType:
 
         return self.origin in (typing.Union, types.UnionType)
 
-    @property
-    @lru_cache
+    @cached_property
     def is_async_generator(self):
         """
         Check if the current type is an async generator type. For example, `AsyncGenerator[int]` would return True,
@@ -202,8 +262,7 @@ class DecomposedType:
             types.AsyncGeneratorType,
         )
 
-    @property
-    @lru_cache
+    @cached_property
     def is_optional(self):
         """
         Check if the current type is an optional type. For example, `Optional[int]` and `int | None` would return True,
@@ -217,8 +276,7 @@ class DecomposedType:
 
         return self.is_union and types.NoneType in self.args
 
-    @property
-    @lru_cache
+    @cached_property
     def has_base_type(self):
         """
         Check if the current type has a base type, ignoring any annotations or async generators.
@@ -13,6 +13,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import gc
+import time
 from unittest.mock import patch
 
 import pytest
@@ -20,6 +23,7 @@ from langchain_core.messages.ai import AIMessage
 from langchain_core.messages.human import HumanMessage
 from langchain_core.messages.tool import ToolMessage
 from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.tools import BaseTool
 from langgraph.graph.state import CompiledStateGraph
 
 from nat.agent.base import AgentDecision
@@ -1018,3 +1022,247 @@ async def test_parallel_execution_flow(mock_rewoo_agent):
     # Check conditional edge - should be END now
     decision = await mock_rewoo_agent.conditional_edge(state)
     assert decision == AgentDecision.END
+
+
+# Tests for dataflow execution
+
+
+class _SleepTool(BaseTool):
+    """Mock tool which sleeps for the number of seconds given as the first word of its input."""
+
+    name: str = "sleep_tool"
+    description: str = "Sleeps for the given number of seconds"
+    calls: list[tuple[str, float, float]] = []
+    active: int = 0
+    max_active: int = 0
+
+    async def _arun(self, query: str = "0", **kwargs):
+        start = time.perf_counter()
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(float(query.split()[0]))
+        finally:
+            self.active -= 1
+        self.calls.append((query, start, time.perf_counter()))
+        return f"done {query}"
+
+    def _run(self, query: str = "0", **kwargs):
+        raise NotImplementedError
+
+
+def _create_dataflow_agent(mock_llm, tools: list[BaseTool], **kwargs) -> ReWOOAgentGraph:
+    from nat.agent.rewoo_agent.prompt import PLANNER_SYSTEM_PROMPT
+    from nat.agent.rewoo_agent.prompt import PLANNER_USER_PROMPT
+    from nat.agent.rewoo_agent.prompt import SOLVER_SYSTEM_PROMPT
+    from nat.agent.rewoo_agent.prompt import SOLVER_USER_PROMPT
+
+    planner_prompt = ChatPromptTemplate([("system", PLANNER_SYSTEM_PROMPT), ("user", PLANNER_USER_PROMPT)])
+    solver_prompt = ChatPromptTemplate([("system", SOLVER_SYSTEM_PROMPT), ("user", SOLVER_USER_PROMPT)])
+    return ReWOOAgentGraph(llm=mock_llm,
+                           planner_prompt=planner_prompt,
+                           solver_prompt=solver_prompt,
+                           tools=tools,
+                           **{
+                               "dataflow_execution": True, **kwargs
+                           })
+
+
+def _skewed_steps(num_chains: int, slow: float, fast: float) -> list[ReWOOPlanStep]:
+    """
+    Chains of two steps, where the first step is slow in even chains and the second step is slow in odd chains.
+    """
+    steps = []
+    for chain in range(num_chains):
+        first, second = (slow, fast) if chain % 2 == 0 else (fast, slow)
+        steps.append(_create_step_info("first", f"#E{2 * chain + 1}", "sleep_tool", f"{first} chain{chain}"))
+        steps.append(
+            _create_step_info("second", f"#E{2 * chain + 2}", "sleep_tool", f"{second} after #E{2 * chain + 1}"))
+    return steps
+
+
+async def _run_executor(agent: ReWOOAgentGraph, state: ReWOOGraphState) -> ReWOOGraphState:
+    """Run the executor node until the conditional edge moves on to the solver, like the graph does."""
+    while True:
+        update = await agent.executor_node(state)
+        state = state.model_copy(update=update)
+        if await agent.conditional_edge(state) == AgentDecision.END:
+            return state
+
+
+def test_rewoo_config_dataflow_execution():
+    config = ReWOOAgentWorkflowConfig(tool_names=["test_tool"], llm_name="test_llm")  # type: ignore
+    assert config.dataflow_execution is False
+    assert config.max_concurrent_tool_calls is None
+    assert config.tool_rate_limits == {}
+
+    config = ReWOOAgentWorkflowConfig(
+        tool_names=["test_tool"],
+        llm_name="test_llm",  # type: ignore
+        dataflow_execution=True,
+        max_concurrent_tool_calls=4,
+        tool_rate_limits={"test_tool": 2.5})
+    assert config.dataflow_execution is True
+    assert config.max_concurrent_tool_calls == 4
+    assert config.tool_rate_limits == {"test_tool": 2.5}
+
+
+async def test_dataflow_execution_flow(mock_llm):
+    tool = _SleepTool(calls=[])
+    agent = _create_dataflow_agent(mock_llm, [tool])
+    state = _create_mock_state_with_parallel_data(_skewed_steps(2, slow=0.3, fast=0.01))
+
+    # The whole plan is executed in a single call of the executor node
+    result = await agent.executor_node(state)
+    state = state.model_copy(update=result)
+
+    assert set(state.intermediate_results) == {"#E1", "#E2", "#E3", "#E4"}
+    assert state.intermediate_results["#E2"].content == "done 0.01 after done 0.3 chain0"
+    assert await agent.conditional_edge(state) == AgentDecision.END
+
+    # The second step of the second chain does not wait for the slow first step of the first chain
+    starts = {query: start for query, start, _ in tool.calls}
+    ends = {query: end for query, _, end in tool.calls}
+    assert starts["0.3 after done 0.01 chain1"] < ends["0.3 chain0"]
+
+
+async def test_dataflow_execution_resumes_partial_results(mock_llm):
+    tool = _SleepTool(calls=[])
+    agent = _create_dataflow_agent(mock_llm, [tool])
+    intermediate_results = {"#E1": ToolMessage(content="earlier", tool_call_id="sleep_tool")}
+    state = _create_mock_state_with_parallel_data(_skewed_steps(1, slow=0, fast=0), intermediate_results)
+
+    result = await agent.executor_node(state)
+
+    assert [query for query, _, _ in tool.calls] == ["0 after earlier"]
+    assert result["intermediate_results"]["#E1"].content == "earlier"
+
+
+async def test_dataflow_execution_concurrency_limit(mock_llm):
+    tool = _SleepTool(calls=[])
+    agent = _create_dataflow_agent(mock_llm, [tool], max_concurrent_tool_calls=2)
+    steps = [_create_step_info("step", f"#E{i}", "sleep_tool", f"0.05 step{i}") for i in range(1, 7)]
+
+    result = await agent.executor_node(_create_mock_state_with_parallel_data(steps))
+
+    assert len(result["intermediate_results"]) == 6
+    assert tool.max_active == 2
+
+
+async def test_tool_rate_limits(mock_llm, mock_tool):
+    tool = _SleepTool(calls=[])
+    agent = _create_dataflow_agent(mock_llm, [tool, mock_tool("mock_tool_A")], tool_rate_limits={"sleep_tool": 10})
+    steps = [_create_step_info("step", f"#E{i}", "sleep_tool", f"0 step{i}") for i in range(1, 5)]
+    steps.append(_create_step_info("step", "#E5", "mock_tool_A", "not limited"))
+
+    start = time.perf_counter()
+    result = await agent.executor_node(_create_mock_state_with_parallel_data(steps))
+
+    assert len(result["intermediate_results"]) == 5
+
+    # Calls of the rate limited tool are spaced at least 0.1 seconds apart
+    starts = sorted(call_start for _, call_start, _ in tool.calls)
+    assert all(b - a >= 0.09 for a, b in zip(starts, starts[1:]))
+    assert time.perf_counter() - start >= 0.29
+
+
+async def test_tool_rate_limits_with_concurrency_limit(mock_llm):
+    tool = _SleepTool(calls=[])
+    agent = _create_dataflow_agent(mock_llm, [tool], max_concurrent_tool_calls=1, tool_rate_limits={"sleep_tool": 10})
+    steps = [
+        _create_step_info("step", f"#E{i}", "sleep_tool", f"{delay} step{i}")
+        for (i, delay) in enumerate([0.25, 0, 0], 1)
+    ]
+
+    result = await agent.executor_node(_create_mock_state_with_parallel_data(steps))
+
+    assert len(result["intermediate_results"]) == 3
+
+    # The calls queued behind the slow first call are still spaced out once they get a concurrency slot
+    starts = sorted(call_start for _, call_start, _ in tool.calls)
+    assert starts[1] - starts[0] >= 0.24
+    assert starts[2] - starts[1] >= 0.09
+
+
+async def test_dataflow_execution_raise_tool_call_error(mock_llm, mock_tool):
+    from unittest.mock import AsyncMock
+
+    for raise_error_setting in [True, False]:
+        agent = _create_dataflow_agent(mock_llm, [mock_tool("failing_tool")],
+                                       raise_tool_call_error=raise_error_setting)
+        error_message = "Tool call failed after all retry attempts. Last error: Connection failed"
+        agent._call_tool = AsyncMock(
+            return_value=ToolMessage(content=error_message, tool_call_id="failing_tool", status="error"))
+
+        steps = [
+            _create_step_info("step1", "#E1", "failing_tool", "input"),
+            _create_step_info("step2", "#E2", "failing_tool", "#E1"),
+        ]
+        state = _create_mock_state_with_parallel_data(steps)
+
+        if raise_error_setting:
+            with pytest.raises(RuntimeError, match="Tool call failed"):
+                await agent.executor_node(state)
+            assert agent._call_tool.call_count == 1
+        else:
+            result = await agent.executor_node(state)
+            assert result["intermediate_results"]["#E2"].status == "error"
+            assert agent._call_tool.call_count == 2
+
+
+async def test_dataflow_execution_failure_cleans_up_steps(mock_llm, mock_tool):
+    agent = _create_dataflow_agent(mock_llm, [mock_tool("mock_tool_A")])
+    cancelled = []
+    unhandled = []
+
+    async def execute_step(placeholder: str, *args):
+        if placeholder != "#E3":
+            raise ValueError(f"{placeholder} failed")
+
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(placeholder)
+            raise
+
+    agent._execute_step = execute_step
+    asyncio.get_running_loop().set_exception_handler(lambda loop, context: unhandled.append(context))
+
+    steps = [_create_step_info("step", f"#E{i}", "mock_tool_A", f"input{i}") for i in range(1, 4)]
+
+    with pytest.raises(ValueError, match="failed"):
+        await agent.executor_node(_create_mock_state_with_parallel_data(steps))
+
+    # The running step is cancelled and finished before the executor returns
+    assert cancelled == ["#E3"]
+
+    # The error of the failed step which was not reported is consumed rather than left unretrieved
+    gc.collect()
+    await asyncio.sleep(0)
+    assert not unhandled
+
+
+@pytest.mark.slow
+@pytest.mark.benchmark
+async def test_dataflow_execution_benchmark(mock_llm):
+    steps = _skewed_steps(num_chains=4, slow=0.2, fast=0.02)
+
+    level_agent = _create_dataflow_agent(mock_llm, [_SleepTool(calls=[])], dataflow_execution=False)
+    start = time.perf_counter()
+    level_state = await _run_executor(level_agent, _create_mock_state_with_parallel_data(steps))
+    levels_elapsed = time.perf_counter() - start
+
+    dataflow_agent = _create_dataflow_agent(mock_llm, [_SleepTool(calls=[])])
+    start = time.perf_counter()
+    dataflow_state = await _run_executor(dataflow_agent, _create_mock_state_with_parallel_data(steps))
+    dataflow_elapsed = time.perf_counter() - start
+
+    assert ({k: v.content
+             for k, v in level_state.intermediate_results.items()} == {
+                 k: v.content
+                 for k, v in dataflow_state.intermediate_results.items()
+             })
+
+    print(f"\nLevel by level: {levels_elapsed * 1000:.0f} ms, dataflow: {dataflow_elapsed * 1000:.0f} ms")
+
+    assert dataflow_elapsed < levels_elapsed
@@ -1369,6 +1369,32 @@ async def test_add_telemetry_exporter():
         assert issubclass(type(exporter1_instance), BaseExporter)
 
 
+async def test_shared_telemetry_exporters():
+
+    general_config = GeneralConfig(telemetry={"shared_exporters": True})
+
+    async with WorkflowBuilder(general_config=general_config) as builder:
+
+        await builder.set_workflow(FunctionReturningFunctionConfig())
+        await builder.add_telemetry_exporter("exporter1", TTelemetryExporterConfig())
+
+        workflow = await builder.build()
+        exporter = workflow.telemetry_exporters["exporter1"]
+
+        assert workflow.exporter_manager.is_shared
+
+        for _ in range(2):
+            async with workflow.run("hi") as runner:
+                assert await runner.result(to_type=str) == "hi!"
+
+        # The exporter keeps running between runs and is not copied
+        assert exporter._running
+        assert not exporter.is_isolated_instance
+
+    # Stopped when the builder is torn down
+    assert not exporter._running
+
+
 # Error Logging Tests
 
 
@@ -29,6 +29,7 @@ from pydantic import BaseModel
 from nat.builder.builder import Builder
 from nat.builder.component_utils import ComponentInstanceData
 from nat.builder.component_utils import _component_group_order
+from nat.builder.component_utils import build_dependency_map
 from nat.builder.component_utils import build_dependency_sequence
 from nat.builder.component_utils import config_to_dependency_objects
 from nat.builder.component_utils import group_from_component
@@ -428,6 +429,40 @@ def test_build_dependency_sequence(nested_nat_config: Config):
     assert noref_instance_ids == list(noref_order.keys())
 
 
+def test_build_dependency_map(nested_nat_config: Config):
+
+    def _id(group: str, name: str | None = None) -> str:
+        if name is None:
+            return generate_instance_id(getattr(nested_nat_config, group))
+        return generate_instance_id(getattr(nested_nat_config, group)[name])
+
+    dependency_map = build_dependency_map(nested_nat_config)
+
+    # Every component is present, including ones without references
+    assert len(dependency_map) == len(build_dependency_sequence(nested_nat_config))
+    assert dependency_map[_id("functions", "leaf_fn2")] == set()
+    assert dependency_map[_id("llms", "llm0")] == set()
+
+    assert dependency_map[_id("functions", "leaf_fn0")] == {
+        _id("llms", "llm0"), _id("embedders", "embedder0"), _id("retrievers", "retriever0")
+    }
+    assert dependency_map[_id("functions", "nested_fn0")] == {
+        _id("llms", "llm0"), _id("embedders", "embedder0"), _id("functions", "leaf_fn0"), _id("functions", "nested_fn1")
+    }
+    assert dependency_map[_id("workflow")] == {
+        _id("llms", "llm0"), _id("embedders", "embedder0"), _id("functions", "leaf_fn0"), _id("functions", "nested_fn1")
+    }
+
+
+@pytest.mark.usefixtures("set_test_api_keys")
+async def test_load_hierarchial_workflow_concurrently(nested_nat_config: Config):
+
+    nested_nat_config.general.build.max_concurrency = 4
+
+    async with WorkflowBuilder.from_config(config=nested_nat_config) as workflow:
+        assert SessionManager(await workflow.build(), max_concurrency=1)
+
+
 @pytest.mark.usefixtures("set_test_api_keys")
 async def test_load_hierarchial_workflow(nested_nat_config: Config):
 
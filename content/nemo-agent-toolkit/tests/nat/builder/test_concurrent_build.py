@@ -0,0 +1,274 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import logging
+import time
+
+import pytest
+
+from nat.builder.build_report import BuildTimingReport
+from nat.builder.build_report import ComponentBuildTiming
+from nat.builder.builder import Builder
+from nat.builder.framework_enum import LLMFrameworkEnum
+from nat.builder.llm import LLMProviderInfo
+from nat.builder.workflow_builder import WorkflowBuilder
+from nat.cli.register_workflow import register_function
+from nat.cli.register_workflow import register_llm_provider
+from nat.data_models.component_ref import LLMRef
+from nat.data_models.config import ComponentBuildConfig
+from nat.data_models.config import Config
+from nat.data_models.config import GeneralConfig
+from nat.data_models.function import FunctionBaseConfig
+from nat.data_models.llm import LLMBaseConfig
+from nat.profiler.callbacks.langchain_callback_handler import LangchainProfilerHandler
+from nat.profiler.decorators.framework_wrapper import callback_handler_var
+
+# Records ("enter" | "exit", component name, task) for every component context
+_events: list[tuple[str, str, asyncio.Task | None]] = []
+_active = 0
+_max_active = 0
+
+
+class SlowLLMConfig(LLMBaseConfig, name="test_slow_llm"):
+    label: str
+    delay: float = 0.0
+    raise_error: bool = False
+
+
+class SlowFunctionConfig(FunctionBaseConfig, name="test_slow_function"):
+    label: str
+    delay: float = 0.0
+    llm_name: LLMRef | None = None
+    raise_error: bool = False
+
+
+class LangchainFunctionConfig(FunctionBaseConfig, name="test_langchain_function"):
+    delay: float = 0.0
+
+
+async def _enter(label: str, delay: float, raise_error: bool):
+    global _active, _max_active
+
+    _active += 1
+    _max_active = max(_max_active, _active)
+    try:
+        await asyncio.sleep(delay)
+    finally:
+        _active -= 1
+
+    if raise_error:
+        raise ValueError(f"{label} failed")
+
+    _events.append(("enter", label, asyncio.current_task()))
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _register():
+
+    @register_llm_provider(config_type=SlowLLMConfig)
+    async def slow_llm(config: SlowLLMConfig, b: Builder):
+        await _enter(config.label, config.delay, config.raise_error)
+        try:
+            yield LLMProviderInfo(config=config, description="A slow test LLM.")
+        finally:
+            _events.append(("exit", config.label, asyncio.current_task()))
+
+    @register_function(config_type=SlowFunctionConfig)
+    async def slow_function(config: SlowFunctionConfig, b: Builder):
+        if config.llm_name is not None:
+            b.get_llm_config(config.llm_name)
+
+        await _enter(config.label, config.delay, config.raise_error)
+
+        async def _inner(message: str) -> str:
+            return message
+
+        try:
+            yield _inner
+        finally:
+            _events.append(("exit", config.label, asyncio.current_task()))
+
+    @register_function(config_type=LangchainFunctionConfig, framework_wrappers=[LLMFrameworkEnum.LANGCHAIN])
+    async def langchain_function(config: LangchainFunctionConfig, b: Builder):
+        await asyncio.sleep(config.delay)
+
+        async def _inner(message: str) -> str:
+            return message
+
+        yield _inner
+
+
+@pytest.fixture(autouse=True)
+def _reset_events():
+    global _active, _max_active
+
+    _events.clear()
+    _active = 0
+    _max_active = 0
+
+
+def _make_config(max_concurrency: int, **components) -> Config:
+    return Config.model_validate({
+        "general": GeneralConfig(build=ComponentBuildConfig(max_concurrency=max_concurrency)),
+        "workflow": SlowFunctionConfig(label="workflow"),
+        **components,
+    })
+
+
+def _labels(kind: str) -> list[str]:
+    return [label for event, label, _ in _events if event == kind]
+
+
+async def test_independent_components_build_concurrently():
+    config = _make_config(4,
+                          llms={f"llm_{i}": SlowLLMConfig(label=f"llm_{i}", delay=0.2)
+                                for i in range(4)})
+
+    start = time.perf_counter()
+    async with WorkflowBuilder(general_config=config.general) as builder:
+        await builder.populate_builder(config)
+    elapsed = time.perf_counter() - start
+
+    assert _max_active == 4
+    assert elapsed < 0.6
+
+
+async def test_concurrency_cap_is_respected():
+    config = _make_config(2,
+                          llms={f"llm_{i}": SlowLLMConfig(label=f"llm_{i}", delay=0.05)
+                                for i in range(5)})
+
+    async with WorkflowBuilder(general_config=config.general) as builder:
+        await builder.populate_builder(config)
+
+    assert _max_active == 2
+    assert sorted(_labels("enter")) == ["llm_0", "llm_1", "llm_2", "llm_3", "llm_4", "workflow"]
+
+
+async def test_dependents_wait_for_dependencies():
+    config = _make_config(4,
+                          llms={
+                              "slow_llm": SlowLLMConfig(label="slow_llm", delay=0.1),
+                              "fast_llm": SlowLLMConfig(label="fast_llm"),
+                          },
+                          functions={
+                              "uses_slow": SlowFunctionConfig(label="uses_slow", llm_name="slow_llm"),
+                              "independent": SlowFunctionConfig(label="independent"),
+                          })
+
+    async with WorkflowBuilder(general_config=config.general) as builder:
+        await builder.populate_builder(config)
+
+        entered = _labels("enter")
+        assert entered.index("slow_llm") < entered.index("uses_slow")
+        assert entered.index("independent") < entered.index("slow_llm")
+        assert entered[-1] == "workflow"
+
+    # Dependents are torn down before their dependencies, each from the task that built it
+    exited = _labels("exit")
+    assert exited.index("uses_slow") < exited.index("slow_llm")
+    assert exited[0] == "workflow"
+
+    enter_tasks = {label: task for event, label, task in _events if event == "enter"}
+    exit_tasks = {label: task for event, label, task in _events if event == "exit"}
+    assert enter_tasks == exit_tasks
+
+
+async def test_failure_reporting_is_deterministic(caplog):
+    caplog.set_level(logging.ERROR)
+
+    # `first` comes first in the build sequence but fails after `second` does
+    config = _make_config(4,
+                          llms={
+                              "first": SlowLLMConfig(label="first", delay=0.1, raise_error=True),
+                              "second": SlowLLMConfig(label="second", raise_error=True),
+                              "ok": SlowLLMConfig(label="ok", delay=0.05),
+                          },
+                          functions={"downstream": SlowFunctionConfig(label="downstream", llm_name="ok")})
+
+    async with WorkflowBuilder(general_config=config.general) as builder:
+        with pytest.raises(ValueError, match="first failed"):
+            await builder.populate_builder(config)
+
+    log_text = caplog.text
+    assert "Failed to initialize component first (llms)" in log_text
+    assert "- ok (llms)" in log_text
+    assert "- second (llms)" in log_text
+    assert "- downstream (functions)" in log_text
+    assert "- <workflow> (workflow)" in log_text
+
+    # Nothing new is started after a failure and everything that was built is cleaned up
+    assert "downstream" not in _labels("enter")
+    assert _labels("exit") == ["ok"]
+
+
+@pytest.mark.parametrize("max_concurrency", [1, 4])
+async def test_profiler_callback_handler_survives_build(max_concurrency: int):
+    config = _make_config(max_concurrency,
+                          llms={"slow_llm": SlowLLMConfig(label="slow_llm", delay=0.05)},
+                          functions={"langchain_fn": LangchainFunctionConfig(delay=0.05)})
+
+    token = callback_handler_var.set(None)
+    try:
+        async with WorkflowBuilder(general_config=config.general) as builder:
+            await builder.populate_builder(config)
+
+            # The framework wrapper installs the handler while building the function, in the builder's context
+            assert isinstance(callback_handler_var.get(), LangchainProfilerHandler)
+    finally:
+        callback_handler_var.reset(token)
+
+
+@pytest.mark.parametrize("max_concurrency", [1, 4])
+async def test_build_report(max_concurrency: int):
+    config = _make_config(max_concurrency,
+                          llms={
+                              "slow_llm": SlowLLMConfig(label="slow_llm", delay=0.1),
+                              "fast_llm": SlowLLMConfig(label="fast_llm"),
+                          },
+                          functions={"uses_slow": SlowFunctionConfig(label="uses_slow", llm_name="slow_llm")})
+
+    async with WorkflowBuilder(general_config=config.general) as builder:
+        await builder.populate_builder(config)
+
+        report = builder.build_report
+
+    assert report is not None
+    assert {timing.label for timing in report.timings} == {
+        "slow_llm (llms)", "fast_llm (llms)", "uses_slow (functions)", "<workflow> (workflow)"
+    }
+    assert report.total_duration >= 0.1
+
+    assert [timing.label for timing in report.critical_path()
+            ] == ["slow_llm (llms)", "uses_slow (functions)", "<workflow> (workflow)"]
+
+    formatted = report.format()
+    assert "Built 4 components" in formatted
+    assert "Critical path: slow_llm (llms) -> uses_slow (functions) -> <workflow> (workflow)" in formatted
+
+
+def test_critical_path_picks_slowest_chain():
+    report = BuildTimingReport(timings=[
+        ComponentBuildTiming(name="a", component_group="llms", start=0.0, duration=1.0),
+        ComponentBuildTiming(name="b", component_group="llms", start=0.0, duration=2.0),
+        ComponentBuildTiming(name="c", component_group="functions", start=1.0, duration=2.0,
+                             dependencies=("a (llms)", )),
+        ComponentBuildTiming(name="d", component_group="functions", start=2.0, duration=0.5,
+                             dependencies=("b (llms)", )),
+    ])
+
+    assert [timing.name for timing in report.critical_path()] == ["a", "c"]
+    assert BuildTimingReport().critical_path() == []
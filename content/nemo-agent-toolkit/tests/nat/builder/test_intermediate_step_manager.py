@@ -26,8 +26,10 @@ from nat.builder.context import ContextState
 from nat.builder.intermediate_step_manager import IntermediateStepManager
 from nat.builder.intermediate_step_manager import IntermediateStepPayload
 from nat.data_models.intermediate_step import IntermediateStep
+from nat.data_models.intermediate_step import IntermediateStepRecord
 from nat.data_models.intermediate_step import IntermediateStepType
 from nat.data_models.invocation_node import InvocationNode
+from nat.utils.reactive.subject import Subject
 
 # --------------------------------------------------------------------------- #
 # Minimal stubs so the tests do not need the whole NAT code-base
@@ -321,3 +323,205 @@ async def test_async_with_task_end(mgr: IntermediateStepManager, output_steps: l
         assert child == actual.name
         assert parent is None or parent == actual.parent_id
         assert etype == actual.event_type
+
+
+def test_subscribe_with_event_types_filters_events(ctx_state: ContextState):
+    ctx_state.event_stream.set(Subject())
+    mgr = IntermediateStepManager(context_state=ctx_state)
+
+    received: list[IntermediateStep] = []
+    mgr.subscribe(received.append, event_types=[IntermediateStepType.LLM_END])
+
+    pay = _payload()
+    mgr.push_intermediate_step(pay)
+    mgr.push_intermediate_step(_payload(step_id=pay.UUID, etype=IntermediateStepType.LLM_END))
+
+    assert [step.event_type for step in received] == [IntermediateStepType.LLM_END]
+
+
+def test_lazy_payload_not_built_without_interest(ctx_state: ContextState):
+    ctx_state.event_stream.set(Subject())
+    mgr = IntermediateStepManager(context_state=ctx_state)
+
+    received: list[IntermediateStep] = []
+    subscription = mgr.subscribe(received.append, event_types=[IntermediateStepType.LLM_START])
+
+    assert mgr.is_interested(IntermediateStepType.LLM_START)
+    assert not mgr.is_interested(IntermediateStepType.FUNCTION_START)
+
+    built: list[IntermediateStepType] = []
+
+    def _factory(etype: IntermediateStepType):
+        built.append(etype)
+        return _payload(step_id="fn", etype=etype)
+
+    mgr.push_lazy_intermediate_step("fn", IntermediateStepType.FUNCTION_START, "fn",
+                                    lambda: _factory(IntermediateStepType.FUNCTION_START))
+
+    # The span bookkeeping must happen even if the payload is never built
+    assert ctx_state.active_span_id_stack.get()[-1] == "fn"
+
+    mgr.push_lazy_intermediate_step("fn", IntermediateStepType.FUNCTION_END, "fn",
+                                    lambda: _factory(IntermediateStepType.FUNCTION_END))
+
+    assert not built
+    assert not received
+    assert "fn" not in mgr._outstanding_start_steps
+
+    # Once a subscriber for all events is added, the payloads are built again
+    subscription.unsubscribe()
+    mgr.subscribe(received.append)
+
+    mgr.push_lazy_intermediate_step("fn", IntermediateStepType.FUNCTION_START, "fn",
+                                    lambda: _factory(IntermediateStepType.FUNCTION_START))
+    mgr.push_lazy_intermediate_step("fn", IntermediateStepType.FUNCTION_END, "fn",
+                                    lambda: _factory(IntermediateStepType.FUNCTION_END))
+
+    assert built == [IntermediateStepType.FUNCTION_START, IntermediateStepType.FUNCTION_END]
+    assert [step.event_type for step in received] == built
+
+
+def test_step_is_shared_by_subscribers(ctx_state: ContextState):
+    ctx_state.event_stream.set(Subject())
+    mgr = IntermediateStepManager(context_state=ctx_state)
+
+    records: list[IntermediateStepRecord] = []
+    mgr.subscribe(records.append, records=True)
+
+    pay = _payload()
+    mgr.push_intermediate_step(pay)
+
+    # Nobody asked for the step, so it is never built
+    assert isinstance(records[0], IntermediateStepRecord)
+    assert records[0].payload is pay
+    assert records[0]._step is None
+
+    first: list[IntermediateStep] = []
+    second: list[IntermediateStep] = []
+    mgr.subscribe(first.append)
+    mgr.subscribe(second.append, event_types=[IntermediateStepType.LLM_END])
+
+    mgr.push_intermediate_step(_payload(step_id=pay.UUID, etype=IntermediateStepType.LLM_END))
+
+    assert isinstance(first[0], IntermediateStep)
+    assert first[0] is second[0]
+    assert first[0] is records[1].step
+    assert first[0].parent_id == "root"
+
+
+def test_push_active_function_with_subscriber(ctx: Context, mgr: IntermediateStepManager,
+                                              output_steps: list[IntermediateStep]):
+
+    with ctx.push_active_function("my_fn", input_data="in") as manager:
+        manager.set_output("out")
+
+    assert [step.event_type for step in output_steps
+            ] == [IntermediateStepType.FUNCTION_START, IntermediateStepType.FUNCTION_END]
+    assert output_steps[0].data.input == "in"
+    assert output_steps[1].data.output == "out"
+
+
+@pytest.mark.slow
+@pytest.mark.benchmark
+def test_push_active_function_overhead_benchmark(ctx_state: ContextState):
+    """Compares the per-function-call overhead of eager step construction to the zero-subscriber fast path."""
+    import time
+
+    from nat.data_models.intermediate_step import StreamEventData
+
+    ctx_state.event_stream.set(Subject())
+    ctx = Context(ctx_state)
+    step_manager = ctx.intermediate_step_manager
+    iterations = 20_000
+
+    def _eager_call():
+        # Mirrors the previous behavior of push_active_function where payloads were always built
+        step_id = str(uuid.uuid4())
+        parent = ctx_state.active_function.get()
+        token = ctx_state.active_function.set(
+            InvocationNode(function_id=step_id,
+                           function_name="fn",
+                           parent_id=parent.function_id,
+                           parent_name=parent.function_name))
+        step_manager.push_intermediate_step(
+            IntermediateStepPayload(UUID=step_id,
+                                    event_type=IntermediateStepType.FUNCTION_START,
+                                    name="fn",
+                                    data=StreamEventData(input="x")))
+        step_manager.push_intermediate_step(
+            IntermediateStepPayload(UUID=step_id,
+                                    event_type=IntermediateStepType.FUNCTION_END,
+                                    name="fn",
+                                    data=StreamEventData(input="x", output="y")))
+        ctx_state.active_function.reset(token)
+
+    def _lazy_call():
+        with ctx.push_active_function("fn", input_data="x") as manager:
+            manager.set_output("y")
+
+    def _time(fn) -> float:
+        start = time.perf_counter()
+        for _ in range(iterations):
+            fn()
+        return (time.perf_counter() - start) / iterations * 1e6
+
+    eager_us = _time(_eager_call)
+    lazy_us = _time(_lazy_call)
+
+    print(f"\nper function call: eager={eager_us:.2f}us, lazy (no subscribers)={lazy_us:.2f}us, "
+          f"speedup={eager_us / lazy_us:.1f}x")
+
+    assert lazy_us < eager_us
+
+
+@pytest.mark.slow
+@pytest.mark.benchmark
+def test_collect_token_stream_benchmark(ctx_state: ContextState):
+    """Compares collecting a token stream as pydantic steps and as the records published on the event stream."""
+    import time
+    import tracemalloc
+
+    from nat.data_models.intermediate_step import StreamEventData
+
+    num_events = 1_000_000
+
+    def _run(count: int, records: bool) -> list:
+        ctx_state.event_stream.set(Subject())
+        mgr = IntermediateStepManager(context_state=ctx_state)
+        received = []
+        mgr.subscribe(received.append, records=records)
+
+        mgr.push_intermediate_step(_payload(step_id="llm"))
+        for _ in range(count):
+            mgr.push_intermediate_step(
+                IntermediateStepPayload(UUID="llm",
+                                        event_type=IntermediateStepType.LLM_NEW_TOKEN,
+                                        data=StreamEventData(chunk="tok")))
+        mgr.push_intermediate_step(_payload(step_id="llm", etype=IntermediateStepType.LLM_END))
+
+        return received
+
+    def _measure(records: bool) -> tuple[float, float]:
+        start = time.process_time()
+        received = _run(num_events, records)
+        cpu_time = time.process_time() - start
+        del received
+
+        # Tracing allocations is slow, measure a sample and scale it up
+        sample_size = num_events // 10
+        tracemalloc.start()
+        received = _run(sample_size, records)
+        memory, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del received
+
+        return cpu_time, memory * (num_events / sample_size)
+
+    steps_time, steps_mem = _measure(records=False)
+    records_time, records_mem = _measure(records=True)
+
+    print(f"\n{num_events} LLM_NEW_TOKEN events: IntermediateStep {steps_time:.2f}s / {steps_mem / 2**20:.0f} MiB, "
+          f"IntermediateStepRecord {records_time:.2f}s / {records_mem / 2**20:.0f} MiB")
+
+    assert records_mem < steps_mem
+    assert records_time < steps_time
@@ -0,0 +1,32 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+
+import pytest
+from click.testing import CliRunner
+
+from nat.cli.commands.info.build_timings import build_timings
+
+
+@pytest.mark.parametrize("extra_args", [[], ["--max_concurrency", "4"]])
+def test_build_timings_command(test_data_dir: str, extra_args: list[str]):
+    config_file = os.path.join(test_data_dir, "echo.yaml")
+
+    result = CliRunner().invoke(build_timings, ["--config_file", config_file, *extra_args])
+
+    assert result.exit_code == 0, result.output
+    assert "Built 1 components" in result.output
+    assert "Critical path: <workflow> (workflow)" in result.output
@@ -0,0 +1,133 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Regression tests for the import cost of the `nat` CLI. The budget for importing `nat.cli.entrypoint` can be adjusted
+with the ``NAT_CLI_IMPORT_BUDGET_MS`` environment variable.
+"""
+
+import dataclasses
+import os
+import subprocess
+import sys
+
+import pytest
+
+DEFAULT_IMPORT_BUDGET_MS = 500.0
+
+# Modules which only specific subcommands need. None of them should be imported by the base CLI.
+HEAVY_MODULES = (
+    "langchain_core",
+    "llama_index",
+    "matplotlib",
+    "nat.cli.commands.evaluate",
+    "nat.cli.commands.start",
+    "nat.eval",
+    "nat.runtime.loader",
+    "optuna",
+    "pandas",
+)
+
+
+@dataclasses.dataclass(frozen=True)
+class ImportTime:
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(stderr: str) -> list[ImportTime]:
+    """
+    Parses the output of ``python -X importtime``. Each line looks like
+    ``import time:       207 |     323355 |     aiobotocore.config`` with the nesting depth given by the indentation.
+    """
+    records = []
+
+    for line in stderr.splitlines():
+        if (not line.startswith("import time:")):
+            continue
+
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+
+        if (not self_us.strip().isdigit()):
+            continue  # Header line
+
+        records.append(
+            ImportTime(module=name.strip(),
+                       self_us=int(self_us),
+                       cumulative_us=int(cumulative_us),
+                       depth=(len(name) - len(name.lstrip()) - 1) // 2))
+
+    return records
+
+
+def format_report(records: list[ImportTime], top: int = 15) -> str:
+    lines = [f"{'cumulative ms':>14} {'self ms':>9}  module"]
+
+    for record in sorted(records, key=lambda r: r.cumulative_us, reverse=True)[:top]:
+        lines.append(f"{record.cumulative_us / 1000:14.1f} {record.self_us / 1000:9.1f}  {record.module}")
+
+    return "\n".join(lines)
+
+
+def _run_with_importtime(*args: str) -> list[ImportTime]:
+    result = subprocess.run([sys.executable, "-X", "importtime", *args],
+                            capture_output=True,
+                            text=True,
+                            check=True,
+                            timeout=120)
+
+    return parse_importtime(result.stderr)
+
+
+def test_parse_importtime():
+    stderr = ("import time: self [us] | cumulative | imported package\n"
+              "import time:       100 |        100 |     pathlib\n"
+              "import time:        50 |        150 |   importlib.metadata\n"
+              "Some other output\n")
+
+    assert parse_importtime(stderr) == [
+        ImportTime(module="pathlib", self_us=100, cumulative_us=100, depth=2),
+        ImportTime(module="importlib.metadata", self_us=50, cumulative_us=150, depth=1),
+    ]
+
+
+def test_cli_import_time_budget():
+    budget_ms = float(os.getenv("NAT_CLI_IMPORT_BUDGET_MS", DEFAULT_IMPORT_BUDGET_MS))
+
+    # Take the fastest of a few runs to reduce noise from the machine
+    best_ms = float("inf")
+    best_records = []
+
+    for _ in range(3):
+        records = _run_with_importtime("-c", "import nat.cli.entrypoint")
+        entrypoint = next(r for r in records if r.module == "nat.cli.entrypoint")
+
+        if (entrypoint.cumulative_us / 1000 < best_ms):
+            best_ms = entrypoint.cumulative_us / 1000
+            best_records = records
+
+    assert best_ms <= budget_ms, (f"Importing nat.cli.entrypoint took {best_ms:.1f} ms, which exceeds the budget of "
+                                  f"{budget_ms:.1f} ms:\n{format_report(best_records)}")
+
+
+@pytest.mark.parametrize("cli_args", [["--version"], ["info", "--help"]], ids=" ".join)
+def test_cli_does_not_import_heavy_modules(cli_args: list[str]):
+    records = _run_with_importtime("-m", "nat.cli.main", *cli_args)
+
+    imported = {record.module for record in records}
+    heavy = sorted(m for m in imported if any(m == h or m.startswith(f"{h}.") for h in HEAVY_MODULES))
+
+    assert not heavy, f"`nat {' '.join(cli_args)}` imported {heavy}:\n{format_report(records)}"
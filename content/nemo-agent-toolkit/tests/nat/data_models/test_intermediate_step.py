@@ -0,0 +1,82 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+
+import pytest
+
+from nat.data_models.intermediate_step import IntermediateStep
+from nat.data_models.intermediate_step import IntermediateStepCategory
+from nat.data_models.intermediate_step import IntermediateStepPayload
+from nat.data_models.intermediate_step import IntermediateStepRecord
+from nat.data_models.intermediate_step import IntermediateStepState
+from nat.data_models.intermediate_step import IntermediateStepType
+from nat.data_models.intermediate_step import StreamEventData
+from nat.data_models.intermediate_step import as_intermediate_step
+from nat.data_models.intermediate_step import event_timestamp_now
+from nat.data_models.invocation_node import InvocationNode
+
+
+@pytest.mark.parametrize("event_type", list(IntermediateStepType))
+def test_event_category_and_state(event_type: IntermediateStepType):
+    payload = IntermediateStepPayload(event_type=event_type)
+
+    category = event_type.value.split("_")[0]
+    state = event_type.value.rsplit("_")[-1]
+    expected_category = IntermediateStepCategory(category)
+    expected_state = {
+        "START": IntermediateStepState.START, "END": IntermediateStepState.END
+    }.get(state, IntermediateStepState.CHUNK)
+
+    assert payload.event_category == expected_category
+    assert payload.event_state == expected_state
+
+
+def test_event_timestamp_is_monotonic():
+    before = time.time()
+    timestamps = [IntermediateStepPayload(event_type=IntermediateStepType.LLM_NEW_TOKEN).event_timestamp
+                  for _ in range(1000)]
+    after = time.time()
+
+    assert timestamps == sorted(timestamps)
+    # Allow for a small amount of drift between the monotonic and wall clocks
+    assert before - 1 <= timestamps[0] <= timestamps[-1] <= after + 1
+    assert abs(event_timestamp_now() - time.time()) < 1
+
+
+def test_record_builds_step_once():
+    payload = IntermediateStepPayload(event_type=IntermediateStepType.LLM_NEW_TOKEN,
+                                      name="llm",
+                                      data=StreamEventData(chunk="tok"))
+    ancestry = InvocationNode(function_id="fn", function_name="fn")
+
+    record = IntermediateStepRecord("root", ancestry, payload)
+
+    assert record.event_type == IntermediateStepType.LLM_NEW_TOKEN
+    assert record.event_state == IntermediateStepState.CHUNK
+    assert record.event_category == IntermediateStepCategory.LLM
+    assert record.event_timestamp == payload.event_timestamp
+    assert record.name == "llm"
+    assert record.UUID == payload.UUID
+    assert record._step is None
+
+    step = record.step
+
+    assert step == IntermediateStep(parent_id="root", function_ancestry=ancestry, payload=payload)
+    assert step.payload is payload
+    assert record.step is step
+    assert as_intermediate_step(record) is step
+    assert as_intermediate_step(step) is step
+    assert IntermediateStepRecord.from_intermediate_step(step).step is step
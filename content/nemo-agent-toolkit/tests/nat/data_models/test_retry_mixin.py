@@ -0,0 +1,148 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+
+import pytest
+from pydantic import ValidationError
+
+from nat.data_models.retry_mixin import RetryMixin
+from nat.utils.exception_handlers import automatic_retries as ar
+
+
+class TestRetryMixin:
+    """Tests for the retry policy objects built from RetryMixin fields."""
+
+    def test_defaults(self):
+
+        class Model(RetryMixin):
+            pass
+
+        m = Model()
+        assert isinstance(m.backoff_strategy, ar.ExponentialBackoff)
+        assert m.backoff_strategy.jitter is False
+        assert m.backoff_strategy.max_delay is None
+        assert m.retry_budget is None
+        assert m.circuit_breaker is None
+
+    @pytest.mark.parametrize("retry_backoff,expected_type", [("exponential", ar.ExponentialBackoff),
+                                                             ("full_jitter", ar.ExponentialBackoff),
+                                                             ("decorrelated_jitter", ar.DecorrelatedJitterBackoff)])
+    def test_backoff_strategy(self, retry_backoff: str, expected_type: type):
+
+        class Model(RetryMixin):
+            pass
+
+        m = Model(retry_backoff=retry_backoff, retry_base_delay=0.5, retry_max_delay=4.0)
+        strategy = m.backoff_strategy
+        assert isinstance(strategy, expected_type)
+        assert strategy.base_delay == 0.5
+        assert strategy.max_delay == 4.0
+        if isinstance(strategy, ar.ExponentialBackoff):
+            assert strategy.jitter is (retry_backoff == "full_jitter")
+
+    def test_decorrelated_jitter_default_max_delay(self):
+
+        class Model(RetryMixin):
+            pass
+
+        assert Model(retry_backoff="decorrelated_jitter").backoff_strategy.max_delay == 20.0
+
+    def test_retry_budget_is_shared(self):
+
+        class Model(RetryMixin):
+            pass
+
+        budget = Model(use_retry_budget=True).retry_budget
+        assert budget is ar.get_global_retry_budget()
+        assert Model(use_retry_budget=True).retry_budget is budget
+
+    def test_circuit_breaker_shared_by_config_class(self):
+
+        class RetryMixinBreakerModel(RetryMixin):
+            pass
+
+        m = RetryMixinBreakerModel(circuit_breaker_threshold=3, circuit_breaker_recovery_timeout=5.0)
+        breaker = m.circuit_breaker
+        assert breaker.name == "RetryMixinBreakerModel"
+        assert breaker.failure_threshold == 3
+        assert breaker.recovery_timeout == 5.0
+        assert RetryMixinBreakerModel(circuit_breaker_threshold=3,
+                                      circuit_breaker_recovery_timeout=5.0).circuit_breaker is breaker
+        assert "RetryMixinBreakerModel" in ar.get_retry_stats()["circuit_breakers"]
+
+        named = RetryMixinBreakerModel(circuit_breaker_threshold=3, circuit_breaker_name="retry-mixin-endpoint")
+        assert named.circuit_breaker is not breaker
+        assert named.circuit_breaker.name == "retry-mixin-endpoint"
+
+    def test_circuit_breaker_per_endpoint(self):
+
+        class RetryMixinEndpointModel(RetryMixin):
+            base_url: str | None = None
+            model_name: str
+
+        a = RetryMixinEndpointModel(base_url="http://a", model_name="m1", circuit_breaker_threshold=3)
+        assert a.circuit_breaker.name == "RetryMixinEndpointModel(http://a, m1)"
+        assert RetryMixinEndpointModel(base_url="http://a", model_name="m1",
+                                       circuit_breaker_threshold=3).circuit_breaker is a.circuit_breaker
+
+        b = RetryMixinEndpointModel(base_url="http://b", model_name="m1", circuit_breaker_threshold=3)
+        c = RetryMixinEndpointModel(base_url="http://a", model_name="m2", circuit_breaker_threshold=3)
+        d = RetryMixinEndpointModel(model_name="m1", circuit_breaker_threshold=3)
+        breakers = {id(m.circuit_breaker) for m in (a, b, c, d)}
+        assert len(breakers) == 4
+        assert d.circuit_breaker.name == "RetryMixinEndpointModel(m1)"
+
+    def test_circuit_breaker_with_different_settings_warns(self, caplog):
+
+        class Model(RetryMixin):
+            pass
+
+        breaker = Model(circuit_breaker_threshold=3, circuit_breaker_name="retry-mixin-settings").circuit_breaker
+        with caplog.at_level(logging.WARNING):
+            assert Model(circuit_breaker_threshold=3,
+                         circuit_breaker_name="retry-mixin-settings").circuit_breaker is breaker
+            assert "already exists" not in caplog.text
+
+            other = Model(circuit_breaker_threshold=10, circuit_breaker_name="retry-mixin-settings").circuit_breaker
+
+        assert other is breaker
+        assert breaker.failure_threshold == 3
+        assert "retry-mixin-settings already exists" in caplog.text
+        assert "failure_threshold" in caplog.text
+
+    def test_retry_fields_excluded_from_dump(self):
+
+        class Model(RetryMixin):
+            pass
+
+        assert Model(retry_backoff="full_jitter", circuit_breaker_threshold=3).model_dump() == {}
+
+    @pytest.mark.parametrize("field", ["retry_base_delay", "retry_max_delay", "circuit_breaker_threshold"])
+    def test_rejects_non_positive_values(self, field: str):
+
+        class Model(RetryMixin):
+            pass
+
+        with pytest.raises(ValidationError):
+            Model(**{field: 0})
+
+    def test_invalid_backoff(self):
+
+        class Model(RetryMixin):
+            pass
+
+        with pytest.raises(ValidationError):
+            Model(retry_backoff="linear")
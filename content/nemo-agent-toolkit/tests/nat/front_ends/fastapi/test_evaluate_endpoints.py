@@ -187,6 +187,31 @@ async def test_get_jobs_by_status(test_client: TestClient, eval_config_file: str
         assert all(job["status"] == "submitted" for job in data)
 
 
+@pytest.mark.asyncio
+async def test_get_jobs_paginated(test_client: TestClient, eval_config_file: str):
+    """Test paging through jobs using the limit parameter and the X-Next-Cursor header."""
+    for i in range(3):
+        create_job(test_client, eval_config_file, job_id=f"job-{i}")
+        await await_job(f"job-{i}")
+
+    response = test_client.get("/evaluate/jobs?limit=2")
+    assert response.status_code == 200
+    assert [job["job_id"] for job in response.json()] == ["job-2", "job-1"]
+
+    cursor = response.headers["X-Next-Cursor"]
+    response = test_client.get("/evaluate/jobs", params={"limit": 2, "cursor": cursor})
+    assert response.status_code == 200
+    assert [job["job_id"] for job in response.json()] == ["job-0"]
+    assert "X-Next-Cursor" not in response.headers
+
+
+@pytest.mark.parametrize("query", ["cursor=invalid", "status=invalid"])
+def test_get_jobs_invalid_query(test_client: TestClient, query: str):
+    """Test an invalid cursor or status is rejected."""
+    response = test_client.get(f"/evaluate/jobs?{query}")
+    assert response.status_code == 400
+
+
 @pytest.mark.asyncio
 async def test_create_job_with_reps(test_client: TestClient, eval_config_file: str):
     """Test creating a new evaluation job with custom repetitions."""
@@ -31,6 +31,7 @@ from nat.data_models.config import GeneralConfig
 from nat.front_ends.fastapi.fastapi_front_end_config import FastApiFrontEndConfig
 from nat.front_ends.fastapi.fastapi_front_end_plugin_worker import FastApiFrontEndPluginWorker
 from nat.object_store.in_memory_object_store import InMemoryObjectStoreConfig
+from nat.object_store.local_file_object_store import LocalFileObjectStoreConfig
 from nat.test.functions import EchoFunctionConfig
 from nat.test.functions import StreamingEchoFunctionConfig
 from nat.test.utils import build_nat_client
@@ -164,6 +165,20 @@ async def test_custom_endpoint():
         assert response.json() == {"message": "This is a custom route"}
 
 
+async def test_retry_stats_endpoint():
+
+    config = Config(
+        general=GeneralConfig(front_end=FastApiFrontEndConfig()),
+        workflow=EchoFunctionConfig(),
+    )
+
+    async with build_nat_client(config) as client:
+        response = await client.get("/retry/stats")
+
+        assert response.status_code == 200
+        assert set(response.json()) == {"retry_budget", "circuit_breakers"}
+
+
 async def test_specified_endpoints():
 
     config = Config(
@@ -274,6 +289,38 @@ async def test_async_job_status_not_found():
         assert response.status_code == 404
 
 
+async def test_async_job_status_events():
+    front_end_config = FastApiFrontEndConfig()
+
+    config = Config(
+        general=GeneralConfig(front_end=front_end_config),
+        workflow=EchoFunctionConfig(use_openai_api=False),
+    )
+
+    job_id = "test_async_job_status_events"
+    workflow_path = f"{front_end_config.workflow.path}/async"
+
+    async with build_nat_client(config) as client:
+        response = await client.post(workflow_path, json={"message": "Hello", "job_id": job_id})
+        assert response.status_code == 202
+
+        # The stream ends once the job has finished
+        events = []
+        async with aconnect_sse(client, "GET", f"{workflow_path}/job/{job_id}/events", timeout=30) as event_source:
+            async for sse in event_source.aiter_sse():
+                assert sse.event == "status"
+                events.append(sse.json())
+
+            assert event_source.response.status_code == 200
+
+        assert all(event["job_id"] == job_id for event in events)
+        assert events[-1]["status"] == "success"
+        assert events[-1]["output"] == {"value": "Hello"}
+
+        response = await client.get(f"{workflow_path}/job/non_existent_job/events")
+        assert response.status_code == 404
+
+
 async def test_static_file_endpoints():
     # Configure the in-memory object store
     object_store_name = "test_store"
@@ -335,3 +382,70 @@ async def test_static_file_endpoints():
         # GET: Should now 404
         response = await client.get(f"/static/{file_path}")
         assert response.status_code == 404
+
+
+@pytest.mark.parametrize("store_type", ["in_memory", "local_file"])
+async def test_static_file_range_and_conditional_requests(store_type: str, tmp_path):
+    object_store_name = "test_store"
+    file_path = "folder/data.bin"
+    file_content = bytes(range(256)) * 4096
+
+    if store_type == "in_memory":
+        object_store_config = InMemoryObjectStoreConfig()
+    else:
+        object_store_config = LocalFileObjectStoreConfig(base_path=str(tmp_path))
+
+    config = Config(
+        general=GeneralConfig(front_end=FastApiFrontEndConfig(object_store=object_store_name)),
+        object_stores={object_store_name: object_store_config},
+        workflow=EchoFunctionConfig(),  # Dummy workflow, not used here
+    )
+
+    async with build_nat_client(config) as client:
+        response = await client.post(
+            f"/static/{file_path}",
+            files={"file": ("data.bin", io.BytesIO(file_content), "application/octet-stream")},
+        )
+        assert response.status_code == 200
+
+        response = await client.get(f"/static/{file_path}")
+        assert response.status_code == 200
+        assert response.content == file_content
+        assert response.headers["content-length"] == str(len(file_content))
+        assert response.headers["accept-ranges"] == "bytes"
+        etag = response.headers["etag"]
+
+        # Byte ranges
+        response = await client.get(f"/static/{file_path}", headers={"Range": "bytes=1000-1999"})
+        assert response.status_code == 206
+        assert response.content == file_content[1000:2000]
+        assert response.headers["content-range"] == f"bytes 1000-1999/{len(file_content)}"
+
+        response = await client.get(f"/static/{file_path}", headers={"Range": "bytes=-100"})
+        assert response.status_code == 206
+        assert response.content == file_content[-100:]
+
+        response = await client.get(f"/static/{file_path}", headers={"Range": f"bytes={len(file_content)}-"})
+        assert response.status_code == 416
+        assert response.headers["content-range"] == f"bytes */{len(file_content)}"
+
+        # A range is only sent if the file has not changed since the client's copy
+        response = await client.get(f"/static/{file_path}", headers={"Range": "bytes=0-9", "If-Range": '"old"'})
+        assert response.status_code == 200
+        assert response.content == file_content
+
+        # Conditional requests
+        response = await client.get(f"/static/{file_path}", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+
+        response = await client.put(
+            f"/static/{file_path}",
+            files={"file": ("data.bin", io.BytesIO(b"Updated content!"), "application/octet-stream")},
+        )
+        assert response.status_code == 200
+
+        response = await client.get(f"/static/{file_path}", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.content == b"Updated content!"
+        assert response.headers["etag"] != etag
@@ -0,0 +1,274 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import time
+import typing
+from datetime import UTC
+from datetime import datetime
+from datetime import timedelta
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+
+if typing.TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine
+
+    from nat.front_ends.fastapi.job_store import JobStore
+
+
+@pytest_asyncio.fixture(name="job_store")
+async def job_store_fixture(setup_db, db_engine: "AsyncEngine", dask_scheduler_address: str) -> "JobStore":
+    from nat.front_ends.fastapi.job_store import JobStore
+
+    return JobStore(scheduler_address=dask_scheduler_address, db_engine=db_engine)
+
+
+async def _update_status_from_other_process(db_engine: "AsyncEngine",
+                                            job_id: str,
+                                            status: str,
+                                            clock_skew: timedelta = timedelta()):
+    """Update a job without going through JobStore, so that only the poller can find the change."""
+    from sqlalchemy import update
+
+    from nat.front_ends.fastapi.job_store import JobInfo
+
+    async with db_engine.begin() as conn:
+        await conn.execute(
+            update(JobInfo).where(JobInfo.job_id == job_id).values(status=status,
+                                                                   updated_at=datetime.now(UTC) - clock_skew))
+
+
+async def _collect(updates: typing.AsyncGenerator) -> list[str]:
+    return [job.status for job in [job async for job in updates] if job is not None]
+
+
+async def test_watch_in_process_changes(job_store: "JobStore"):
+    """Test status changes committed by a JobStore in this process are delivered without polling."""
+    from nat.front_ends.fastapi.job_status_hub import JobStatusHub
+    from nat.front_ends.fastapi.job_store import JobStatus
+
+    hub = JobStatusHub(job_store, poll_interval=None)
+    job_id = await job_store._create_job()
+
+    watcher = asyncio.create_task(_collect(hub.watch(job_id)))
+    await asyncio.sleep(0.1)
+
+    await job_store.update_status(job_id, JobStatus.RUNNING)
+    await asyncio.sleep(0.1)
+    await job_store.update_status(job_id, JobStatus.SUCCESS, output={"value": "done"})
+
+    assert await asyncio.wait_for(watcher, timeout=5) == ["submitted", "running", "success"]
+    assert hub.get_stats()["watchers"] == 0
+
+    await hub.close()
+
+
+async def test_watch_other_process_changes(job_store: "JobStore", db_engine: "AsyncEngine"):
+    """Test status changes committed by other processes are found by the poller."""
+    from nat.front_ends.fastapi.job_status_hub import JobStatusHub
+
+    hub = JobStatusHub(job_store, poll_interval=0.1)
+    job_id = await job_store._create_job()
+
+    watchers = [asyncio.create_task(_collect(hub.watch(job_id))) for _ in range(10)]
+    await asyncio.sleep(0.1)
+
+    await _update_status_from_other_process(db_engine, job_id, "running")
+    await asyncio.sleep(0.5)
+    await _update_status_from_other_process(db_engine, job_id, "failure")
+
+    for watcher in watchers:
+        assert await asyncio.wait_for(watcher, timeout=5) == ["submitted", "running", "failure"]
+
+    # One query per poll, not per watcher
+    assert hub.get_stats()["queries"] < 20
+
+    await hub.close()
+
+
+async def test_watch_reloads_changes_missed_by_poller(job_store: "JobStore", db_engine: "AsyncEngine"):
+    """Test a change from a worker whose clock is behind, which the poller cannot find, is found by reloading the job."""
+    from nat.front_ends.fastapi.job_status_hub import JobStatusHub
+
+    hub = JobStatusHub(job_store, poll_interval=0.1, refresh_interval=0.5)
+    job_id = await job_store._create_job()
+
+    watcher = asyncio.create_task(_collect(hub.watch(job_id, heartbeat_interval=0.2)))
+    await asyncio.sleep(0.1)
+
+    await _update_status_from_other_process(db_engine, job_id, "success", clock_skew=timedelta(minutes=5))
+
+    assert await asyncio.wait_for(watcher, timeout=5) == ["submitted", "success"]
+
+    await hub.close()
+
+
+async def test_watch_finished_and_missing_jobs(job_store: "JobStore"):
+    """Test watching a finished job yields it once, and watching an unknown job yields nothing."""
+    from nat.front_ends.fastapi.job_status_hub import JobStatusHub
+    from nat.front_ends.fastapi.job_store import JobStatus
+
+    hub = JobStatusHub(job_store)
+    job_id = await job_store._create_job()
+    await job_store.update_status(job_id, JobStatus.INTERRUPTED)
+
+    assert await _collect(hub.watch(job_id)) == ["interrupted"]
+    assert await _collect(hub.watch("unknown-job")) == []
+
+    await hub.close()
+
+
+async def test_watch_heartbeat_and_close(job_store: "JobStore"):
+    """Test heartbeats are yielded while nothing changes, and closing the hub ends the watch."""
+    from nat.front_ends.fastapi.job_status_hub import JobStatusHub
+
+    hub = JobStatusHub(job_store, poll_interval=None)
+    job_id = await job_store._create_job()
+
+    updates = hub.watch(job_id, heartbeat_interval=0.05)
+    assert (await anext(updates)).status == "submitted"
+    assert await anext(updates) is None
+
+    await hub.close()
+    assert await _collect(updates) == []
+
+
+async def _create_jobs(db_engine: "AsyncEngine", num_jobs: int) -> list[str]:
+    from sqlalchemy import insert
+
+    from nat.front_ends.fastapi.job_store import JobInfo
+
+    now = datetime.now(UTC)
+    job_ids = [str(uuid4()) for _ in range(num_jobs)]
+    async with db_engine.begin() as conn:
+        await conn.execute(insert(JobInfo), [{
+            "job_id": job_id,
+            "status": "running",
+            "created_at": now,
+            "updated_at": now,
+            "expiry_seconds": 3600,
+            "is_expired": False,
+        } for job_id in job_ids])
+
+    return job_ids
+
+
+async def _measure_waiting_clients(writer_engine: "AsyncEngine",
+                                   job_ids: list[str],
+                                   wait_fn: typing.Callable[[str, typing.Callable[[], None]], typing.Awaitable[None]],
+                                   query_counter: typing.Callable[[], int],
+                                   duration: float) -> dict[str, float]:
+    """
+    Finish the jobs from another engine, standing in for a Dask worker process, over `duration` seconds while a client
+    waits on each of them. Measures the queries made by the clients and the notification latency.
+    """
+    finished_at = {}
+    received_at = {}
+    all_started = asyncio.Event()
+    num_started = 0
+
+    def _started():
+        nonlocal num_started
+        num_started += 1
+        if num_started == len(job_ids):
+            all_started.set()
+
+    async def _client(job_id: str):
+        await wait_fn(job_id, _started)
+        received_at[job_id] = time.perf_counter()
+
+    clients = [asyncio.create_task(_client(job_id)) for job_id in job_ids]
+
+    # Wait until every client has loaded the initial status of its job
+    start = time.perf_counter()
+    await all_started.wait()
+    startup_time = time.perf_counter() - start
+
+    start_queries = query_counter()
+    start = time.perf_counter()
+
+    batch_size = 50
+    for (i, batch_start) in enumerate(range(0, len(job_ids), batch_size)):
+        await asyncio.sleep(max(0, start + i * duration * batch_size / len(job_ids) - time.perf_counter()))
+        for job_id in job_ids[batch_start:batch_start + batch_size]:
+            await _update_status_from_other_process(writer_engine, job_id, "success")
+            finished_at[job_id] = time.perf_counter()
+
+    await asyncio.wait_for(asyncio.gather(*clients), timeout=300)
+    elapsed = time.perf_counter() - start
+
+    latencies = sorted(received_at[job_id] - finished_at[job_id] for job_id in job_ids)
+    return {
+        "startup_s": startup_time,
+        "qps": (query_counter() - start_queries) / elapsed,
+        "p50_ms": latencies[len(latencies) // 2] * 1000,
+        "p99_ms": latencies[int(len(latencies) * 0.99)] * 1000,
+    }
+
+
+@pytest.mark.slow
+@pytest.mark.benchmark
+async def test_job_status_hub_benchmark(job_store: "JobStore", db_engine: "AsyncEngine"):
+    """Compare 5k clients polling their job every second against 5k clients watching their job through the hub."""
+    from sqlalchemy import event
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    from nat.front_ends.fastapi.job_status_hub import JobStatusHub
+
+    num_clients = 5000
+    poll_interval = 1.0
+
+    queries = 0
+
+    def _count_query(*_):
+        nonlocal queries
+        queries += 1
+
+    writer_engine = create_async_engine(db_engine.url)
+    event.listen(db_engine.sync_engine, "before_cursor_execute", _count_query)
+
+    async def _poll(job_id: str, started: typing.Callable[[], None]):
+        while (await job_store.get_status(job_id)) != "success":
+            if started is not None:
+                started()
+                started = None
+            await asyncio.sleep(poll_interval)
+
+    job_ids = await _create_jobs(writer_engine, num_clients)
+    polling = await _measure_waiting_clients(writer_engine, job_ids, _poll, lambda: queries, duration=5)
+
+    hub = JobStatusHub(job_store, poll_interval=poll_interval)
+
+    async def _watch(job_id: str, started: typing.Callable[[], None]):
+        async for _ in hub.watch(job_id):
+            if started is not None:
+                started()
+                started = None
+
+    job_ids = await _create_jobs(writer_engine, num_clients)
+    watching = await _measure_waiting_clients(writer_engine, job_ids, _watch, lambda: queries, duration=5)
+    await hub.close()
+
+    event.remove(db_engine.sync_engine, "before_cursor_execute", _count_query)
+    await writer_engine.dispose()
+
+    for (name, result) in (("Polling", polling), ("Job status hub", watching)):
+        print(f"\n{name}: {result['startup_s']:.1f} s until every client has the initial status, then "
+              f"{result['qps']:.0f} database queries/s, notification latency p50 {result['p50_ms']:.0f} ms, "
+              f"p99 {result['p99_ms']:.0f} ms")
+
+    assert watching["qps"] < polling["qps"] / 10
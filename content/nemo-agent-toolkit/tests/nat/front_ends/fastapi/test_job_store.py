@@ -416,6 +416,76 @@ async def test_get_all_jobs_multiple(db_engine: "AsyncEngine", dask_scheduler_ad
     assert job_ids == {job_id1, job_id2, job_id3}
 
 
+@pytest.mark.usefixtures("setup_db")
+@pytest.mark.asyncio
+async def test_get_jobs_pagination(db_engine: "AsyncEngine", dask_scheduler_address: str):
+    """Test paging through jobs with a cursor returns every job once, most recent first."""
+    from nat.front_ends.fastapi.job_store import JobStore
+
+    job_store = JobStore(scheduler_address=dask_scheduler_address, db_engine=db_engine)
+
+    job_ids = [await job_store._create_job() for _ in range(5)]
+
+    page = await job_store.get_jobs(limit=2)
+    pages = [page]
+    while page.next_cursor is not None:
+        page = await job_store.get_jobs(limit=2, cursor=page.next_cursor)
+        pages.append(page)
+
+    assert [len(page.jobs) for page in pages] == [2, 2, 1]
+    assert [job.job_id for page in pages for job in page.jobs] == list(reversed(job_ids))
+
+    # Without a limit every job is returned
+    page = await job_store.get_jobs(limit=None)
+    assert len(page.jobs) == 5
+    assert page.next_cursor is None
+
+
+@pytest.mark.usefixtures("setup_db")
+@pytest.mark.asyncio
+async def test_get_jobs_filters(db_engine: "AsyncEngine", dask_scheduler_address: str):
+    """Test filtering jobs by status and creation time."""
+    from nat.front_ends.fastapi.job_store import JobStatus
+    from nat.front_ends.fastapi.job_store import JobStore
+
+    job_store = JobStore(scheduler_address=dask_scheduler_address, db_engine=db_engine)
+
+    job_id1 = await job_store._create_job()
+    job_id2 = await job_store._create_job()
+    job_id3 = await job_store._create_job()
+
+    await job_store.update_status(job_id1, JobStatus.SUCCESS)
+    await job_store.update_status(job_id2, JobStatus.FAILURE)
+
+    page = await job_store.get_jobs(JobStatus.SUCCESS)
+    assert [job.job_id for job in page.jobs] == [job_id1]
+
+    page = await job_store.get_jobs([JobStatus.SUCCESS, "failure"])
+    assert [job.job_id for job in page.jobs] == [job_id2, job_id1]
+
+    job2 = await job_store.get_job(job_id2)
+    page = await job_store.get_jobs(created_after=job2.created_at)
+    assert [job.job_id for job in page.jobs] == [job_id3, job_id2]
+
+    page = await job_store.get_jobs(created_before=job2.created_at)
+    assert [job.job_id for job in page.jobs] == [job_id1]
+
+
+@pytest.mark.usefixtures("setup_db")
+@pytest.mark.asyncio
+async def test_get_jobs_invalid_arguments(db_engine: "AsyncEngine", dask_scheduler_address: str):
+    """Test get_jobs rejects invalid limits and cursors."""
+    from nat.front_ends.fastapi.job_store import JobStore
+
+    job_store = JobStore(scheduler_address=dask_scheduler_address, db_engine=db_engine)
+
+    with pytest.raises(ValueError, match="limit must be at least 1"):
+        await job_store.get_jobs(limit=0)
+
+    with pytest.raises(ValueError, match="Invalid job cursor"):
+        await job_store.get_jobs(cursor="not-a-cursor")
+
+
 @pytest.mark.usefixtures("setup_db")
 @pytest.mark.asyncio
 async def test_get_last_job_empty(db_engine: "AsyncEngine", dask_scheduler_address: str):
@@ -664,6 +734,136 @@ async def test_cleanup_expired_jobs_keeps_active(db_engine: "AsyncEngine",
         assert job3.is_expired is False  # last job is not expired
 
 
+@pytest.mark.usefixtures("setup_db")
+@pytest.mark.asyncio
+async def test_cleanup_expired_jobs_in_batches(db_engine: "AsyncEngine",
+                                               dask_scheduler_address: str,
+                                               tmp_path: Path,
+                                               monkeypatch: pytest.MonkeyPatch):
+    """Test cleanup expires every expired job when the candidates span several batches."""
+    from nat.front_ends.fastapi.job_store import JobStatus
+    from nat.front_ends.fastapi.job_store import JobStore
+
+    with monkeypatch.context() as monkey_context:
+        # Lower minimum expiry for testing
+        monkey_context.setattr(JobStore, "MIN_EXPIRY", 1, raising=True)
+
+        job_store = JobStore(scheduler_address=dask_scheduler_address, db_engine=db_engine)
+
+        output_files = []
+        job_ids = []
+        for i in range(7):
+            output_file = tmp_path / f"output_{i}.json"
+            output_file.write_text("{}")
+            output_files.append(output_file)
+
+            job_id = await job_store._create_job(expiry_seconds=1)
+            await job_store.update_status(job_id, JobStatus.SUCCESS, output_path=str(output_file))
+            job_ids.append(job_id)
+
+        await asyncio.sleep(2)
+
+        num_expired = await job_store.cleanup_expired_jobs(batch_size=2, max_concurrency=2, variable_timeout=0.1)
+        assert num_expired == 6
+
+        for (job_id, output_file) in zip(job_ids[:-1], output_files[:-1]):
+            assert (await job_store.get_job(job_id)).is_expired
+            assert not output_file.exists()
+
+        # Most recent job is kept
+        assert (await job_store.get_job(job_ids[-1])).is_expired is False
+        assert output_files[-1].exists()
+
+        # Nothing left to expire
+        assert await job_store.cleanup_expired_jobs(batch_size=2, variable_timeout=0.1) == 0
+
+
+@pytest.mark.usefixtures("setup_db")
+@pytest.mark.asyncio
+async def test_expiry_task(db_engine: "AsyncEngine", dask_scheduler_address: str, monkeypatch: pytest.MonkeyPatch):
+    """Test the background expiry task periodically expires jobs until it is stopped."""
+    from nat.front_ends.fastapi.job_store import JobStatus
+    from nat.front_ends.fastapi.job_store import JobStore
+
+    with monkeypatch.context() as monkey_context:
+        # Lower minimum expiry for testing
+        monkey_context.setattr(JobStore, "MIN_EXPIRY", 1, raising=True)
+
+        job_store = JobStore(scheduler_address=dask_scheduler_address, db_engine=db_engine)
+
+        job_id1 = await job_store._create_job(expiry_seconds=1)
+        job_id2 = await job_store._create_job(expiry_seconds=1)
+        await job_store.update_status(job_id1, JobStatus.SUCCESS)
+        await job_store.update_status(job_id2, JobStatus.SUCCESS)
+
+        task = job_store.start_expiry_task(interval=0.5, variable_timeout=0.1)
+        assert job_store.start_expiry_task(interval=0.5) is task
+
+        try:
+            for _ in range(50):
+                await asyncio.sleep(0.1)
+                if (await job_store.get_job(job_id1)).is_expired:
+                    break
+
+            assert (await job_store.get_job(job_id1)).is_expired
+            assert (await job_store.get_job(job_id2)).is_expired is False
+        finally:
+            await job_store.stop_expiry_task()
+
+        assert task.cancelled()
+
+
+@pytest.mark.usefixtures("setup_db")
+@pytest.mark.asyncio
+async def test_update_statuses(db_engine: "AsyncEngine", dask_scheduler_address: str, monkeypatch: pytest.MonkeyPatch):
+    """Test updating the status of many jobs at once."""
+    from nat.front_ends.fastapi.job_store import JobStatus
+    from nat.front_ends.fastapi.job_store import JobStore
+
+    # Exercise several UPDATE statements
+    monkeypatch.setattr(JobStore, "UPDATE_BATCH_SIZE", 2)
+
+    job_store = JobStore(scheduler_address=dask_scheduler_address, db_engine=db_engine)
+
+    job_ids = [await job_store._create_job() for _ in range(5)]
+
+    num_updated = await job_store.update_statuses(job_ids[:4] + ["unknown-job"], "interrupted", error="Shutdown")
+    assert num_updated == 4
+
+    for job_id in job_ids[:4]:
+        job = await job_store.get_job(job_id)
+        assert job.status == JobStatus.INTERRUPTED
+        assert job.error == "Shutdown"
+
+    assert (await job_store.get_status(job_ids[4])) == JobStatus.SUBMITTED
+
+
+@pytest.mark.usefixtures("setup_db")
+@pytest.mark.asyncio
+async def test_create_tables_adds_missing_indexes(db_engine: "AsyncEngine"):
+    """Test create_tables adds indexes to a job table created before they were introduced."""
+    from sqlalchemy import inspect
+
+    from nat.front_ends.fastapi.job_store import JobInfo
+    from nat.front_ends.fastapi.job_store import create_tables
+
+    # Simulate a job table from an older version
+    async with db_engine.begin() as conn:
+        for index in JobInfo.__table__.indexes:
+            await conn.run_sync(lambda sync_conn, index=index: index.drop(sync_conn))
+
+    await create_tables(db_engine)
+    # Calling it again is a no-op
+    await create_tables(db_engine)
+
+    async with db_engine.connect() as conn:
+        index_names = await conn.run_sync(
+            lambda sync_conn: {index["name"]
+                               for index in inspect(sync_conn).get_indexes("job_info")})
+
+    assert index_names == {index.name for index in JobInfo.__table__.indexes}
+
+
 def test_get_db_engine_with_url():
     """Test get_db_engine with provided URL."""
     from nat.front_ends.fastapi.job_store import get_db_engine
@@ -748,3 +948,128 @@ async def test_session_context_manager(db_engine: "AsyncEngine", dask_scheduler_
         from sqlalchemy import text
         result = await session.execute(text("SELECT 1"))
         assert result is not None
+
+
+async def _insert_synthetic_jobs(db_engine: "AsyncEngine", num_jobs: int, num_expiry_candidates: int) -> list[Path]:
+    """
+    Insert `num_jobs` finished jobs created one second apart. All but the last `2 * num_expiry_candidates` jobs are
+    already expired, half of the remaining jobs are due to expire.
+    """
+    from datetime import UTC
+    from datetime import datetime
+
+    from sqlalchemy import insert
+
+    from nat.front_ends.fastapi.job_store import JobInfo
+    from nat.front_ends.fastapi.job_store import JobStatus
+
+    statuses = [JobStatus.SUCCESS] * 7 + [JobStatus.FAILURE] * 2 + [JobStatus.INTERRUPTED]
+    start = datetime.now(UTC) - timedelta(seconds=num_jobs)
+    first_candidate = num_jobs - 2 * num_expiry_candidates
+
+    async with db_engine.begin() as conn:
+        for batch_start in range(0, num_jobs, 50000):
+            rows = []
+            for i in range(batch_start, min(batch_start + 50000, num_jobs)):
+                created_at = start + timedelta(seconds=i)
+                # The newest candidates were updated recently and are not due to expire
+                recent = i >= first_candidate + num_expiry_candidates
+                rows.append({
+                    "job_id": f"job-{i:07d}",
+                    "status": statuses[i % len(statuses)].value,
+                    "config_file": None,
+                    "error": None,
+                    "output_path": None,
+                    "created_at": created_at,
+                    "updated_at": datetime.now(UTC) if recent else created_at,
+                    "expiry_seconds": 600,
+                    "output": None,
+                    "is_expired": i < first_candidate,
+                })
+
+            await conn.execute(insert(JobInfo), rows)
+
+
+@pytest.mark.slow
+@pytest.mark.benchmark
+@pytest.mark.usefixtures("setup_db")
+@pytest.mark.asyncio
+async def test_job_store_benchmark(db_engine: "AsyncEngine", dask_scheduler_address: str):
+    """Benchmark job queries and expiry on SQLite with 1M jobs, with and without the job_info indexes."""
+    import time
+
+    from sqlalchemy import text
+
+    from nat.front_ends.fastapi.job_store import JobInfo
+    from nat.front_ends.fastapi.job_store import JobStatus
+    from nat.front_ends.fastapi.job_store import JobStore
+
+    num_jobs = 1_000_000
+    num_expiry_candidates = 1000
+
+    job_store = JobStore(scheduler_address=dask_scheduler_address, db_engine=db_engine)
+
+    start = time.perf_counter()
+    await _insert_synthetic_jobs(db_engine, num_jobs, num_expiry_candidates)
+    print(f"\nInserted {num_jobs} jobs in {time.perf_counter() - start:.1f} s")
+
+    async def _time_queries() -> dict[str, float]:
+        timings = {}
+
+        start = time.perf_counter()
+        await job_store.get_last_job()
+        timings["last job"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        page = await job_store.get_jobs(JobStatus.FAILURE, limit=100)
+        timings["first page by status"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(20):
+            page = await job_store.get_jobs(JobStatus.FAILURE, limit=100, cursor=page.next_cursor)
+        timings["next page by status"] = (time.perf_counter() - start) / 20
+
+        return timings
+
+    async def _drop_indexes():
+        async with db_engine.begin() as conn:
+            for index in JobInfo.__table__.indexes:
+                if index.name != "ix_job_info_is_expired":
+                    await conn.execute(text(f"DROP INDEX {index.name}"))
+
+    indexed = await _time_queries()
+
+    # Previously the only way to list failed jobs
+    start = time.perf_counter()
+    failed_jobs = await job_store.get_jobs_by_status(JobStatus.FAILURE)
+    all_failed_time = time.perf_counter() - start
+
+    # Measure how responsive the event loop stays while expiring jobs
+    max_lag = 0.0
+    expiring = True
+
+    async def _monitor_loop():
+        nonlocal max_lag
+        while expiring:
+            start = time.perf_counter()
+            await asyncio.sleep(0.01)
+            max_lag = max(max_lag, time.perf_counter() - start - 0.01)
+
+    monitor = asyncio.create_task(_monitor_loop())
+    start = time.perf_counter()
+    num_expired = await job_store.cleanup_expired_jobs(variable_timeout=0.05)
+    expiry_time = time.perf_counter() - start
+    expiring = False
+    await monitor
+
+    await _drop_indexes()
+    unindexed = await _time_queries()
+
+    print(f"All {len(failed_jobs)} failed jobs at once: {all_failed_time * 1000:.0f} ms")
+    for (name, elapsed) in indexed.items():
+        print(f"{name}: {elapsed * 1000:.2f} ms with indexes, {unindexed[name] * 1000:.2f} ms without")
+    print(f"Expired {num_expired} jobs in {expiry_time:.2f} s, max event loop lag {max_lag * 1000:.0f} ms")
+
+    assert num_expired == num_expiry_candidates
+    assert indexed["next page by status"] < unindexed["next page by status"]
+    assert indexed["next page by status"] < all_failed_time
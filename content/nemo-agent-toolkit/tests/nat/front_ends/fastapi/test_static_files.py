@@ -0,0 +1,256 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import os
+import time
+
+import pytest
+
+from nat.front_ends.fastapi.static_files import ZERO_COPY_SEND_EXTENSION
+from nat.front_ends.fastapi.static_files import RangeNotSatisfiableError
+from nat.front_ends.fastapi.static_files import StaticFileResponse
+from nat.front_ends.fastapi.static_files import StaticFileServer
+from nat.front_ends.fastapi.static_files import etag_matches
+from nat.front_ends.fastapi.static_files import parse_range_header
+from nat.object_store.in_memory_object_store import InMemoryObjectStore
+from nat.object_store.local_file_object_store import LocalFileObjectStore
+from nat.object_store.models import ObjectStoreItem
+
+
+@pytest.mark.parametrize("value, expected",
+                         [("bytes=0-99", (0, 100)), ("bytes=100-", (100, 1000)), ("bytes=-100", (900, 1000)),
+                          ("bytes=900-5000", (900, 1000)), ("bytes=-5000", (0, 1000)), ("bytes = 5-9", (5, 10)),
+                          ("bytes=0-9,20-29", None), ("items=0-9", None), ("bytes=9-0", None), ("bytes=a-9", None),
+                          ("bytes=", None)])
+def test_parse_range_header(value: str, expected: tuple[int, int] | None):
+    assert parse_range_header(value, 1000) == expected
+
+
+@pytest.mark.parametrize("value, size", [("bytes=1000-", 1000), ("bytes=-0", 1000), ("bytes=0-", 0), ("bytes=-5", 0)])
+def test_parse_range_header_not_satisfiable(value: str, size: int):
+    with pytest.raises(RangeNotSatisfiableError):
+        parse_range_header(value, size)
+
+
+def test_etag_matches():
+    assert etag_matches('"abc"', '"abc"')
+    assert etag_matches('W/"abc"', '"abc"')
+    assert etag_matches('"xyz", "abc"', '"abc"')
+    assert etag_matches('*', '"abc"')
+    assert not etag_matches('"xyz"', '"abc"')
+
+
+class _ASGIRecorder:
+    """Records the messages sent by an ASGI response, optionally blocking until released."""
+
+    def __init__(self, block: bool = False):
+        self.messages = []
+        self.started = asyncio.Event()
+        self.release = asyncio.Event()
+        if not block:
+            self.release.set()
+
+    async def receive(self):
+        await asyncio.Event().wait()
+
+    async def send(self, message):
+        self.messages.append(message)
+        self.started.set()
+        await self.release.wait()
+
+
+async def test_local_file_zero_copy(tmp_path):
+    """Test local files are sent with the zero copy extension when the server supports it."""
+    store = LocalFileObjectStore(base_path=str(tmp_path))
+    await store.put_object("data.bin", ObjectStoreItem(data=b"0123456789"))
+    local_path = await store.get_local_path("data.bin")
+
+    def _response():
+        return StaticFileResponse(store,
+                                  "data.bin",
+                                  start=2,
+                                  end=7,
+                                  local_path=local_path,
+                                  limiter=None,
+                                  chunk_size=2,
+                                  headers={"Content-Length": "5"})
+
+    recorder = _ASGIRecorder()
+    await _response()({"type": "http", "extensions": {ZERO_COPY_SEND_EXTENSION: {}}}, recorder.receive, recorder.send)
+
+    (start, body) = recorder.messages
+    assert start["type"] == "http.response.start"
+    assert body["type"] == ZERO_COPY_SEND_EXTENSION
+    assert (body["offset"], body["count"], body["more_body"]) == (2, 5, False)
+    assert body["file"].name == local_path
+
+    # Without the extension the file is read in chunks
+    recorder = _ASGIRecorder()
+    await _response()({"type": "http"}, recorder.receive, recorder.send)
+    assert [message["body"] for message in recorder.messages[1:]] == [b"23", b"45", b"6", b""]
+
+
+async def test_large_download_limit():
+    """Test large downloads wait for a slot while small downloads do not."""
+    store = InMemoryObjectStore()
+    await store.put_object("large.bin", ObjectStoreItem(data=b"x" * 1000))
+    await store.put_object("small.bin", ObjectStoreItem(data=b"x" * 10))
+
+    server = StaticFileServer(store, max_concurrent_large_downloads=1, large_download_threshold=100)
+
+    class _Request:
+        headers = {}
+
+    async def _download(key: str, recorder: _ASGIRecorder):
+        response = await server.get_file(key, _Request())
+        await response({"type": "http"}, recorder.receive, recorder.send)
+
+    first = _ASGIRecorder(block=True)
+    second = _ASGIRecorder()
+    small = _ASGIRecorder()
+
+    first_task = asyncio.create_task(_download("large.bin", first))
+    await first.started.wait()
+    second_task = asyncio.create_task(_download("large.bin", second))
+    await _download("small.bin", small)
+    await asyncio.sleep(0.1)
+
+    assert small.messages[-1]["more_body"] is False
+    assert not second.messages
+
+    first.release.set()
+    await asyncio.wait_for(asyncio.gather(first_task, second_task), timeout=5)
+    assert b"".join(message.get("body", b"") for message in second.messages) == b"x" * 1000
+
+
+def _rss() -> int:
+    with open("/proc/self/statm", encoding="utf-8") as statm:
+        return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+async def _measure_downloads(store, key: str, size: int, num_clients: int, buffered: bool) -> dict[str, float]:
+    """
+    Serve a file with uvicorn and download it with `num_clients` concurrent clients. Measures the throughput and the
+    peak resident memory above the memory in use before the downloads.
+    """
+    import httpx
+    import uvicorn
+    from fastapi import FastAPI
+    from fastapi import Request
+    from fastapi.responses import StreamingResponse
+
+    app = FastAPI()
+    static_file_server = StaticFileServer(store)
+
+    @app.get("/static/{file_path:path}")
+    async def get_static_file(file_path: str, request: Request):
+        if not buffered:
+            return await static_file_server.get_file(file_path, request)
+
+        # The route before files were streamed: the whole file is read and sent at once
+        file_data = await store.get_object(file_path)
+
+        async def reader():
+            yield file_data.data
+
+        return StreamingResponse(reader(), media_type=file_data.content_type)
+
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=0, log_level="warning", lifespan="off"))
+    server_task = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.01)
+    port = server.servers[0].sockets[0].getsockname()[1]
+
+    base_rss = _rss()
+    peak_rss = base_rss
+    done = False
+
+    async def _sample_rss():
+        nonlocal peak_rss
+        while not done:
+            peak_rss = max(peak_rss, _rss())
+            await asyncio.sleep(0.02)
+
+    async def _download(client: httpx.AsyncClient) -> int:
+        received = 0
+        async with client.stream("GET", f"http://127.0.0.1:{port}/static/{key}") as response:
+            async for chunk in response.aiter_raw():
+                received += len(chunk)
+        return received
+
+    sampler = asyncio.create_task(_sample_rss())
+    start = time.perf_counter()
+    async with httpx.AsyncClient(timeout=600, limits=httpx.Limits(max_connections=num_clients)) as client:
+        received = await asyncio.gather(*(_download(client) for _ in range(num_clients)))
+    elapsed = time.perf_counter() - start
+
+    done = True
+    await sampler
+    server.should_exit = True
+    await server_task
+
+    assert received == [size] * num_clients
+    return {"throughput_mb_s": size * num_clients / elapsed / 1e6, "peak_mb": (peak_rss - base_rss) / 1e6}
+
+
+@pytest.mark.slow
+@pytest.mark.benchmark
+async def test_static_file_benchmark(tmp_path):
+    """
+    Compare reading whole files against streaming them with 50 concurrent downloads, then stream 50 concurrent 500 MB
+    downloads from the in-memory and the local file object stores.
+    """
+    num_clients = 50
+
+    async def _fill(store, size: int):
+        block = os.urandom(1024 * 1024)
+        await store.upsert_object_stream("data.bin", _blocks(block, size))
+
+    async def _blocks(block: bytes, size: int):
+        for offset in range(0, size, len(block)):
+            yield block[:size - offset]
+
+    # Streamed downloads are measured first, as memory freed by the whole file downloads stays part of the process
+    small_size = 20 * 1024 * 1024
+    store = InMemoryObjectStore()
+    await _fill(store, small_size)
+
+    # Warm up, so that memory allocated once by the server and client is not measured
+    await _measure_downloads(store, "data.bin", small_size, 1, buffered=False)
+
+    streamed = await _measure_downloads(store, "data.bin", small_size, num_clients, buffered=False)
+
+    large_size = 500 * 1024 * 1024
+    for (name, large_store) in (("in-memory", InMemoryObjectStore()),
+                                ("local file", LocalFileObjectStore(base_path=str(tmp_path)))):
+        await _fill(large_store, large_size)
+        result = await _measure_downloads(large_store, "data.bin", large_size, num_clients, buffered=False)
+        await large_store.delete_object("data.bin")
+        print(f"\n{num_clients} x {large_size // 2**20} MB, {name} store, streamed: "
+              f"{result['throughput_mb_s']:.0f} MB/s, peak memory +{result['peak_mb']:.0f} MB")
+
+        # The memory used does not grow with the file size
+        assert result["peak_mb"] < large_size / 1e6
+
+    # Reading whole files buffers a copy per connection, so they are only compared with smaller files
+    buffered = await _measure_downloads(store, "data.bin", small_size, num_clients, buffered=True)
+
+    print(f"{num_clients} x {small_size // 2**20} MB, in-memory store, streamed: "
+          f"{streamed['throughput_mb_s']:.0f} MB/s, peak memory +{streamed['peak_mb']:.0f} MB")
+    print(f"{num_clients} x {small_size // 2**20} MB, in-memory store, whole file: "
+          f"{buffered['throughput_mb_s']:.0f} MB/s, peak memory +{buffered['peak_mb']:.0f} MB")
+
+    assert streamed["peak_mb"] < buffered["peak_mb"] / 4
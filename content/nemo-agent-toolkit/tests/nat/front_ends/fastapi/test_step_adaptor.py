@@ -13,6 +13,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import time
+
 import pytest
 
 from nat.data_models.api_server import ResponseIntermediateStep
@@ -111,7 +114,7 @@ def test_process_llm_events_in_default(step_adaptor_default, make_intermediate_s
 
     assert result is not None, f"Expected LLM event '{event_type}' to be processed in DEFAULT mode."
     assert isinstance(result, ResponseIntermediateStep)
-    assert step_adaptor_default._history[-1] is step, "Step must be appended to _history."
+    assert step.UUID in step_adaptor_default._open_steps, "The start must be kept until the step ends."
 
 
 def test_process_tool_in_default(step_adaptor_default, make_intermediate_step):
@@ -130,7 +133,7 @@ def test_process_tool_in_default(step_adaptor_default, make_intermediate_step):
     assert isinstance(result, ResponseIntermediateStep)
     assert "Tool:" in result.name
     assert "Input:" in result.payload
-    assert step_adaptor_default._history[-1] is step
+    assert step.UUID in step_adaptor_default._open_steps
 
     step = make_intermediate_step(
         event_type=IntermediateStepType.TOOL_END,
@@ -145,7 +148,7 @@ def test_process_tool_in_default(step_adaptor_default, make_intermediate_step):
     assert "Tool:" in result.name
     assert "Input:" in result.payload
     assert "Output:" in result.payload
-    assert step_adaptor_default._history[-1] is step
+    assert step.UUID not in step_adaptor_default._open_steps, "The step must be evicted once it ends."
 
 
 @pytest.mark.parametrize("event_type",
@@ -163,8 +166,7 @@ def test_process_other_events_in_default_returns_none(step_adaptor_default, make
     result = step_adaptor_default.process(step)
 
     assert result is None, f"Expected event {event_type} to be ignored in DEFAULT mode."
-    # The step should still be appended to _history
-    assert step_adaptor_default._history[-1] is step
+    assert not step_adaptor_default._open_steps
 
 
 # --------------------
@@ -198,8 +200,7 @@ def test_process_custom_events_in_custom_mode(step_adaptor_custom, make_intermed
     assert result_llm is None
     assert result_tool is None
 
-    # Ensure all steps are appended to _history in the order they were processed
-    assert step_adaptor_custom._history == [step_start, step_end, step_llm, step_tool]
+    assert not step_adaptor_custom._open_steps
 
 
 def test_process_custom_events_empty_list(step_adaptor_custom, make_intermediate_step):
@@ -214,7 +215,7 @@ def test_process_custom_events_empty_list(step_adaptor_custom, make_intermediate
     result_start = step_adaptor_custom.process(step_custom_start)
 
     assert result_start is None, "With empty custom_event_types, no events should be processed."
-    assert step_adaptor_custom._history[-1] is step_custom_start
+    assert not step_adaptor_custom._open_steps
 
 
 def test_process_llm_in_custom_mode_no_op(step_adaptor_custom, make_intermediate_step):
@@ -226,7 +227,7 @@ def test_process_llm_in_custom_mode_no_op(step_adaptor_custom, make_intermediate
     result = step_adaptor_custom.process(step_llm)
 
     assert result is None
-    assert step_adaptor_custom._history[-1] is step_llm
+    assert step_llm.UUID in step_adaptor_custom._open_steps
 
 
 def test_process_llm_in_disabled_mode_no_op(step_adaptor_disabled, make_intermediate_step):
@@ -237,7 +238,7 @@ def test_process_llm_in_disabled_mode_no_op(step_adaptor_disabled, make_intermed
     result = step_adaptor_disabled.process(step_llm)
 
     assert result is None
-    assert step_adaptor_disabled._history[-1] is step_llm
+    assert not step_adaptor_disabled._open_steps
 
 
 # --------------------
@@ -351,7 +352,7 @@ def test_process_function_start_in_default(step_adaptor_default, make_intermedia
     assert "test_function" in result.name
     assert "Function Input:" in result.payload
     assert "Function Input Data" in result.payload
-    assert step_adaptor_default._history[-1] is step
+    assert step.UUID in step_adaptor_default._open_steps
 
 
 def test_process_function_end_in_default(step_adaptor_default, make_intermediate_step):
@@ -372,7 +373,7 @@ def test_process_function_end_in_default(step_adaptor_default, make_intermediate
     assert "test_function" in result.name
     assert "Function Output:" in result.payload
     assert "Function Output Data" in result.payload
-    assert step_adaptor_default._history[-1] is step
+    assert not step_adaptor_default._open_steps
 
 
 def test_function_end_with_matching_start_event(step_adaptor_default, make_intermediate_step):
@@ -472,7 +473,7 @@ def test_process_function_start_without_input(step_adaptor_default, make_interme
     assert "test_function_no_input" in result.name
     assert "Function Input:" in result.payload
     assert "None" in result.payload
-    assert step_adaptor_default._history[-1] is step
+    assert step.UUID in step_adaptor_default._open_steps
 
 
 def test_process_function_end_without_output(step_adaptor_default, make_intermediate_step):
@@ -493,7 +494,7 @@ def test_process_function_end_without_output(step_adaptor_default, make_intermed
     assert "test_function_no_output" in result.name
     assert "Function Output:" in result.payload
     assert "None" in result.payload
-    assert step_adaptor_default._history[-1] is step
+    assert not step_adaptor_default._open_steps
 
 
 def test_function_events_in_custom_mode(step_adaptor_custom, make_intermediate_step):
@@ -522,6 +523,101 @@ def test_function_events_in_custom_mode(step_adaptor_custom, make_intermediate_s
     assert result_end is None, (
         "FUNCTION_END should not be processed in CUSTOM mode without being in custom_event_types")
 
-    # Steps should still be added to history
-    assert step_adaptor_custom._history[-2] is step_start
-    assert step_adaptor_custom._history[-1] is step_end
+    # The start is no longer needed once the step has ended
+    assert not step_adaptor_custom._open_steps
+
+
+# --------------------
+# Tests for LLM token streaming
+# --------------------
+def _stream_llm(adaptor: StepAdaptor, make_intermediate_step, uuid: str, chunks: list[str], output: str | None = None):
+    results = [
+        adaptor.process(make_intermediate_step(event_type=IntermediateStepType.LLM_START, data_input="Q", UUID=uuid))
+    ]
+
+    for chunk in chunks:
+        token = make_intermediate_step(event_type=IntermediateStepType.LLM_NEW_TOKEN, UUID=uuid)
+        token.payload.data.chunk = chunk
+        results.append(adaptor.process(token))
+
+    results.append(
+        adaptor.process(
+            make_intermediate_step(event_type=IntermediateStepType.LLM_END,
+                                   data_output=output if output is not None else "".join(chunks),
+                                   UUID=uuid)))
+
+    return results
+
+
+def test_llm_tokens_accumulate_per_step(step_adaptor_default, make_intermediate_step):
+    """
+    Each LLM_NEW_TOKEN event carries the escaped output so far, and interleaved LLM calls do not mix their output.
+    """
+    step_adaptor_default.process(
+        make_intermediate_step(event_type=IntermediateStepType.LLM_START, data_input="Q1", UUID="llm-1"))
+    step_adaptor_default.process(
+        make_intermediate_step(event_type=IntermediateStepType.LLM_START, data_input="Q2", UUID="llm-2"))
+
+    results = []
+    for uuid, chunk in [("llm-1", "a<"), ("llm-2", "x"), ("llm-1", "&b"), ("llm-2", "y")]:
+        token = make_intermediate_step(event_type=IntermediateStepType.LLM_NEW_TOKEN, UUID=uuid)
+        token.payload.data.chunk = chunk
+        results.append(step_adaptor_default.process(token))
+
+    assert results[2].payload.endswith("**Output:**\na&lt;&amp;b")
+    assert results[3].payload.endswith("**Output:**\nxy")
+    assert "Q1" in results[2].payload and "Q2" in results[3].payload
+
+    step_adaptor_default.process(make_intermediate_step(event_type=IntermediateStepType.LLM_END, UUID="llm-1"))
+
+    assert list(step_adaptor_default._open_steps) == ["llm-2"]
+
+
+def test_llm_token_deltas(make_intermediate_step):
+    adaptor = StepAdaptor(StepAdaptorConfig(stream_deltas=True))
+
+    start, first, second, third, end = _stream_llm(adaptor, make_intermediate_step, "llm-1", ["Hel", "lo", " <b>"])
+
+    assert start.type == "markdown" and "**Output:**" not in start.payload
+    assert first.type == "markdown" and first.payload.endswith("**Output:**\nHel")
+    assert (second.type, second.payload) == ("markdown_delta", "lo")
+    assert (third.type, third.payload) == ("markdown_delta", " &lt;b&gt;")
+    assert end.type == "markdown" and end.payload.endswith("**Output:**\nHello &lt;b&gt;")
+    assert not adaptor._open_steps
+
+
+@pytest.mark.slow
+@pytest.mark.benchmark
+async def test_llm_token_streaming_benchmark(make_intermediate_step):
+    """
+    Streams 4k-token LLM responses for 200 concurrent connections, each with its own adaptor, in both the full output
+    mode and the delta mode.
+    """
+    num_connections = 200
+    num_tokens = 4000
+
+    async def connection(adaptor: StepAdaptor, index: int):
+        uuid = f"llm-{index}"
+        adaptor.process(make_intermediate_step(event_type=IntermediateStepType.LLM_START, data_input="Q", UUID=uuid))
+
+        token = make_intermediate_step(event_type=IntermediateStepType.LLM_NEW_TOKEN, UUID=uuid)
+        token.payload.data.chunk = "token "
+
+        for _ in range(num_tokens):
+            assert adaptor.process(token) is not None
+            await asyncio.sleep(0)
+
+        adaptor.process(make_intermediate_step(event_type=IntermediateStepType.LLM_END, data_output="done", UUID=uuid))
+
+        assert not adaptor._open_steps
+
+    for stream_deltas in (False, True):
+        config = StepAdaptorConfig(stream_deltas=stream_deltas)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(connection(StepAdaptor(config), i) for i in range(num_connections)))
+        elapsed = time.perf_counter() - start
+
+        print(f"\nstream_deltas={stream_deltas}: {num_connections * num_tokens / elapsed:,.0f} tokens/s "
+              f"({elapsed:.2f}s for {num_connections} connections x {num_tokens} tokens)")
+
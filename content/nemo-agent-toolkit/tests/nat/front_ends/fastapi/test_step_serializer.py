@@ -0,0 +1,106 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import functools
+import json
+import time
+from unittest.mock import patch
+
+import pytest
+
+from nat.data_models.api_server import ResponseIntermediateStep
+from nat.data_models.intermediate_step import IntermediateStep
+from nat.data_models.intermediate_step import IntermediateStepPayload
+from nat.data_models.intermediate_step import IntermediateStepType
+from nat.data_models.intermediate_step import StreamEventData
+from nat.data_models.invocation_node import InvocationNode
+from nat.front_ends.fastapi import step_serializer
+from nat.front_ends.fastapi.step_serializer import SerializedIntermediateStep
+from nat.front_ends.fastapi.step_serializer import parse_filter_steps
+
+
+def _make_step(name: str | None = "my_tool") -> IntermediateStep:
+    payload = IntermediateStepPayload(UUID="step-1",
+                                      event_type=IntermediateStepType.TOOL_END,
+                                      name=name,
+                                      data=StreamEventData(input="héllo \"quoted\" \n", output={"answer": "✓"}),
+                                      metadata={"path": "a/b\\c"})
+
+    return IntermediateStep(parent_id="root",
+                            function_ancestry=InvocationNode(function_id="fn-1", function_name="fn"),
+                            payload=payload)
+
+
+def _legacy_stream_data(step: IntermediateStep) -> str:
+    return ResponseIntermediateStep(id=step.UUID,
+                                    type=step.event_type,
+                                    name=step.name or "",
+                                    parent_id=step.parent_id,
+                                    payload=step.payload.model_dump_json()).get_stream_data()
+
+
+@pytest.mark.parametrize("name", ["my_tool", None])
+def test_serialized_step_matches_response_intermediate_step(name: str | None):
+    step = _make_step(name)
+
+    serialized = SerializedIntermediateStep.from_intermediate_step(step)
+
+    assert serialized.event_type == IntermediateStepType.TOOL_END
+    assert serialized.get_stream_data() == _legacy_stream_data(step)
+
+
+def test_serialized_step_matches_with_stdlib_encoder():
+    step = _make_step()
+    stdlib_dumps = functools.partial(json.dumps, ensure_ascii=False, separators=(",", ":"))
+
+    with patch.object(step_serializer, "_json_dumps", stdlib_dumps):
+        assert SerializedIntermediateStep.from_intermediate_step(step).get_stream_data() == _legacy_stream_data(step)
+
+
+@pytest.mark.parametrize("filter_steps, expected",
+                         [
+                             (None, None),
+                             ("", None),
+                             ("none", frozenset()),
+                             ("NONE", frozenset()),
+                             ("TOOL_END", frozenset({IntermediateStepType.TOOL_END})),
+                             ("LLM_START,LLM_END", frozenset({IntermediateStepType.LLM_START,
+                                                              IntermediateStepType.LLM_END})),
+                             ("LLM_END,NOT_A_STEP", frozenset({IntermediateStepType.LLM_END})),
+                         ])
+def test_parse_filter_steps(filter_steps: str | None, expected: frozenset | None):
+    assert parse_filter_steps(filter_steps) == expected
+
+
+@pytest.mark.slow
+@pytest.mark.benchmark
+def test_serialize_step_benchmark():
+    step = _make_step()
+    num_iterations = 20000
+
+    start = time.perf_counter()
+    for _ in range(num_iterations):
+        _legacy_stream_data(step)
+    legacy = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(num_iterations):
+        SerializedIntermediateStep.from_intermediate_step(step).get_stream_data()
+    single_pass = time.perf_counter() - start
+
+    print(f"\nResponseIntermediateStep: {legacy / num_iterations * 1e6:.2f} us/step, "
+          f"{step_serializer.JSON_ENCODER_NAME}: {single_pass / num_iterations * 1e6:.2f} us/step")
+
+    assert single_pass < legacy
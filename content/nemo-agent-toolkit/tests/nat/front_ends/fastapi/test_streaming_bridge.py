@@ -0,0 +1,402 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import json
+import re
+import statistics
+import threading
+import time
+import uuid
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+
+import pytest
+
+from nat.builder.builder import Builder
+from nat.builder.context import Context
+from nat.cli.register_workflow import register_function
+from nat.data_models.config import Config
+from nat.data_models.config import GeneralConfig
+from nat.data_models.function import FunctionBaseConfig
+from nat.data_models.intermediate_step import IntermediateStepPayload
+from nat.data_models.intermediate_step import IntermediateStepType
+from nat.data_models.intermediate_step import StreamEventData
+from nat.front_ends.fastapi import response_helpers
+from nat.front_ends.fastapi.fastapi_front_end_config import FastApiFrontEndConfig
+from nat.front_ends.fastapi.intermediate_steps_subscriber import _QueueBridge
+from nat.front_ends.fastapi.response_helpers import _iter_queue_batches
+from nat.test.utils import build_nat_client
+from nat.utils.producer_consumer_queue import AsyncIOProducerConsumerQueue
+from nat.utils.producer_consumer_queue import QueueClosed
+
+_BENCH_MARKER = re.compile(r"bench:(\d+)")
+
+
+class StepEmitterConfig(FunctionBaseConfig, name="test_step_emitter"):
+    num_steps: int = 10
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _register_step_emitter_fn():
+
+    @register_function(config_type=StepEmitterConfig)
+    async def register(config: StepEmitterConfig, b: Builder):
+
+        async def _inner(message: str) -> str:
+            step_manager = Context.get().intermediate_step_manager
+
+            for _ in range(config.num_steps):
+                step_id = str(uuid.uuid4())
+                step_manager.push_intermediate_step(
+                    IntermediateStepPayload(UUID=step_id,
+                                            event_type=IntermediateStepType.TOOL_START,
+                                            name="bench_tool",
+                                            data=StreamEventData(input=message)))
+                step_manager.push_intermediate_step(
+                    IntermediateStepPayload(UUID=step_id,
+                                            event_type=IntermediateStepType.TOOL_END,
+                                            name="bench_tool",
+                                            data=StreamEventData(input=message,
+                                                                 output=f"bench:{time.perf_counter_ns()}")))
+
+                # Let the streaming side make progress, like a real workflow awaiting an LLM or tool would
+                await asyncio.sleep(0)
+
+            return message
+
+        yield _inner
+
+
+async def test_bridge_preserves_order_with_bounded_queue():
+    q = AsyncIOProducerConsumerQueue(maxsize=4)
+    bridge = _QueueBridge(q, asyncio.get_running_loop())
+
+    for i in range(100):
+        bridge.put(i)
+    bridge.finish()
+
+    # Only the first items fit directly, the rest are held back for the writer
+    assert q.qsize() == 4
+    assert not bridge.done.is_set()
+
+    received = []
+    while len(received) < 100:
+        received.append(await q.get())
+
+    await asyncio.wait_for(bridge.done.wait(), timeout=1)
+    assert received == list(range(100))
+
+
+async def test_bridge_done_waits_for_backlog():
+    q = AsyncIOProducerConsumerQueue(maxsize=1)
+    bridge = _QueueBridge(q, asyncio.get_running_loop())
+
+    bridge.put("a")
+    bridge.put("b")
+    bridge.finish()
+
+    await asyncio.sleep(0)
+    assert not bridge.done.is_set()
+
+    assert await q.get() == "a"
+    assert await q.get() == "b"
+    await asyncio.wait_for(bridge.done.wait(), timeout=1)
+
+
+async def test_bridge_accepts_items_from_other_threads():
+    q = AsyncIOProducerConsumerQueue()
+    bridge = _QueueBridge(q, asyncio.get_running_loop())
+
+    def produce():
+        for i in range(50):
+            bridge.put(i)
+        bridge.finish()
+
+    thread = threading.Thread(target=produce)
+    thread.start()
+    await asyncio.wait_for(bridge.done.wait(), timeout=1)
+    thread.join()
+
+    assert [q.get_nowait() for _ in range(q.qsize())] == list(range(50))
+
+
+async def test_bridge_drops_items_after_queue_closed():
+    q = AsyncIOProducerConsumerQueue(maxsize=1)
+    bridge = _QueueBridge(q, asyncio.get_running_loop())
+
+    bridge.put("a")
+    bridge.put("b")
+    await q.close()
+    bridge.put("c")
+    bridge.finish()
+
+    await asyncio.wait_for(bridge.done.wait(), timeout=1)
+
+
+async def test_bridge_bounds_backlog_by_dropping_oldest():
+    q = AsyncIOProducerConsumerQueue(maxsize=2)
+    bridge = _QueueBridge(q, asyncio.get_running_loop(), max_backlog=3)
+
+    for i in range(10):
+        bridge.put(i)
+    bridge.finish()
+
+    # Two items fit in the queue, the backlog keeps the three newest of the remaining eight
+    assert bridge.dropped == 5
+
+    received = []
+    while len(received) < 5:
+        received.append(await q.get())
+
+    await asyncio.wait_for(bridge.done.wait(), timeout=1)
+    assert received == [0, 1, 7, 8, 9]
+
+
+async def test_bridge_keeps_order_while_writer_is_putting():
+    q = AsyncIOProducerConsumerQueue(maxsize=2)
+    bridge = _QueueBridge(q, asyncio.get_running_loop())
+
+    for i in range(1, 4):
+        bridge.put(i)
+
+    # Let the writer take 3 off the backlog and wait for room in the queue
+    await asyncio.sleep(0)
+
+    # Room is made, but the writer has not put 3 yet when 4 arrives
+    received = [q.get_nowait()]
+    bridge.put(4)
+    bridge.finish()
+
+    while len(received) < 4:
+        received.append(await q.get())
+
+    await asyncio.wait_for(bridge.done.wait(), timeout=1)
+    assert received == [1, 2, 3, 4]
+
+
+async def test_queue_close_wakes_every_putter():
+    q = AsyncIOProducerConsumerQueue(maxsize=1)
+    q.put_nowait("full")
+
+    putters = [asyncio.create_task(q.put(i)) for i in range(3)]
+    await asyncio.sleep(0)
+    assert not any(putter.done() for putter in putters)
+
+    await q.close()
+
+    results = await asyncio.wait_for(asyncio.gather(*putters, return_exceptions=True), timeout=1)
+    assert all(isinstance(result, QueueClosed) for result in results)
+
+
+async def test_disconnect_while_queue_full_releases_producers(monkeypatch):
+    monkeypatch.setattr(response_helpers, "STREAM_QUEUE_MAXSIZE", 4)
+
+    producer_finished = asyncio.Event()
+
+    class _Runner:
+
+        async def result_stream(self, to_type=None):
+            step_manager = Context.get().intermediate_step_manager
+
+            try:
+                for i in range(100):
+                    # Every chunk is paired with a step, so the result putter and the bridge writer both block
+                    step_manager.push_intermediate_step(
+                        IntermediateStepPayload(event_type=IntermediateStepType.CUSTOM_START, name=f"step_{i}"))
+                    yield f"chunk_{i}"
+            finally:
+                producer_finished.set()
+
+    class _SessionManager:
+        workflow = SimpleNamespace(has_streaming_output=True)
+
+        @asynccontextmanager
+        async def run(self, payload):
+            yield _Runner()
+
+    batches = response_helpers._generate_streaming_response_full_batches("payload",
+                                                                         session_manager=_SessionManager(),
+                                                                         streaming=True,
+                                                                         result_type=None,
+                                                                         output_type=None,
+                                                                         filter_steps=None)
+
+    await anext(batches)
+
+    # Let both producers fill the queue and block on it
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+    # The client disconnects, which closes the generator
+    await batches.aclose()
+
+    await asyncio.wait_for(producer_finished.wait(), timeout=1)
+
+    pending = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+    await asyncio.wait_for(asyncio.gather(*pending, return_exceptions=True), timeout=1)
+
+
+async def test_iter_queue_batches():
+    q = AsyncIOProducerConsumerQueue()
+
+    for i in range(5):
+        q.put_nowait(i)
+
+    batches = _iter_queue_batches(q, max_batch_size=2)
+
+    assert await anext(batches) == [0, 1]
+    assert await anext(batches) == [2, 3]
+    assert await anext(batches) == [4]
+
+    await q.close()
+
+    with pytest.raises(StopAsyncIteration):
+        await anext(batches)
+
+
+async def test_generate_full_streams_all_steps_in_order():
+    num_steps = 200
+    front_end_config = FastApiFrontEndConfig()
+    config = Config(general=GeneralConfig(front_end=front_end_config),
+                    workflow=StepEmitterConfig(num_steps=num_steps))
+
+    async with build_nat_client(config) as client:
+        response = await client.post(f"{front_end_config.workflow.path}/full", json={"message": "Hello"})
+
+    assert response.status_code == 200
+
+    lines = [line for line in response.text.splitlines() if line]
+    steps = [json.loads(line[len("intermediate_data: "):]) for line in lines if line.startswith("intermediate_data: ")]
+    steps = [step for step in steps if step["name"] == "bench_tool"]
+    assert len(steps) == num_steps * 2
+
+    # Every start is immediately followed by its end
+    for start, end in zip(steps[::2], steps[1::2]):
+        assert start["id"] == end["id"]
+        assert start["type"] == IntermediateStepType.TOOL_START
+        assert end["type"] == IntermediateStepType.TOOL_END
+
+    assert any(line.startswith("data: ") for line in lines)
+
+
+@pytest.mark.parametrize("filter_steps, expected_types",
+                         [
+                             ("TOOL_END", {IntermediateStepType.TOOL_END}),
+                             ("TOOL_START,WORKFLOW_END", {IntermediateStepType.TOOL_START,
+                                                          IntermediateStepType.WORKFLOW_END}),
+                             ("none", set()),
+                         ])
+async def test_generate_full_filter_steps(filter_steps: str, expected_types: set[IntermediateStepType]):
+    front_end_config = FastApiFrontEndConfig()
+    config = Config(general=GeneralConfig(front_end=front_end_config), workflow=StepEmitterConfig(num_steps=3))
+
+    async with build_nat_client(config) as client:
+        response = await client.post(f"{front_end_config.workflow.path}/full",
+                                     params={"filter_steps": filter_steps},
+                                     json={"message": "Hello"})
+
+    assert response.status_code == 200
+
+    lines = [line for line in response.text.splitlines() if line]
+    steps = [json.loads(line[len("intermediate_data: "):]) for line in lines if line.startswith("intermediate_data: ")]
+
+    assert {step["type"] for step in steps} == expected_types
+    assert any(line.startswith("data: ") for line in lines)
+
+
+def _summarize(label: str, latencies_ns: list[int], elapsed_s: float, num_events: int) -> None:
+    latencies_ms = sorted(x / 1e6 for x in latencies_ns)
+    p99 = latencies_ms[min(len(latencies_ms) - 1, int(len(latencies_ms) * 0.99))]
+    print(f"\n{label}: {num_events / elapsed_s:,.0f} events/s, "
+          f"p50 {statistics.median(latencies_ms):.2f} ms, p99 {p99:.2f} ms per chunk")
+
+
+@pytest.mark.slow
+@pytest.mark.benchmark
+async def test_sse_streaming_load_benchmark():
+    num_steps = 2000
+    front_end_config = FastApiFrontEndConfig()
+    config = Config(general=GeneralConfig(front_end=front_end_config),
+                    workflow=StepEmitterConfig(num_steps=num_steps))
+
+    latencies_ns = []
+    num_events = 0
+
+    async with build_nat_client(config) as client:
+        start = time.perf_counter()
+
+        async with client.stream("POST", f"{front_end_config.workflow.path}/full",
+                                 json={"message": "Hello"}) as response:
+            async for line in response.aiter_lines():
+                received_ns = time.perf_counter_ns()
+                num_events += '"name":"bench_tool"' in line
+                latencies_ns.extend(received_ns - int(sent) for sent in _BENCH_MARKER.findall(line))
+
+        elapsed = time.perf_counter() - start
+
+    assert num_events == num_steps * 2
+    assert len(latencies_ns) == num_steps
+    _summarize("SSE /generate/full", latencies_ns, elapsed, num_events)
+
+
+@pytest.mark.slow
+@pytest.mark.benchmark
+def test_websocket_streaming_load_benchmark():
+    from fastapi.testclient import TestClient
+
+    from nat.front_ends.fastapi.fastapi_front_end_plugin_worker import FastApiFrontEndPluginWorker
+
+    num_steps = 2000
+    front_end_config = FastApiFrontEndConfig()
+    config = Config(general=GeneralConfig(front_end=front_end_config),
+                    workflow=StepEmitterConfig(num_steps=num_steps))
+
+    app = FastApiFrontEndPluginWorker(config).build_app()
+    user_message = {
+        "type": "user_message",
+        "schema_type": "generate_stream",
+        "content": {
+            "messages": [{
+                "role": "user", "content": [{
+                    "type": "text", "text": "Hello"
+                }]
+            }]
+        },
+    }
+
+    latencies_ns = []
+    num_events = 0
+
+    with TestClient(app) as client:
+        with client.websocket_connect(front_end_config.workflow.websocket_path) as websocket:
+            start = time.perf_counter()
+            websocket.send_json(user_message)
+
+            while True:
+                message = websocket.receive_text()
+                received_ns = time.perf_counter_ns()
+                parsed = json.loads(message)
+
+                if (parsed["type"] == "system_intermediate_message"):
+                    num_events += 1
+                    latencies_ns.extend(received_ns - int(sent) for sent in _BENCH_MARKER.findall(message))
+                elif (parsed["type"] == "system_response_message" and parsed["status"] == "complete"):
+                    break
+
+            elapsed = time.perf_counter() - start
+
+    assert latencies_ns
+    _summarize("WebSocket", latencies_ns, elapsed, num_events)
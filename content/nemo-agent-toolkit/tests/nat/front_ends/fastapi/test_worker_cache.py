@@ -0,0 +1,226 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import time
+from pathlib import Path
+
+import pytest
+
+from nat.builder.builder import Builder
+from nat.cli.register_workflow import register_function
+from nat.data_models.config import Config
+from nat.data_models.config import GeneralConfig
+from nat.data_models.function import FunctionBaseConfig
+from nat.front_ends.fastapi.fastapi_front_end_config import FastApiFrontEndConfig
+from nat.front_ends.fastapi.response_helpers import generate_single_response
+from nat.front_ends.fastapi.worker_cache import WorkerCache
+from nat.front_ends.fastapi.worker_cache import close_worker_cache
+from nat.front_ends.fastapi.worker_cache import get_worker_cache
+from nat.runtime.loader import load_workflow
+from nat.test.functions import EchoFunctionConfig
+from nat.test.utils import build_nat_client
+
+# Records ("build" | "teardown", label) for every workflow build
+_events: list[tuple[str, str]] = []
+
+
+class CachedWorkflowConfig(FunctionBaseConfig, name="test_cached_workflow"):
+    label: str = "a"
+    build_delay: float = 0.0
+    raise_error: bool = False
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _register():
+
+    @register_function(config_type=CachedWorkflowConfig)
+    async def cached_workflow(config: CachedWorkflowConfig, b: Builder):
+        await asyncio.sleep(config.build_delay)
+
+        if config.raise_error:
+            raise ValueError("build failed")
+
+        _events.append(("build", config.label))
+
+        async def _inner(message: str) -> str:
+            return f"{config.label}:{message}"
+
+        try:
+            yield _inner
+        finally:
+            _events.append(("teardown", config.label))
+
+
+@pytest.fixture(autouse=True)
+def _reset_events():
+    _events.clear()
+
+
+def _write_config(path: Path, **workflow):
+    path.write_text("workflow:\n" + "".join(f"  {key}: {value}\n"
+                                            for key, value in {
+                                                "_type": "test_cached_workflow", **workflow
+                                            }.items()))
+
+
+async def _run_job(session_manager, message: str = "hi") -> str:
+    return await generate_single_response(message, session_manager, result_type=str)
+
+
+async def test_workflow_is_built_once(tmp_path: Path):
+    config_file = tmp_path / "config.yml"
+    _write_config(config_file, build_delay=0.05)
+
+    cache = WorkerCache()
+
+    async def job():
+        async with cache.session_manager(str(config_file)) as session_manager:
+            return session_manager, await _run_job(session_manager)
+
+    results = await asyncio.gather(*(job() for _ in range(5)))
+
+    assert len({id(session_manager) for session_manager, _ in results}) == 1
+    assert [output for _, output in results] == ["a:hi"] * 5
+    assert _events == [("build", "a")]
+
+    await cache.close()
+
+    assert _events == [("build", "a"), ("teardown", "a")]
+
+
+async def test_workflow_is_rebuilt_when_the_config_changes(tmp_path: Path):
+    config_file = tmp_path / "config.yml"
+    _write_config(config_file, label="a")
+
+    cache = WorkerCache()
+
+    async with cache.session_manager(str(config_file)) as old_session_manager:
+        _write_config(config_file, label="b")
+
+        async with cache.session_manager(str(config_file)) as new_session_manager:
+            assert await _run_job(new_session_manager) == "b:hi"
+
+        # The old workflow is still in use by the outer job
+        assert await _run_job(old_session_manager) == "a:hi"
+        assert ("teardown", "a") not in _events
+
+    assert _events == [("build", "a"), ("build", "b"), ("teardown", "a")]
+
+    await cache.close()
+
+    assert _events[-1] == ("teardown", "b")
+
+
+async def test_failed_builds_are_not_cached(tmp_path: Path):
+    config_file = tmp_path / "config.yml"
+    _write_config(config_file, raise_error=True)
+
+    cache = WorkerCache()
+
+    for _ in range(2):
+        with pytest.raises(ValueError, match="build failed"):
+            async with cache.session_manager(str(config_file)):
+                pass
+
+    _write_config(config_file)
+
+    async with cache.session_manager(str(config_file)) as session_manager:
+        assert await _run_job(session_manager) == "a:hi"
+
+    await cache.close()
+
+
+async def test_job_store_and_engine_are_shared(db_url: str, dask_scheduler_address: str):
+    cache = WorkerCache()
+
+    job_store = cache.get_job_store(scheduler_address=dask_scheduler_address, db_url=db_url)
+
+    assert cache.get_job_store(scheduler_address=dask_scheduler_address, db_url=db_url) is job_store
+    assert cache.get_db_engine(db_url) is cache.get_db_engine(db_url)
+
+    await cache.close()
+
+
+async def test_worker_cache_is_per_event_loop():
+    cache = get_worker_cache()
+
+    assert get_worker_cache() is cache
+
+    await close_worker_cache()
+
+    assert get_worker_cache() is not cache
+
+    await close_worker_cache()
+
+
+@pytest.mark.slow
+@pytest.mark.benchmark
+async def test_cached_job_throughput_benchmark(tmp_path: Path):
+    """
+    Compares 100 short jobs which build the workflow each time, like async jobs used to, against jobs which reuse the
+    workflow cached by the worker.
+    """
+    config_file = tmp_path / "config.yml"
+    _write_config(config_file, build_delay=0.01)
+
+    num_jobs = 100
+
+    start = time.perf_counter()
+    for _ in range(num_jobs):
+        async with load_workflow(str(config_file)) as session_manager:
+            await _run_job(session_manager)
+    uncached = time.perf_counter() - start
+
+    cache = WorkerCache()
+
+    start = time.perf_counter()
+    for _ in range(num_jobs):
+        async with cache.session_manager(str(config_file)) as session_manager:
+            await _run_job(session_manager)
+    cached = time.perf_counter() - start
+
+    await cache.close()
+
+    print(f"\n{num_jobs} jobs: rebuilding the workflow {num_jobs / uncached:.1f} jobs/s, "
+          f"cached workflow {num_jobs / cached:.1f} jobs/s")
+
+    assert cached < uncached
+
+
+@pytest.mark.slow
+@pytest.mark.benchmark
+async def test_async_generation_throughput_benchmark():
+    """
+    End-to-end throughput of 100 short `/generate/async` jobs through the Dask cluster.
+    """
+    front_end_config = FastApiFrontEndConfig()
+    config = Config(general=GeneralConfig(front_end=front_end_config), workflow=EchoFunctionConfig())
+
+    num_jobs = 100
+    workflow_path = f"{front_end_config.workflow.path}/async"
+
+    async with build_nat_client(config) as client:
+        start = time.perf_counter()
+
+        for i in range(num_jobs):
+            response = await client.post(workflow_path, json={"message": f"Hello {i}", "sync_timeout": 30})
+
+            assert response.status_code == 200
+            assert response.json()["output"] == {"value": f"Hello {i}"}
+
+        elapsed = time.perf_counter() - start
+
+    print(f"\n{num_jobs} async generation jobs: {num_jobs / elapsed:.1f} jobs/s")
@@ -0,0 +1,58 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from contextlib import asynccontextmanager
+
+from nat.data_models.object_store import KeyAlreadyExistsError
+from nat.data_models.object_store import NoSuchKeyError
+from nat.object_store.interfaces import BufferedObjectStoreUpload
+from nat.object_store.interfaces import ObjectStore
+from nat.object_store.models import ObjectStoreItem
+from nat.test.object_store_tests import ObjectStoreTests
+
+
+class _MinimalObjectStore(ObjectStore):
+    """An object store which only implements the abstract methods, like most third party object stores."""
+
+    def __init__(self) -> None:
+        self._store: dict[str, ObjectStoreItem] = {}
+
+    async def put_object(self, key: str, item: ObjectStoreItem) -> None:
+        if key in self._store:
+            raise KeyAlreadyExistsError(key)
+        self._store[key] = item
+
+    async def upsert_object(self, key: str, item: ObjectStoreItem) -> None:
+        self._store[key] = item
+
+    async def get_object(self, key: str) -> ObjectStoreItem:
+        if key not in self._store:
+            raise NoSuchKeyError(key)
+        return self._store[key]
+
+    async def delete_object(self, key: str) -> None:
+        if self._store.pop(key, None) is None:
+            raise NoSuchKeyError(key)
+
+
+class TestBufferedFallbacks(ObjectStoreTests):
+    """Runs the object store tests against the default implementations of the streaming and range methods."""
+
+    @asynccontextmanager
+    async def _get_store(self):
+        yield _MinimalObjectStore()
+
+    async def test_open_upload_is_buffered(self, store: ObjectStore):
+        assert isinstance(store.open_upload("test_key"), BufferedObjectStoreUpload)
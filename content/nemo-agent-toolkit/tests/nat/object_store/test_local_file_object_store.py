@@ -0,0 +1,50 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+from contextlib import asynccontextmanager
+
+import pytest
+
+from nat.builder.workflow_builder import WorkflowBuilder
+from nat.object_store.interfaces import ObjectStore
+from nat.object_store.local_file_object_store import LocalFileObjectStoreConfig
+from nat.object_store.models import ObjectStoreItem
+from nat.test.object_store_tests import ObjectStoreTests
+
+
+class TestLocalFileObjectStore(ObjectStoreTests):
+
+    @asynccontextmanager
+    async def _get_store(self):
+        with tempfile.TemporaryDirectory() as base_path:
+            async with WorkflowBuilder() as builder:
+                await builder.add_object_store("object_store_name", LocalFileObjectStoreConfig(base_path=base_path))
+
+                yield await builder.get_object_store_client("object_store_name")
+
+    async def test_get_local_path(self, store: ObjectStore):
+        await store.put_object("folder/test_file.txt", ObjectStoreItem(data=b"test_value"))
+
+        path = await store.get_local_path("folder/test_file.txt")
+        assert path.endswith(os.path.join("folder", "test_file.txt"))
+        with open(path, "rb") as f:
+            assert f.read() == b"test_value"
+
+    async def test_invalid_keys(self, store: ObjectStore):
+        for key in ("..", "../outside.txt", "folder/../../outside.txt"):
+            with pytest.raises(ValueError):
+                await store.put_object(key, ObjectStoreItem(data=b"test_value"))
@@ -0,0 +1,259 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import contextvars
+import logging
+
+import pytest
+
+from nat.observability.exporter.export_scheduler import ExportOverflowPolicy
+from nat.observability.exporter.export_scheduler import ExportScheduler
+
+_request_id: contextvars.ContextVar[str | None] = contextvars.ContextVar("request_id", default=None)
+
+
+class TestExportScheduler:
+    """Test the bounded export scheduler."""
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError, match="num_workers"):
+            ExportScheduler(num_workers=0)
+
+        with pytest.raises(ValueError, match="max_queue_size"):
+            ExportScheduler(max_queue_size=0)
+
+    async def test_exports_are_run(self):
+        scheduler = ExportScheduler(num_workers=2)
+        results = []
+
+        async def export(i: int):
+            await asyncio.sleep(0)
+            results.append(i)
+
+        for i in range(10):
+            assert scheduler.submit(export(i))
+
+        assert await scheduler.drain(timeout=1)
+        assert sorted(results) == list(range(10))
+
+        stats = scheduler.get_stats()
+        assert stats["items_submitted"] == 10
+        assert stats["items_processed"] == 10
+        assert stats["current_queue_size"] == 0
+        assert stats["in_flight"] == 0
+
+        await scheduler.shutdown()
+
+    async def test_same_key_runs_in_order(self):
+        scheduler = ExportScheduler(num_workers=4)
+        results: dict[str, list[int]] = {"a": [], "b": [], "c": []}
+
+        async def export(key: str, i: int):
+            # Later exports finish faster, which would reorder them if they ran concurrently
+            await asyncio.sleep(0.001 * (10 - i))
+            results[key].append(i)
+
+        for i in range(10):
+            for key in results:
+                scheduler.submit(export(key, i), key=key)
+
+        assert await scheduler.drain(timeout=5)
+        assert all(values == list(range(10)) for values in results.values())
+
+        await scheduler.shutdown()
+
+    async def test_concurrency_is_bounded(self):
+        scheduler = ExportScheduler(num_workers=3)
+        running = 0
+        max_running = 0
+
+        async def export():
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.001)
+            running -= 1
+
+        for _ in range(30):
+            scheduler.submit(export())
+
+        assert await scheduler.drain(timeout=5)
+        assert max_running == 3
+
+        await scheduler.shutdown()
+
+    async def test_export_runs_in_submitting_context(self):
+        scheduler = ExportScheduler(num_workers=1)
+        seen = []
+
+        async def export():
+            seen.append(_request_id.get())
+
+        async def submit(request_id: str):
+            _request_id.set(request_id)
+            scheduler.submit(export())
+
+        await asyncio.gather(*(asyncio.create_task(submit(f"req_{i}")) for i in range(3)))
+
+        assert await scheduler.drain(timeout=1)
+        assert seen == ["req_0", "req_1", "req_2"]
+
+        await scheduler.shutdown()
+
+    async def test_drop_newest_when_full(self, caplog):
+        scheduler = ExportScheduler(num_workers=1, max_queue_size=2)
+        release = asyncio.Event()
+        results = []
+
+        async def export(i: int):
+            await release.wait()
+            results.append(i)
+
+        scheduler.submit(export(0))
+        await asyncio.sleep(0)  # Let the worker pick up the first export
+
+        with caplog.at_level(logging.WARNING):
+            assert scheduler.submit(export(1))
+            assert scheduler.submit(export(2))
+            assert not scheduler.submit(export(3))
+
+        assert "dropping new export" in caplog.text
+
+        release.set()
+        assert await scheduler.drain(timeout=1)
+        assert results == [0, 1, 2]
+
+        stats = scheduler.get_stats()
+        assert stats["items_dropped"] == 1
+        assert stats["queue_overflows"] == 1
+        assert stats["peak_queue_size"] == 2
+
+        await scheduler.shutdown()
+
+    async def test_drop_oldest_when_full(self):
+        scheduler = ExportScheduler(num_workers=1, max_queue_size=2, overflow_policy=ExportOverflowPolicy.DROP_OLDEST)
+        release = asyncio.Event()
+        results = []
+
+        async def export(i: int):
+            await release.wait()
+            results.append(i)
+
+        scheduler.submit(export(0))
+        await asyncio.sleep(0)
+
+        for i in range(1, 5):
+            assert scheduler.submit(export(i))
+
+        release.set()
+        assert await scheduler.drain(timeout=1)
+        assert results == [0, 3, 4]
+        assert scheduler.get_stats()["items_dropped"] == 2
+
+        await scheduler.shutdown()
+
+    async def test_failed_exports_are_counted(self):
+        scheduler = ExportScheduler(num_workers=1)
+
+        async def export():
+            raise ValueError("export failed")
+
+        scheduler.submit(export())
+        scheduler.submit(export())
+
+        assert await scheduler.drain(timeout=1)
+
+        stats = scheduler.get_stats()
+        assert stats["items_failed"] == 2
+        assert stats["items_processed"] == 0
+
+        await scheduler.shutdown()
+
+    async def test_shutdown_runs_queued_exports(self):
+        scheduler = ExportScheduler(num_workers=1)
+        results = []
+
+        async def export(i: int):
+            await asyncio.sleep(0.001)
+            results.append(i)
+
+        for i in range(5):
+            scheduler.submit(export(i))
+
+        await scheduler.shutdown(timeout=5)
+
+        assert results == list(range(5))
+
+    async def test_shutdown_timeout_drops_remaining_exports(self, caplog):
+        scheduler = ExportScheduler(num_workers=1)
+
+        async def export():
+            await asyncio.sleep(10)
+
+        for _ in range(3):
+            scheduler.submit(export())
+
+        with caplog.at_level(logging.WARNING):
+            await scheduler.shutdown(timeout=0.05)
+
+        assert "did not drain" in caplog.text
+        assert scheduler.get_stats()["items_dropped"] == 2
+
+    async def test_scheduler_can_be_reused_after_shutdown(self):
+        scheduler = ExportScheduler(num_workers=1)
+        results = []
+
+        async def export(i: int):
+            results.append(i)
+
+        scheduler.submit(export(0))
+        await scheduler.shutdown()
+
+        scheduler.submit(export(1))
+        await scheduler.shutdown()
+
+        assert results == [0, 1]
+
+    def test_exports_queued_on_previous_loop_are_dropped(self, caplog):
+        scheduler = ExportScheduler(num_workers=1)
+
+        async def export():
+            await asyncio.sleep(10)
+
+        async def submit(count: int):
+            for _ in range(count):
+                scheduler.submit(export())
+
+            await asyncio.sleep(0)
+
+        def run_on_new_loop(count: int):
+            # Not asyncio.run, which reuses the running loop once nest_asyncio is applied
+            loop = asyncio.new_event_loop()
+            try:
+                loop.run_until_complete(submit(count))
+            finally:
+                loop.close()
+
+        # One export is picked up by the worker, the other two are still queued when the loop goes away
+        run_on_new_loop(3)
+
+        with caplog.at_level(logging.WARNING):
+            run_on_new_loop(1)
+
+        stats = scheduler.get_stats()
+        assert "previous event loop" in caplog.text
+        assert stats["items_dropped"] == 2
+        assert stats["drop_rate"] == 50
@@ -14,7 +14,6 @@
 # limitations under the License.
 
 import asyncio
-from unittest.mock import AsyncMock
 from unittest.mock import Mock
 from unittest.mock import patch
 
@@ -124,7 +123,6 @@ class TestFileExporterInheritance:
         assert hasattr(exporter, 'export_processed')
         assert hasattr(exporter, '_filepath')
         assert hasattr(exporter, '_project')
-        assert hasattr(exporter, '_lock')
 
     def test_inheritance_from_raw_exporter(self, mock_context_state, tmp_path):
         """Test that FileExporter properly inherits from RawExporter."""
@@ -195,19 +193,16 @@ class TestFileExporterFunctionality:
             assert lines[0].strip() == '{"line": 1}'
             assert lines[1].strip() == '{"line": 2}'
 
-    @patch('aiofiles.open')
-    async def test_export_processed_file_error_handling(self, mock_aiofiles_open, mock_context_state,
-                                                        invalid_file_path):
+    async def test_export_processed_file_error_handling(self, mock_context_state, invalid_file_path):
         """Test error handling when file operations fail."""
-        # Mock file operation to raise an exception
-        mock_aiofiles_open.side_effect = OSError("File write error")
-
         exporter = FileExporter(context_state=mock_context_state,
                                 output_path=str(invalid_file_path),
                                 project="test_project")
 
-        # Should not raise exception, but log error
-        with patch('nat.observability.mixin.file_mixin.logger') as mock_logger:
+        # Mock file operation to raise an exception
+        with patch.object(exporter, '_open_file', side_effect=OSError("File write error")), \
+                patch('nat.observability.mixin.file_mixin.logger') as mock_logger:
+            # Should not raise exception, but log error
             await exporter.export_processed('{"test": "data"}')
             # Verify error was logged (implementation logs errors but doesn't re-raise)
             mock_logger.exception.assert_called()
@@ -233,16 +228,8 @@ class TestFileExporterFunctionality:
 class TestFileExporterIntegration:
     """Test FileExporter integration with processing pipeline."""
 
-    @patch('aiofiles.open')
-    async def test_end_to_end_processing(self,
-                                         mock_aiofiles_open,
-                                         mock_context_state,
-                                         sample_intermediate_step,
-                                         tmp_path):
+    async def test_end_to_end_processing(self, mock_context_state, sample_intermediate_step, tmp_path):
         """Test end-to-end processing from IntermediateStep to file output."""
-        # Mock file operations
-        mock_file = AsyncMock()
-        mock_aiofiles_open.return_value.__aenter__.return_value = mock_file
         test_output_path = tmp_path / "test.jsonl"
 
         exporter = FileExporter(context_state=mock_context_state,
@@ -256,11 +243,8 @@ class TestFileExporterIntegration:
             # Verify processor was called
             mock_process.assert_called_once_with(sample_intermediate_step)
 
-            # Verify file write was called
-            mock_file.write.assert_called()
-            written_calls = [call.args[0] for call in mock_file.write.call_args_list]
-            assert '{"serialized": "data"}' in written_calls
-            assert '\n' in written_calls
+            # Verify the serialized item was written as a line
+            assert test_output_path.read_text() == '{"serialized": "data"}\n'
 
     async def test_processor_pipeline_integration(self, mock_context_state, sample_intermediate_step, tmp_path):
         """Test integration with the processing pipeline."""
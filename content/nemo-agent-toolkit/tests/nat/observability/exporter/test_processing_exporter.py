@@ -15,6 +15,7 @@
 
 import asyncio
 import logging
+import time
 from typing import get_args
 from typing import get_origin
 from unittest.mock import Mock
@@ -23,6 +24,7 @@ from unittest.mock import patch
 import pytest
 
 from nat.builder.context import ContextState
+from nat.observability.exporter.export_scheduler import ExportOverflowPolicy
 from nat.observability.exporter.processing_exporter import ProcessingExporter
 from nat.observability.processor.callback_processor import CallbackProcessor
 from nat.observability.processor.processor import Processor
@@ -1609,3 +1611,121 @@ class TestEdgeCases:
         processor = MockProcessor("proc1")
         processors.append(processor)
         assert len(processing_exporter._processors) == 1
+
+
+class TraceRecordingExporter(ProcessingExporter[str, str]):
+    """Exporter which records the trace each item was exported for. Items ending in a digit are delayed by it."""
+
+    def __init__(self, context_state: ContextState | None = None):
+        super().__init__(context_state)
+        self.exported: list[tuple[int | None, str]] = []
+
+    async def export_processed(self, item: str) -> None:
+        if item[-1].isdigit():
+            await asyncio.sleep(0.001 * int(item[-1]))
+        self.exported.append((self._context_state.workflow_trace_id.get(), item))
+
+
+class TestExportWorkers:
+    """Test running exports on a bounded pool of workers."""
+
+    def test_export_stats_none_by_default(self, processing_exporter):
+        assert processing_exporter.get_export_stats() is None
+
+    def test_configure_after_start_raises_error(self, processing_exporter):
+        processing_exporter._pipeline_locked = True
+
+        with pytest.raises(RuntimeError, match="Cannot modify processor pipeline"):
+            processing_exporter.configure_export_workers()
+
+    async def test_exports_run_on_workers_in_trace_order(self):
+        context_state = ContextState.get()
+        exporter = TraceRecordingExporter(context_state)
+        exporter.configure_export_workers(num_workers=2)
+
+        async def run_trace(trace_id: int):
+            context_state.workflow_trace_id.set(trace_id)
+            for step in ("start_9", "llm_5", "end_0"):
+                exporter.export(step)
+
+        async with exporter.start_shared():
+            await asyncio.gather(*(asyncio.create_task(run_trace(trace_id)) for trace_id in range(1, 6)))
+            await exporter.wait_for_tasks()
+
+            stats = exporter.get_export_stats()
+
+        # Exports are not tracked as tasks of the exporter
+        assert not exporter._tasks
+
+        for trace_id in range(1, 6):
+            assert [item for tid, item in exporter.exported if tid == trace_id] == ["start_9", "llm_5", "end_0"]
+
+        assert stats["items_processed"] == 15
+        assert stats["num_workers"] == 2
+
+    async def test_isolated_instances_share_workers(self):
+        context_state = ContextState.get()
+        exporter = TraceRecordingExporter(context_state)
+        exporter.configure_export_workers(num_workers=1, max_queue_size=5, overflow_policy="drop_oldest")
+
+        isolated = exporter.create_isolated_instance(context_state)
+
+        assert isolated._export_scheduler is exporter._export_scheduler
+        assert isolated.get_export_stats()["overflow_policy"] == ExportOverflowPolicy.DROP_OLDEST
+
+        async with exporter.start_shared():
+            async with isolated.start_shared():
+                isolated.export("from isolated")
+
+            # Stopping the isolated instance does not stop the shared workers
+            exporter.export("from original")
+            await exporter.wait_for_tasks()
+
+        assert [item for _, item in exporter.exported] == ["from isolated", "from original"]
+
+    async def test_stop_runs_queued_exports(self):
+        context_state = ContextState.get()
+        exporter = TraceRecordingExporter(context_state)
+        exporter.configure_export_workers(num_workers=1)
+
+        async with exporter.start_shared():
+            for i in range(5):
+                exporter.export(f"item_{i}")
+
+        assert [item for _, item in exporter.exported] == [f"item_{i}" for i in range(5)]
+
+    @pytest.mark.slow
+    @pytest.mark.benchmark
+    async def test_export_burst_benchmark(self):
+        """
+        Compares a burst of exports which each create a task with exports run on a pool of workers, measuring the time
+        to export the burst and the peak number of tasks.
+        """
+        num_events = 20000
+        context_state = ContextState.get()
+
+        async def measure(num_workers: int | None) -> tuple[float, int]:
+            exporter = TraceRecordingExporter(context_state)
+            if num_workers is not None:
+                exporter.configure_export_workers(num_workers=num_workers, max_queue_size=num_events)
+
+            async with exporter.start_shared():
+                start = time.perf_counter()
+                for i in range(num_events):
+                    exporter.export(f"event {i}.")
+                peak_tasks = len(asyncio.all_tasks())
+
+                await exporter.wait_for_tasks(timeout=60)
+                elapsed = time.perf_counter() - start
+
+            assert len(exporter.exported) == num_events
+
+            return num_events / elapsed, peak_tasks
+
+        task_rate, task_peak = await measure(None)
+        worker_rate, worker_peak = await measure(4)
+
+        print(f"\n{num_events} event burst: task per export {task_rate:.0f} events/s, peak {task_peak} tasks; "
+              f"4 export workers {worker_rate:.0f} events/s, peak {worker_peak} tasks")
+
+        assert worker_peak < task_peak
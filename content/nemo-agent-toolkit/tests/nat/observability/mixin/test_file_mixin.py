@@ -14,11 +14,15 @@
 # limitations under the License.
 
 import asyncio
+import gzip
 import re
+import time
+from unittest.mock import patch
 
 import aiofiles
 import pytest
 
+from nat.observability.mixin.file_compression import FileCompression
 from nat.observability.mixin.file_mixin import FileExportMixin
 from nat.observability.mixin.file_mode import FileMode
 
@@ -70,7 +74,6 @@ class TestFileExportMixin:
 
         assert exporter._filepath == output_path
         assert exporter._project == project
-        assert isinstance(exporter._lock, asyncio.Lock)
 
     def test_init_with_additional_args_and_kwargs(self, file_mixin_class, temp_file):
         """Test initialization with additional arguments."""
@@ -83,7 +86,6 @@ class TestFileExportMixin:
 
         assert exporter._filepath == output_path
         assert exporter._project == project
-        assert isinstance(exporter._lock, asyncio.Lock)
 
     def test_init_with_rolling_enabled(self, file_mixin_class, temp_dir):
         """Test initialization with rolling enabled."""
@@ -518,26 +520,6 @@ class TestFileExportMixinRolling:
         for timestamp in timestamps:
             assert re.match(r'\d{8}_\d{6}_\d{6}', timestamp), f"Invalid timestamp format: {timestamp}"
 
-    async def test_should_roll_file_logic(self, file_mixin_class, temp_dir):
-        """Test the _should_roll_file logic works correctly."""
-        output_path = temp_dir / "roll_test.log"
-
-        exporter = file_mixin_class(output_path=output_path, project="test", enable_rolling=True, max_file_size=20)
-
-        # Should not roll when file doesn't exist
-        should_roll = await exporter._should_roll_file()
-        assert should_roll is False
-
-        # Write small content
-        await exporter.export_processed("Small")
-        should_roll = await exporter._should_roll_file()
-        assert should_roll is False  # Should be under 20 bytes
-
-        # Write content to exceed limit
-        await exporter.export_processed("This is a longer message")
-        should_roll = await exporter._should_roll_file()
-        assert should_roll is True  # Should exceed 20 bytes
-
     async def test_rolling_disabled_behavior(self, file_mixin_class, tmp_path):
         """Test that rolling doesn't occur when disabled."""
         temp_file = tmp_path / "no_rolling.log"
@@ -683,3 +665,185 @@ class TestFileExportMixinRolling:
         # Should have cleaned up to only 1 file (the newest)
         rolled_files = list(temp_dir.glob("cleanup_init_*.log"))
         assert len(rolled_files) <= 1
+
+    @pytest.mark.parametrize("compression", [FileCompression.GZIP, FileCompression.ZSTD])
+    async def test_rolled_files_are_compressed(self, file_mixin_class, temp_dir, compression):
+        """Test that rolled files are compressed and the current file is not."""
+        output_path = temp_dir / "compressed.log"
+
+        exporter = file_mixin_class(output_path=output_path,
+                                    project="test",
+                                    enable_rolling=True,
+                                    max_file_size=15,
+                                    max_files=5,
+                                    compression=compression)
+
+        await exporter.export_processed("This first message")
+        await exporter.export_processed("Second message")
+
+        rolled_files = list(temp_dir.glob(f"compressed_*.log{compression.suffix}"))
+        assert len(rolled_files) == 1
+        assert not [f for f in temp_dir.glob("compressed_*.log")]
+
+        if compression == FileCompression.GZIP:
+            rolled_content = gzip.decompress(rolled_files[0].read_bytes())
+        else:
+            import zstandard
+            rolled_content = zstandard.ZstdDecompressor().decompressobj().decompress(rolled_files[0].read_bytes())
+
+        assert rolled_content == b"This first message\n"
+        assert output_path.read_text() == "Second message\n"
+
+    async def test_compressed_files_count_towards_max_files(self, file_mixin_class, temp_dir):
+        """Test that compressed rolled files are cleaned up once max_files is exceeded."""
+        output_path = temp_dir / "limit.log"
+
+        exporter = file_mixin_class(output_path=output_path,
+                                    project="test",
+                                    enable_rolling=True,
+                                    max_file_size=10,
+                                    max_files=2,
+                                    compression=FileCompression.GZIP)
+
+        for i in range(6):
+            await exporter.export_processed(f"Message number {i}")
+
+        assert len(list(temp_dir.glob("limit_*.log.gz"))) == 2
+
+    async def test_fsync_bytes_policy(self, file_mixin_class, temp_dir):
+        """Test that the file is synced once enough bytes have been written."""
+        exporter = file_mixin_class(output_path=temp_dir / "sync.log", project="test", fsync_bytes=20)
+
+        with patch("nat.observability.mixin.file_mixin.os.fsync") as mock_fsync:
+            await exporter.export_processed("0123456789")  # 11 bytes
+            assert mock_fsync.call_count == 0
+
+            await exporter.export_processed("0123456789")  # 22 bytes
+            assert mock_fsync.call_count == 1
+
+            await exporter.export_processed("short")
+            assert mock_fsync.call_count == 1
+
+            # Remaining bytes are synced when the file is closed
+            await exporter._cleanup()
+            assert mock_fsync.call_count == 2
+
+    async def test_fsync_interval_policy(self, file_mixin_class, temp_dir):
+        """Test that data is synced once the interval elapses, even when nothing else is written."""
+        exporter = file_mixin_class(output_path=temp_dir / "interval.log", project="test", fsync_interval=0.05)
+
+        with patch("nat.observability.mixin.file_mixin.os.fsync") as mock_fsync:
+            await exporter.export_processed("message")
+            assert mock_fsync.call_count == 0
+            assert exporter._writer_state.sync_timer is not None
+
+            await asyncio.sleep(0.2)
+            assert mock_fsync.call_count == 1
+            assert exporter._writer_state.sync_timer is None
+
+            # Nothing is left to sync when the file is closed
+            await exporter._cleanup()
+            assert mock_fsync.call_count == 1
+
+    async def test_close_cancels_pending_fsync(self, file_mixin_class, temp_dir):
+        """Test that closing the file syncs it and cancels the pending timed sync."""
+        exporter = file_mixin_class(output_path=temp_dir / "cancel.log", project="test", fsync_interval=10)
+
+        with patch("nat.observability.mixin.file_mixin.os.fsync") as mock_fsync:
+            await exporter.export_processed("message")
+            timer = exporter._writer_state.sync_timer
+            assert timer is not None
+
+            await exporter._cleanup()
+
+        assert timer.cancelled()
+        assert exporter._writer_state.sync_timer is None
+        assert mock_fsync.call_count == 1
+
+    async def test_no_fsync_without_policy(self, file_mixin_class, temp_dir):
+        """Test that the file is never synced when no fsync policy is configured."""
+        exporter = file_mixin_class(output_path=temp_dir / "nosync.log", project="test")
+
+        with patch("nat.observability.mixin.file_mixin.os.fsync") as mock_fsync:
+            await exporter.export_processed("message")
+            await exporter._cleanup()
+
+        mock_fsync.assert_not_called()
+
+    async def test_cleanup_closes_file_and_export_reopens_it(self, file_mixin_class, temp_dir):
+        """Test that cleanup closes the file and that exporting afterwards appends to it."""
+        output_path = temp_dir / "reopen.log"
+        exporter = file_mixin_class(output_path=output_path, project="test", mode=FileMode.OVERWRITE)
+
+        await exporter.export_processed("first")
+        assert exporter._writer_state.file is not None
+
+        await exporter._cleanup()
+        assert exporter._writer_state.file is None
+
+        await exporter.export_processed("second")
+        await exporter._cleanup()
+
+        assert output_path.read_text() == "first\nsecond\n"
+
+    async def test_concurrent_exports_are_batched(self, file_mixin_class, temp_dir):
+        """Test that concurrent exports are written in order with fewer writes than exports."""
+        output_path = temp_dir / "batched.log"
+        exporter = file_mixin_class(output_path=output_path, project="test")
+
+        with patch.object(exporter, "_write_batch", wraps=exporter._write_batch) as mock_write_batch:
+            await asyncio.gather(*(exporter.export_processed(f"line {i}") for i in range(100)))
+
+        assert mock_write_batch.call_count < 100
+        assert output_path.read_text().splitlines() == [f"line {i}" for i in range(100)]
+
+        await exporter._cleanup()
+
+    async def test_queue_size_is_bounded(self, file_mixin_class, temp_dir):
+        """Test that exports wait for the writer when the queue is full."""
+        output_path = temp_dir / "bounded.log"
+        exporter = file_mixin_class(output_path=output_path, project="test", max_queue_size=2)
+
+        await asyncio.gather(*(exporter.export_processed(f"line {i}") for i in range(20)))
+
+        assert exporter._writer_state.queue.maxsize == 2
+        assert len(output_path.read_text().splitlines()) == 20
+
+        await exporter._cleanup()
+
+    @pytest.mark.slow
+    @pytest.mark.benchmark
+    async def test_concurrent_export_throughput_benchmark(self, file_mixin_class, temp_dir):
+        """
+        Compares concurrent exports which open the file for each item, as the exporter used to, with the background
+        writer.
+        """
+        num_events = 5000
+        line = "x" * 200
+
+        baseline_path = temp_dir / "baseline.log"
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        lock = asyncio.Lock()
+
+        async def legacy_export(item: str):
+            async with lock:
+                async with aiofiles.open(baseline_path, mode="a") as f:
+                    await f.write(item)
+                    await f.write("\n")
+
+        start = time.perf_counter()
+        await asyncio.gather(*(legacy_export(line) for _ in range(num_events)))
+        baseline = time.perf_counter() - start
+
+        exporter = file_mixin_class(output_path=temp_dir / "writer.log", project="test")
+
+        start = time.perf_counter()
+        await asyncio.gather(*(exporter.export_processed(line) for _ in range(num_events)))
+        writer = time.perf_counter() - start
+
+        await exporter._cleanup()
+
+        print(f"\n{num_events} concurrent exports: open per item {num_events / baseline:.0f} events/s, "
+              f"background writer {num_events / writer:.0f} events/s")
+
+        assert writer < baseline
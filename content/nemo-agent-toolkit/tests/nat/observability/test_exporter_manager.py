@@ -16,6 +16,8 @@
 import asyncio
 import gc
 import logging
+import time
+import uuid
 from contextlib import asynccontextmanager
 from unittest.mock import Mock
 from unittest.mock import patch
@@ -26,6 +28,7 @@ from nat.builder.context import ContextState
 from nat.observability.exporter.base_exporter import BaseExporter
 from nat.observability.exporter.base_exporter import IsolatedAttribute
 from nat.observability.exporter_manager import ExporterManager
+from nat.utils.reactive.subject import Subject
 
 
 def get_exporter_counts():
@@ -1088,3 +1091,227 @@ class TestWaitForTasksExplicitly:
 
         # This should complete without hanging despite the slow task
         await exporter.wait_for_tasks(timeout=0.1)
+
+
+class RecordingExporter(BaseExporter):
+    """Exporter which records the events it receives along with the run they were produced by."""
+
+    def __init__(self, context_state: ContextState | None = None):
+        super().__init__(context_state)
+        self.events: list[tuple[str | None, str]] = []
+        self.start_count = 0
+        self.cleanup_count = 0
+
+    def export(self, event):
+        self.events.append((self._context_state.workflow_run_id.get(), event))
+
+    async def _pre_start(self):
+        self.start_count += 1
+
+    async def _cleanup(self):
+        self.cleanup_count += 1
+
+
+async def _run_workflow(manager: ExporterManager, num_events: int = 3) -> str:
+    """Simulate a workflow run the way the Runner does: a new event stream and run id, then events."""
+    context_state = ContextState.get()
+    run_id = str(uuid.uuid4())
+
+    context_state.event_stream.set(Subject())
+    token = context_state.workflow_run_id.set(run_id)
+
+    try:
+        async with manager.start(context_state=context_state):
+            for i in range(num_events):
+                context_state.event_stream.get().on_next(f"event_{i}")
+                await asyncio.sleep(0)
+
+            context_state.event_stream.get().on_complete()
+    finally:
+        context_state.workflow_run_id.reset(token)
+
+    return run_id
+
+
+class TestSharedExporters:
+    """Test ExporterManager with exporters shared between workflow runs."""
+
+    async def test_exporters_are_started_once(self):
+        exporter1 = RecordingExporter()
+        exporter2 = RecordingExporter()
+        manager = ExporterManager.from_exporters({"e1": exporter1, "e2": exporter2}, shutdown_timeout=1, shared=True)
+
+        assert manager.is_shared
+
+        for _ in range(3):
+            await _run_workflow(manager.get())
+
+        assert exporter1.start_count == 1
+        assert exporter2.start_count == 1
+        assert len(exporter1.events) == 9
+        assert len(exporter2.events) == 9
+        assert not manager._active_isolated_exporters
+
+        await manager.shutdown()
+
+        assert exporter1.cleanup_count == 1
+        assert exporter2.cleanup_count == 1
+        assert not exporter1._running
+
+    async def test_concurrent_runs_keep_their_context(self):
+        exporter = RecordingExporter()
+        manager = ExporterManager.from_exporters({"e": exporter}, shutdown_timeout=1, shared=True)
+
+        run_ids = await asyncio.gather(*(asyncio.create_task(_run_workflow(manager.get())) for _ in range(10)))
+
+        for run_id in run_ids:
+            assert [event for rid, event in exporter.events if rid == run_id] == ["event_0", "event_1", "event_2"]
+
+        assert {rid for rid, _ in exporter.events} == set(run_ids)
+
+        await manager.shutdown()
+
+    async def test_run_unsubscribes_on_exit(self):
+        exporter = RecordingExporter()
+        manager = ExporterManager.from_exporters({"e": exporter}, shutdown_timeout=1, shared=True).get()
+        context_state = ContextState.get()
+
+        context_state.event_stream.set(Subject())
+        subject = context_state.event_stream.get()
+
+        async with manager.start(context_state=context_state):
+            assert len(subject.observers) == 1
+
+        assert len(subject.observers) == 0
+
+        subject.on_next("after the run")
+        assert exporter.events == []
+
+        # Running again on the same copy is allowed once the previous run finished
+        async with manager.start(context_state=context_state):
+            pass
+
+        await manager.shutdown()
+
+    async def test_already_running_raises_error(self):
+        manager = ExporterManager.from_exporters({"e": RecordingExporter()}, shutdown_timeout=1, shared=True)
+
+        async with manager.start():
+            with pytest.raises(RuntimeError, match="already running"):
+                async with manager.start():
+                    pass
+
+        await manager.shutdown()
+
+    async def test_failing_exporter_does_not_affect_others(self, caplog):
+
+        class FailingExporter(RecordingExporter):
+
+            def export(self, event):
+                raise ValueError("export failed")
+
+        healthy = RecordingExporter()
+        manager = ExporterManager.from_exporters({"failing": FailingExporter(), "healthy": healthy},
+                                                 shutdown_timeout=1,
+                                                 shared=True)
+
+        with caplog.at_level(logging.ERROR):
+            await _run_workflow(manager.get())
+
+        assert len(healthy.events) == 3
+        assert "export failed" in caplog.text
+
+        await manager.shutdown()
+
+    async def test_exporters_restart_after_shutdown(self):
+        exporter = RecordingExporter()
+        manager = ExporterManager.from_exporters({"e": exporter}, shutdown_timeout=1, shared=True)
+
+        await _run_workflow(manager.get())
+        await manager.shutdown()
+        await _run_workflow(manager.get())
+
+        assert exporter.start_count == 2
+        assert len(exporter.events) == 6
+
+        await manager.shutdown()
+
+    async def test_exporter_added_to_copy_is_started(self):
+        exporter1 = RecordingExporter()
+        exporter2 = RecordingExporter()
+        manager = ExporterManager.from_exporters({"e1": exporter1}, shutdown_timeout=1, shared=True)
+
+        await _run_workflow(manager.get())
+
+        copy = manager.get()
+        copy.add_exporter("e2", exporter2)
+        await _run_workflow(copy)
+
+        assert exporter1.start_count == 1
+        assert exporter2.start_count == 1
+        assert len(exporter1.events) == 6
+        assert len(exporter2.events) == 3
+
+        await manager.shutdown()
+
+    async def test_exporter_which_fails_to_start_is_retried(self, caplog):
+
+        class BrokenExporter(RecordingExporter):
+
+            async def _pre_start(self):
+                await super()._pre_start()
+                raise ValueError("cannot start")
+
+        broken = BrokenExporter()
+        healthy = RecordingExporter()
+        manager = ExporterManager.from_exporters({"broken": broken, "healthy": healthy}, shutdown_timeout=1, shared=True)
+
+        with caplog.at_level(logging.ERROR):
+            await _run_workflow(manager.get())
+            await _run_workflow(manager.get())
+
+        assert broken.start_count == 2
+        assert healthy.start_count == 1
+        assert len(healthy.events) == 6
+        assert "failed to start" in caplog.text
+
+        await manager.shutdown()
+
+    async def test_shutdown_without_shared_exporters_is_noop(self):
+        manager = ExporterManager.from_exporters({"e": RecordingExporter()}, shutdown_timeout=1)
+
+        assert not manager.is_shared
+        await manager.shutdown()
+
+    @pytest.mark.slow
+    @pytest.mark.benchmark
+    async def test_shared_exporters_request_rate_benchmark(self):
+        """
+        Compares the rate of short workflow runs with 3 exporters configured, when each run creates and starts isolated
+        exporters and when the exporters are shared.
+        """
+        num_runs = 2000
+
+        async def measure(shared: bool) -> float:
+            exporters = {f"exporter_{i}": RecordingExporter() for i in range(3)}
+            manager = ExporterManager.from_exporters(exporters, shutdown_timeout=5, shared=shared)
+
+            start = time.perf_counter()
+            for _ in range(num_runs):
+                await _run_workflow(manager.get())
+            elapsed = time.perf_counter() - start
+
+            await manager.shutdown()
+
+            for exporter in exporters.values():
+                assert len(exporter.events) == num_runs * 3
+
+            return num_runs / elapsed
+
+        isolated_rate = await measure(shared=False)
+        shared_rate = await measure(shared=True)
+
+        print(f"\n{num_runs} runs with 3 exporters: isolated exporters {isolated_rate:.0f} runs/s, "
+              f"shared exporters {shared_rate:.0f} runs/s")
+
+        assert shared_rate > isolated_rate
@@ -101,6 +101,105 @@ async def test_langchain_handler(reactive_stream: Subject):
     assert all_stats[3].payload.data.output == "Hello back!"
 
 
+async def test_langchain_handler_token_coalescing(reactive_stream: Subject):
+    """
+    Test that streamed tokens are coalesced into chunk events which omit the LLM input, and that any remaining tokens
+    are flushed before the LLM_END event.
+    """
+    from langchain_core.messages import AIMessage
+    from langchain_core.outputs import ChatGeneration
+    from langchain_core.outputs import LLMResult
+
+    from nat.data_models.config import TokenCoalescingConfig
+
+    all_stats = []
+    handler = LangchainProfilerHandler(
+        token_coalescing=TokenCoalescingConfig(enable=True, flush_every_n_tokens=3, flush_interval_ms=None))
+    _ = reactive_stream.subscribe(all_stats.append)
+
+    run_id = str(uuid4())
+    await handler.on_llm_start(serialized={}, prompts=["Hello world"], run_id=run_id)
+
+    tokens = ["a", "b", "c", "d", "e"]
+    for token in tokens:
+        await handler.on_llm_new_token(token, run_id=run_id)
+
+    generation = ChatGeneration(message=AIMessage(content="abcde"))
+    await handler.on_llm_end(response=LLMResult(generations=[[generation]]), run_id=run_id)
+
+    assert [s.event_type for s in all_stats] == [
+        IntermediateStepType.LLM_START,
+        IntermediateStepType.LLM_NEW_TOKEN,
+        IntermediateStepType.LLM_NEW_TOKEN,
+        IntermediateStepType.LLM_END,
+    ]
+    assert all_stats[1].payload.data.chunk == "abc"
+    assert all_stats[2].payload.data.chunk == "de"
+
+    for chunk_event in all_stats[1:3]:
+        assert chunk_event.UUID == run_id
+        assert chunk_event.payload.data.input is None
+        assert chunk_event.payload.metadata is None
+
+
+async def test_langchain_handler_token_coalescing_llm_error(reactive_stream: Subject):
+    """
+    Test that the tokens streamed before an LLM call fails are emitted and the buffer of the run is released.
+    """
+    from nat.data_models.config import TokenCoalescingConfig
+
+    all_stats = []
+    handler = LangchainProfilerHandler(
+        token_coalescing=TokenCoalescingConfig(enable=True, flush_every_n_tokens=3, flush_interval_ms=None))
+    _ = reactive_stream.subscribe(all_stats.append)
+
+    run_id = str(uuid4())
+    await handler.on_llm_start(serialized={}, prompts=["Hello world"], run_id=run_id)
+
+    for token in ["a", "b"]:
+        await handler.on_llm_new_token(token, run_id=run_id)
+
+    await handler.on_llm_error(RuntimeError("connection reset"), run_id=run_id)
+
+    assert [s.event_type for s in all_stats] == [IntermediateStepType.LLM_START, IntermediateStepType.LLM_NEW_TOKEN]
+    assert all_stats[1].payload.data.chunk == "ab"
+    assert not handler._token_coalescer._buffers
+
+
+def test_token_coalescer_flush_policies():
+    from nat.profiler.callbacks.token_coalescer import TokenCoalescer
+
+    # Flush on end only
+    coalescer = TokenCoalescer()
+    assert coalescer.add("run", "a") is None
+    assert coalescer.add("run", "b") is None
+    assert coalescer.add("other", "x") is None
+
+    flushed = coalescer.flush("run")
+    assert flushed.text == "ab"
+    assert flushed.num_tokens == 2
+    assert coalescer.flush("run") is None
+    assert coalescer.flush("other").text == "x"
+
+    # Flush by interval, the first token always starts a new buffer
+    coalescer = TokenCoalescer(flush_interval_ms=10)
+    assert coalescer.add("run", "a") is None
+    time.sleep(0.02)
+    flushed = coalescer.add("run", "b", chunk="raw")
+    assert flushed.text == "ab"
+    assert flushed.last_chunk == "raw"
+    assert coalescer.flush("run") is None
+
+
+def test_token_coalescer_from_config():
+    from nat.data_models.config import TokenCoalescingConfig
+    from nat.profiler.callbacks.token_coalescer import TokenCoalescer
+
+    assert TokenCoalescer.from_config(None) is None
+    assert TokenCoalescer.from_config(TokenCoalescingConfig()) is None
+    assert isinstance(TokenCoalescer.from_config(TokenCoalescingConfig(enable=True)), TokenCoalescer)
+
+
 async def test_llama_index_handler_order(reactive_stream: Subject):
     """
     Test that the LlamaIndexProfilerHandler usage stats occur in correct order for LLM events.
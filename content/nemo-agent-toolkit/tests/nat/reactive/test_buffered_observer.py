@@ -0,0 +1,234 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import threading
+from unittest import mock
+
+import pytest
+
+from nat.utils.reactive.buffered_observer import BufferedDeliveryConfig
+from nat.utils.reactive.buffered_observer import BufferedObserver
+from nat.utils.reactive.buffered_observer import OverflowPolicy
+from nat.utils.reactive.observer import Observer
+from nat.utils.reactive.subject import Subject
+
+
+def test_buffered_observer_without_loop_delivers_synchronously():
+    items = []
+    obs = BufferedObserver(Observer(on_next=items.append))
+
+    obs.on_next(1)
+    obs.on_next(2)
+
+    assert items == [1, 2]
+    assert obs.stats.delivered == 2
+
+
+async def test_buffered_observer_delivers_off_producer_stack():
+    items = []
+    completed = []
+    obs = BufferedObserver(Observer(on_next=items.append, on_complete=lambda: completed.append(True)))
+
+    for i in range(5):
+        obs.on_next(i)
+    obs.on_complete()
+
+    # Nothing is delivered until the event loop runs the drain task
+    assert not items
+
+    await obs.drain()
+
+    assert items == [0, 1, 2, 3, 4]
+    assert completed == [True]
+
+    # Events after completion are ignored
+    obs.on_next(5)
+    await obs.drain()
+    assert items == [0, 1, 2, 3, 4]
+
+
+@pytest.mark.parametrize("policy, expected, dropped",
+                         [
+                             (OverflowPolicy.DROP_OLDEST, [2, 3, 4], 2),
+                             (OverflowPolicy.DROP_NEWEST, [0, 1, 2], 2),
+                             (OverflowPolicy.BLOCK, [0, 1, 2, 3, 4], 0),
+                         ])
+async def test_buffered_observer_overflow_policies(policy: OverflowPolicy, expected: list[int], dropped: int):
+    items = []
+    obs = BufferedObserver(Observer(on_next=items.append),
+                           BufferedDeliveryConfig(max_size=3, overflow_policy=policy))
+
+    for i in range(5):
+        obs.on_next(i)
+
+    assert obs.stats.max_lag == 3
+
+    await obs.drain()
+
+    assert items == expected
+    assert obs.stats.dropped == dropped
+    assert obs.stats.delivered == len(expected)
+    assert obs.stats.lag == 0
+
+
+async def test_buffered_observer_sample_policy():
+    items = []
+    obs = BufferedObserver(Observer(on_next=items.append),
+                           BufferedDeliveryConfig(max_size=2, overflow_policy=OverflowPolicy.SAMPLE, sample_every=3))
+
+    for i in range(8):
+        obs.on_next(i)
+
+    await obs.drain()
+
+    # Overflowing events 2..7, every third one (4 and 7) is kept
+    assert items == [4, 7]
+    assert obs.stats.dropped == 6
+
+
+async def test_buffered_observer_block_from_thread():
+    items = []
+    obs = BufferedObserver(Observer(on_next=items.append),
+                           BufferedDeliveryConfig(max_size=2, overflow_policy=OverflowPolicy.BLOCK))
+
+    # Start the drain task on this loop
+    obs.on_next(-1)
+
+    def _produce():
+        for i in range(20):
+            obs.on_next(i)
+
+    await asyncio.to_thread(_produce)
+    await obs.drain()
+
+    assert items == [-1] + list(range(20))
+    assert obs.stats.dropped == 0
+
+
+async def test_buffered_observer_block_inline_signals_space():
+    items = []
+    obs = BufferedObserver(Observer(on_next=items.append),
+                           BufferedDeliveryConfig(max_size=1, overflow_policy=OverflowPolicy.BLOCK))
+    obs._space_available = mock.MagicMock(wraps=obs._space_available)
+
+    obs.on_next(0)
+    obs.on_next(1)
+
+    # The event loop thread delivered the oldest event itself, producers waiting on other threads must be woken up
+    assert items == [0]
+    obs._space_available.notify.assert_called_once()
+
+    await obs.drain()
+    assert items == [0, 1]
+
+
+async def test_buffered_observer_dispose_cancels_drain_task():
+    items = []
+    obs = BufferedObserver(Observer(on_next=items.append))
+
+    obs.on_next(1)
+    task = obs._drain_task
+
+    obs.dispose()
+    await asyncio.sleep(0)
+
+    assert task.cancelled()
+    assert obs.stats.lag == 0
+
+    # Nothing is delivered after the observer is disposed
+    obs.on_next(2)
+    await obs.drain()
+    assert not items
+
+
+@pytest.mark.parametrize("dispose_subject", [False, True], ids=["unsubscribe", "dispose"])
+async def test_subject_disposes_buffered_observers(dispose_subject: bool):
+    sub = Subject[int](delivery_config=BufferedDeliveryConfig())
+
+    items = []
+    subscription = sub.subscribe(items.append)
+    (obs, ) = sub.observers
+
+    sub.on_next(1)
+    task = obs._drain_task
+
+    if (dispose_subject):
+        sub.dispose()
+    else:
+        subscription.unsubscribe()
+    await asyncio.sleep(0)
+
+    assert task.done()
+    assert not items
+
+
+async def test_buffered_observer_error_not_dropped():
+    items = []
+    errors = []
+    obs = BufferedObserver(Observer(on_next=items.append, on_error=errors.append),
+                           BufferedDeliveryConfig(max_size=1, overflow_policy=OverflowPolicy.DROP_NEWEST))
+
+    obs.on_next(1)
+    obs.on_error(ValueError("boom"))
+    obs.on_next(2)
+
+    await obs.drain()
+
+    assert items == [1]
+    assert [str(e) for e in errors] == ["boom"]
+
+
+async def test_subject_buffered_delivery():
+    sub = Subject[int](delivery_config=BufferedDeliveryConfig(max_size=10))
+
+    items = []
+    completed = threading.Event()
+    sub.subscribe(Observer(on_next=items.append, on_complete=completed.set))
+
+    sub.on_next(1)
+    sub.on_next(2)
+
+    assert not items
+    assert sub.delivery_stats()[0].lag == 2
+
+    await sub.drain()
+
+    assert items == [1, 2]
+    assert sub.delivery_stats()[0].delivered == 2
+
+    sub.on_complete()
+    await asyncio.sleep(0)
+
+    assert completed.is_set()
+
+
+async def test_per_subscription_buffered_delivery():
+    sub = Subject[int]()
+
+    sync_items = []
+    buffered_items = []
+    sub.subscribe(sync_items.append)
+    sub.subscribe(buffered_items.append, delivery_config=BufferedDeliveryConfig())
+
+    sub.on_next(1)
+
+    assert sync_items == [1]
+    assert not buffered_items
+
+    await sub.drain()
+
+    assert buffered_items == [1]
+    assert len(sub.delivery_stats()) == 1
@@ -84,3 +84,21 @@ def test_subject_late_subscriber_after_dispose():
     sub.subscribe(Observer(on_next=items.append))
     sub.on_next("ignored")
     assert not items
+
+
+def test_subject_observers_snapshot():
+    sub = Subject[str]()
+    assert sub.observers == ()
+
+    obs = Observer(on_next=lambda _: None)
+    subscription = sub.subscribe(obs)
+
+    snapshot = sub.observers
+    assert snapshot == (obs, )
+
+    # The snapshot is stable until subscriptions change
+    assert sub.observers is snapshot
+
+    subscription.unsubscribe()
+    assert sub.observers == ()
+    assert snapshot == (obs, )
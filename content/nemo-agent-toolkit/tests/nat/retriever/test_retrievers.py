@@ -13,6 +13,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import json
+import time
+
+import httpx
 import pytest
 from langchain_core.embeddings import Embeddings
 from pytest_httpserver import HTTPServer
@@ -109,6 +114,7 @@ class CustomMilvusClient:
         assert isinstance(anns_field, str)
         to_return = min(limit, 4)
 
+        # One list of hits per query vector
         return [[
             {
                 'id': '1234', 'distance': 0.45, 'entity': self._get_entity_from_fields(output_fields, num=1)
@@ -122,7 +128,7 @@ class CustomMilvusClient:
             {
                 'id': '1357', 'distance': 0.85, 'entity': self._get_entity_from_fields(output_fields, num=4)
             },
-        ][:to_return]]
+        ][:to_return] for _ in data]
 
     def search_iterator(
         self,
@@ -258,6 +264,155 @@ async def test_milvus_validation(milvus_retriever):
         _ = await milvus_retriever.search(query="Test query", collection_name="collection1", top_k=2)
 
 
+class SlowMilvusClient(CustomMilvusClient):
+    """Stand-in for a remote Milvus service, each call blocks for the round trip latency."""
+
+    def __init__(self, latency: float, **kwargs):
+        super().__init__(**kwargs)
+        self.latency = latency
+        self.num_calls = 0
+
+    def list_collections(self):
+        self.num_calls += 1
+        time.sleep(self.latency)
+        return super().list_collections()
+
+    def describe_collection(self, collection_name: str):
+        self.num_calls += 1
+        time.sleep(self.latency)
+        return super().describe_collection(collection_name)
+
+    def search(self, **kwargs):
+        self.num_calls += 1
+        time.sleep(self.latency)
+        return super().search(**kwargs)
+
+
+class SlowEmbeddings(TestEmbeddings):
+
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    def embed_query(self, text):
+        time.sleep(self.latency)
+        return super().embed_query(text)
+
+
+async def test_milvus_search_many():
+    client = SlowMilvusClient(latency=0)
+    retriever = MilvusRetriever(client=client, embedder=TestEmbeddings())
+    retriever.bind(collection_name="collection1", output_fields=["title"])
+
+    results = await retriever.search_many(["query 1", "query 2", "query 3"], top_k=2)
+
+    assert len(results) == 3
+    for res in results:
+        assert isinstance(res, RetrieverOutput)
+        assert len(res) == 2
+        _validate_document_milvus(res.results[0], ["title"])
+
+    # All queries are sent in a single search, the collection list and schema are cached
+    calls = client.num_calls
+    await retriever.search_many(["query 4", "query 5"], top_k=2)
+    assert client.num_calls == calls + 1
+
+
+async def test_milvus_search_does_not_block_event_loop():
+    retriever = MilvusRetriever(client=SlowMilvusClient(latency=0.2), embedder=SlowEmbeddings(latency=0.2))
+
+    ticks = 0
+
+    async def _ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    ticker = asyncio.create_task(_ticker())
+    try:
+        await retriever.search(query="Test query", collection_name="collection1", top_k=2)
+    finally:
+        ticker.cancel()
+
+    # The search took at least 0.8 seconds, the event loop must have kept running during it
+    assert ticks > 20
+
+
+async def test_milvus_async_client():
+    sync_client = SlowMilvusClient(latency=0)
+
+    class AsyncClient:
+
+        def __init__(self):
+            self.num_calls = 0
+
+        async def list_collections(self):
+            self.num_calls += 1
+            return CustomMilvusClient.list_collections(sync_client)
+
+        async def describe_collection(self, collection_name: str):
+            self.num_calls += 1
+            return CustomMilvusClient.describe_collection(sync_client, collection_name)
+
+        async def search(self, **kwargs):
+            self.num_calls += 1
+            return CustomMilvusClient.search(sync_client, **kwargs)
+
+    async_client = AsyncClient()
+    retriever = MilvusRetriever(client=sync_client, embedder=TestEmbeddings(), async_client=async_client)
+
+    res = await retriever.search(query="Test query", collection_name="collection1", top_k=3)
+
+    assert len(res) == 3
+    assert async_client.num_calls == 3
+    assert sync_client.num_calls == 0
+
+
+@pytest.mark.slow
+@pytest.mark.benchmark
+async def test_milvus_concurrent_search_benchmark():
+    latency = 0.02
+    num_queries = 20
+    queries = [f"query {i}" for i in range(num_queries)]
+
+    # Previous behaviour: three blocking round trips and a blocking embedding per search, run on the event loop
+    client = SlowMilvusClient(latency=latency)
+    embedder = SlowEmbeddings(latency=latency)
+    start = time.perf_counter()
+    for query in queries:
+        client.list_collections()
+        client.describe_collection("collection1")
+        client.search(collection_name="collection1",
+                      data=[embedder.embed_query(query)],
+                      limit=4,
+                      search_params={},
+                      filter=None,
+                      output_fields=["text"],
+                      timeout=None,
+                      anns_field="vector")
+    blocking_elapsed = time.perf_counter() - start
+
+    retriever = MilvusRetriever(client=SlowMilvusClient(latency=latency), embedder=SlowEmbeddings(latency=latency))
+    retriever.bind(collection_name="collection1", top_k=4)
+    start = time.perf_counter()
+    await asyncio.gather(*(retriever.search(query) for query in queries))
+    concurrent_elapsed = time.perf_counter() - start
+
+    retriever = MilvusRetriever(client=SlowMilvusClient(latency=latency), embedder=SlowEmbeddings(latency=latency))
+    retriever.bind(collection_name="collection1", top_k=4)
+    start = time.perf_counter()
+    results = await retriever.search_many(queries)
+    batched_elapsed = time.perf_counter() - start
+
+    assert len(results) == num_queries
+    print(f"\nBlocking: {num_queries / blocking_elapsed:.0f} queries/s, "
+          f"concurrent: {num_queries / concurrent_elapsed:.0f} queries/s, "
+          f"search_many: {num_queries / batched_elapsed:.0f} queries/s")
+
+    assert concurrent_elapsed < blocking_elapsed
+    assert batched_elapsed < blocking_elapsed
+
+
 @pytest.fixture(name="nemo_retriever")
 def get_nemo_retriever(httpserver: HTTPServer):
     httpserver.expect_request(
@@ -378,3 +533,102 @@ async def test_nemo_binding(nemo_retriever):
 
     nemo_retriever.bind(top_k=2, collection_name="test_collection_1")
     _ = await nemo_retriever.search("Test query")
+
+
+def _num_requests(httpserver: HTTPServer, path: str) -> int:
+    return sum(1 for request, _ in httpserver.log if request.path == path)
+
+
+async def test_nemo_retriever_reuses_client(nemo_retriever, httpserver: HTTPServer):
+
+    for _ in range(3):
+        res = await nemo_retriever.search("Test query", collection_name="test_collection_1", top_k=2)
+        assert len(res) == 2
+
+    client = nemo_retriever.client
+    await nemo_retriever.search("Test query", collection_name="test_collection_2", top_k=2)
+    assert nemo_retriever.client is client
+
+    # The collections are only fetched once
+    assert _num_requests(httpserver, "/v1/collections") == 1
+
+    await nemo_retriever.aclose()
+    assert client.is_closed
+
+    # A new client is created after closing
+    res = await nemo_retriever.search("Test query", collection_name="test_collection_1", top_k=2)
+    assert len(res) == 2
+    assert nemo_retriever.client is not client
+    await nemo_retriever.aclose()
+
+
+async def test_nemo_retriever_collection_cache_expiry(httpserver: HTTPServer, nemo_retriever):
+    nemo_retriever.collection_cache_ttl = 0
+
+    await nemo_retriever.search("Test query", collection_name="test_collection_1", top_k=2)
+    await nemo_retriever.search("Test query", collection_name="test_collection_1", top_k=2)
+    assert _num_requests(httpserver, "/v1/collections") == 2
+
+    nemo_retriever.collection_cache_ttl = 60
+    nemo_retriever.invalidate_collections()
+    await nemo_retriever.search("Test query", collection_name="test_collection_1", top_k=2)
+    await nemo_retriever.search("Test query", collection_name="test_collection_1", top_k=2)
+    assert _num_requests(httpserver, "/v1/collections") == 3
+
+    await nemo_retriever.aclose()
+
+
+async def test_nemo_retriever_search_many(nemo_retriever, httpserver: HTTPServer):
+    nemo_retriever.bind(top_k=2, collection_name="test_collection_1")
+
+    async with nemo_retriever:
+        results = await nemo_retriever.search_many(["query 1", "query 2", "query 3"], output_fields=["title"])
+
+        assert len(results) == 3
+        for res in results:
+            assert isinstance(res, RetrieverOutput)
+            assert len(res) == 2
+            assert "title" in res.results[0].metadata
+            assert "author" not in res.results[0].metadata
+
+        with pytest.raises(CollectionUnavailableError):
+            await nemo_retriever.search_many(["query 1"], collection_name="collection_not_exist")
+
+    assert _num_requests(httpserver, "/v1/collections/92e2c5e6/search") == 3
+
+
+@pytest.mark.slow
+@pytest.mark.benchmark
+async def test_nemo_retriever_pooled_client_benchmark(nemo_retriever):
+    num_queries = 200
+    url = nemo_retriever.base_url
+
+    # Previous behaviour: a new client, connection and collection lookup per search
+    start = time.perf_counter()
+    for _ in range(num_queries):
+        async with httpx.AsyncClient(timeout=60) as client:
+            collection = await nemo_retriever.get_collections(client)
+            await client.post(f"{url}v1/collections/{collection[0].id}/search",
+                              content=json.dumps({
+                                  "query": "Test query", "top_k": 2
+                              }))
+    per_request_elapsed = time.perf_counter() - start
+
+    async with nemo_retriever:
+        start = time.perf_counter()
+        for _ in range(num_queries):
+            await nemo_retriever.search("Test query", collection_name="test_collection_1", top_k=2)
+        pooled_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        results = await nemo_retriever.search_many(["Test query"] * num_queries,
+                                                   collection_name="test_collection_1",
+                                                   top_k=2)
+        batched_elapsed = time.perf_counter() - start
+
+    assert len(results) == num_queries
+    print(f"\nClient per search: {num_queries / per_request_elapsed:.0f} queries/s, "
+          f"pooled client: {num_queries / pooled_elapsed:.0f} queries/s, "
+          f"search_many: {num_queries / batched_elapsed:.0f} queries/s")
+
+    assert pooled_elapsed < per_request_elapsed
@@ -0,0 +1,283 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import importlib.metadata
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+from nat.cli.type_registry import GlobalTypeRegistry
+from nat.data_models.component import ComponentEnum
+from nat.runtime import loader
+from nat.runtime.plugin_index import PluginIndex
+from nat.runtime.plugin_index import PluginIndexEntry
+from nat.runtime.plugin_index import collect_config_types
+from nat.runtime.plugin_index import compute_fingerprint
+from nat.runtime.plugin_index import read_plugin_index
+from nat.runtime.plugin_index import write_plugin_index
+
+# Each module is exposed as an entry point. The client module imports the provider module's config, like framework
+# plugins do with the core providers.
+_PLUGIN_MODULES = {
+    "nat_lazy_test_function":
+        """
+        from nat.cli.register_workflow import register_function
+        from nat.data_models.function import FunctionBaseConfig
+
+        class LazyFunctionConfig(FunctionBaseConfig, name="lazy_test_function"):
+            pass
+
+        @register_function(config_type=LazyFunctionConfig, framework_wrappers=["lazy_framework"])
+        async def lazy_function(config, builder):
+
+            async def _inner(message: str) -> str:
+                return message
+
+            yield _inner
+        """,
+    "nat_lazy_test_llm":
+        """
+        from nat.builder.llm import LLMProviderInfo
+        from nat.cli.register_workflow import register_llm_provider
+        from nat.data_models.llm import LLMBaseConfig
+
+        class LazyLLMConfig(LLMBaseConfig, name="lazy_test_llm"):
+            pass
+
+        @register_llm_provider(config_type=LazyLLMConfig)
+        async def lazy_llm(config, builder):
+            yield LLMProviderInfo(config=config, description="A lazily loaded LLM.")
+        """,
+    "nat_lazy_test_client":
+        """
+        from nat.cli.register_workflow import register_llm_client
+        from nat_lazy_test_llm import LazyLLMConfig
+
+        @register_llm_client(config_type=LazyLLMConfig, wrapper_type="lazy_framework")
+        async def lazy_client(config, builder):
+            yield object()
+        """,
+}
+
+
+@pytest.fixture(name="plugin_entry_points")
+def plugin_entry_points_fixture(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+
+    module_dir = tmp_path / "modules"
+    module_dir.mkdir()
+
+    for module_name, source in _PLUGIN_MODULES.items():
+        (module_dir / f"{module_name}.py").write_text(textwrap.dedent(source))
+
+    monkeypatch.syspath_prepend(str(module_dir))
+    monkeypatch.setenv("NAT_PLUGIN_INDEX_PATH", str(tmp_path / "plugin_index.json"))
+
+    entry_points = [
+        importlib.metadata.EntryPoint(name=module_name, value=module_name, group="nat.components")
+        for module_name in _PLUGIN_MODULES
+    ]
+
+    def discover_entrypoints(plugin_type: loader.PluginTypes):
+        return entry_points if plugin_type & loader.PluginTypes.COMPONENT else []
+
+    monkeypatch.setattr(loader, "discover_entrypoints", discover_entrypoints)
+
+    # Restored after the test, since `_new_process` replaces it
+    monkeypatch.setattr(loader, "_lazy_state", loader._LazyDiscoveryState())
+
+    yield entry_points
+
+    for module_name in _PLUGIN_MODULES:
+        sys.modules.pop(module_name, None)
+
+
+def _new_process():
+    """
+    Simulates a fresh process by forgetting the imported plugin modules and any lazily loaded state.
+    """
+    for module_name in _PLUGIN_MODULES:
+        sys.modules.pop(module_name, None)
+
+    loader._lazy_state = loader._LazyDiscoveryState()
+
+
+def _imported() -> set[str]:
+    return {module_name for module_name in _PLUGIN_MODULES if module_name in sys.modules}
+
+
+def test_collect_config_types():
+    config = {
+        "functions": {
+            "a": {
+                "_type": "tool_a", "tool_names": ["x"]
+            }, "b": {
+                "type": "tool_b", "nested": [{
+                    "_type": "pkg/tool_c"
+                }]
+            }
+        },
+        "workflow": {
+            "_type": "react_agent", "type": 5
+        },
+    }
+
+    assert collect_config_types(config) == ({"tool_a", "pkg/tool_c", "react_agent"}, {"tool_b"})
+
+
+def test_fingerprint_tracks_entry_points():
+    entry_point_a = importlib.metadata.EntryPoint(name="a", value="pkg_a.register", group="nat.components")
+    entry_point_b = importlib.metadata.EntryPoint(name="b", value="pkg_b.register", group="nat.components")
+    moved_b = importlib.metadata.EntryPoint(name="b", value="pkg_b.other", group="nat.components")
+
+    assert compute_fingerprint([entry_point_a, entry_point_b]) == compute_fingerprint([entry_point_b, entry_point_a])
+    assert compute_fingerprint([entry_point_a, entry_point_b]) != compute_fingerprint([entry_point_a])
+    assert compute_fingerprint([entry_point_a, entry_point_b]) != compute_fingerprint([entry_point_a, moved_b])
+
+
+def test_read_write_plugin_index(tmp_path: Path):
+    index_path = tmp_path / "nested" / "plugin_index.json"
+    index = PluginIndex(fingerprint="abc",
+                        entries={
+                            "nat.components:a":
+                                PluginIndexEntry(group="nat.components",
+                                                 name="a",
+                                                 value="pkg_a.register",
+                                                 types=["pkg_a/tool"],
+                                                 clients=[("llm_client", "pkg_a/llm", "langchain"),
+                                                          ("retriever_client", "pkg_a/retriever", None)],
+                                                 tool_wrappers=["langchain"])
+                        })
+
+    assert read_plugin_index(index_path, "abc") is None
+
+    write_plugin_index(index, index_path)
+
+    assert read_plugin_index(index_path, "abc") == index
+    assert read_plugin_index(index_path, "other") is None
+
+    index_path.write_text("not json")
+    assert read_plugin_index(index_path, "abc") is None
+
+
+def test_plugin_index_lookups():
+    index = PluginIndex(fingerprint="abc",
+                        entries={
+                            "a": PluginIndexEntry(group="g", name="a", value="a", types=["pkg_a/tool", "pkg_a/llm"]),
+                            "b": PluginIndexEntry(group="g",
+                                                  name="b",
+                                                  value="b",
+                                                  clients=[("llm_client", "pkg_a/llm", "langchain")],
+                                                  tool_wrappers=["langchain"]),
+                        })
+
+    assert index.has_type("tool") and index.has_type("pkg_a/tool")
+    assert not index.has_type("pkg_b/tool")
+
+    assert index.find_types(["tool"]) == {"a"}
+    assert index.find_clients(["llm"], ["langchain"]) == {"b"}
+    assert index.find_clients(["llm"], ["crewai"]) == set()
+    assert index.find_clients(["other"], ["langchain"]) == {"b"}
+    assert index.find_client(ComponentEnum.LLM_CLIENT, "pkg_a/llm", "langchain") == {"b"}
+    assert index.find_client(ComponentEnum.LLM_CLIENT, "pkg_a/llm", "crewai") == set()
+
+
+def test_lazy_discovery_loads_referenced_plugins(plugin_entry_points, tmp_path: Path):
+    _new_process()
+
+    config = {"workflow": {"_type": "lazy_test_function"}, "llms": {"llm": {"_type": "lazy_test_llm"}}}
+
+    # The first run builds the index, which loads every plugin
+    with GlobalTypeRegistry.push():
+        loader.discover_and_register_plugins_for_config(config, lazy=True)
+
+        assert _imported() == set(_PLUGIN_MODULES)
+
+    index_path = tmp_path / "plugin_index.json"
+    index = read_plugin_index(index_path, compute_fingerprint(plugin_entry_points))
+
+    assert index is not None
+    assert index.entries["nat.components:nat_lazy_test_function"].types == [
+        "nat_lazy_test_function/lazy_test_function"
+    ]
+    assert index.entries["nat.components:nat_lazy_test_client"].clients == [
+        ("llm_client", "nat_lazy_test_llm/lazy_test_llm", "lazy_framework")
+    ]
+
+    # The LLM does not need the client for an LLM framework that is not used by any function
+    _new_process()
+
+    with GlobalTypeRegistry.push():
+        loader.discover_and_register_plugins_for_config({"llms": {"llm": {"_type": "lazy_test_llm"}}}, lazy=True)
+
+        assert _imported() == {"nat_lazy_test_llm"}
+
+    # The function uses `lazy_framework`, so the client for the LLM in that framework is loaded as well
+    _new_process()
+
+    with GlobalTypeRegistry.push():
+        loader.discover_and_register_plugins_for_config(config, lazy=True)
+
+        assert _imported() == set(_PLUGIN_MODULES)
+
+
+def test_lazy_discovery_loads_missing_clients_on_demand(plugin_entry_points):
+    _new_process()
+
+    with GlobalTypeRegistry.push():
+        loader.discover_and_register_plugins_for_config({}, lazy=True)
+
+    _new_process()
+
+    with GlobalTypeRegistry.push() as registry:
+        loader.discover_and_register_plugins_for_config({"llms": {"llm": {"_type": "lazy_test_llm"}}}, lazy=True)
+
+        assert "nat_lazy_test_client" not in sys.modules
+
+        llm_config_type = sys.modules["nat_lazy_test_llm"].LazyLLMConfig
+
+        assert registry.get_llm_client(llm_config_type, "lazy_framework").llm_framework == "lazy_framework"
+        assert "nat_lazy_test_client" in sys.modules
+
+        with pytest.raises(KeyError):
+            registry.get_llm_client(llm_config_type, "unknown_framework")
+
+
+def test_lazy_discovery_falls_back_for_unknown_types(plugin_entry_points):
+    _new_process()
+
+    with GlobalTypeRegistry.push():
+        loader.discover_and_register_plugins_for_config({}, lazy=True)
+
+    _new_process()
+
+    with GlobalTypeRegistry.push():
+        loader.discover_and_register_plugins_for_config({"workflow": {"_type": "not_installed"}}, lazy=True)
+
+        assert _imported() == set(_PLUGIN_MODULES)
+
+
+def test_index_is_not_persisted_when_plugins_were_already_imported(plugin_entry_points, tmp_path: Path):
+    _new_process()
+
+    with GlobalTypeRegistry.push():
+        __import__("nat_lazy_test_llm")
+
+        loader.discover_and_register_plugins_for_config({}, lazy=True)
+
+        assert _imported() == set(_PLUGIN_MODULES)
+
+    assert not (tmp_path / "plugin_index.json").exists()
@@ -13,16 +13,23 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import logging
 import multiprocessing
+import threading
+import time
 from urllib.parse import urljoin
 
+import httpx
 import pytest
-import requests
 from pytest_httpserver import HTTPServer
 
 from nat.tool.code_execution import code_sandbox
+from nat.tool.code_execution.local_sandbox import local_sandbox_server
+from nat.tool.code_execution.local_sandbox.local_sandbox_server import CodeExecutionStatus
+from nat.tool.code_execution.local_sandbox.local_sandbox_server import WorkerPool
 from nat.tool.code_execution.local_sandbox.local_sandbox_server import do_execute
+from nat.tool.code_execution.local_sandbox.local_sandbox_server import execute_python
 
 logger = logging.getLogger(__name__)
 
@@ -65,7 +72,7 @@ async def test_bad_response(httpserver: HTTPServer):
     client = code_sandbox.get_sandbox("local", uri="http://localhost:9999")
 
     # Test that connection error is raised when the service is unavailable
-    with pytest.raises(requests.exceptions.ConnectionError):
+    with pytest.raises(httpx.ConnectError):
         _ = await client.execute_code(generated_code='print("Hello World")')
 
     # Test for JSON parsing error
@@ -125,3 +132,148 @@ print(5+5)
     assert resp.get("process_status") == "completed"
     assert resp.get("stdout").rstrip() == "10"
     assert resp.get("stderr") == ""
+
+
+async def test_client_does_not_block_event_loop(httpserver: HTTPServer):
+    client = code_sandbox.get_sandbox("local", uri=httpserver.url_for("/execute"))
+    httpserver.expect_request("/execute", method="POST").respond_with_handler(do_execute)
+
+    ticks = 0
+
+    async def _ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    ticker = asyncio.create_task(_ticker())
+    try:
+        resp = await client.execute_code(generated_code="import time; time.sleep(1); print('done')")
+    finally:
+        ticker.cancel()
+        await client.aclose()
+
+    assert resp.get("stdout").rstrip() == "done"
+    assert ticks > 50
+
+
+async def test_client_of_previous_event_loop_is_closed():
+    sandbox = code_sandbox.get_sandbox("local", uri="http://localhost:6000")
+
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+
+    async def _get_client() -> httpx.AsyncClient:
+        return sandbox.http_client
+
+    try:
+        old_client = asyncio.run_coroutine_threadsafe(_get_client(), loop).result()
+
+        # Using the sandbox from this event loop replaces the client, the old one is closed on its own loop
+        assert sandbox.http_client is not old_client
+        await asyncio.sleep(0.1)
+        assert old_client.is_closed
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+        await sandbox.aclose()
+
+
+@pytest.fixture(name="worker_pool")
+def worker_pool_fixture():
+    pool = WorkerPool(num_workers=2, max_jobs_per_worker=3, preload_modules=["json", "module_does_not_exist"])
+    yield pool
+    pool.shutdown()
+
+
+def _worker_pids(pool: WorkerPool) -> set[int]:
+    return {worker.process.pid for worker in list(pool._idle.queue)}
+
+
+def test_worker_pool_execute(worker_pool: WorkerPool):
+    result = worker_pool.execute("import sys; print('json' in sys.modules)", timeout=10)
+    assert result.process_status == CodeExecutionStatus.COMPLETED
+    assert result.stdout.rstrip() == "True"
+
+    result = worker_pool.execute("print(1/0)", timeout=10)
+    assert result.process_status == CodeExecutionStatus.ERROR
+    assert result.stderr.startswith("Traceback")
+
+    # Exiting does not stop the worker
+    pids = _worker_pids(worker_pool)
+    result = worker_pool.execute("import sys; sys.exit(1)", timeout=10)
+    assert result.process_status == CodeExecutionStatus.ERROR
+    assert len(_worker_pids(worker_pool) - pids) == 0
+
+    # Each execution gets new globals
+    worker_pool.execute("x = 5", timeout=10)
+    worker_pool.execute("x = 5", timeout=10)
+    result = worker_pool.execute("print(x)", timeout=10)
+    assert result.process_status == CodeExecutionStatus.ERROR
+    assert "NameError" in result.stderr
+
+
+def test_worker_pool_replaces_workers(worker_pool: WorkerPool):
+    pids = _worker_pids(worker_pool)
+
+    # Timed out workers are killed and replaced
+    result = worker_pool.execute("import time; time.sleep(5)", timeout=1)
+    assert result.process_status == CodeExecutionStatus.TIMEOUT
+    assert len(_worker_pids(worker_pool) - pids) == 1
+
+    # So are crashed workers
+    result = worker_pool.execute("import os; os._exit(1)", timeout=10)
+    assert result.process_status == CodeExecutionStatus.ERROR
+    assert len(_worker_pids(worker_pool) - pids) == 2
+
+    for _ in range(6):
+        result = worker_pool.execute("print('ok')", timeout=10)
+        assert result.stdout.rstrip() == "ok"
+
+    # Workers are recycled after max_jobs_per_worker executions
+    assert len(_worker_pids(worker_pool) & pids) == 0
+    assert len(_worker_pids(worker_pool)) == 2
+
+
+def test_execute_python_uses_worker_pool(monkeypatch):
+    monkeypatch.setenv("SANDBOX_WORKERS", "1")
+    monkeypatch.setattr(local_sandbox_server, "_worker_pool", None)
+
+    try:
+        result = execute_python("import os; print(os.getpid())", timeout=10)
+        assert result.process_status == CodeExecutionStatus.COMPLETED
+
+        pool = local_sandbox_server.get_worker_pool()
+        assert pool is not None
+        assert int(result.stdout) in _worker_pids(pool)
+    finally:
+        if local_sandbox_server._worker_pool is not None:
+            local_sandbox_server._worker_pool.shutdown()
+
+
+@pytest.mark.slow
+@pytest.mark.benchmark
+def test_worker_pool_benchmark():
+    num_snippets = 50
+    snippets = [f"print(sum(range({i})))" for i in range(num_snippets)]
+
+    start = time.perf_counter()
+    for snippet in snippets:
+        assert execute_python(snippet, timeout=30).process_status == CodeExecutionStatus.COMPLETED
+    per_request_elapsed = time.perf_counter() - start
+
+    pool = WorkerPool(num_workers=4)
+    try:
+        start = time.perf_counter()
+        for snippet in snippets:
+            assert pool.execute(snippet, timeout=30).process_status == CodeExecutionStatus.COMPLETED
+        pool_elapsed = time.perf_counter() - start
+    finally:
+        pool.shutdown()
+
+    print(f"\nProcess per request: {num_snippets / per_request_elapsed:.0f} snippets/s, "
+          f"worker pool: {num_snippets / pool_elapsed:.0f} snippets/s")
+
+    assert pool_elapsed < per_request_elapsed
@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import time
 from io import BytesIO
 from io import TextIOWrapper
 
@@ -458,3 +459,98 @@ def test_try_convert_preserves_object_identity():
     original_dict = {"key": "value"}
     result = converter.try_convert(original_dict, list)
     assert result is original_dict  # Same object, not a copy
+
+
+# --------------------------------------------------------------------
+# Compiled conversion paths
+# --------------------------------------------------------------------
+def test_conversion_paths_are_compiled_once(basic_converter, monkeypatch):
+    """Repeated conversions between the same types do not search the registry again, including when there is no path."""
+    assert basic_converter.convert({"value": "1"}, float) == 1.0
+
+    with pytest.raises(ValueError):
+        basic_converter.convert(1.5, dict)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("The conversion path should have been cached")
+
+    monkeypatch.setattr(basic_converter, "_try_indirect_conversion", fail)
+
+    assert basic_converter.convert({"value": "2"}, float) == 2.0
+
+    with pytest.raises(ValueError):
+        basic_converter.convert(2.5, dict)
+
+
+def test_compiled_paths_are_invalidated_by_new_converters(parent_converter, child_converter):
+    with pytest.raises(ValueError):
+        child_converter.convert(1.5, dict)
+
+    def convert_float_to_dict(f: float) -> dict:
+        return {"value": f}
+
+    # Adding a converter to the parent invalidates the paths compiled by the child
+    parent_converter.add_converter(convert_float_to_dict)
+
+    assert child_converter.convert(1.5, dict) == {"value": 1.5}
+
+
+def test_compiled_path_falls_back_for_values_it_does_not_apply_to():
+    """
+    If a converter on the compiled path rejects a value, the other paths are searched for that value.
+    """
+
+    def convert_dict_to_int(d: dict) -> int:
+        if "int" not in d:
+            raise ConvertException("No int")
+        return d["int"]
+
+    def convert_int_to_float(i: int) -> float:
+        return float(i)
+
+    converter = TypeConverter([convert_dict_to_str, convert_str_to_float, convert_dict_to_int, convert_int_to_float])
+
+    assert converter.convert({"value": "1.5"}, float) == 1.5
+    assert converter.convert({"value": "x", "int": 2}, float) == 2.0
+    assert converter.convert({"value": "2.5"}, float) == 2.5
+
+
+# --------------------------------------------------------------------
+# Benchmark over the converters registered by nat.data_models.api_server
+# --------------------------------------------------------------------
+@pytest.mark.slow
+@pytest.mark.benchmark
+def test_api_server_conversion_benchmark():
+    """
+    Measures conversions between the API server models and strings through a function-level converter, which falls
+    back on the global converter like `Function` does.
+    """
+    from nat.data_models.api_server import ChatRequest
+    from nat.data_models.api_server import ChatResponse
+
+    converter = TypeConverter([])
+
+    chat_request = converter.convert("Hello", ChatRequest)
+    chat_response = converter.convert("Hello", ChatResponse)
+
+    cases = [
+        ("ChatRequest -> str", chat_request, str),
+        ("str -> ChatRequest", "Hello", ChatRequest),
+        ("ChatResponse -> str", chat_response, str),
+        ("str -> ChatResponse", "Hello", ChatResponse),
+        ("str -> ChatResponse | ChatRequest", "Hello", ChatResponse | ChatRequest),
+        ("str -> BytesIO (no path)", "Hello", BytesIO),
+    ]
+
+    num_calls = 20_000
+
+    for name, data, to_type in cases:
+        start = time.perf_counter()
+        for _ in range(num_calls):
+            try:
+                converter.convert(data, to_type)
+            except ValueError:
+                pass
+        elapsed = time.perf_counter() - start
+
+        print(f"\n{name}: {elapsed / num_calls * 1e6:.2f} us/call")
@@ -0,0 +1,65 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import logging
+import threading
+import time
+
+import httpx
+import pytest
+
+from nat.utils.http_client_utils import close_client_on_loop
+
+
+@pytest.fixture(name="background_loop")
+def background_loop_fixture():
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+
+    yield loop
+
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    loop.close()
+
+
+def test_close_client_on_running_loop(background_loop: asyncio.AbstractEventLoop):
+
+    async def _create_client() -> httpx.AsyncClient:
+        return httpx.AsyncClient()
+
+    client = asyncio.run_coroutine_threadsafe(_create_client(), background_loop).result()
+
+    close_client_on_loop(client, background_loop)
+
+    deadline = time.monotonic() + 5
+    while not client.is_closed and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert client.is_closed
+
+
+def test_close_client_on_closed_loop(caplog: pytest.LogCaptureFixture):
+    loop = asyncio.new_event_loop()
+    loop.close()
+    client = httpx.AsyncClient()
+
+    with caplog.at_level(logging.WARNING):
+        close_client_on_loop(client, loop)
+
+    assert "Discarding an HTTP client" in caplog.text
+
@@ -13,8 +13,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import asyncio
+import time
 from collections.abc import Iterable
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+from email.utils import format_datetime
 
+import httpx
 import pytest
 
 from nat.utils.exception_handlers import automatic_retries as ar
@@ -121,11 +127,14 @@ class Service:
 
 # monkey-patch time.sleep / asyncio.sleep so tests run instantly -------------
 @pytest.fixture(autouse=True)
-def fast_sleep(monkeypatch):
+def fast_sleep(request, monkeypatch):
     """Fixture that monkey‑patches blocking sleeps with no‑ops.
 
-    Eliminates real delays so the test suite executes near‑instantaneously.
+    Eliminates real delays so the test suite executes near‑instantaneously. Benchmarks keep the real sleeps.
     """
+    if request.node.get_closest_marker("benchmark"):
+        return
+
     # Patch time.sleep with a synchronous no‑op.
     monkeypatch.setattr(ar.time, "sleep", lambda *_: None)
 
@@ -398,3 +407,374 @@ def test_exception_propagation_in_nested_calls():
     # Inner should be called twice (once per outer call, no nested retries)
     assert svc.outer_calls == 2
     assert svc.inner_calls == 2
+
+
+
+# ---------------------------------------------------------------------------
+# 4. Back-off strategies, retry hints, retry budget and circuit breaking
+# ---------------------------------------------------------------------------
+class HintedAPIError(APIError):
+    """`APIError` carrying the response headers, like the errors of HTTP clients."""
+
+    def __init__(self, code: int, headers: dict | httpx.Headers, msg: str = ""):
+        super().__init__(code, msg)
+        self.response = httpx.Response(code, headers=headers)
+
+
+class FlakyCall:
+    """Callable failing with the given exceptions in order, then returning 'ok'."""
+
+    def __init__(self, *errors: BaseException):
+        self.errors = list(errors)
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return "ok"
+
+
+@pytest.fixture(name="sleeps")
+def sleeps_fixture(monkeypatch) -> list[float]:
+    """Record the delays the retry wrappers sleep for, without sleeping."""
+    sleeps = []
+    monkeypatch.setattr(ar.time, "sleep", sleeps.append)
+    return sleeps
+
+
+@pytest.mark.parametrize(
+    "exc,expected",
+    [
+        (HintedAPIError(429, {"Retry-After": "3"}), 3.0),
+        (HintedAPIError(429, httpx.Headers({"retry-after": "1.5"})), 1.5),
+        (HintedAPIError(429, {"retry-after-ms": "250"}), 0.25),
+        (HintedAPIError(503, {"Retry-After": "not a date"}), None),
+        (HintedAPIError(503, {}), None),
+        (APIError(503), None),
+    ],
+)
+def test_extract_retry_after(exc, expected):
+    assert ar._extract_retry_after(exc) == expected
+
+
+def test_extract_retry_after_http_date_and_attribute():
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+    hint = ar._extract_retry_after(HintedAPIError(503, {"Retry-After": format_datetime(retry_at, usegmt=True)}))
+    assert 25 < hint <= 30
+
+    exc = APIError(429)
+    exc.retry_after = 2
+    assert ar._extract_retry_after(exc) == 2.0
+
+
+def test_backoff_strategies():
+    exponential = ar.ExponentialBackoff(base_delay=0.1, factor=2, max_delay=0.5)
+    assert [exponential.next_delay(i, None) for i in range(5)] == pytest.approx([0.1, 0.2, 0.4, 0.5, 0.5])
+
+    jittered = ar.ExponentialBackoff(base_delay=0.1, factor=2, max_delay=0.5, jitter=True)
+    for attempt in range(5):
+        assert 0 <= jittered.next_delay(attempt, None) <= min(0.5, 0.1 * 2**attempt)
+
+    decorrelated = ar.DecorrelatedJitterBackoff(base_delay=0.1, max_delay=1.0)
+    delay = None
+    delays = set()
+    for attempt in range(50):
+        previous = delay if delay is not None else 0.1
+        delay = decorrelated.next_delay(attempt, delay)
+        assert 0.1 <= delay <= min(1.0, previous * 3)
+        delays.add(delay)
+    assert len(delays) > 1
+
+
+def test_backoff_strategy_is_used(sleeps):
+    call = FlakyCall(APIError(503), APIError(503), APIError(503))
+    wrapped = ar._retry_decorator(retries=4, backoff_strategy=ar.ExponentialBackoff(base_delay=1, factor=3))(call)
+
+    assert wrapped() == "ok"
+    assert sleeps == [1, 3, 9]
+
+
+def test_retry_after_is_respected(sleeps):
+    call = FlakyCall(HintedAPIError(429, {"Retry-After": "5"}), HintedAPIError(429, {"Retry-After": "0"}))
+    wrapped = ar._retry_decorator(retries=3, base_delay=0.5)(call)
+
+    assert wrapped() == "ok"
+    # The hint is a lower bound for the back-off delay
+    assert sleeps == [5.0, 1.0]
+
+    # Hints are ignored when disabled
+    sleeps.clear()
+    call = FlakyCall(HintedAPIError(429, {"Retry-After": "5"}))
+    assert ar._retry_decorator(retries=3, base_delay=0.5, respect_retry_after=False)(call)() == "ok"
+    assert sleeps == [0.5]
+
+    # Hints longer than max_retry_after are not retried
+    sleeps.clear()
+    call = FlakyCall(HintedAPIError(429, {"Retry-After": "120"}))
+    with pytest.raises(HintedAPIError):
+        ar._retry_decorator(retries=3, max_retry_after=60)(call)()
+    assert call.calls == 1
+    assert not sleeps
+
+
+def test_retry_budget(sleeps):
+    budget = ar.RetryBudget(retries_per_second=0.001, max_tokens=3)
+    deco = ar._retry_decorator(retries=3, base_delay=0, retry_budget=budget)
+
+    # The first call uses two of the three tokens
+    call = FlakyCall(APIError(503), APIError(503))
+    assert deco(call)() == "ok"
+
+    # The second call can only retry once
+    call = FlakyCall(APIError(503), APIError(503))
+    with pytest.raises(APIError):
+        deco(call)()
+    assert call.calls == 2
+
+    stats = budget.get_stats()
+    assert stats["retries_allowed"] == 3
+    assert stats["retries_rejected"] == 1
+    assert stats["tokens"] < 1
+
+    # Tokens are refilled over time
+    budget = ar.RetryBudget(retries_per_second=10, max_tokens=1)
+    assert budget.try_acquire()
+    assert not budget.try_acquire()
+    budget._last_refill -= 0.1
+    assert budget.try_acquire()
+
+
+def test_global_retry_budget_is_shared():
+    assert ar.get_global_retry_budget() is ar.get_global_retry_budget()
+
+
+def test_circuit_breaker(sleeps):
+    breaker = ar.CircuitBreaker("test-endpoint", failure_threshold=3, recovery_timeout=60)
+    deco = ar._retry_decorator(retries=2, base_delay=0, retry_codes=["5xx"], circuit_breaker=breaker)
+
+    # Non retryable errors mean the endpoint is up
+    with pytest.raises(APIError):
+        deco(FlakyCall(APIError(400)))()
+    assert breaker.get_stats()["successes"] == 1
+
+    with pytest.raises(APIError):
+        deco(FlakyCall(APIError(503), APIError(503)))()
+    assert breaker.state == ar.CircuitState.CLOSED
+
+    # The third consecutive failure opens the circuit, and the retry is rejected without calling the endpoint
+    call = FlakyCall(APIError(503), APIError(503))
+    with pytest.raises(ar.CircuitOpenError):
+        deco(call)()
+    assert call.calls == 1
+    assert breaker.state == ar.CircuitState.OPEN
+
+    call = FlakyCall()
+    with pytest.raises(ar.CircuitOpenError):
+        deco(call)()
+    assert call.calls == 0
+
+    stats = breaker.get_stats()
+    assert stats["state"] == "open"
+    assert stats["failures"] == 3
+    assert stats["rejected"] == 2
+    assert stats["times_opened"] == 1
+
+
+def test_circuit_breaker_half_open(sleeps):
+    breaker = ar.CircuitBreaker("test-endpoint", failure_threshold=1, recovery_timeout=0)
+    deco = ar._retry_decorator(retries=1, circuit_breaker=breaker)
+
+    with pytest.raises(APIError):
+        deco(FlakyCall(APIError(503)))()
+
+    # After the recovery timeout one trial call is allowed
+    assert breaker.state == ar.CircuitState.HALF_OPEN
+    breaker.before_call()
+    with pytest.raises(ar.CircuitOpenError):
+        breaker.before_call()
+
+    # A cancelled trial call frees its slot
+    breaker.record_aborted()
+    assert deco(FlakyCall())() == "ok"
+    assert breaker.state == ar.CircuitState.CLOSED
+
+
+class _Client:
+    """Client with one method calling the endpoint and one local method."""
+
+    def __init__(self):
+        self.invoke_calls = 0
+
+    def invoke(self):
+        self.invoke_calls += 1
+        raise APIError(503)
+
+    def bind_tools(self):
+        return "bound"
+
+
+def test_circuit_breaker_only_guards_endpoint_methods(sleeps):
+    breaker = ar.CircuitBreaker("patched-endpoint", failure_threshold=5, recovery_timeout=60)
+    client = ar.patch_with_retry(_Client(), retries=1, retry_codes=["5xx"], circuit_breaker=breaker)
+
+    # Successful local calls do not reset the failure count
+    for _ in range(5):
+        with pytest.raises(APIError):
+            client.invoke()
+        assert client.bind_tools() == "bound"
+
+    assert breaker.state == ar.CircuitState.OPEN
+    assert breaker.get_stats()["times_opened"] == 1
+
+    # Local methods still work while the circuit is open
+    assert client.bind_tools() == "bound"
+    with pytest.raises(ar.CircuitOpenError):
+        client.invoke()
+    assert client.invoke_calls == 5
+
+
+def test_circuit_breaker_methods_allow_list(sleeps):
+    breaker = ar.CircuitBreaker("allow-list-endpoint", failure_threshold=1, recovery_timeout=60)
+    client = ar.patch_with_retry(_Client(),
+                                 retries=1,
+                                 retry_codes=["5xx"],
+                                 circuit_breaker=breaker,
+                                 circuit_breaker_methods=["bind_tools"])
+
+    with pytest.raises(APIError):
+        client.invoke()
+    assert breaker.state == ar.CircuitState.CLOSED
+    assert breaker.get_stats()["successes"] == 0
+
+    assert client.bind_tools() == "bound"
+    assert breaker.get_stats()["successes"] == 1
+
+
+async def test_circuit_breaker_cancelled_attempt():
+    breaker = ar.CircuitBreaker("test-endpoint", failure_threshold=1, recovery_timeout=0)
+    breaker.record_failure()
+    started = asyncio.Event()
+
+    async def _hang():
+        started.set()
+        await asyncio.Event().wait()
+
+    task = asyncio.create_task(ar._retry_decorator(circuit_breaker=breaker)(_hang)())
+    await started.wait()
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert breaker.get_stats()["state"] == "half_open"
+    breaker.before_call()
+
+
+def test_circuit_breaker_registry():
+    breaker = ar.get_circuit_breaker("registry-test-endpoint", failure_threshold=2)
+    assert ar.get_circuit_breaker("registry-test-endpoint") is breaker
+    assert breaker.failure_threshold == 2
+    assert ar.get_circuit_breaker_stats()["registry-test-endpoint"]["state"] == "closed"
+
+
+class _FlakyBackend:
+    """
+    Local HTTP stub of a shared backend which degrades. It fails every request during the first `outage` seconds.
+    Afterwards it slows down as the number of concurrent requests grows past `capacity`, and fails requests once
+    there are more than twice as many. Failed requests carry a Retry-After hint.
+    """
+
+    def __init__(self, capacity: int, outage: float, service_time: float = 0.01):
+        self.capacity = capacity
+        self.outage = outage
+        self.service_time = service_time
+        self.in_flight = 0
+        self.requests = 0
+        self.started = time.perf_counter()
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        self.in_flight += 1
+        try:
+            load = self.in_flight / self.capacity
+            await asyncio.sleep(self.service_time * max(1, load))
+            if time.perf_counter() - self.started < self.outage or load > 2:
+                return httpx.Response(503, headers={"Retry-After": "0.1"})
+            return httpx.Response(200)
+        finally:
+            self.in_flight -= 1
+
+
+async def _run_load(num_clients: int, calls_per_client: int, **retry_kwargs) -> dict:
+    backend = _FlakyBackend(capacity=10, outage=0.3)
+    client = httpx.AsyncClient(transport=httpx.MockTransport(backend.handle), base_url="http://backend")
+
+    @ar._retry_decorator(retry_codes=[503], **retry_kwargs)
+    async def _call():
+        response = await client.get("/generate")
+        if response.status_code != 200:
+            raise HintedAPIError(response.status_code, response.headers)
+        return response
+
+    latencies = []
+    failures = 0
+
+    async def _user():
+        nonlocal failures
+        for _ in range(calls_per_client):
+            start = time.perf_counter()
+            try:
+                await _call()
+                latencies.append(time.perf_counter() - start)
+            except Exception:
+                failures += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(_user() for _ in range(num_clients)))
+    elapsed = time.perf_counter() - start
+    await client.aclose()
+
+    latencies.sort()
+    return {
+        "goodput": len(latencies) / elapsed,
+        "p99_ms": latencies[max(0, int(len(latencies) * 0.99) - 1)] * 1000 if latencies else float("inf"),
+        "failures": failures,
+        "requests": backend.requests,
+        "requests_per_success": backend.requests / max(1, len(latencies)),
+    }
+
+
+@pytest.mark.slow
+@pytest.mark.benchmark
+async def test_retry_load():
+    results = {
+        "Lockstep exponential":
+            await _run_load(num_clients=50,
+                            calls_per_client=4,
+                            retries=6,
+                            backoff_strategy=ar.ExponentialBackoff(base_delay=0.01, factor=2),
+                            respect_retry_after=False),
+        "Decorrelated jitter and Retry-After":
+            await _run_load(num_clients=50,
+                            calls_per_client=4,
+                            retries=6,
+                            backoff_strategy=ar.DecorrelatedJitterBackoff(base_delay=0.01, max_delay=0.5)),
+        "With retry budget and circuit breaker":
+            await _run_load(num_clients=50,
+                            calls_per_client=4,
+                            retries=6,
+                            backoff_strategy=ar.DecorrelatedJitterBackoff(base_delay=0.01, max_delay=0.5),
+                            retry_budget=ar.RetryBudget(retries_per_second=100, max_tokens=50),
+                            circuit_breaker=ar.CircuitBreaker("load-test", failure_threshold=50, recovery_timeout=0.1)),
+    }
+
+    for name, result in results.items():
+        assert result["goodput"] > 0, name
+        assert result["p99_ms"] < float("inf"), name
+        assert result["requests"] >= 200 - result["failures"], name
+
+    lockstep, jittered, budgeted = results.values()
+    assert jittered["requests_per_success"] < lockstep["requests_per_success"]
+
+    # The budget and breaker shed load from the degraded backend, failing calls fast instead
+    assert budgeted["requests"] < lockstep["requests"]
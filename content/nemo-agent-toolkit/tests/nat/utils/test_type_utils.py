@@ -13,6 +13,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import copy
+import pickle
+import types
 import typing
 from collections.abc import AsyncGenerator
 from typing import Generic
@@ -244,3 +247,113 @@ class TestDecomposedTypeBasics:
         """Test is_generic property."""
         assert DecomposedType(list[int]).is_generic is True
         assert DecomposedType(int).is_generic is False
+
+
+class TestDecomposedTypeInterning:
+    """Tests for the interning of DecomposedType instances."""
+
+    def test_same_type_returns_same_instance(self):
+        input_type = list[int] | None
+
+        assert DecomposedType(input_type) is DecomposedType(input_type)
+        assert DecomposedType(int) is DecomposedType(int)
+        assert DecomposedType(int) is not DecomposedType(str)
+
+    def test_equal_types_share_instance(self):
+        # Each subscription creates a new alias object, which compares equal to the others
+        assert list[int] is not list[int]
+        assert DecomposedType(list[int]) is DecomposedType(list[int])
+
+    def test_union_argument_order_is_preserved(self):
+        assert DecomposedType(typing.Union[int, None]).args == (int, types.NoneType)
+        assert DecomposedType(typing.Union[None, int]).args == (types.NoneType, int)
+        assert DecomposedType(int | None).origin is types.UnionType
+        assert DecomposedType(typing.Optional[int]).origin is typing.Union
+
+    def test_unhashable_types_are_not_interned(self):
+        input_type = typing.Annotated[int, {"unhashable": True}]
+
+        assert DecomposedType(input_type) is not DecomposedType(input_type)
+        assert DecomposedType(input_type).root is typing.Annotated
+
+    def test_copy_and_pickle(self):
+        decomposed = DecomposedType(dict[str, int])
+
+        assert copy.copy(decomposed) is decomposed
+        assert copy.deepcopy(decomposed) is decomposed
+        assert pickle.loads(pickle.dumps(decomposed)) is decomposed
+
+    def test_properties_are_computed_once(self, monkeypatch: pytest.MonkeyPatch):
+        input_type = dict[str, int]
+
+        assert DecomposedType(input_type).origin is dict
+
+        def fail(tp):
+            raise AssertionError("The origin should have been cached")
+
+        monkeypatch.setattr(typing, "get_origin", fail)
+
+        assert DecomposedType(input_type).root is dict
+        assert DecomposedType(input_type).is_generic is True
+
+    def test_empty_signature_is_none_type(self):
+        import inspect
+
+        assert DecomposedType(inspect.Signature.empty).type is types.NoneType
+        assert DecomposedType(inspect.Signature.empty).is_empty is True
+
+    def test_interned_types_are_bounded(self, monkeypatch: pytest.MonkeyPatch):
+        from nat.utils import type_utils
+
+        monkeypatch.setattr(DecomposedType, "_interned", {})
+        monkeypatch.setattr(type_utils, "_INTERNED_TYPES_MAXSIZE", 2)
+
+        first = DecomposedType(int)
+        DecomposedType(str)
+        DecomposedType(float)
+
+        assert len(DecomposedType._interned) == 2
+        assert DecomposedType(int) is not first
+        assert DecomposedType(int).root is int
+
+
+@pytest.mark.slow
+@pytest.mark.benchmark
+def test_decomposed_type_benchmark():
+    """
+    Measures the code paths which create `DecomposedType` objects: decomposing a type, building a `Function` and
+    converting values with the converters registered by the API server models.
+    """
+    import time
+
+    from nat.builder.function import LambdaFunction
+    from nat.builder.function_info import FunctionInfo
+    from nat.data_models.api_server import ChatRequest
+    from nat.data_models.function import EmptyFunctionConfig
+    from nat.utils.type_converter import TypeConverter
+
+    def _time(num_calls: int, fn: typing.Callable[[], typing.Any]) -> float:
+        start = time.perf_counter()
+        for _ in range(num_calls):
+            fn()
+        return (time.perf_counter() - start) / num_calls * 1e6
+
+    input_type = list[int] | None
+
+    def decompose():
+        decomposed = DecomposedType(input_type)
+        return decomposed.is_optional and decomposed.get_optional_type().root
+
+    async def _fn(message: ChatRequest) -> str:
+        return message.messages[0].content
+
+    def build_function():
+        LambdaFunction.from_info(config=EmptyFunctionConfig(), info=FunctionInfo.from_fn(_fn))
+
+    converter = TypeConverter([])
+    chat_request = converter.convert("Hello", ChatRequest)
+
+    print(f"\nDecomposedType properties: {_time(100_000, decompose):.2f} us/call")
+    print(f"Function construction: {_time(500, build_function):.1f} us/function")
+    print(f"ChatRequest -> str: {_time(20_000, lambda: converter.convert(chat_request, str)):.2f} us/call")
+    print(f"str -> ChatRequest: {_time(20_000, lambda: converter.convert('Hello', ChatRequest)):.2f} us/call")